@@ -15,13 +15,24 @@ from ._exceptions import (
     InvalidUserError,
     DuplicateUserError,
 )
+from ._query import Query
 from ._main import (
+    batch,
+    complete,
     create,
+    create_many,
     delete,
+    delete_many,
+    export_users,
     get,
+    import_users,
+    iter_read,
+    lookup_phone,
     read,
+    search,
     set_data_store,
     update,
+    update_many,
 )
 
 
@@ -30,10 +41,21 @@ __all__ = (
     "MissingUserError",
     "DuplicateUserError",
     "InvalidUserError",
+    "Query",
+    "batch",
+    "complete",
     "create",
+    "create_many",
     "delete",
+    "delete_many",
+    "export_users",
     "get",
+    "import_users",
+    "iter_read",
+    "lookup_phone",
     "read",
+    "search",
     "set_data_store",
     "update",
+    "update_many",
 )
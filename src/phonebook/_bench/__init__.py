@@ -0,0 +1,11 @@
+"""Benchmarks of how the data stores scale with the number of users.
+
+The benchmarks are run with ``phonebook bench``, which can save the
+results as JSON to compare them between versions. The scenarios are run
+by :mod:`phonebook._bench.runner`, which is only imported when the
+benchmarks are run.
+"""
+
+
+SCENARIOS = ("reload", "get", "read", "update", "create", "delete")
+"""tuple(str): The scenarios to benchmark, in the order they are run."""
@@ -0,0 +1,105 @@
+"""Benchmark the throughput of the codecs of the file data stores.
+
+Times writing and reading a file of synthetic users with the codec of
+each file data store, and with the pure-Python paths of the codecs that
+use a C-accelerated package when it is installed, e.g.::
+
+    python -m phonebook._bench.codec --users 10000 200000 --codecs json binary
+
+"""
+
+
+import argparse
+import os
+import tempfile
+import time
+
+from .._datastore import DATA_STORES, codec
+from .._datastore.file_ import FileDataStore
+from .users import generate_users
+
+
+def time_codec(user_codec, users):
+    """Time writing and reading the given `users` with the codec.
+
+    Args:
+        user_codec (phonebook._datastore.codec.BaseCodec): The codec to
+            time.
+        users (list(dict(str, str))): The users to write and read.
+
+    Returns:
+        tuple(float, float, int): The number of seconds writing and
+        reading the users took, and the size of the file in bytes.
+
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, f"phonebook{user_codec.EXTENSION}")
+        binary = "b" if user_codec.BINARY else ""
+
+        start = time.perf_counter()
+        with open(file_path, f"w{binary}") as data_file:
+            user_codec.dump(users, data_file)
+        dump_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(file_path, f"r{binary}") as data_file:
+            loaded = user_codec.load(data_file)
+        load_seconds = time.perf_counter() - start
+
+        if len(loaded) != len(users):
+            raise AssertionError(f"Read {len(loaded)} of {len(users)} users")
+        return dump_seconds, load_seconds, os.path.getsize(file_path)
+
+
+def codecs():
+    """Get the codecs to benchmark.
+
+    Returns:
+        dict(str, phonebook._datastore.codec.BaseCodec): The codec of
+        each file data store by its name, and the pure-Python paths of
+        the YAML and binary codecs (named e.g. ``"yaml (python)"``) when
+        they use a C-accelerated package.
+
+    """
+    result = {}
+    for data_store in DATA_STORES:
+        if issubclass(data_store, FileDataStore):
+            data_store_codec = data_store.CODEC
+            if data_store.COMPRESSION is not None:
+                data_store_codec = codec.CompressedCodec(
+                    data_store_codec, data_store.COMPRESSION
+                )
+            result.setdefault(data_store_codec.NAME, data_store_codec)
+    for pure_codec in (codec.YAMLCodec(fast=False), codec.BinaryCodec(fast=False)):
+        if result[pure_codec.NAME].fast:
+            result[f"{pure_codec.NAME} (python)"] = pure_codec
+    return result
+
+
+def main():
+    """Run the benchmark and print the results."""
+    all_codecs = codecs()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--codecs", nargs="+", choices=sorted(all_codecs), default=sorted(all_codecs)
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'users':>9} {'codec':<20} {'dump s':>9} {'load s':>9} "
+        f"{'dump/s':>10} {'load/s':>10} {'MB':>8}"
+    )
+    for count in args.users:
+        users = list(generate_users(count))
+        for name in args.codecs:
+            dump_seconds, load_seconds, size = time_codec(all_codecs[name], users)
+            print(
+                f"{count:>9} {name:<20} {dump_seconds:>9.3f} {load_seconds:>9.3f} "
+                f"{count / dump_seconds:>10.0f} {count / load_seconds:>10.0f} "
+                f"{size / 1e6:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark the load time of compressed data store files against their size.
+
+Times writing and reading a file of synthetic users with each codec
+compressed with each compression and level, and estimates how long
+loading it would take if the file were read at the given bandwidth
+(e.g. from a network-mounted home directory), e.g.::
+
+    python -m phonebook._bench.compression --users 200000 --bandwidth 12.5
+
+"""
+
+
+import argparse
+
+from .._datastore import codec
+from .codec import codecs, time_codec
+from .users import generate_users
+
+
+def run(users, codec_names, compressions, levels, bandwidth):
+    """Time each codec with each compression and level.
+
+    Args:
+        users (list(dict(str, str))): The users to write and read.
+        codec_names (iterable(str)): The names of the codecs to compress,
+            see :func:`phonebook._bench.codec.codecs`.
+        compressions (iterable(str or None)): The compressions to use. A
+            compression of None times the uncompressed file.
+        levels (iterable(int or None)): The compression levels to use.
+            A level of None uses the compression's default level.
+        bandwidth (float): The number of megabytes per second the file
+            is read at.
+
+    Returns:
+        list(dict): The result of each combination, with the "codec",
+        "compression", "level", "dump_seconds", "load_seconds", "size",
+        and "read_seconds" (the load time plus the time to read the file
+        at the `bandwidth`) of each.
+
+    """
+    all_codecs = codecs()
+    results = []
+    for codec_name in codec_names:
+        for compression in compressions:
+            for level in levels if compression is not None else [None]:
+                user_codec = all_codecs[codec_name]
+                if compression is not None:
+                    user_codec = codec.CompressedCodec(
+                        user_codec, compression, level=level
+                    )
+                dump_seconds, load_seconds, size = time_codec(user_codec, users)
+                results.append(
+                    {
+                        "codec": codec_name,
+                        "compression": compression,
+                        "level": level,
+                        "dump_seconds": dump_seconds,
+                        "load_seconds": load_seconds,
+                        "size": size,
+                        "read_seconds": load_seconds + size / (bandwidth * 1e6),
+                    }
+                )
+    return results
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument(
+        "--codecs",
+        nargs="+",
+        choices=("json", "json-compact", "yaml", "binary"),
+        default=["json", "yaml"],
+    )
+    parser.add_argument(
+        "--compressions",
+        nargs="+",
+        choices=("none",) + tuple(codec.COMPRESSIONS),
+        default=("none",) + tuple(codec.COMPRESSIONS),
+    )
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=12.5,
+        help="The megabytes per second the file is read at (12.5 is 100 Mbit/s).",
+    )
+    args = parser.parse_args()
+
+    results = run(
+        list(generate_users(args.users)),
+        args.codecs,
+        [None if name == "none" else name for name in args.compressions],
+        args.levels,
+        args.bandwidth,
+    )
+
+    print(
+        f"{'codec':<13} {'compression':<11} {'level':>5} {'MB':>8} "
+        f"{'dump s':>9} {'load s':>9} {'read s':>9}"
+    )
+    for result in results:
+        level = "" if result["level"] is None else result["level"]
+        print(
+            f"{result['codec']:<13} {result['compression'] or 'none':<11} "
+            f"{level:>5} {result['size'] / 1e6:>8.2f} "
+            f"{result['dump_seconds']:>9.3f} {result['load_seconds']:>9.3f} "
+            f"{result['read_seconds']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark how long the Phonebook takes to import."""
+
+
+import subprocess
+import sys
+
+from .runner import percentile
+
+
+STATEMENTS = ("import phonebook", "import phonebook._cli")
+"""tuple(str): The import statements to benchmark."""
+
+_TIMER = """\
+import sys
+import time
+modules = len(sys.modules)
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, len(sys.modules) - modules)
+"""
+
+
+def time_import(statement, runs=10):
+    """Time the given import `statement` in new Python processes.
+
+    Each run is in a new process so nothing is already imported.
+
+    Args:
+        statement (str): The import statement to time.
+
+    Keyword Args:
+        runs (int): The number of times to run the statement.
+
+    Returns:
+        dict: The ``statement``, number of ``runs``, ``min_ms`` and
+        ``p50_ms`` import times, and the number of ``modules`` it
+        imported.
+
+    """
+    durations = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        duration, modules = output.split()
+        durations.append(float(duration))
+
+    return {
+        "statement": statement,
+        "runs": runs,
+        "min_ms": min(durations) * 1000,
+        "p50_ms": percentile(durations, 50) * 1000,
+        "modules": int(modules),
+    }
+
+
+def format_import_results(results):
+    """Format the import `results` as a table.
+
+    Args:
+        results (list(dict)): The results from :func:`time_import`.
+
+    Returns:
+        str: The table of results.
+
+    """
+    lines = [f"{'statement':<24} {'min ms':>8} {'p50 ms':>8} {'modules':>8}"]
+    for result in results:
+        lines.append(
+            f"{result['statement']:<24} {result['min_ms']:>8.2f} "
+            f"{result['p50_ms']:>8.2f} {result['modules']:>8}"
+        )
+    return "\n".join(lines)
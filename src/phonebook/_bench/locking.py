@@ -0,0 +1,141 @@
+"""Benchmark the overhead of sharing a data store file between processes.
+
+Measures the cost of the file locking and atomic writes used by the file
+data stores, both for a single process and for many processes changing
+the same file at once, e.g.::
+
+    python -m phonebook._bench.locking --users 1000 --processes 1 2 4 8
+
+"""
+
+
+import argparse
+import concurrent.futures
+import os
+import tempfile
+import time
+
+from .._datastore import DATA_STORES, locking
+from .runner import percentile
+
+
+def _user(name):
+    """Get a synthetic user with the given `name`.
+
+    Args:
+        name (str): The name of the user.
+
+    Returns:
+        dict(str, str): The user information.
+
+    """
+    return {"name": name, "phone": "555-555-5555", "address": "123 Main St"}
+
+
+def _create_users(data_store_class, file_path, prefix, count, lock):
+    """Create users in the data store, timing each creation.
+
+    Args:
+        data_store_class (type): The class of the data store.
+        file_path (str): The path of the data store's file.
+        prefix (str): The prefix of the name of each user.
+        count (int): The number of users to create.
+        lock (bool): Whether to lock the file.
+
+    Returns:
+        list(float): The number of seconds each creation took.
+
+    """
+    if not lock:
+        locking.fcntl = None
+
+    data_store = data_store_class(file_path=file_path)
+    latencies = []
+    for number in range(count):
+        start = time.perf_counter()
+        data_store.create(_user(f"{prefix}-{number}"))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _run(data_store_class, users, processes, operations, lock):
+    """Run a single scenario of the benchmark.
+
+    Args:
+        data_store_class (type): The class of the data store.
+        users (int): The number of users in the data store beforehand.
+        processes (int): The number of processes changing the data store
+            at once.
+        operations (int): The number of users each process creates.
+        lock (bool): Whether to lock the file.
+
+    Returns:
+        tuple(float, list(float), int): The total number of seconds the
+        scenario took, the number of seconds each creation took, and the
+        number of created users that were lost.
+
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, f"phonebook.{data_store_class.NAME}")
+        data_store = data_store_class(file_path=file_path)
+        with data_store.batch():
+            for number in range(users):
+                data_store.create(_user(f"existing-{number}"))
+
+        start = time.perf_counter()
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            futures = [
+                executor.submit(
+                    _create_users,
+                    data_store_class,
+                    file_path,
+                    f"process-{process}",
+                    operations,
+                    lock,
+                )
+                for process in range(processes)
+            ]
+            latencies = [latency for future in futures for latency in future.result()]
+        elapsed = time.perf_counter() - start
+
+        created = len(data_store_class(file_path=file_path).read())
+    return elapsed, latencies, users + processes * operations - created
+
+
+def main():
+    """Run the benchmark and print the results."""
+    data_store_names = {
+        data_store.NAME: data_store
+        for data_store in DATA_STORES
+        if data_store.NAME in ("json", "yaml")
+    }
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--data-store", choices=sorted(data_store_names), default="json"
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operations", type=int, default=50)
+    args = parser.parse_args()
+    data_store_class = data_store_names[args.data_store]
+
+    print(
+        f"{'processes':>9} {'locked':>6} {'ops/s':>9} {'p50 ms':>9} "
+        f"{'p99 ms':>9} {'lost':>5}"
+    )
+    for processes in args.processes:
+        for lock in (False, True):
+            elapsed, latencies, lost = _run(
+                data_store_class, args.users, processes, args.operations, lock
+            )
+            print(
+                f"{processes:>9} {str(lock):>6} "
+                f"{len(latencies) / elapsed:>9.1f} "
+                f"{percentile(latencies, 50) * 1000:>9.2f} "
+                f"{percentile(latencies, 99) * 1000:>9.2f} "
+                f"{lost:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
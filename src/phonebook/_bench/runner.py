@@ -0,0 +1,338 @@
+"""Run the benchmark scenarios against the data stores."""
+
+
+import concurrent.futures
+import itertools
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # peak memory is only measured on POSIX platforms
+    resource = None
+
+from .. import __version__
+from . import SCENARIOS
+from .users import generate_users
+
+
+_LOGGER = logging.getLogger(__name__)
+# the scenarios that change the users, which read-only data stores skip
+_CHANGE_SCENARIOS = frozenset(("update", "create", "delete"))
+_READ_FILTERS = (
+    {"name": "Eric*"},
+    {"address": "*Main St*"},
+    {"phone": "555-*"},
+    {"name": "John Cleese 1*", "address": "1*"},
+)
+
+
+def percentile(values, percent):
+    """Get the given `percent` percentile of the `values`.
+
+    Args:
+        values (list(float)): The values.
+        percent (float): The percentile to get, from 0 to 100.
+
+    Returns:
+        float: The percentile of the values.
+
+    """
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def run(data_stores, sizes, scenarios=SCENARIOS, operations=100, duration=2.0):
+    """Run the benchmark scenarios against the data stores.
+
+    For each data store and size, a data store with that many synthetic
+    users is created in a temporary directory. Each scenario is then run
+    in its own process, which loads the data store and makes up to
+    `operations` calls, so the peak memory of each scenario is measured
+    separately. Read-only data stores are written directly and skip the
+    scenarios that change the users.
+
+    Args:
+        data_stores (iterable(type)): The classes of the data stores to
+            benchmark.
+        sizes (iterable(int)): The numbers of users to benchmark each
+            data store with.
+
+    Keyword Args:
+        scenarios (iterable(str)): The scenarios to run. See
+            :data:`SCENARIOS`.
+        operations (int): The maximum number of calls each scenario
+            makes.
+        duration (float): The number of seconds after which a scenario
+            stops making calls, even if it hasn't made `operations`
+            calls. At least one call is always made.
+
+    Returns:
+        list(dict): The result of each scenario. See
+        :func:`_run_scenario` for the fields.
+
+    Raises:
+        ValueError: Raised when a scenario isn't one of
+            :data:`SCENARIOS`.
+
+    """
+    unknown_scenarios = set(scenarios).difference(SCENARIOS)
+    if unknown_scenarios:
+        raise ValueError(f"Unknown benchmark scenarios: {unknown_scenarios}")
+    scenarios = [scenario for scenario in SCENARIOS if scenario in set(scenarios)]
+    results = []
+    for data_store_class, size in itertools.product(data_stores, sizes):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, f"phonebook.{data_store_class.NAME}")
+            with concurrent.futures.ProcessPoolExecutor(1) as executor:
+                _LOGGER.info(f"Creating {data_store_class.NAME} with {size} users")
+                executor.submit(_populate, data_store_class, file_path, size).result()
+
+            for scenario in scenarios:
+                if data_store_class.READ_ONLY and scenario in _CHANGE_SCENARIOS:
+                    continue
+                _LOGGER.debug(f"Running {scenario} on {data_store_class.NAME}")
+                # a new process per scenario so the peak memory is its own
+                with concurrent.futures.ProcessPoolExecutor(1) as executor:
+                    result = executor.submit(
+                        _run_scenario,
+                        data_store_class,
+                        file_path,
+                        size,
+                        scenario,
+                        operations,
+                        duration,
+                    ).result()
+                results.append(result)
+    return results
+
+
+def environment():
+    """Get a description of the environment the benchmarks run in.
+
+    Returns:
+        dict(str, str): The version of the Phonebook, Python, and the
+        platform.
+
+    """
+    return {
+        "phonebook": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(baseline, results):
+    """Compare the `results` to the `baseline` results.
+
+    Args:
+        baseline (list(dict)): The results to compare against, e.g.
+            from the previous version.
+        results (list(dict)): The results to compare.
+
+    Returns:
+        list(dict): For each result that is also in the `baseline`, the
+        data store, users, scenario, and the ratio of its throughput
+        and p99 latency to the baseline's.
+
+    """
+    baseline_results = {_result_key(result): result for result in baseline}
+    comparisons = []
+    for result in results:
+        baseline_result = baseline_results.get(_result_key(result))
+        if baseline_result is None:
+            continue
+        comparisons.append(
+            {
+                "data_store": result["data_store"],
+                "users": result["users"],
+                "scenario": result["scenario"],
+                "ops_per_second": _ratio(
+                    result["ops_per_second"], baseline_result["ops_per_second"]
+                ),
+                "p99_ms": _ratio(result["p99_ms"], baseline_result["p99_ms"]),
+            }
+        )
+    return comparisons
+
+
+def format_results(results):
+    """Format the `results` as a table.
+
+    Args:
+        results (list(dict)): The results to format.
+
+    Returns:
+        str: The table of results.
+
+    """
+    lines = [
+        f"{'data store':<10} {'users':>9} {'scenario':<8} {'ops':>6} "
+        f"{'ops/s':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak MB':>8}"
+    ]
+    for result in results:
+        peak_memory = result["peak_memory_mb"]
+        lines.append(
+            f"{result['data_store']:<10} {result['users']:>9} "
+            f"{result['scenario']:<8} {result['operations']:>6} "
+            f"{result['ops_per_second']:>10.1f} {result['p50_ms']:>9.3f} "
+            f"{result['p90_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+            f"{'-' if peak_memory is None else f'{peak_memory:.1f}':>8}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons):
+    """Format the `comparisons` as a table.
+
+    Args:
+        comparisons (list(dict)): The comparisons from :func:`compare`.
+
+    Returns:
+        str: The table of comparisons.
+
+    """
+    lines = [
+        f"{'data store':<10} {'users':>9} {'scenario':<8} {'ops/s':>8} {'p99 ms':>8}"
+    ]
+    for comparison in comparisons:
+        lines.append(
+            f"{comparison['data_store']:<10} {comparison['users']:>9} "
+            f"{comparison['scenario']:<8} "
+            f"{comparison['ops_per_second']:>7.2f}x {comparison['p99_ms']:>7.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def _populate(data_store_class, file_path, size):
+    """Create a data store with the given number of synthetic users.
+
+    Args:
+        data_store_class (type): The class of the data store.
+        file_path (str): The path of the data store's file.
+        size (int): The number of users to create.
+
+    """
+    if data_store_class.READ_ONLY:
+        data_store_class.write(generate_users(size), file_path)
+    else:
+        data_store = data_store_class(file_path=file_path)
+        data_store.create_many(generate_users(size))
+
+
+def _run_scenario(data_store_class, file_path, size, scenario, operations, duration):
+    """Run a single scenario against the data store.
+
+    Args:
+        data_store_class (type): The class of the data store.
+        file_path (str): The path of the data store's file.
+        size (int): The number of users the data store was created with.
+        scenario (str): The scenario to run. One of :data:`SCENARIOS`.
+        operations (int): The maximum number of calls to make.
+        duration (float): The number of seconds after which to stop
+            making calls.
+
+    Returns:
+        dict: The ``data_store`` name, number of ``users``,
+        ``scenario``, number of ``operations`` made, total ``seconds``,
+        ``ops_per_second``, ``p50_ms``, ``p90_ms``, and ``p99_ms``
+        latencies, and ``peak_memory_mb`` (None if it can't be
+        measured).
+
+    """
+    data_store = data_store_class(file_path=file_path)
+    # the users the scenarios read, change, and delete, spread over all
+    # of the users
+    step = max(1, size // operations)
+    names = [
+        user["name"] for user in itertools.islice(generate_users(size), 0, None, step)
+    ]
+    new_users = generate_users(operations, seed=1, prefix="New ")
+
+    calls = {
+        "reload": lambda number: data_store_class(file_path=file_path),
+        "get": lambda number: data_store.get(names[number % len(names)]),
+        "read": lambda number: data_store.read(
+            filters=_READ_FILTERS[number % len(_READ_FILTERS)]
+        ),
+        "update": lambda number: data_store.update(
+            names[number % len(names)], phone=f"555-555-{number:04}"
+        ),
+        "create": lambda number: data_store.create(next(new_users)),
+        "delete": lambda number: data_store.delete(names[number]),
+    }
+    call = calls[scenario]
+    if scenario == "delete":
+        operations = min(operations, len(names))
+
+    latencies = []
+    scenario_start = time.perf_counter()
+    deadline = scenario_start + duration
+    for number in range(operations):
+        start = time.perf_counter()
+        call(number)
+        end = time.perf_counter()
+        latencies.append(end - start)
+        if end >= deadline:
+            break
+    seconds = time.perf_counter() - scenario_start
+
+    return {
+        "data_store": data_store_class.NAME,
+        "users": size,
+        "scenario": scenario,
+        "operations": len(latencies),
+        "seconds": seconds,
+        "ops_per_second": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_memory_mb": _peak_memory_mb(),
+    }
+
+
+def _peak_memory_mb():
+    """Get the peak memory used by the process.
+
+    Returns:
+        float or None: The peak resident memory in megabytes, or None if
+        it can't be measured on this platform.
+
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and kilobytes elsewhere
+    return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _result_key(result):
+    """Get the key identifying what a result was measured for.
+
+    Args:
+        result (dict): The result.
+
+    Returns:
+        tuple(str, int, str): The data store, users, and scenario.
+
+    """
+    return result["data_store"], result["users"], result["scenario"]
+
+
+def _ratio(value, baseline_value):
+    """Get the ratio of the `value` to the `baseline_value`.
+
+    Args:
+        value (float): The value.
+        baseline_value (float): The baseline value.
+
+    Returns:
+        float: The ratio, or infinity if the baseline value is 0.
+
+    """
+    return value / baseline_value if baseline_value else float("inf")
@@ -0,0 +1,64 @@
+"""Synthetic users to benchmark the data stores with."""
+
+
+import random
+
+
+_FIRST_NAMES = (
+    "Eric",
+    "Graham",
+    "John",
+    "Michael",
+    "Terry",
+    "Carol",
+    "Connie",
+    "Neil",
+)
+_LAST_NAMES = (
+    "Idle",
+    "Chapman",
+    "Cleese",
+    "Palin",
+    "Jones",
+    "Gilliam",
+    "Cleveland",
+    "Booth",
+    "Innes",
+)
+_STREETS = (
+    "Main St",
+    "High St",
+    "Church Rd",
+    "Station Rd",
+    "Park Ave",
+    "Mill Ln",
+    "Victoria Rd",
+)
+
+
+def generate_users(count, seed=0, prefix=""):
+    """Generate synthetic users with unique names.
+
+    The same `count` and `seed` always generate the same users.
+
+    Args:
+        count (int): The number of users to generate.
+
+    Keyword Args:
+        seed (int): The seed of the random phone numbers and addresses.
+        prefix (str): The prefix of the name of each user, to generate
+            users that don't clash with the users generated before.
+
+    Yields:
+        dict(str, str): The information for each user.
+
+    """
+    rng = random.Random(seed)
+    for number in range(count):
+        first_name = _FIRST_NAMES[number % len(_FIRST_NAMES)]
+        last_name = _LAST_NAMES[number % len(_LAST_NAMES)]
+        yield {
+            "name": f"{prefix}{first_name} {last_name} {number}",
+            "phone": f"{rng.randint(200, 999)}-555-{rng.randint(0, 9999):04}",
+            "address": f"{rng.randint(1, 9999)} {rng.choice(_STREETS)}",
+        }
@@ -4,19 +4,20 @@
 import argparse
 import json
 import logging
-
-import yaml
+import sys
 
 import phonebook
+import phonebook._bench
 import phonebook._datastore
+import phonebook._transfer
 
 
-_DATA_STORES = {
-    data_store.NAME: data_store for data_store in phonebook._datastore.DATA_STORES
-}
+# only the modules needed by the command being run are imported, e.g. the
+# selected data store, or yaml for the yaml output format
 _OUTPUT_FORMATS = (
     "json",
     "yaml",
+    "ndjson",
 )
 
 
@@ -39,10 +40,17 @@ def _parse_args():
     )
     parser.add_argument(
         "--data-store",
-        default=phonebook._datastore.DATA_STORES[0].NAME,
-        choices=_DATA_STORES.keys(),
+        default=phonebook._datastore.DATA_STORE_NAMES[0],
+        choices=phonebook._datastore.DATA_STORE_NAMES,
         help="The Data Store to use to store the backend.",
     )
+    parser.add_argument(
+        "--server",
+        help=(
+            "The address of a Phonebook server started with the serve command to "
+            "use instead of a Data Store. Either HOST:PORT or a Unix socket path."
+        ),
+    )
     subparsers = parser.add_subparsers(title="commands", dest="command")
 
     # get args
@@ -83,6 +91,68 @@ def _parse_args():
         help="The fnmatch-style address expression to use to filter the users by.",
     )
     read_parser.add_argument(
+        "--output-format",
+        default=_OUTPUT_FORMATS[0],
+        choices=_OUTPUT_FORMATS,
+        help=(
+            "Specify the desired manner of output. The ndjson format prints "
+            "each user as it is read rather than all users at once."
+        ),
+    )
+    read_parser.add_argument(
+        "--limit", type=int, help="The maximum number of users to output."
+    )
+    read_parser.add_argument(
+        "--offset", type=int, help="The number of matching users to skip."
+    )
+    read_parser.add_argument(
+        "--after",
+        help="Only output the users after the user with this name.",
+    )
+
+    # complete args
+    complete_parser = subparsers.add_parser(
+        "complete", help="Get the names in the Phonebook that start with a prefix."
+    )
+    complete_parser.add_argument("prefix", help="The text the names start with.")
+    complete_parser.add_argument(
+        "--limit", type=int, help="The maximum number of names to get."
+    )
+    complete_parser.add_argument(
+        "--output-format",
+        default=_OUTPUT_FORMATS[0],
+        choices=_OUTPUT_FORMATS,
+        help="Specify the desired manner of output.",
+    )
+
+    # lookup-phone args
+    lookup_phone_parser = subparsers.add_parser(
+        "lookup-phone", help="Get the users in the Phonebook with a phone number."
+    )
+    lookup_phone_parser.add_argument("number", help="The phone number to look up.")
+    lookup_phone_parser.add_argument(
+        "--digits",
+        type=int,
+        help="Only match the last DIGITS digits of the phone numbers.",
+    )
+    lookup_phone_parser.add_argument(
+        "--output-format",
+        default=_OUTPUT_FORMATS[0],
+        choices=_OUTPUT_FORMATS,
+        help="Specify the desired manner of output.",
+    )
+
+    # search args
+    search_parser = subparsers.add_parser(
+        "search", help="Get the users in the Phonebook whose address has every term."
+    )
+    search_parser.add_argument(
+        "terms", nargs="+", help="The words and numbers to search the addresses for."
+    )
+    search_parser.add_argument(
+        "--limit", type=int, help="The maximum number of users to get."
+    )
+    search_parser.add_argument(
         "--output-format",
         default=_OUTPUT_FORMATS[0],
         choices=_OUTPUT_FORMATS,
@@ -118,14 +188,166 @@ def _parse_args():
         "-a", "--address", help="The address to update the user with."
     )
 
+    # import args
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Add all of the users in a file to the Phonebook, saving them once.",
+    )
+    import_parser.add_argument(
+        "file", help="The file to import the users from, or - to read stdin."
+    )
+    import_parser.add_argument(
+        "--format",
+        choices=phonebook._transfer.FORMATS,
+        help=(
+            "The format of the file. If not given it is guessed from the file's "
+            "extension, or ndjson for stdin."
+        ),
+    )
+    import_parser.add_argument(
+        "--skip-duplicates",
+        action="store_true",
+        help=(
+            "Skip the users whose name is already in the Phonebook or earlier in "
+            "the file rather than failing."
+        ),
+    )
+
+    # export args
+    export_parser = subparsers.add_parser(
+        "export",
+        help=(
+            "Write the users in the Phonebook to a file, optionally filtered by "
+            "fnmatch-style filters."
+        ),
+    )
+    export_parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="The file to export the users to. Defaults to stdout.",
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=phonebook._transfer.FORMATS,
+        help=(
+            "The format to write the users in. If not given it is guessed from the "
+            "file's extension, or ndjson for stdout."
+        ),
+    )
+    export_parser.add_argument(
+        "-n",
+        "--name",
+        help="The fnmatch-style name expression to use to filter the users by.",
+    )
+    export_parser.add_argument(
+        "-p",
+        "--phone",
+        help="The fnmatch-style phone number expression to use to filter the users by.",
+    )
+    export_parser.add_argument(
+        "-a",
+        "--address",
+        help="The fnmatch-style address expression to use to filter the users by.",
+    )
+
+    # snapshot args
+    snapshot_parser = subparsers.add_parser(
+        "snapshot",
+        help=(
+            "Write the users in the Phonebook to a read-only snapshot, which the "
+            "snapshot Data Store opens near-instantly."
+        ),
+    )
+    snapshot_parser.add_argument(
+        "file",
+        nargs="?",
+        help="The file to write the snapshot to. Defaults to $HOME/phonebook.snapshot.",
+    )
+
+    # bench args
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help=(
+            "Benchmark how the Data Stores scale with the number of users. The "
+            "Phonebook itself is not changed."
+        ),
+    )
+    bench_parser.add_argument(
+        "--data-stores",
+        nargs="+",
+        default=["json", "yaml"],
+        choices=phonebook._datastore.DATA_STORE_NAMES,
+        help="The Data Stores to benchmark.",
+    )
+    bench_parser.add_argument(
+        "--users",
+        nargs="+",
+        type=int,
+        default=[1000, 10000],
+        help="The numbers of users to benchmark each Data Store with.",
+    )
+    bench_parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=phonebook._bench.SCENARIOS,
+        choices=phonebook._bench.SCENARIOS,
+        help="The scenarios to run.",
+    )
+    bench_parser.add_argument(
+        "--operations",
+        type=int,
+        default=100,
+        help="The maximum number of operations each scenario makes.",
+    )
+    bench_parser.add_argument(
+        "--duration",
+        type=float,
+        default=2.0,
+        help="The number of seconds after which a scenario stops early.",
+    )
+    bench_parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="Also benchmark how long the Phonebook takes to import.",
+    )
+    bench_parser.add_argument("--output", help="A file to save the results to as JSON.")
+    bench_parser.add_argument(
+        "--compare",
+        help="A file of results saved with --output to compare the results to.",
+    )
+
+    # serve args
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help=(
+            "Serve the Phonebook over HTTP, keeping the Data Store loaded between "
+            "requests."
+        ),
+    )
+    serve_parser.add_argument(
+        "--address",
+        default="127.0.0.1:8080",
+        help="The address to serve on. Either HOST:PORT or a Unix socket path.",
+    )
+
     return parser.parse_args()
 
 
 def _print_result(result, output_format):
     """Print the result to the terminal."""
+    if output_format == "ndjson":
+        # print each user as soon as it is available
+        users = [result] if isinstance(result, dict) else result
+        for user in users:
+            print(json.dumps(user))
+        return
+
     if output_format == "json":
         output = json.dumps(result, indent=2)
     elif output_format == "yaml":
+        import yaml
+
         output = yaml.dump(result, default_flow_style=False, indent=2)
     print(output)
 
@@ -146,7 +368,31 @@ def _handle_read(args):
     if args.address:
         filters["address"] = args.address
 
-    result = phonebook.read(filters=filters)
+    pagination = {"limit": args.limit, "offset": args.offset, "after": args.after}
+    if args.output_format == "ndjson":
+        result = phonebook.iter_read(filters=filters, **pagination)
+    elif any(value is not None for value in pagination.values()):
+        result = list(phonebook.iter_read(filters=filters, **pagination))
+    else:
+        result = phonebook.read(filters=filters)
+    _print_result(result, args.output_format)
+
+
+def _handle_complete(args):
+    """Output the result of the "complete" command."""
+    result = phonebook.complete(args.prefix, limit=args.limit)
+    _print_result(result, args.output_format)
+
+
+def _handle_lookup_phone(args):
+    """Output the result of the "lookup-phone" command."""
+    result = phonebook.lookup_phone(args.number, digits=args.digits)
+    _print_result(result, args.output_format)
+
+
+def _handle_search(args):
+    """Output the result of the "search" command."""
+    result = phonebook.search(" ".join(args.terms), limit=args.limit)
     _print_result(result, args.output_format)
 
 
@@ -173,6 +419,108 @@ def _handle_update(args):
     phonebook.update(args.user_name, **user_fields)
 
 
+def _file_format(args):
+    """Get the format of the file to import or export."""
+    if args.format:
+        return args.format
+    if args.file == "-":
+        return "ndjson"
+    file_format = phonebook._transfer.guess_format(args.file)
+    if file_format is None:
+        raise ValueError(
+            f"Unable to guess the format of '{args.file}', use --format to give it."
+        )
+    return file_format
+
+
+def _handle_import(args):
+    """Add all of the users in a file to the Phonebook."""
+    file_format = _file_format(args)
+    if args.file == "-":
+        count = phonebook.import_users(sys.stdin, file_format, args.skip_duplicates)
+    else:
+        with open(args.file, newline="") as input_file:
+            count = phonebook.import_users(
+                input_file, file_format, args.skip_duplicates
+            )
+    logging.info(f"Imported {count} users")
+
+
+def _handle_export(args):
+    """Write the users in the Phonebook to a file."""
+    filters = {}
+    if args.name:
+        filters["name"] = args.name
+    if args.phone:
+        filters["phone"] = args.phone
+    if args.address:
+        filters["address"] = args.address
+
+    file_format = _file_format(args)
+    if args.file == "-":
+        phonebook.export_users(sys.stdout, file_format, filters=filters)
+    else:
+        with open(args.file, "w", newline="") as output_file:
+            count = phonebook.export_users(output_file, file_format, filters=filters)
+        logging.info(f"Exported {count} users")
+
+
+def _handle_snapshot(args):
+    """Write the users in the Phonebook to a snapshot."""
+    snapshot_data_store = phonebook._datastore.load_data_store("snapshot")
+    count = snapshot_data_store.write(phonebook.iter_read(), args.file)
+    logging.info(f"Wrote {count} users to the snapshot")
+
+
+def _handle_bench(args):
+    """Benchmark the Data Stores and output the results."""
+    from phonebook._bench import runner
+
+    results = runner.run(
+        [phonebook._datastore.load_data_store(name) for name in args.data_stores],
+        args.users,
+        scenarios=args.scenarios,
+        operations=args.operations,
+        duration=args.duration,
+    )
+    print(runner.format_results(results))
+
+    output = {"environment": runner.environment(), "results": results}
+    if args.imports:
+        from phonebook._bench import imports
+
+        output["imports"] = [
+            imports.time_import(statement) for statement in imports.STATEMENTS
+        ]
+        print()
+        print(imports.format_import_results(output["imports"]))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(output, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        comparisons = runner.compare(baseline["results"], results)
+        print(f"\nCompared to {baseline['environment']['phonebook']}:")
+        print(runner.format_comparisons(comparisons))
+
+
+def _handle_serve(args):
+    """Serve the Phonebook until interrupted."""
+    from phonebook import _server
+
+    server = _server.make_server(args.address)
+    logging.info(f"Serving the Phonebook on {args.address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 def main():
     """The main entry point for the CLI."""
     args = _parse_args()
@@ -190,15 +538,30 @@ def main():
         print(phonebook.__version__)
         return 0
 
-    data_store = _DATA_STORES[args.data_store]()
-    phonebook.set_data_store(data_store)
+    # the benchmarks create their own data stores
+    if args.command != "bench":
+        if args.server:
+            from phonebook._datastore import remote
+
+            data_store = remote.RemoteDataStore(args.server)
+        else:
+            data_store = phonebook._datastore.load_data_store(args.data_store)()
+        phonebook.set_data_store(data_store)
 
     command_funcs = {
         "get": _handle_get,
         "read": _handle_read,
+        "complete": _handle_complete,
+        "lookup-phone": _handle_lookup_phone,
+        "search": _handle_search,
         "create": _handle_create,
         "delete": _handle_delete,
         "update": _handle_update,
+        "import": _handle_import,
+        "export": _handle_export,
+        "snapshot": _handle_snapshot,
+        "bench": _handle_bench,
+        "serve": _handle_serve,
     }
     command_funcs[args.command](args)
 
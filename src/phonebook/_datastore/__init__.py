@@ -1,9 +1,110 @@
-"""Functionality related to storing and retrieving user information."""
+"""Functionality related to storing and retrieving user information.
 
+The data store modules are imported when they are first used, so only
+the data store being used (and its serializer) is ever imported.
+"""
 
-from .json_ import JSONDataStore
-from .yaml_ import YAMLDataStore
 
+import importlib
+import sys
 
-DATA_STORES = (JSONDataStore, YAMLDataStore)
-"""tuple: The supported data stores for Phonebook."""
+from . import base
+
+
+_DATA_STORE_CLASSES = {
+    "json": ("json_", "JSONDataStore"),
+    "yaml": ("yaml_", "YAMLDataStore"),
+    "sqlite": ("sqlite_", "SQLiteDataStore"),
+    "journal": ("journal_", "JournalDataStore"),
+    "snapshot": ("snapshot_", "SnapshotDataStore"),
+    "json-compact": ("file_", "CompactJSONDataStore"),
+    "binary": ("file_", "BinaryDataStore"),
+    "json-gzip": ("file_", "GzipJSONDataStore"),
+    "json-lzma": ("file_", "LZMAJSONDataStore"),
+    "json-incremental": ("json_", "IncrementalJSONDataStore"),
+}
+
+DATA_STORE_NAMES = tuple(_DATA_STORE_CLASSES)
+"""tuple(str): The names of the supported data stores, the default first."""
+
+__all__ = ("DATA_STORE_NAMES", "base", "load_data_store")
+
+
+def load_data_store(name):
+    """Get the class of the data store with the given `name`.
+
+    The data store's module is imported if it hasn't been already.
+
+    Args:
+        name (str): The name of the data store. One of
+            :data:`DATA_STORE_NAMES`.
+
+    Returns:
+        type: The class of the data store.
+
+    Raises:
+        ValueError: Raised when there is no data store with the `name`.
+
+    """
+    if name not in _DATA_STORE_CLASSES:
+        raise ValueError(f"Unknown data store: {name}")
+    module_name, class_name = _DATA_STORE_CLASSES[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name):
+    """Import the data store classes, and DATA_STORES, when first used.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        object: The data store class, or the tuple of all of them.
+
+    Raises:
+        AttributeError: Raised when there is no attribute with the
+            `name`.
+
+    """
+    if name == "DATA_STORES":
+        value = tuple(load_data_store(name) for name in DATA_STORE_NAMES)
+    else:
+        data_store_names = {
+            class_name: data_store_name
+            for data_store_name, (_, class_name) in _DATA_STORE_CLASSES.items()
+        }
+        if name not in data_store_names:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+        value = load_data_store(data_store_names[name])
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # modules can't define __getattr__ before Python 3.7, so the data
+    # stores are imported up front
+    from .file_ import (
+        BinaryDataStore,
+        CompactJSONDataStore,
+        GzipJSONDataStore,
+        LZMAJSONDataStore,
+    )
+    from .journal_ import JournalDataStore
+    from .json_ import IncrementalJSONDataStore, JSONDataStore
+    from .snapshot_ import SnapshotDataStore
+    from .sqlite_ import SQLiteDataStore
+    from .yaml_ import YAMLDataStore
+
+    DATA_STORES = (
+        JSONDataStore,
+        YAMLDataStore,
+        SQLiteDataStore,
+        JournalDataStore,
+        SnapshotDataStore,
+        CompactJSONDataStore,
+        BinaryDataStore,
+        GzipJSONDataStore,
+        LZMAJSONDataStore,
+        IncrementalJSONDataStore,
+    )
@@ -2,13 +2,26 @@
 
 
 import abc
+import contextlib
+import heapq
+import itertools
 import logging
+import operator
+import re
 
 from .. import _exceptions
 
 
 _LOGGER = logging.getLogger(__name__)
 REQUIRED_FIELDS = {"name", "phone", "address"}
+_WILDCARDS = frozenset("*?[")
+_NON_DIGITS = re.compile(r"\D+")
+_TOKENS = re.compile(r"[^\W_]+")
+# removes the ASCII characters other than the digits, which is faster than
+# `_NON_DIGITS` for the usual phone numbers
+_ASCII_NON_DIGITS = dict.fromkeys(
+    code_point for code_point in range(128) if not chr(code_point).isdecimal()
+)
 
 
 def validate(user, ignore_required_fields=False):
@@ -51,6 +64,89 @@ def validate(user, ignore_required_fields=False):
     return user
 
 
+def has_wildcards(pattern):
+    """Check if the given :mod:`fnmatch` `pattern` contains wildcards.
+
+    Args:
+        pattern (str): The :mod:`fnmatch`-compliant pattern to check.
+
+    Returns:
+        bool: True if the `pattern` can match more than one value,
+        False if it only matches itself exactly.
+
+    """
+    return not _WILDCARDS.isdisjoint(pattern)
+
+
+def normalize_phone(phone, digits=None):
+    """Get the canonical digit string of the given `phone` number.
+
+    Every character but the digits is removed, so differently formatted
+    numbers (e.g. ``"(555) 123-4567"`` and ``"555.123.4567"``) have the
+    same digit string.
+
+    Args:
+        phone (str): The phone number to normalize.
+
+    Keyword Args:
+        digits (int or None): Only keep this many of the last digits of
+            the number. If None then every digit is kept.
+
+    Returns:
+        str: The digits of the phone number.
+
+    Raises:
+        ValueError: Raised when `digits` is less than one.
+
+    """
+    phone_digits = str(phone).translate(_ASCII_NON_DIGITS)
+    if not phone_digits.isdecimal():
+        phone_digits = _NON_DIGITS.sub("", phone_digits)
+    if digits is None:
+        return phone_digits
+    if digits < 1:
+        raise ValueError(f"Can't keep {digits} digits of a phone number")
+    return phone_digits[-digits:]
+
+
+def tokenize(text):
+    """Get the words and numbers in the given `text`.
+
+    Args:
+        text (str): The text to split into tokens.
+
+    Returns:
+        set(str): The casefolded runs of letters and digits in the
+        `text`, e.g. ``{"12", "main", "st"}`` for ``"12 Main St."``.
+        Empty if the text is not a string.
+
+    """
+    if not isinstance(text, str):
+        return set()
+    return set(_TOKENS.findall(text.casefold()))
+
+
+def paginate(users, limit=None, offset=None):
+    """Get a single page of the given `users`.
+
+    Args:
+        users (iterable(dict)): The users to get the page of.
+
+    Keyword Args:
+        limit (int or None): The maximum number of users in the page. If
+            None then every remaining user is in the page.
+        offset (int or None): The number of users to skip before the
+            page starts.
+
+    Returns:
+        iterator(dict): The users in the page.
+
+    """
+    start = offset or 0
+    stop = None if limit is None else start + limit
+    return itertools.islice(users, start, stop)
+
+
 class BaseDataStore(object):
     """The base data store used to access the information for Phonebook.
 
@@ -67,12 +163,26 @@ class BaseDataStore(object):
     single result is available to your data store (e.g. a database ONE
     query), the :meth:`get` method can be overloaded.
 
+    By default, the :meth:`create_many`, :meth:`update_many`, and
+    :meth:`delete_many` methods call their single-user counterparts
+    inside :meth:`batch`, which does nothing special. If your data store
+    can persist many changes at once (e.g. a database transaction), the
+    :meth:`batch` method should be overloaded to apply all of the
+    changes in it together, or none of them if any change fails.
+
     When subclassing make sure to define the "NAME" attribute for your
     class. This attribute is used by the CLI to allow the CLI user to
     choose their backend.
 
+    Data stores that can't change their users (e.g. a snapshot) should
+    set the "READ_ONLY" attribute to True and raise
+    :exc:`io.UnsupportedOperation` from :meth:`create`, :meth:`update`,
+    and :meth:`delete`.
+
     """
 
+    READ_ONLY = False
+
     def get(self, name):
         """Get a single user's information from the data store.
 
@@ -94,17 +204,239 @@ class BaseDataStore(object):
             )
         return users[0]
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Group the changes made inside the context into one batch.
+
+        By default the changes are persisted one at a time as they are
+        made. Data stores that support it persist the changes once when
+        the context exits, and discard all of them if an exception is
+        raised inside the context.
+
+        Yields:
+            BaseDataStore: This data store.
+
+        """
+        yield self
+
+    def create_many(self, users):
+        """Add all of the given `users` to the data store in one batch.
+
+        Args:
+            users (iterable(dict(str, str))): The information of each
+                user to add to the data store.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when a given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with a
+                given `name` already exists in the data store.
+
+        """
+        with self.batch():
+            for user in users:
+                self.create(user)
+
+    def delete_many(self, names):
+        """Delete the users with the given `names` in one batch.
+
+        Args:
+            names (iterable(str)): The names of the users to delete from
+                the data store.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with a given
+                name does not exist in the data store.
+
+        """
+        with self.batch():
+            for name in names:
+                self.delete(name)
+
+    def update_many(self, updates):
+        """Update many users in the data store in one batch.
+
+        Args:
+            updates (dict(str, dict(str, str))): The user information
+                to replace, keyed by the name of the user to update. See
+                :meth:`update` for the valid fields.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with a given
+                name does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        with self.batch():
+            for user_name, user_fields in updates.items():
+                self.update(user_name, **user_fields)
+
+    def iter_read(self, filters=None, limit=None, offset=None, after=None):
+        """Iterate over user information from the data store.
+
+        By default, this method pages through the result of :meth:`read`.
+        If a more efficient method of streaming the users is available
+        to your data store (e.g. a database cursor), this method can be
+        overloaded.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. See :meth:`read` for details.
+            limit (int or None): The maximum number of users to return.
+                If None then all matching users are returned.
+            offset (int or None): The number of matching users to skip
+                before returning any.
+            after (str or None): The name of the last user returned by
+                the previous page. Only the users after it are returned,
+                which keeps pages stable when users are created in
+                between pages. The `after` user must still exist, but
+                needn't match the `filters`.
+
+        Returns:
+            iterator(dict): The information for each user that matches
+            the given `filters`.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the `after` user
+                does not exist in the data store.
+
+        """
+        if after is None:
+            return paginate(self.read(filters=filters), limit=limit, offset=offset)
+
+        # the `after` user needn't match the filters, so it is looked for
+        # among every user
+        users = self.read()
+        for index, user in enumerate(users):
+            if user["name"] == after:
+                break
+        else:
+            raise _exceptions.MissingUserError(
+                f"User '{after}' does not exist in the data store!"
+            )
+
+        # imported here since the query module imports this one
+        from .. import _query
+
+        query = _query.Query.compile(filters)
+        return paginate(
+            (user for user in users[index + 1 :] if query.matches(user)),
+            limit=limit,
+            offset=offset,
+        )
+
+    def complete(self, prefix, limit=None):
+        """Get the names of the users that start with the given `prefix`.
+
+        By default, this method checks the name of every user from
+        :meth:`iter_read`. If your data store keeps the names sorted
+        (e.g. a database index), this method can be overloaded to find
+        them without checking every user.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        names = (
+            user["name"] for user in self.iter_read() if user["name"].startswith(prefix)
+        )
+        if limit is None:
+            return sorted(names)
+        return heapq.nsmallest(limit, names)
+
+    def lookup_phone(self, number, digits=None):
+        """Get the users with the given phone `number`.
+
+        Phone numbers are compared by their digits alone (see
+        :func:`normalize_phone`), however they are formatted.
+
+        By default, this method checks the phone number of every user
+        from :meth:`iter_read`. If your data store can index the
+        normalized phone numbers, this method can be overloaded to find
+        them without checking every user.
+
+        Args:
+            number (str): The phone number to look up.
+
+        Keyword Args:
+            digits (int or None): Only match the last this many digits
+                of the phone numbers, e.g. to ignore a country or area
+                code. If None then every digit must match.
+
+        Returns:
+            list(dict): The information for each user with the phone
+            number, sorted by name.
+
+        Raises:
+            ValueError: Raised when `digits` is less than one.
+
+        """
+        key = normalize_phone(number, digits=digits)
+        if not key:
+            return []
+        if digits is None:
+            matches = key.__eq__
+        else:
+            matches = operator.methodcaller("endswith", key)
+        users = (
+            user for user in self.iter_read() if matches(normalize_phone(user["phone"]))
+        )
+        return sorted(users, key=operator.itemgetter("name"))
+
+    def search(self, terms, limit=None):
+        """Get the users whose address has every one of the `terms`.
+
+        The terms and the addresses are split into words and numbers
+        (see :func:`tokenize`), ignoring case and punctuation, so
+        ``"main 12"`` finds ``"12 Main St."`` but not
+        ``"120 Main St."``.
+
+        By default, this method checks the address of every user from
+        :meth:`iter_read`. If your data store can index the words of
+        the addresses, this method can be overloaded to find them
+        without checking every user.
+
+        Args:
+            terms (str): The words and numbers to search for.
+
+        Keyword Args:
+            limit (int or None): The maximum number of users to get. If
+                None then every user found is returned.
+
+        Returns:
+            list(dict): The information for each user whose address has
+            every term, in the order they were added. Empty if the
+            `terms` have no words or numbers.
+
+        """
+        tokens = tokenize(terms)
+        if not tokens:
+            return []
+        users = (
+            user for user in self.iter_read() if tokens <= tokenize(user["address"])
+        )
+        return list(itertools.islice(users, limit))
+
     @abc.abstractmethod
     def read(self, filters=None):
         """Get user information from the data store.
 
         Keyword Args:
-            filters (dict(str, str) or None): The filters to use to
-                restrict the user information returned. Each key of the
-                dictionary is the name of the field to filter by. Each
-                value is a :mod:`glob`-compliant string that must be
-                true for the named field in order for the user to be
-                returned.
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. Each key of the dictionary is the name of the
+                field to filter by. Each value is a
+                :mod:`glob`-compliant string that must be true for the
+                named field in order for the user to be returned.
 
                 If multiple filters are provided, ALL filters must be
                 valid for a user's information for it to be returned.
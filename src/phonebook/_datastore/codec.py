@@ -0,0 +1,972 @@
+"""Codecs that read and write the users of the file data stores.
+
+Each codec reads and writes a whole list of users to an open file, so
+a :class:`~phonebook._datastore.file_.FileDataStore` can keep its users
+in any format. The modules a codec needs (e.g. :mod:`yaml` or
+:mod:`lzma`) are only imported when it is first used.
+"""
+
+
+import array
+import importlib
+import io
+import itertools
+import json
+import struct
+
+
+COMPRESSIONS = {"gzip": ".gz", "lzma": ".xz", "bz2": ".bz2"}
+"""dict(str, str): The extension of each supported compression."""
+
+# the bytes each compressed file starts with
+_MAGIC_NUMBERS = {"gzip": b"\x1f\x8b", "lzma": b"\xfd7zXZ\x00", "bz2": b"BZh"}
+
+_STR_TAG = "tag:yaml.org,2002:str"
+
+_FIXSTR_HEADERS = [bytes((0xA0 | length,)) for length in range(32)]
+_INT_FORMATS = (
+    (0, 0xFF, 0xCC, ">B"),
+    (0, 0xFFFF, 0xCD, ">H"),
+    (0, 0xFFFFFFFF, 0xCE, ">I"),
+    (0, 0xFFFFFFFFFFFFFFFF, 0xCF, ">Q"),
+    (-0x80, 0x7F, 0xD0, ">b"),
+    (-0x8000, 0x7FFF, 0xD1, ">h"),
+    (-0x80000000, 0x7FFFFFFF, 0xD2, ">i"),
+    (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF, 0xD3, ">q"),
+)
+# the struct format of the value (or length) following each header byte
+_STRUCTS = {
+    0xCA: struct.Struct(">f"),
+    0xCB: struct.Struct(">d"),
+    0xCC: struct.Struct(">B"),
+    0xCD: struct.Struct(">H"),
+    0xCE: struct.Struct(">I"),
+    0xCF: struct.Struct(">Q"),
+    0xD0: struct.Struct(">b"),
+    0xD1: struct.Struct(">h"),
+    0xD2: struct.Struct(">i"),
+    0xD3: struct.Struct(">q"),
+    0xD9: struct.Struct(">B"),
+    0xDA: struct.Struct(">H"),
+    0xDB: struct.Struct(">I"),
+    0xDC: struct.Struct(">H"),
+    0xDD: struct.Struct(">I"),
+    0xDE: struct.Struct(">H"),
+    0xDF: struct.Struct(">I"),
+}
+_CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+
+
+def has_libyaml():
+    """Check if PyYAML was built with the C-accelerated libyaml.
+
+    Returns:
+        bool: True if the YAML codec can use libyaml.
+
+    """
+    import yaml
+
+    return hasattr(yaml, "CSafeLoader")
+
+
+def has_msgpack():
+    """Check if the C-accelerated :mod:`msgpack` package is installed.
+
+    Returns:
+        bool: True if the binary codec can use :mod:`msgpack`.
+
+    """
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def detect_compression(file_path):
+    """Get the compression of the file at the given `file_path`.
+
+    An existing file's compression is detected from the bytes it starts
+    with, which are the same whatever its name. Otherwise it is guessed
+    from the file's extension.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str or None: The compression of the file, one of the keys of
+        :data:`COMPRESSIONS`, or None if it isn't compressed.
+
+    """
+    try:
+        with open(file_path, "rb") as data_file:
+            start = data_file.read(max(map(len, _MAGIC_NUMBERS.values())))
+    except FileNotFoundError:
+        start = b""
+    if start:
+        for compression, magic_number in _MAGIC_NUMBERS.items():
+            if start.startswith(magic_number):
+                return compression
+        return None
+
+    for compression, extension in COMPRESSIONS.items():
+        if file_path.endswith(extension):
+            return compression
+    return None
+
+
+class BaseCodec(object):
+    """The base class of the codecs that read and write users.
+
+    When subclassing make sure to define the "NAME" and "EXTENSION"
+    attributes, and set the "BINARY" attribute to True if the codec
+    reads and writes bytes rather than text.
+
+    """
+
+    NAME = None
+    EXTENSION = None
+    BINARY = False
+
+    def __repr__(self):
+        """Get the representation of the codec."""
+        return f"{self.__class__.__name__}()"
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given `data_file`.
+
+        Args:
+            data_file (io.IOBase): The file to read the users from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user read
+                as a dictionary. Its return value is used instead of the
+                dictionary, e.g. to convert each user into a record as
+                it is read.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.load")
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.IOBase): The file to write the users to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.dump")
+
+
+class JSONCodec(BaseCodec):
+    """Reads and writes a list of users as indented JSON."""
+
+    NAME = "json"
+    EXTENSION = ".json"
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given `data_file`.
+
+        Args:
+            data_file (io.TextIOBase): The file to read the users from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user read
+                as a dictionary. Its return value is used instead of the
+                dictionary.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not valid JSON.
+
+        """
+        # the users are the only objects in the file, so each one is
+        # decoded straight into what the hook returns
+        return json.load(data_file, object_hook=object_hook)
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.TextIOBase): The file to write the users to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        json.dump(users, data_file, indent=2, default=default)
+        return len(users)
+
+
+class CompactJSONCodec(JSONCodec):
+    """Reads and writes a list of users as JSON without any whitespace.
+
+    Leaving out the indentation lets :mod:`json` use its C-accelerated
+    encoder, which writes the users several times faster, and makes the
+    file about a quarter smaller.
+
+    """
+
+    NAME = "json-compact"
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.TextIOBase): The file to write the users to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        # `json.dump` never uses the C-accelerated encoder, `json.dumps`
+        # does when there is no indentation
+        data_file.write(json.dumps(users, separators=(",", ":"), default=default))
+        return len(users)
+
+
+class SlottedJSONCodec(BaseCodec):
+    """Reads and writes a list of users as JSON with a padded slot per user.
+
+    Each user is written on its own line and padded with spaces, so it
+    can later be overwritten in place by a slightly longer user without
+    moving the rest of the file, e.g.::
+
+        [
+        {"name":"Eric Idle","phone":"123-456-7890","address":"here"}          ,
+        null                                                                  ,
+        null]
+
+    A deleted user is overwritten with ``null`` (a tombstone), and the
+    final ``null`` lets users be appended by overwriting the end of the
+    file. The file is still valid JSON.
+
+    """
+
+    NAME = "json-slotted"
+    EXTENSION = ".json"
+    BINARY = True
+    END = b"null]\n"
+    # the smallest number of spaces a slot is padded with, and the
+    # fraction of the user's length to pad longer users with
+    MIN_PADDING = 16
+    PADDING_RATIO = 0.25
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given `data_file`.
+
+        Args:
+            data_file (io.BufferedIOBase): The file to read the users
+                from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user read
+                as a dictionary. Its return value is used instead of the
+                dictionary.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+
+        """
+        slots, _ = self.load_slots(data_file, object_hook=object_hook)
+        return [user for user in slots if user is not None]
+
+    def load_slots(self, data_file, object_hook=None):
+        """Read every slot in the given `data_file`.
+
+        Args:
+            data_file (io.BufferedIOBase): The file to read the slots
+                from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user read
+                as a dictionary. Its return value is used instead of the
+                dictionary.
+
+        Returns:
+            tuple(list, array.array or None): The user in each slot, or
+            None for a tombstone, and the offset each slot starts at
+            followed by the offset of the end of the file. The offsets
+            are None if the file is JSON that isn't laid out in slots
+            (e.g. written by :class:`JSONCodec`).
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+
+        """
+        data = data_file.read()
+        slots = json.loads(data, object_hook=object_hook)
+        if not isinstance(slots, list):
+            raise ValueError("The file must contain a list of users")
+
+        # the file is only laid out in slots if each element is on its
+        # own line between the opening bracket and the end
+        lines = data.split(b"\n")
+        if (
+            len(lines) != len(slots) + 2
+            or lines[0] != b"["
+            or lines[-2] + b"\n" != self.END
+            or lines[-1]
+        ):
+            return [user for user in slots if user is not None], None
+
+        del slots[-1]
+        offsets = array.array(
+            "q",
+            itertools.accumulate(
+                itertools.chain((2,), (len(line) + 1 for line in lines[1:-2]))
+            ),
+        )
+        return slots, offsets
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.BufferedIOBase): The file to write the users
+                to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        self.dump_slots(users, data_file, default=default)
+        return len(users)
+
+    def dump_slots(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` with a slot each.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.BufferedIOBase): The file to write the users
+                to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            array.array: The offset each user's slot starts at, followed
+            by the offset of the end of the file.
+
+        """
+        chunks = [b"[\n"]
+        offsets = array.array("q", [2])
+        for user in users:
+            chunks.append(self.encode(user, default=default))
+            offsets.append(offsets[-1] + len(chunks[-1]))
+        chunks.append(self.END)
+        data_file.write(b"".join(chunks))
+        return offsets
+
+    def encode(self, user, capacity=None, default=None):
+        """Encode the slot of the given `user`.
+
+        Args:
+            user (dict(str, str) or None): The user to encode, or None
+                for a tombstone.
+
+        Keyword Args:
+            capacity (int or None): The number of bytes the user is
+                padded to. If None then the user is padded with room to
+                grow.
+            default (callable or None): Called with a user that isn't a
+                dictionary to get the dictionary to write instead.
+
+        Returns:
+            bytes or None: The slot, including the separator and line
+            ending after it, or None if the user is longer than the
+            `capacity`.
+
+        """
+        # non-ASCII characters are escaped, so each character is a byte
+        encoded = json.dumps(user, separators=(",", ":"), default=default).encode(
+            "ascii"
+        )
+        if capacity is None:
+            capacity = len(encoded) + max(
+                self.MIN_PADDING, int(len(encoded) * self.PADDING_RATIO)
+            )
+        elif len(encoded) > capacity:
+            return None
+        return encoded + b" " * (capacity - len(encoded)) + b",\n"
+
+
+class YAMLCodec(BaseCodec):
+    """Reads and writes a list of users as YAML.
+
+    The users are parsed from, and emitted as, a stream of YAML events
+    one user at a time, rather than building the node graph of the whole
+    file, so only one user's nodes are held at once. The events are
+    parsed and emitted by libyaml's ``CSafeLoader`` and ``CSafeDumper``
+    when PyYAML was built with it, which is many times faster than the
+    pure-Python ``SafeLoader`` and ``SafeDumper`` used otherwise.
+
+    Every field of a user is read as a string, e.g. ``phone: 5551234``
+    is read as ``"5551234"`` rather than as a number.
+
+    """
+
+    NAME = "yaml"
+    EXTENSION = ".yaml"
+
+    def __init__(self, fast=True):
+        """Initialize the codec.
+
+        Keyword Args:
+            fast (bool): Use libyaml if it is available. If False then
+                the pure-Python parser and emitter are used.
+
+        """
+        import yaml
+
+        self.fast = fast and has_libyaml()
+        self._loader = yaml.CSafeLoader if self.fast else yaml.SafeLoader
+        self._dumper = yaml.CSafeDumper if self.fast else yaml.SafeDumper
+
+    def __repr__(self):
+        """Get the representation of the codec."""
+        return f"{self.__class__.__name__}(fast={self.fast!r})"
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given `data_file`.
+
+        Args:
+            data_file (io.TextIOBase): The file to read the users from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user as it
+                is parsed. Its return value is used instead of the
+                dictionary.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+            yaml.YAMLError: Raised when the file is not valid YAML.
+
+        """
+        users = self.iter_load(data_file)
+        if object_hook is not None:
+            users = map(object_hook, users)
+        return list(users)
+
+    def iter_load(self, data_file):
+        """Iterate over the users in the given `data_file`.
+
+        Args:
+            data_file (io.TextIOBase): The file to read the users from.
+
+        Yields:
+            dict(str, str): Each user, in order. An empty file has no
+            users.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+            yaml.YAMLError: Raised when the file is not valid YAML.
+
+        """
+        import yaml
+
+        events = yaml.parse(data_file, Loader=self._loader)
+        for event in events:
+            if isinstance(event, yaml.SequenceStartEvent):
+                break
+            if isinstance(event, (yaml.MappingStartEvent, yaml.ScalarEvent)):
+                raise ValueError("The YAML file must contain a list of users")
+        else:
+            return
+
+        for event in events:
+            if isinstance(event, yaml.SequenceEndEvent):
+                return
+            if not isinstance(event, yaml.MappingStartEvent):
+                raise ValueError("Each user in the YAML file must be a mapping")
+
+            user = {}
+            for key_event in events:
+                if isinstance(key_event, yaml.MappingEndEvent):
+                    break
+                value_event = next(events)
+                if not isinstance(key_event, yaml.ScalarEvent) or not isinstance(
+                    value_event, yaml.ScalarEvent
+                ):
+                    raise ValueError("The fields of each user must be strings")
+                user[key_event.value] = value_event.value
+            yield user
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (iterable): The users to write, in order.
+            data_file (io.TextIOBase): The file to write the users to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        import yaml
+
+        dumper = self._dumper(data_file, default_flow_style=False)
+        count = 0
+        try:
+            dumper.emit(yaml.StreamStartEvent())
+            dumper.emit(yaml.DocumentStartEvent(explicit=False))
+            dumper.emit(yaml.SequenceStartEvent(None, None, True, flow_style=False))
+            for count, user in enumerate(users, start=1):
+                if not isinstance(user, dict):
+                    user = default(user)
+                dumper.emit(yaml.MappingStartEvent(None, None, True, flow_style=False))
+                for field, value in user.items():
+                    dumper.emit(_scalar_event(dumper, field))
+                    dumper.emit(_scalar_event(dumper, value))
+                dumper.emit(yaml.MappingEndEvent())
+            dumper.emit(yaml.SequenceEndEvent())
+            dumper.emit(yaml.DocumentEndEvent(explicit=False))
+            dumper.emit(yaml.StreamEndEvent())
+        finally:
+            dumper.dispose()
+        return count
+
+
+class BinaryCodec(BaseCodec):
+    """Reads and writes a list of users as MessagePack.
+
+    `MessagePack <https://msgpack.org>`_ is a compact binary format of
+    the same types as JSON, which is smaller than JSON and faster to
+    parse, while unlike :mod:`pickle` it can't run code when read. The
+    C-accelerated :mod:`msgpack` package is used when it is installed,
+    otherwise the users are read and written in pure Python.
+
+    """
+
+    NAME = "binary"
+    EXTENSION = ".msgpack"
+    BINARY = True
+
+    def __init__(self, fast=True):
+        """Initialize the codec.
+
+        Keyword Args:
+            fast (bool): Use :mod:`msgpack` if it is installed. If False
+                then the users are read and written in pure Python.
+
+        """
+        self.fast = fast and has_msgpack()
+
+    def __repr__(self):
+        """Get the representation of the codec."""
+        return f"{self.__class__.__name__}(fast={self.fast!r})"
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given `data_file`.
+
+        Args:
+            data_file (io.BufferedIOBase): The file to read the users
+                from.
+
+        Keyword Args:
+            object_hook (callable or None): Called with each user read
+                as a dictionary. Its return value is used instead of the
+                dictionary.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+
+        """
+        data = data_file.read()
+        if self.fast:
+            import msgpack
+
+            users = msgpack.unpackb(data, raw=False, object_hook=object_hook)
+        else:
+            try:
+                users, end = _unpack(data, 0, object_hook)
+            except (IndexError, struct.error):
+                raise ValueError("The MessagePack data ended unexpectedly") from None
+            # a string cut short is only noticed by where it ends
+            if end != len(data):
+                raise ValueError("The MessagePack data has an unexpected length")
+        if not isinstance(users, list):
+            raise ValueError("The file must contain a list of users")
+        return users
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the `data_file` as a list.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.BufferedIOBase): The file to write the users
+                to.
+
+        Keyword Args:
+            default (callable or None): Called with each user that isn't
+                a dictionary to get the dictionary to write instead.
+
+        Returns:
+            int: The number of users written.
+
+        Raises:
+            ValueError: Raised when a field can't be written as
+                MessagePack.
+
+        """
+        if self.fast:
+            import msgpack
+
+            data_file.write(msgpack.packb(users, default=default))
+            return len(users)
+
+        buffer = bytearray()
+        _pack_length(buffer, len(users), 0x90, 16, 0xDC, 0xDD)
+        for user in users:
+            if not isinstance(user, dict):
+                user = default(user)
+            _pack_length(buffer, len(user), 0x80, 16, 0xDE, 0xDF)
+            for field, value in user.items():
+                _pack(buffer, field)
+                _pack(buffer, value)
+        data_file.write(buffer)
+        return len(users)
+
+
+class CompressedCodec(BaseCodec):
+    """Compresses the file of another codec.
+
+    The file is decompressed as it is read and compressed as it is
+    written, so the uncompressed file is never held in memory (unless
+    the wrapped codec holds it).
+
+    """
+
+    BINARY = True
+
+    def __init__(self, codec, compression="gzip", level=None):
+        """Initialize the codec.
+
+        Args:
+            codec (BaseCodec): The codec of the uncompressed file.
+
+        Keyword Args:
+            compression (str): The compression to use. One of the keys
+                of :data:`COMPRESSIONS`.
+            level (int or None): The compression level, from 0 (fastest)
+                to 9 (smallest), or from 1 for bz2. If None then the
+                compression's default level is used.
+
+        Raises:
+            ValueError: Raised when the `compression` isn't supported.
+
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.codec = codec
+        self.compression = compression
+        self.level = level
+        self.NAME = f"{codec.NAME}-{compression}"
+        self.EXTENSION = f"{codec.EXTENSION}{COMPRESSIONS[compression]}"
+
+    def __repr__(self):
+        """Get the representation of the codec."""
+        return (
+            f"{self.__class__.__name__}({self.codec!r}, "
+            f"compression={self.compression!r}, level={self.level!r})"
+        )
+
+    def load(self, data_file, object_hook=None):
+        """Read every user in the given compressed `data_file`.
+
+        Args:
+            data_file (io.BufferedIOBase): The file to read the users
+                from.
+
+        Keyword Args:
+            object_hook (callable or None): Passed to the wrapped
+                codec.
+
+        Returns:
+            list: The users, in order.
+
+        Raises:
+            ValueError: Raised when the file is not a list of users.
+            OSError: Raised when the file isn't compressed correctly.
+
+        """
+        with self._open(data_file, "rb") as compressed_file:
+            return self.codec.load(compressed_file, object_hook=object_hook)
+
+    def dump(self, users, data_file, default=None):
+        """Write the given `users` to the compressed `data_file`.
+
+        Args:
+            users (list): The users to write, in order.
+            data_file (io.BufferedIOBase): The file to write the users
+                to.
+
+        Keyword Args:
+            default (callable or None): Passed to the wrapped codec.
+
+        Returns:
+            int: The number of users written.
+
+        """
+        with self._open(data_file, "wb") as compressed_file:
+            return self.codec.dump(users, compressed_file, default=default)
+
+    def _open(self, data_file, mode):
+        """Open a (de)compressing file object over the given `data_file`.
+
+        Args:
+            data_file (io.BufferedIOBase): The compressed file.
+            mode (str): Either ``"rb"`` or ``"wb"``.
+
+        Returns:
+            io.IOBase: The uncompressed file, as text if the wrapped
+            codec reads and writes text. Closing it doesn't close the
+            `data_file`.
+
+        """
+        module = importlib.import_module(self.compression)
+        if self.level is None or mode == "rb":
+            # the level is only needed to compress
+            compressed_file = module.open(data_file, mode)
+        elif self.compression == "lzma":
+            compressed_file = module.open(data_file, mode, preset=self.level)
+        else:
+            compressed_file = module.open(data_file, mode, compresslevel=self.level)
+        if self.codec.BINARY:
+            return compressed_file
+        return io.TextIOWrapper(compressed_file, encoding="utf-8")
+
+
+def _scalar_event(dumper, value):
+    """Get the event that emits the given scalar `value`.
+
+    Args:
+        dumper (yaml.SafeDumper or yaml.CSafeDumper): The dumper to
+            represent and resolve the value with.
+        value (str or int or float or bool or None): The value to emit.
+
+    Returns:
+        yaml.ScalarEvent: The event of the value, which is quoted if it
+        would otherwise be read back as a different type.
+
+    """
+    import yaml
+
+    if isinstance(value, str):
+        # a quoted string is always read back as a string, so it only
+        # needs to be quoted if it would be read back as another type
+        plain = dumper.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG
+        return yaml.ScalarEvent(None, _STR_TAG, (plain, True), value)
+
+    node = dumper.represent_data(value)
+    if not isinstance(node, yaml.ScalarNode):
+        raise ValueError("The fields of each user must be strings")
+    implicit = (
+        node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+        node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+    )
+    return yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+
+
+def _pack_length(buffer, length, fix_header, fix_limit, header16, header32):
+    """Write the header of a MessagePack string, array, or map.
+
+    Args:
+        buffer (bytearray): The buffer to write the header to.
+        length (int): The length of the string, array, or map.
+        fix_header (int): The header that holds lengths up to
+            `fix_limit` itself.
+        fix_limit (int): The first length that doesn't fit in the
+            `fix_header`.
+        header16 (int): The header of a 16-bit length.
+        header32 (int): The header of a 32-bit length.
+
+    """
+    if length < fix_limit:
+        buffer.append(fix_header | length)
+    elif length <= 0xFFFF:
+        buffer.append(header16)
+        buffer += struct.pack(">H", length)
+    else:
+        buffer.append(header32)
+        buffer += struct.pack(">I", length)
+
+
+def _pack(buffer, value):
+    """Write a scalar `value` as MessagePack.
+
+    Args:
+        buffer (bytearray): The buffer to write the value to.
+        value (str or int or float or bool or None): The value to write.
+
+    Raises:
+        ValueError: Raised when the `value` isn't a scalar.
+
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        if len(encoded) < 32:
+            buffer += _FIXSTR_HEADERS[len(encoded)]
+        elif len(encoded) <= 0xFF:
+            buffer.append(0xD9)
+            buffer.append(len(encoded))
+        else:
+            _pack_length(buffer, len(encoded), 0xA0, 0, 0xDA, 0xDB)
+        buffer += encoded
+    elif value is None:
+        buffer.append(0xC0)
+    elif isinstance(value, bool):
+        buffer.append(0xC3 if value else 0xC2)
+    elif isinstance(value, int):
+        if -32 <= value < 128:
+            buffer += struct.pack(">b", value)
+            return
+        for minimum, maximum, header, int_format in _INT_FORMATS:
+            if minimum <= value <= maximum:
+                buffer.append(header)
+                buffer += struct.pack(int_format, value)
+                return
+        raise ValueError(f"The number is too large to write: {value}")
+    elif isinstance(value, float):
+        buffer.append(0xCB)
+        buffer += struct.pack(">d", value)
+    else:
+        raise ValueError(f"The fields of each user must be strings: {value!r}")
+
+
+def _unpack(data, position, object_hook):
+    """Read the MessagePack value at the given `position` of the `data`.
+
+    Args:
+        data (bytes): The MessagePack data.
+        position (int): The index of the value's first byte.
+        object_hook (callable or None): Called with each map read. Its
+            return value is used instead of the dictionary.
+
+    Returns:
+        tuple(object, int): The value, and the index of the byte after
+        it.
+
+    Raises:
+        ValueError: Raised when the value is a type that users can't
+            have, like binary data.
+        IndexError: Raised when the data ends before the value.
+        struct.error: Raised when the data ends before a number.
+
+    """
+    header = data[position]
+    position += 1
+    if 0xA0 <= header <= 0xBF:
+        end = position + (header & 0x1F)
+        return data[position:end].decode("utf-8"), end
+    if header <= 0x7F:
+        return header, position
+    if header >= 0xE0:
+        return header - 0x100, position
+    if header in _CONSTANTS:
+        return _CONSTANTS[header], position
+
+    if header <= 0x8F or header in (0xDE, 0xDF):
+        length, position = _unpack_length(data, position, header, 0x80)
+        user = {}
+        for _ in range(length):
+            # the fields are almost always short strings, which are read
+            # here rather than by another call
+            header = data[position]
+            if 0xA0 <= header <= 0xBF:
+                end = position + 1 + (header & 0x1F)
+                field = data[position + 1 : end].decode("utf-8")
+                position = end
+            else:
+                field, position = _unpack(data, position, object_hook)
+            header = data[position]
+            if 0xA0 <= header <= 0xBF:
+                end = position + 1 + (header & 0x1F)
+                user[field] = data[position + 1 : end].decode("utf-8")
+                position = end
+            else:
+                user[field], position = _unpack(data, position, object_hook)
+        return (user if object_hook is None else object_hook(user)), position
+
+    if header <= 0x9F or header in (0xDC, 0xDD):
+        length, position = _unpack_length(data, position, header, 0x90)
+        values = []
+        for _ in range(length):
+            value, position = _unpack(data, position, object_hook)
+            values.append(value)
+        return values, position
+
+    if header in (0xD9, 0xDA, 0xDB):
+        length, position = _unpack_length(data, position, header, 0xA0)
+        end = position + length
+        return data[position:end].decode("utf-8"), end
+
+    if header in _STRUCTS:
+        unpacker = _STRUCTS[header]
+        return unpacker.unpack_from(data, position)[0], position + unpacker.size
+
+    raise ValueError(f"Unsupported MessagePack type: 0x{header:02x}")
+
+
+def _unpack_length(data, position, header, fix_header):
+    """Read the length of a MessagePack string, array, or map.
+
+    Args:
+        data (bytes): The MessagePack data.
+        position (int): The index of the byte after the `header`.
+        header (int): The header of the string, array, or map.
+        fix_header (int): The header of the type that holds the length
+            itself.
+
+    Returns:
+        tuple(int, int): The length, and the index of the byte after it.
+
+    """
+    if header < 0xC0:
+        return header - fix_header, position
+    unpacker = _STRUCTS[header]
+    return unpacker.unpack_from(data, position)[0], position + unpacker.size
@@ -0,0 +1,943 @@
+"""The in-memory file data store engine, and the data stores built on it.
+
+A :class:`FileDataStore` keeps every user in memory and rewrites the
+whole file on each change, or in write-behind mode at most once every
+``flush_interval`` seconds. How the users are kept in the file is left
+to its codec (see :mod:`phonebook._datastore.codec`), so each format is
+a subclass that only picks its codec, name, and default path.
+"""
+
+
+import atexit
+import contextlib
+import copy
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+
+from .. import _exceptions, _query
+from . import base, codec, index, locking, record
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FileDataStore(base.BaseDataStore):
+    """A data store that keeps every user in memory and in a file.
+
+    When subclassing make sure to define the "NAME" and "_DEFAULT_PATH"
+    attributes, and set the "CODEC" attribute to the
+    :class:`~phonebook._datastore.codec.BaseCodec` that reads and writes
+    the file. Set the "COMPRESSION" attribute to always compress the
+    file, otherwise whether it is compressed is detected from the file.
+
+    """
+
+    CODEC = None
+    COMPRESSION = None
+
+    def __init__(
+        self,
+        file_path=None,
+        trigram_index=False,
+        auto_reload=False,
+        reload_interval=1.0,
+        compact=False,
+        compression=None,
+        compression_level=None,
+        write_behind=False,
+        flush_interval=1.0,
+        flush_changes=1000,
+    ):
+        """Initialize the data store.
+
+        Keyword Args:
+            file_path (str): The path of the data file the data store
+                will read. If None, then the default path will be used.
+            trigram_index (bool): Keep a
+                :class:`~phonebook._datastore.index.TrigramIndex` of the
+                users to speed up reading with filters like
+                ``"*Main St*"``, at the cost of memory and slower
+                changes.
+            auto_reload (bool): Reload the users whenever the data file
+                is changed by another process. The file's modification
+                time, size, and inode are checked before each access.
+            reload_interval (float): The minimum number of seconds
+                between checks of the data file when `auto_reload` is
+                enabled.
+            compact (bool): Keep the users in memory as
+                :class:`~phonebook._datastore.record.UserRecord` objects
+                rather than dictionaries, which uses about 40% less
+                memory at the cost of slower loading and filtering. A new
+                dictionary is created for each user returned.
+            compression (str or None): The compression of the data file,
+                one of the keys of
+                :data:`~phonebook._datastore.codec.COMPRESSIONS`. If None
+                then it is detected from the bytes the file starts with,
+                or if there is no file yet from its extension (e.g.
+                ``.json.gz``).
+            compression_level (int or None): The level the data file is
+                compressed with, from 0 (fastest) to 9 (smallest), or
+                from 1 for bz2. If None then the compression's default
+                level is used.
+            write_behind (bool): Only change the users in memory, and
+                write them to the data file in a background thread at
+                most `flush_interval` seconds later, so many changes
+                are written at once. Changes not written yet are written
+                by :meth:`flush`, :meth:`close`, and when the
+                interpreter exits. Changes made to the data file by
+                other processes aren't reloaded while there are changes
+                waiting to be written, and are overwritten by them.
+            flush_interval (float): The maximum number of seconds a
+                change waits to be written in write-behind mode.
+            flush_changes (int): The number of changes that are written
+                right away rather than waiting for the `flush_interval`
+                in write-behind mode.
+
+        """
+        self._init_state(
+            file_path,
+            trigram_index=trigram_index,
+            auto_reload=auto_reload,
+            reload_interval=reload_interval,
+            compact=compact,
+            write_behind=write_behind,
+            flush_interval=flush_interval,
+            flush_changes=flush_changes,
+        )
+        compression = (
+            compression or self.COMPRESSION or codec.detect_compression(self._file_path)
+        )
+        self._codec = self.CODEC
+        if compression is not None:
+            # the file is decompressed as it is read, and compressed as it
+            # is written, rather than all at once
+            self._codec = codec.CompressedCodec(
+                self.CODEC, compression, level=compression_level
+            )
+        with self._file_lock.exclusive():
+            if os.path.exists(self._file_path):
+                self.reload()
+            else:
+                self._users = []
+                self._index_users()
+                self._write()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group the changes made inside the context into one batch.
+
+        The changes are applied in memory and the data file is only
+        written once when the context exits. If an exception is raised
+        inside the context then all of the changes are discarded.
+
+        The data store and the data file are exclusively locked for the
+        duration of the context, and the file is reloaded first if
+        another process changed it.
+
+        Yields:
+            FileDataStore: This data store.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # nested batches are part of the outer batch
+                yield self
+                return
+
+            with self._file_lock.exclusive():
+                self._sync()
+                users = list(self._users)
+                pending_changes = self._pending_changes
+                self._in_batch = True
+                try:
+                    yield self
+                except BaseException:
+                    self._users = users
+                    self._index_users()
+                    self._pending_changes = pending_changes
+                    raise
+                finally:
+                    self._in_batch = False
+                self._save()
+
+    def get(self, name):
+        """Get a single user's information from the data store.
+
+        Args:
+            name (str): The name of the user to get from the data store.
+
+        Returns:
+            dict(str, str): The information for the requested user.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the requested user
+                does not exist in the data store.
+
+        """
+        self._refresh()
+        with self._lock.read():
+            user = self._user(name)
+        if user is None:
+            raise _exceptions.MissingUserError(
+                f"Unable to find a user with '{name}' name!"
+            )
+        return user.to_dict() if self._compact else user
+
+    def read(self, filters=None):
+        """Get user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. Each key of the dictionary is the name of the
+                field to filter by. Each value is a
+                :mod:`fnmatch`-compliant string that must be true for
+                the named field in order for the user to be returned.
+
+                If multiple filters are provided, ALL filters must be
+                valid for a user's information for it to be returned.
+
+                If None then no filters are applied and all user
+                information is returned.
+
+        Returns:
+            list(dict): The list of information for each user that
+            matches the given `filters`.
+
+        """
+        return list(self.iter_read(filters=filters))
+
+    def iter_read(self, filters=None, limit=None, offset=None, after=None):
+        """Iterate over user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. See :meth:`read` for details.
+            limit (int or None): The maximum number of users to return.
+                If None then all matching users are returned.
+            offset (int or None): The number of matching users to skip
+                before returning any.
+            after (str or None): The name of the last user returned by
+                the previous page. Only the users after it are returned.
+
+        Returns:
+            iterator(dict): The information for each user that matches
+            the given `filters`.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the `after` user
+                does not exist in the data store.
+
+        """
+        self._refresh()
+        with self._lock.read():
+            query = _query.Query.compile(filters)
+            after_position = -1
+            if after is not None:
+                after_position = self._positions.get(after)
+                if after_position is None:
+                    raise _exceptions.MissingUserError(
+                        f"User '{after}' does not exist in the data store!"
+                    )
+
+            name = query.exact("name")
+            prefix = query.prefix("name")
+            candidate_names = None
+            if name is None and self._trigram_index is not None:
+                candidate_names = self._trigram_index.candidates(query, after=after)
+
+            if name is not None:
+                # an exact name can match at most one user, so use the index
+                # rather than scanning every user
+                position = self._positions.get(name, -1)
+                users = [self._users[position]] if position > after_position else []
+            elif candidate_names is not None:
+                # only the users containing all of the literal text of the
+                # filters can match
+                users = (self._users[self._positions[name]] for name in candidate_names)
+            elif prefix is not None:
+                # only the users in the prefix's range of the name index
+                # can match, which are put back in order by their positions
+                positions = sorted(
+                    position
+                    for position in map(
+                        self._positions.__getitem__,
+                        self._name_index.complete(prefix),
+                    )
+                    if position > after_position
+                )
+                users = map(self._users.__getitem__, positions)
+            else:
+                # start right after the `after` user's position rather
+                # than skipping the users before it
+                users = map(
+                    self._users.__getitem__, range(after_position + 1, len(self._users))
+                )
+
+            # collect the users while the lock is held so changes made by
+            # other threads can't affect the iteration
+            users = list(
+                base.paginate(
+                    (
+                        user
+                        for user in users
+                        if user is not None and query.matches(user)
+                    ),
+                    limit=limit,
+                    offset=offset,
+                )
+            )
+        if self._compact:
+            # only the records are collected, and each is converted as it
+            # is iterated so the dictionaries are never all held at once
+            return map(record.UserRecord.to_dict, users)
+        return iter(users)
+
+    def complete(self, prefix, limit=None):
+        """Get the names of the users that start with the given `prefix`.
+
+        The names are found with a binary search of a sorted index of
+        the names rather than by checking every user.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        self._refresh()
+        with self._lock.read():
+            return self._name_index.complete(prefix, limit=limit)
+
+    def lookup_phone(self, number, digits=None):
+        """Get the users with the given phone `number`.
+
+        The users are found in a
+        :class:`~phonebook._datastore.index.PhoneIndex` of their
+        normalized phone numbers rather than by checking every user. The
+        index is built by the first lookup and kept up to date as the
+        users are changed.
+
+        Args:
+            number (str): The phone number to look up.
+
+        Keyword Args:
+            digits (int or None): Only match the last this many digits
+                of the phone numbers, e.g. to ignore a country or area
+                code. If None then every digit must match.
+
+        Returns:
+            list(dict): The information for each user with the phone
+            number, sorted by name.
+
+        Raises:
+            ValueError: Raised when `digits` is less than one.
+
+        """
+        self._refresh()
+        with self._lock.read():
+            if self._phone_index is None:
+                self._phone_index = index.PhoneIndex(self._iter_users())
+            users = self._phone_index.lookup(number, digits=digits)
+        if self._compact:
+            return [user.to_dict() for user in users]
+        return users
+
+    def search(self, terms, limit=None):
+        """Get the users whose address has every one of the `terms`.
+
+        The users are found in a
+        :class:`~phonebook._datastore.index.TokenIndex` of the words and
+        numbers of their addresses rather than by checking every user.
+        The index is built by the first search and kept up to date as
+        the users are changed.
+
+        Args:
+            terms (str): The words and numbers to search for, e.g.
+                ``"main 12"``. Case and punctuation are ignored.
+
+        Keyword Args:
+            limit (int or None): The maximum number of users to get. If
+                None then every user found is returned.
+
+        Returns:
+            list(dict): The information for each user whose address has
+            every term, in the order they were added.
+
+        """
+        self._refresh()
+        with self._lock.read():
+            if self._token_index is None:
+                self._token_index = index.TokenIndex(self._iter_users())
+            names = self._token_index.search(terms)
+            users = [
+                self._users[self._positions[name]]
+                for name in itertools.islice(names, limit)
+            ]
+        if self._compact:
+            return [user.to_dict() for user in users]
+        return users
+
+    def create(self, user):
+        """Add the given `user` to the data store.
+
+        Args:
+            user (dict(str, str)): The user information to add to the
+                data store.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with the
+                given `name` already exists in the data store.
+
+        """
+        with self._modify():
+            self._create(user)
+
+    def delete(self, name):
+        """Delete the user with given `name` from the data store.
+
+        Args:
+            name (str): The name of the user to delete from the data
+                store.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+
+        """
+        with self._modify():
+            self._delete(name)
+
+    def update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the data store.
+
+        Args:
+            user_name (str): The name of the user to update from the
+                data store.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with. The valid options
+                are:
+
+                * **name**: The name to update the user to.
+                * **phone**: The phone number to update the user to.
+                * **address**: The address to update the user to.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        with self._modify():
+            self._update(user_name, **user_fields)
+
+    def flush(self):
+        """Write the changes that are waiting to be written in write-behind mode.
+
+        Does nothing if there are no such changes, or a batch is in
+        progress.
+
+        """
+        with self._lock.write():
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_changes or self._in_batch:
+                return
+
+            self._write()
+            self._pending_changes = 0
+
+    def close(self):
+        """Write any changes waiting to be written, and stop writing at exit.
+
+        In write-behind mode the changes are no longer written when the
+        interpreter exits, until the next change is made.
+
+        """
+        with self._lock.write():
+            self.flush()
+            if self._at_exit is not None:
+                atexit.unregister(self._at_exit)
+                self._at_exit = None
+
+    def reload(self):
+        """Reload the internal data store from the data file.
+
+        Any changes waiting to be written in write-behind mode are
+        discarded, so call :meth:`flush` first to keep them.
+
+        """
+        _LOGGER.debug(f"Reloading data store: {self._file_path}")
+        with self._lock.write():
+            self._pending_changes = 0
+            mode = "rb" if self._codec.BINARY else "r"
+            with self._file_lock.shared(), open(self._file_path, mode) as data_file:
+                # stat the file that is actually read, before reading it,
+                # so a change made while it is read is seen by the next
+                # check
+                self._checked(_signature(os.fstat(data_file.fileno())))
+                self._users = self._load(data_file)
+            self._index_users()
+
+    def _load(self, data_file):
+        """Read the users from the open data file.
+
+        Args:
+            data_file (io.IOBase): The data file to read.
+
+        Returns:
+            list: The users, in order.
+
+        """
+        # convert each user straight into a record as it is read so the
+        # dictionaries are never all held at once
+        return self._codec.load(
+            data_file,
+            object_hook=record.UserRecord.from_dict if self._compact else None,
+        )
+
+    def _init_state(
+        self,
+        file_path,
+        trigram_index=False,
+        auto_reload=False,
+        reload_interval=1.0,
+        compact=False,
+        write_behind=False,
+        flush_interval=1.0,
+        flush_changes=1000,
+    ):
+        """Initialize the state of the data store, without loading the users.
+
+        Subclasses that load the users themselves call this rather than
+        :meth:`__init__`. See :meth:`__init__` for the arguments.
+
+        Args:
+            file_path (str or None): The path of the data file.
+
+        """
+        self._file_path = file_path or self._DEFAULT_PATH
+        self._in_batch = False
+        self._write_behind = write_behind
+        self._flush_interval = flush_interval
+        self._flush_changes = flush_changes
+        # the number of changes not written to the data file yet, the
+        # timer that writes them, and the function that writes them when
+        # the interpreter exits
+        self._pending_changes = 0
+        self._flush_timer = None
+        self._at_exit = None
+        self._auto_reload = auto_reload
+        self._reload_interval = reload_interval
+        self._file_signature = None
+        self._last_checked = None
+        self._trigram_index = index.TrigramIndex() if trigram_index else None
+        # built by the first phone number lookup and address search
+        self._phone_index = None
+        self._token_index = None
+        self._compact = compact
+        self._lock = locking.ReadWriteLock()
+        self._file_lock = locking.FileLock(self._file_path)
+
+    def _refresh(self):
+        """Reload the users if the data file was changed by another process.
+
+        Does nothing unless `auto_reload` is enabled, a batch is not in
+        progress, and at least `reload_interval` seconds have passed
+        since the file was last checked.
+
+        """
+        if not self._auto_reload or self._in_batch:
+            return
+        if time.monotonic() - self._last_checked < self._reload_interval:
+            return
+
+        self._last_checked = time.monotonic()
+        self._sync()
+
+    def _sync(self):
+        """Reload the users if the data file was changed by another process.
+
+        The file has changed if its modification time, size, or inode
+        differ from when it was last read or written by the data store.
+        The users aren't reloaded while there are changes waiting to be
+        written in write-behind mode.
+
+        """
+        if self._pending_changes:
+            return
+
+        try:
+            file_signature = _signature(os.stat(self._file_path))
+        except FileNotFoundError:
+            # keep the current users until the file is replaced
+            return
+        if file_signature != self._file_signature:
+            self.reload()
+
+    def _checked(self, file_signature):
+        """Record the state of the data file as of the latest check.
+
+        Args:
+            file_signature (tuple or None): The signature of the file.
+
+        """
+        self._file_signature = file_signature
+        self._last_checked = time.monotonic()
+
+    def _index_users(self):
+        """Rebuild the indexes of the in-memory users."""
+        self._compact_users()
+        self._name_index = index.NameIndex(self._positions)
+        if self._phone_index is not None:
+            self._phone_index = index.PhoneIndex(self._users)
+        if self._token_index is not None:
+            self._token_index = index.TokenIndex(self._users)
+        if self._trigram_index is not None:
+            self._trigram_index = index.TrigramIndex(self._users)
+
+    def _compact_users(self):
+        """Remove the holes left by deleted users from the in-memory users.
+
+        Deleting a user leaves a hole (None) at its position rather than
+        moving every user after it, and the holes are removed once they
+        make up half of the users, so deleting is O(1) amortized.
+
+        """
+        self._users = [user for user in self._users if user is not None]
+        self._positions = {
+            user["name"]: position for position, user in enumerate(self._users)
+        }
+        self._holes = 0
+
+    def _iter_users(self):
+        """Iterate over the in-memory users in order.
+
+        Yields:
+            dict(str, str) or phonebook._datastore.record.UserRecord: Each
+            user, skipping the holes left by deleted users.
+
+        """
+        return (user for user in self._users if user is not None)
+
+    def _user(self, name):
+        """Get the in-memory user with the given `name`.
+
+        Args:
+            name (str): The name of the user.
+
+        Returns:
+            dict(str, str) or phonebook._datastore.record.UserRecord or
+            None: The user, or None if there is no user with the name.
+
+        """
+        position = self._positions.get(name)
+        return None if position is None else self._users[position]
+
+    @contextlib.contextmanager
+    def _modify(self):
+        """Write the changes made to the users inside the context.
+
+        The data file is exclusively locked and reloaded first if
+        another process changed it, so changes made by other processes
+        aren't lost. If a batch is in progress the changes are left for
+        the batch to write instead.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # only the thread holding the lock can be in the batch
+                yield
+                self._pending_changes += 1
+                return
+
+            with self._file_lock.exclusive():
+                self._sync()
+                yield
+                self._pending_changes += 1
+                self._save()
+
+    def _save(self):
+        """Write the changes made to the users.
+
+        In write-behind mode the changes are left for the flush timer to
+        write, unless there are `flush_changes` of them.
+
+        """
+        if not self._write_behind or self._pending_changes >= self._flush_changes:
+            self.flush()
+            return
+
+        if self._flush_timer is None:
+            # holds a reference to the data store until the changes are
+            # written
+            self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        if self._at_exit is None:
+            self._at_exit = _flush_at_exit(weakref.ref(self))
+            atexit.register(self._at_exit)
+
+    def _write(self):
+        """Write the internal data store to the data file."""
+        _LOGGER.debug(f"Writing to data store: {self._file_path}")
+        mode = "wb" if self._codec.BINARY else "w"
+        if self._holes:
+            self._compact_users()
+        with self._file_lock.exclusive():
+            with locking.atomic_write(self._file_path, mode) as data_file:
+                self._dump(data_file)
+            self._checked(_signature(os.stat(self._file_path)))
+
+    def _dump(self, data_file):
+        """Write the users to the open data file.
+
+        Args:
+            data_file (io.IOBase): The data file to write.
+
+        """
+        self._codec.dump(self._users, data_file, default=record.UserRecord.to_dict)
+
+    def _create(self, user):
+        """Add the given `user` to the in-memory users.
+
+        Args:
+            user (dict(str, str)): The user information to add.
+
+        Returns:
+            dict(str, str): The added user with unknown fields removed.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with the
+                given `name` already exists in the data store.
+
+        """
+        user = base.validate(user)
+
+        # ensure the given user doesn't already exist
+        if user["name"] in self._positions:
+            raise _exceptions.DuplicateUserError(
+                f"User '{user['name']}' already exists in the data store!"
+            )
+
+        stored_user = self._stored(user)
+        self._positions[user["name"]] = len(self._users)
+        self._users.append(stored_user)
+        self._name_index.add(user["name"])
+        if self._phone_index is not None:
+            self._phone_index.add(stored_user)
+        if self._token_index is not None:
+            self._token_index.add(stored_user)
+        if self._trigram_index is not None:
+            self._trigram_index.add(stored_user)
+        return user
+
+    def _delete(self, name):
+        """Delete the user with given `name` from the in-memory users.
+
+        Args:
+            name (str): The name of the user to delete.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+
+        """
+        # ensure the given user exists
+        position = self._positions.pop(name, None)
+        if position is None:
+            raise _exceptions.MissingUserError(
+                f"User '{name}' does not exist in the data store!"
+            )
+
+        existing_user = self._users[position]
+        self._users[position] = None
+        self._holes += 1
+        if self._holes > len(self._users) // 2:
+            self._compact_users()
+        self._name_index.remove(name)
+        if self._phone_index is not None:
+            self._phone_index.remove(existing_user)
+        if self._token_index is not None:
+            self._token_index.remove(existing_user)
+        if self._trigram_index is not None:
+            self._trigram_index.remove(existing_user)
+
+    def _update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the in-memory users.
+
+        Args:
+            user_name (str): The name of the user to update.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with.
+
+        Returns:
+            dict(str, str): The updated user.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        user_fields = base.validate(user_fields, ignore_required_fields=True)
+        new_name = user_fields.get("name", user_name)
+
+        # ensure the given user exists
+        position = self._positions.get(user_name)
+        if position is None:
+            raise _exceptions.MissingUserError(
+                f"User '{user_name}' does not exist in the data store!"
+            )
+        # ensure the given user doesn't already exist (if they changed
+        # the user name)
+        if new_name != user_name and new_name in self._positions:
+            raise _exceptions.DuplicateUserError(
+                f"User '{new_name}' already exists in the data store!"
+            )
+
+        original_user = self._users[position]
+        if self._compact:
+            updated_user = original_user.to_dict()
+        else:
+            updated_user = copy.copy(original_user)
+        updated_user.update(user_fields)
+        stored_user = self._stored(updated_user)
+        self._users[position] = stored_user
+        if new_name != user_name:
+            del self._positions[user_name]
+            self._positions[new_name] = position
+            self._name_index.remove(user_name)
+            self._name_index.add(new_name)
+        if self._phone_index is not None:
+            self._phone_index.replace(original_user, stored_user)
+        if self._token_index is not None:
+            self._token_index.replace(original_user, stored_user)
+        if self._trigram_index is not None:
+            self._trigram_index.replace(original_user, stored_user)
+        return updated_user
+
+    def _stored(self, user):
+        """Get the form the given `user` is kept in memory in.
+
+        Args:
+            user (dict(str, str)): The validated user information.
+
+        Returns:
+            dict(str, str) or phonebook._datastore.record.UserRecord: A
+            record of the user if the data store is compact, otherwise
+            the user itself.
+
+        """
+        return record.UserRecord.from_dict(user) if self._compact else user
+
+
+class CompactJSONDataStore(FileDataStore):
+    """Keeps the users in a JSON file without any whitespace.
+
+    The file is written several times faster than the ``json`` data
+    store's indented file, and is about a quarter smaller.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook_compact.json")
+    NAME = "json-compact"
+    CODEC = codec.CompactJSONCodec()
+
+
+class BinaryDataStore(FileDataStore):
+    """Keeps the users in a MessagePack file.
+
+    The file is the smallest of the uncompressed formats and, unlike a
+    :mod:`pickle`, can't run code when it is read. It is read and written
+    fastest when the :mod:`msgpack` package is installed.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.msgpack")
+    NAME = "binary"
+    CODEC = codec.BinaryCodec()
+
+
+class GzipJSONDataStore(FileDataStore):
+    """Keeps the users in a gzip-compressed JSON file.
+
+    The file is about a seventh of the size of the ``json`` data store's
+    file, at the cost of slower writes.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.json.gz")
+    NAME = "json-gzip"
+    CODEC = codec.CompactJSONCodec()
+    COMPRESSION = "gzip"
+
+
+class LZMAJSONDataStore(FileDataStore):
+    """Keeps the users in an LZMA-compressed JSON file.
+
+    The file is about a tenth of the size of the ``json`` data store's
+    file, at the cost of much slower writes.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.json.xz")
+    NAME = "json-lzma"
+    CODEC = codec.CompactJSONCodec()
+    COMPRESSION = "lzma"
+
+
+def _flush_at_exit(data_store_ref):
+    """Get a function that flushes the changes of a data store.
+
+    Args:
+        data_store_ref (weakref.ref): A weak reference to the data
+            store, so registering the function with :mod:`atexit`
+            doesn't keep the data store alive.
+
+    Returns:
+        callable: The function.
+
+    """
+
+    def flush():
+        data_store = data_store_ref()
+        if data_store is not None:
+            data_store.flush()
+
+    return flush
+
+
+def _signature(stat_result):
+    """Get the signature used to tell if a file has been changed.
+
+    Args:
+        stat_result (os.stat_result): The status of the file.
+
+    Returns:
+        tuple(int, int, int): The modification time in nanoseconds, size,
+        and inode of the file.
+
+    """
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
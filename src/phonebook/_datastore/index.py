@@ -0,0 +1,446 @@
+"""Indexes the data stores can keep over their in-memory users."""
+
+
+import bisect
+import collections
+import itertools
+import operator
+
+from . import base
+
+
+class _InvertedIndex(object):
+    """An inverted index of the terms in each user's fields.
+
+    Each term maps to the names of the users with that term in one of
+    the indexed fields, and the users keep their position so the users
+    found can be returned in order. Subclasses define the fields to
+    index and the terms of a value.
+
+    """
+
+    FIELDS = ()
+    """tuple(str): The fields of the users that are indexed."""
+
+    def __init__(self, users=()):
+        """Initialize the index.
+
+        Keyword Args:
+            users (iterable(dict(str, str))): The users to index, in
+                order.
+
+        """
+        self._postings = {field: collections.defaultdict(set) for field in self.FIELDS}
+        self._positions = {}
+        self._next_position = 0
+        for user in users:
+            self.add(user)
+
+    def add(self, user, position=None):
+        """Add the given `user` to the index.
+
+        Args:
+            user (dict(str, str)): The user to add.
+
+        Keyword Args:
+            position (int or None): The position of the user relative
+                to the other users. If None then the user is positioned
+                after every other user.
+
+        """
+        if position is None:
+            position = self._next_position
+            self._next_position += 1
+        self._positions[user["name"]] = position
+        for field in self.FIELDS:
+            postings = self._postings[field]
+            for term in self._terms(user[field]):
+                postings[term].add(user["name"])
+
+    def remove(self, user):
+        """Remove the given `user` from the index.
+
+        Args:
+            user (dict(str, str)): The user to remove.
+
+        """
+        del self._positions[user["name"]]
+        for field in self.FIELDS:
+            postings = self._postings[field]
+            for term in self._terms(user[field]):
+                names = postings[term]
+                names.discard(user["name"])
+                if not names:
+                    del postings[term]
+
+    def replace(self, old_user, new_user):
+        """Replace the `old_user` in the index with the `new_user`.
+
+        The new user keeps the position of the old user.
+
+        Args:
+            old_user (dict(str, str)): The user to remove.
+            new_user (dict(str, str)): The user to add in its place.
+
+        """
+        position = self._positions[old_user["name"]]
+        self.remove(old_user)
+        self.add(new_user, position=position)
+
+    def _terms(self, value):
+        """Get the terms of the given `value` to index.
+
+        Args:
+            value (str): The value of an indexed field.
+
+        Returns:
+            set(str): The terms of the value.
+
+        """
+        raise NotImplementedError
+
+    def _intersect(self, postings, after=None):
+        """Get the names of the users in every one of the `postings`.
+
+        Args:
+            postings (list(set(str))): The names of the users with each
+                term.
+
+        Keyword Args:
+            after (str or None): Only get the users positioned after the
+                user with this name.
+
+        Returns:
+            list(str): The names of the users with every term, in order.
+
+        """
+        # start from the rarest term so the intersection stays small
+        postings = sorted(postings, key=len)
+        names = set(postings[0])
+        for other_names in postings[1:]:
+            if not names:
+                break
+            names &= other_names
+
+        if after is not None:
+            after_position = self._positions[after]
+            names = {name for name in names if self._positions[name] > after_position}
+        return sorted(names, key=self._positions.__getitem__)
+
+
+class TrigramIndex(_InvertedIndex):
+    """An inverted index of the trigrams in each user's fields.
+
+    Every value matching a filter contains the literal text of the
+    filter's pattern, and so contains every trigram (i.e. three
+    character substring) of that text. Intersecting the users containing
+    each of those trigrams narrows the users that need to be checked
+    against the pattern, even for patterns like ``"*Main St*"`` that
+    can't use a sorted or hash index.
+
+    """
+
+    FIELDS = ("name", "phone", "address")
+    """tuple(str): The fields of the users that are indexed."""
+
+    def candidates(self, query, after=None):
+        """Get the names of the users that might match the `query`.
+
+        Args:
+            query (phonebook.Query): The query to find the users for.
+
+        Keyword Args:
+            after (str or None): Only get the users positioned after the
+                user with this name.
+
+        Returns:
+            list(str) or None: The names of the users that might match,
+            in order. None if the query has no literal text of at least
+            three characters in the indexed fields, so every user might
+            match.
+
+        """
+        postings = []
+        for field in self.FIELDS:
+            for literal in query.literals(field):
+                for trigram in _trigrams(literal):
+                    postings.append(self._postings[field].get(trigram, set()))
+        if not postings:
+            return None
+        return self._intersect(postings, after=after)
+
+    def _terms(self, value):
+        """Get the trigrams of the given `value` to index."""
+        return _trigrams(value)
+
+
+class TokenIndex(_InvertedIndex):
+    """An inverted index of the words and numbers in each user's address.
+
+    Each token (see :func:`~phonebook._datastore.base.tokenize`) maps to
+    the users whose address contains it, so the users with every token
+    of a search are found by intersecting their postings, starting from
+    the rarest token, rather than by checking every address.
+
+    """
+
+    FIELDS = ("address",)
+    """tuple(str): The fields of the users that are indexed."""
+
+    def search(self, terms):
+        """Get the names of the users whose address has every term.
+
+        Args:
+            terms (str): The words and numbers to search for, separated
+                by spaces or punctuation. Case is ignored.
+
+        Returns:
+            list(str): The names of the users whose address has every
+            token of the `terms`, in order. Empty if the terms have no
+            tokens.
+
+        """
+        postings = [
+            self._postings["address"].get(token, set())
+            for token in base.tokenize(terms)
+        ]
+        if not postings:
+            return []
+        return self._intersect(postings)
+
+    def _terms(self, value):
+        """Get the tokens of the given `value` to index."""
+        return base.tokenize(value)
+
+
+class NameIndex(object):
+    """A sorted index of the names of the users.
+
+    The names starting with a prefix are next to each other in the
+    index, so they are found with a binary search in ``O(log N + k)``
+    time rather than by checking every user.
+
+    New names are appended and the index is only sorted again when it is
+    next searched, so adding many names at once (e.g. in a batch) costs
+    a single sort rather than an insertion into the middle of the index
+    for each name.
+
+    """
+
+    def __init__(self, names=()):
+        """Initialize the index.
+
+        Keyword Args:
+            names (iterable(str)): The names to index.
+
+        """
+        self._names = sorted(names)
+        self._sorted = True
+
+    def add(self, name):
+        """Add the given `name` to the index.
+
+        Args:
+            name (str): The name to add.
+
+        """
+        if self._sorted and self._names and name < self._names[-1]:
+            self._sorted = False
+        self._names.append(name)
+
+    def remove(self, name):
+        """Remove the given `name` from the index.
+
+        Args:
+            name (str): The name to remove.
+
+        """
+        names = self._sorted_names()
+        del names[bisect.bisect_left(names, name)]
+
+    def complete(self, prefix, limit=None):
+        """Get the names that start with the given `prefix`.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        names = self._sorted_names()
+        start = bisect.bisect_left(names, prefix)
+        stop = len(names) if limit is None else min(start + limit, len(names))
+        return list(
+            itertools.takewhile(
+                lambda name: name.startswith(prefix),
+                # index the names rather than slicing them, so only the
+                # names with the prefix are copied
+                (names[index] for index in range(start, stop)),
+            )
+        )
+
+    def _sorted_names(self):
+        """Get the names, sorting them first if names were appended.
+
+        Returns:
+            list(str): The sorted names.
+
+        """
+        if not self._sorted:
+            # the names are a sorted run followed by the appended names,
+            # which are merged in close to linear time
+            self._names.sort()
+            self._sorted = True
+        return self._names
+
+
+class PhoneIndex(object):
+    """A hash index of the users by their normalized phone number.
+
+    The users are found by the digits of their phone number (see
+    :func:`~phonebook._datastore.base.normalize_phone`) in ``O(1)``
+    time, however the numbers are formatted. The digit strings are also
+    kept reversed in a :class:`NameIndex`, where the numbers ending with
+    the same digits are next to each other, so the users are found by
+    the last digits of their phone number with a binary search.
+
+    """
+
+    def __init__(self, users=()):
+        """Initialize the index.
+
+        Keyword Args:
+            users (iterable(dict(str, str))): The users to index.
+
+        """
+        # keyed by the reversed digits, so the keys are shared with the
+        # sorted index. Most numbers have a single user, which is kept
+        # as-is rather than in a container, and the users sharing a
+        # number are kept in a tuple
+        self._users_by_digits = {}
+        for user in users:
+            self._add(base.normalize_phone(user["phone"])[::-1], user)
+        self._reversed_digits = NameIndex(self._users_by_digits)
+
+    def add(self, user):
+        """Add the given `user` to the index.
+
+        Args:
+            user (dict(str, str)): The user to add.
+
+        """
+        key = base.normalize_phone(user["phone"])[::-1]
+        if key not in self._users_by_digits:
+            self._reversed_digits.add(key)
+        self._add(key, user)
+
+    def remove(self, user):
+        """Remove the given `user` from the index.
+
+        Args:
+            user (dict(str, str)): The user to remove.
+
+        """
+        key = base.normalize_phone(user["phone"])[::-1]
+        # users are found by identity, as records don't compare equal
+        users = [other for other in self._users(key) if other is not user]
+        if not users:
+            del self._users_by_digits[key]
+            self._reversed_digits.remove(key)
+        elif len(users) == 1:
+            self._users_by_digits[key] = users[0]
+        else:
+            self._users_by_digits[key] = tuple(users)
+
+    def replace(self, old_user, new_user):
+        """Replace the `old_user` in the index with the `new_user`.
+
+        Args:
+            old_user (dict(str, str)): The user to remove.
+            new_user (dict(str, str)): The user to add in its place.
+
+        """
+        self.remove(old_user)
+        self.add(new_user)
+
+    def lookup(self, number, digits=None):
+        """Get the users with the given phone `number`.
+
+        Args:
+            number (str): The phone number to look up.
+
+        Keyword Args:
+            digits (int or None): Only match the last this many digits
+                of the phone numbers. If None then every digit must
+                match.
+
+        Returns:
+            list(dict(str, str)): The users with the phone number,
+            sorted by name.
+
+        Raises:
+            ValueError: Raised when `digits` is less than one.
+
+        """
+        key = base.normalize_phone(number, digits=digits)
+        if not key:
+            return []
+        if digits is None:
+            users = self._users(key[::-1])
+        else:
+            users = [
+                user
+                for reversed_key in self._reversed_digits.complete(key[::-1])
+                for user in self._users(reversed_key)
+            ]
+        return sorted(users, key=operator.itemgetter("name"))
+
+    def _add(self, key, user):
+        """Add the given `user` to the users with the reversed digits `key`.
+
+        Args:
+            key (str): The reversed digits of the user's phone number.
+            user (dict(str, str)): The user to add.
+
+        """
+        users = self._users_by_digits.get(key)
+        if users is None:
+            self._users_by_digits[key] = user
+        elif isinstance(users, tuple):
+            self._users_by_digits[key] = users + (user,)
+        else:
+            self._users_by_digits[key] = (users, user)
+
+    def _users(self, key):
+        """Get the users with the reversed digits `key`.
+
+        Args:
+            key (str): The reversed digits of the phone number.
+
+        Returns:
+            tuple(dict(str, str)): The users with the phone number.
+
+        """
+        users = self._users_by_digits.get(key, ())
+        return users if isinstance(users, tuple) else (users,)
+
+
+def _trigrams(value):
+    """Get the trigrams of the given `value`.
+
+    Args:
+        value (str): The value to get the trigrams of.
+
+    Returns:
+        set(str): Each three character substring of the `value`. Empty
+        if the value is shorter than three characters or not a string.
+
+    """
+    if not isinstance(value, str):
+        return set()
+    return {value[index : index + 3] for index in range(len(value) - 2)}
@@ -0,0 +1,476 @@
+"""The journal data store used to access the information for Phonebook.
+
+Rather than rewriting every user on each change, this data store appends
+a single record per change to a journal file. On load the journal is
+replayed on top of the last snapshot of the users. Once the journal
+grows large enough relative to the number of users it is compacted into
+a new snapshot.
+
+Each snapshot and journal is tagged with a generation number. A
+snapshot of generation ``N`` contains every change from the journals of
+the generations before ``N``, so journals left behind by an interrupted
+compaction are ignored (and removed) the next time the data store is
+loaded.
+
+Many processes may share the same journal. Before each change the
+journal is locked and the records other processes appended since it was
+last read are replayed, so the change is checked against every user. If
+another process compacted the journal in the meantime then the new
+snapshot and journal are loaded instead.
+"""
+
+
+import contextlib
+import json
+import logging
+import os
+import re
+import threading
+
+from .. import _exceptions
+from . import json_, locking
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JournalDataStore(json_.JSONDataStore):
+    """The journal data store used to access the information for Phonebook."""
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook_journal.json")
+    NAME = "journal"
+
+    def __init__(
+        self,
+        file_path=None,
+        compact_min_records=1000,
+        compact_ratio=1.0,
+        background_compaction=False,
+        trigram_index=False,
+    ):
+        """Initialize the data store.
+
+        Keyword Args:
+            file_path (str): The path of the snapshot file the data
+                store will read. The journals are stored next to it. If
+                None, then the default path will be used.
+            compact_min_records (int): The minimum number of records in
+                the journal before it is compacted.
+            compact_ratio (float): The number of records in the journal,
+                relative to the number of users, before it is
+                compacted.
+            background_compaction (bool): Write the compacted snapshot
+                in a background thread rather than blocking the change
+                that triggered the compaction.
+            trigram_index (bool): Keep a
+                :class:`~phonebook._datastore.index.TrigramIndex` of the
+                users to speed up reading with filters like
+                ``"*Main St*"``, at the cost of memory and slower
+                changes.
+
+        """
+        # each change is appended to the journal as it is made, and the
+        # changes other processes append are only replayed before a change
+        # rather than before each read
+        self._init_state(file_path, trigram_index=trigram_index)
+        self._compact_min_records = compact_min_records
+        self._compact_ratio = compact_ratio
+        self._background_compaction = background_compaction
+        self._journal = None
+        # how far the journal of the current generation has been read
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._compaction_thread = None
+        self._batch_records = []
+        self.reload()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group the changes made inside the context into one batch.
+
+        The changes are applied in memory and their records are only
+        appended to the journal once when the context exits. If an
+        exception is raised inside the context then all of the changes
+        are discarded.
+
+        The journal is exclusively locked for the duration of the
+        context, and the changes other processes appended to it are
+        replayed first.
+
+        Yields:
+            JournalDataStore: This data store.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # nested batches are part of the outer batch
+                yield self
+                return
+
+            with self._file_lock.exclusive():
+                self._catch_up()
+                users = list(self._users)
+                self._batch_records = []
+                self._in_batch = True
+                try:
+                    yield self
+                except BaseException:
+                    self._users = users
+                    self._index_users()
+                    raise
+                finally:
+                    self._in_batch = False
+                self._write_records(self._batch_records)
+                self._batch_records = []
+            self._compact_if_needed()
+
+    def create(self, user):
+        """Add the given `user` to the data store.
+
+        Args:
+            user (dict(str, str)): The user information to add to the
+                data store.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with the
+                given `name` already exists in the data store.
+
+        """
+        with self._changing():
+            user = self._create(user)
+            self._append({"op": "create", "user": user})
+
+    def delete(self, name):
+        """Delete the user with given `name` from the data store.
+
+        Args:
+            name (str): The name of the user to delete from the data
+                store.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+
+        """
+        with self._changing():
+            self._delete(name)
+            self._append({"op": "delete", "name": name})
+
+    def update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the data store.
+
+        Args:
+            user_name (str): The name of the user to update from the
+                data store.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with. The valid options
+                are:
+
+                * **name**: The name to update the user to.
+                * **phone**: The phone number to update the user to.
+                * **address**: The address to update the user to.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        with self._changing():
+            user = self._update(user_name, **user_fields)
+            self._append({"op": "update", "name": user_name, "user": user})
+
+    def reload(self):
+        """Reload the internal data store from the snapshot and journals."""
+        with self._lock.write():
+            self.close()
+            with self._file_lock.exclusive():
+                self._reload()
+
+    def compact(self):
+        """Compact the journal into a new snapshot of the users."""
+        with self._lock.write():
+            # wait before locking the journal, which the compaction thread
+            # needs to finish
+            self._wait_for_compaction()
+            with self._file_lock.exclusive():
+                # include the changes other processes appended in the
+                # snapshot, since their journal is removed once it's written
+                self._catch_up()
+                # users are replaced rather than modified in place, so a
+                # shallow copy is a consistent snapshot
+                users = list(self._iter_users())
+                self._generation += 1
+                generation = self._generation
+                self._open_journal()
+
+                if self._background_compaction:
+                    self._compaction_thread = threading.Thread(
+                        target=self._write_snapshot,
+                        args=(users, generation),
+                        daemon=True,
+                    )
+                    self._compaction_thread.start()
+                else:
+                    self._write_snapshot(users, generation)
+
+    def close(self):
+        """Wait for any running compaction and close the journal file."""
+        with self._lock.write():
+            self._wait_for_compaction()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def _reload(self):
+        """Load the snapshot and replay the journals on top of it."""
+        _LOGGER.debug(f"Reloading data store: {self._file_path}")
+
+        self._generation = 0
+        self._users = []
+        if os.path.exists(self._file_path):
+            with open(self._file_path) as data_file:
+                snapshot = json.load(data_file)
+            self._generation = snapshot["generation"]
+            self._users = snapshot["users"]
+        self._index_users()
+
+        self._open_journal()
+        needs_newline = False
+        for generation, journal_path in self._journal_paths():
+            if generation < self._generation:
+                # left behind by an interrupted compaction
+                os.remove(journal_path)
+                continue
+            if generation > self._generation:
+                self._generation = generation
+                self._open_journal()
+            needs_newline = self._replay(journal_path)
+        # remove the holes left by the replayed deletes
+        self._compact_users()
+        if needs_newline:
+            self._terminate_record()
+
+    def _catch_up(self):
+        """Replay the changes other processes appended to the journal.
+
+        If another process compacted the journal since it was last read
+        then the new snapshot and journals are loaded instead. The
+        journal must be exclusively locked.
+
+        """
+        journal_path = self._journal_path(self._generation)
+        try:
+            journal_size = os.path.getsize(journal_path)
+        except FileNotFoundError:
+            journal_size = None
+        if journal_size is None or os.path.exists(
+            self._journal_path(self._generation + 1)
+        ):
+            _LOGGER.debug(f"Journal compacted by another process: {journal_path}")
+            self._reload()
+            return
+        if journal_size == self._journal_offset:
+            return
+
+        needs_newline = self._replay(journal_path)
+        # remove the holes left by the replayed deletes
+        self._compact_users()
+        if needs_newline:
+            self._terminate_record()
+
+    @contextlib.contextmanager
+    def _changing(self):
+        """Hold the locks needed to change the users for the context.
+
+        Outside of a batch the journal is exclusively locked, the
+        changes other processes appended to it are replayed first, and
+        it is compacted afterwards if it grew large enough.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # the batch already holds the lock on the journal
+                yield
+                return
+
+            with self._file_lock.exclusive():
+                self._catch_up()
+                yield
+            self._compact_if_needed()
+
+    def _compact_if_needed(self):
+        """Compact the journal if it grew large enough."""
+        if (
+            self._journal_records >= self._compact_min_records
+            and self._journal_records >= self._compact_ratio * len(self._positions)
+        ):
+            self.compact()
+
+    def _open_journal(self):
+        """Open the journal of the current generation to append to."""
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self._journal_path(self._generation), "ab")
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._journal_records = 0
+
+    def _terminate_record(self):
+        """Terminate a partially written record at the end of the journal.
+
+        Otherwise it would corrupt the next record appended.
+
+        """
+        self._journal.write(b"\n")
+        self._journal.flush()
+        self._journal_offset = self._journal.tell()
+
+    def _write(self):
+        """Write the internal data store to a new snapshot file."""
+        self.compact()
+
+    def _append(self, record):
+        """Append the given change `record` to the journal.
+
+        If a batch is in progress the record is held until the batch
+        finishes.
+
+        Args:
+            record (dict): The change to append.
+
+        """
+        if self._in_batch:
+            self._batch_records.append(record)
+        else:
+            self._write_records([record])
+
+    def _write_records(self, records):
+        """Write the given change `records` to the journal.
+
+        The journal must be exclusively locked.
+
+        Args:
+            records (list(dict)): The changes to write.
+
+        """
+        if not records:
+            return
+
+        lines = [f"{json.dumps(record)}\n" for record in records]
+        self._journal.write("".join(lines).encode())
+        self._journal.flush()
+        self._journal_offset = self._journal.tell()
+        self._journal_lines += len(records)
+        self._journal_records += len(records)
+
+    def _replay(self, journal_path):
+        """Apply the changes in the given journal to the in-memory users.
+
+        The journal is replayed from where it was last read. Records
+        that no longer apply, e.g. creating a user another process
+        created at the same time, are skipped.
+
+        Args:
+            journal_path (str): The path of the journal to replay.
+
+        Returns:
+            bool: True if the last record of the journal was not
+            terminated, i.e. it was only partially written.
+
+        """
+        _LOGGER.debug(f"Replaying journal: {journal_path}")
+        line = b"\n"
+        with open(journal_path, "rb") as journal_file:
+            journal_file.seek(self._journal_offset)
+            for line in journal_file:
+                self._journal_lines += 1
+                location = f"{journal_path}:{self._journal_lines}"
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    _LOGGER.warning(f"Ignoring corrupt journal record: {location}")
+                    continue
+
+                try:
+                    if record["op"] == "create":
+                        self._create(record["user"])
+                    elif record["op"] == "delete":
+                        self._delete(record["name"])
+                    elif record["op"] == "update":
+                        self._update(record["name"], **record["user"])
+                except (
+                    _exceptions.InvalidUserError,
+                    _exceptions.MissingUserError,
+                    _exceptions.DuplicateUserError,
+                ) as error:
+                    _LOGGER.warning(
+                        f"Ignoring journal record that no longer applies: "
+                        f"{location}: {error}"
+                    )
+                self._journal_records += 1
+            self._journal_offset = journal_file.tell()
+
+        return not line.endswith(b"\n")
+
+    def _write_snapshot(self, users, generation):
+        """Write the given `users` as the snapshot of the `generation`.
+
+        Args:
+            users (list(dict)): The users to write to the snapshot.
+            generation (int): The generation of the snapshot. Journals
+                of earlier generations are removed once it is written.
+
+        """
+        _LOGGER.debug(f"Writing to data store: {self._file_path}")
+        with self._file_lock.exclusive():
+            if not os.path.exists(self._journal_path(generation)):
+                # another process already compacted the journal into a
+                # newer snapshot, which includes these users
+                return
+            with locking.atomic_write(self._file_path) as data_file:
+                json.dump({"generation": generation, "users": users}, data_file)
+
+            for journal_generation, journal_path in self._journal_paths():
+                if journal_generation < generation:
+                    os.remove(journal_path)
+
+    def _wait_for_compaction(self):
+        """Wait for the background compaction (if any) to finish."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+            self._compaction_thread = None
+
+    def _journal_path(self, generation):
+        """Get the path of the journal for the given `generation`.
+
+        Args:
+            generation (int): The generation of the journal.
+
+        Returns:
+            str: The path of the journal.
+
+        """
+        return f"{self._file_path}.{generation}.journal"
+
+    def _journal_paths(self):
+        """Get the existing journals of the data store.
+
+        Returns:
+            list(tuple(int, str)): The generation and path of each
+            journal, oldest first.
+
+        """
+        directory, file_name = os.path.split(os.path.abspath(self._file_path))
+        journal_regex = re.compile(re.escape(file_name) + r"\.(\d+)\.journal$")
+        journals = []
+        for entry in os.listdir(directory):
+            match = journal_regex.match(entry)
+            if match:
+                journals.append((int(match.group(1)), os.path.join(directory, entry)))
+        return sorted(journals)
@@ -1,191 +1,367 @@
-"""The JSON data store used to access the information for Phonebook."""
+"""The JSON data stores used to access the information for Phonebook."""
 
 
-import copy
-import fnmatch
+import contextlib
 import logging
 import os
 
-import json
-
-from .. import _exceptions
-from . import base
+from . import codec, file_, record
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class JSONDataStore(base.BaseDataStore):
+class JSONDataStore(file_.FileDataStore):
     """The JSON data store used to access the information for Phonebook."""
 
     _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.json")
     NAME = "json"
-
-    def __init__(self, file_path=None):
+    CODEC = codec.JSONCodec()
+
+
+class IncrementalJSONDataStore(JSONDataStore):
+    """A JSON data store that only writes the users that changed.
+
+    Each user is kept in a padded slot of the data file (see
+    :class:`~phonebook._datastore.codec.SlottedJSONCodec`), and the
+    offset of each slot is kept in memory. A changed user that still
+    fits in its slot is overwritten in place. Otherwise its slot is
+    overwritten with a tombstone and the user is appended to the end of
+    the file, so it is read last once the file is reloaded. A deleted
+    user's slot is overwritten with a tombstone. Once the tombstones
+    make up enough of the file it is rewritten without them.
+
+    Unlike a rewrite, overwriting a slot is not atomic, so a crash while
+    it is written may leave that user corrupt.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook_incremental.json")
+    NAME = "json-incremental"
+    CODEC = codec.SlottedJSONCodec()
+
+    def __init__(
+        self,
+        file_path=None,
+        trigram_index=False,
+        auto_reload=False,
+        reload_interval=1.0,
+        compact=False,
+        fragmentation_threshold=0.5,
+        write_behind=False,
+        flush_interval=1.0,
+        flush_changes=1000,
+    ):
         """Initialize the data store.
 
         Keyword Args:
-            file_path (str): The path of the JSON file the data store
+            file_path (str): The path of the data file the data store
                 will read. If None, then the default path will be used.
+            trigram_index (bool): Keep a
+                :class:`~phonebook._datastore.index.TrigramIndex` of the
+                users to speed up reading with filters like
+                ``"*Main St*"``, at the cost of memory and slower
+                changes.
+            auto_reload (bool): Reload the users whenever the data file
+                is changed by another process.
+            reload_interval (float): The minimum number of seconds
+                between checks of the data file when `auto_reload` is
+                enabled.
+            compact (bool): Keep the users in memory as
+                :class:`~phonebook._datastore.record.UserRecord` objects
+                rather than dictionaries.
+            fragmentation_threshold (float): The fraction of the data
+                file taken up by tombstones, or of the users changed at
+                once, above which the whole file is rewritten rather
+                than changed in place.
+            write_behind (bool): Only change the users in memory, and
+                write them to the data file in a background thread at
+                most `flush_interval` seconds later.
+            flush_interval (float): The maximum number of seconds a
+                change waits to be written in write-behind mode.
+            flush_changes (int): The number of changes that are written
+                right away rather than waiting for the `flush_interval`
+                in write-behind mode.
+
+        Raises:
+            ValueError: Raised when the data file is compressed, since a
+                compressed file can't be changed in place.
 
         """
-        self._file_path = file_path or self._DEFAULT_PATH
-        if os.path.exists(self._file_path):
-            self.reload()
-        else:
-            self._users = []
-            self._write()
+        file_path = file_path or self._DEFAULT_PATH
+        if codec.detect_compression(file_path) is not None:
+            raise ValueError(
+                f"The incremental JSON data store can't be compressed: {file_path}"
+            )
+        self._fragmentation_threshold = fragmentation_threshold
+        # the slot of each user by name, and the offset of each slot
+        # followed by the offset of the end of the file, or None until
+        # the file is laid out in slots
+        self._slots = None
+        self._offsets = None
+        self._dead_bytes = 0
+        # the names of the users changed since the file was written, and
+        # the name each renamed user had when it was written
+        self._dirty = {}
+        self._renamed = {}
+        super().__init__(
+            file_path=file_path,
+            trigram_index=trigram_index,
+            auto_reload=auto_reload,
+            reload_interval=reload_interval,
+            compact=compact,
+            write_behind=write_behind,
+            flush_interval=flush_interval,
+            flush_changes=flush_changes,
+        )
+
+    def _load(self, data_file):
+        """Read the users and the offsets of their slots from the data file.
 
-    def read(self, filters=None):
-        """Get user information from the data store.
+        Args:
+            data_file (io.BufferedIOBase): The data file to read.
 
-        Keyword Args:
-            filters (dict(str, str) or None): The filters to use to
-                restrict the user information returned. Each key of the
-                dictionary is the name of the field to filter by. Each
-                value is a :mod:`fnmatch`-compliant string that must be
-                true for the named field in order for the user to be
-                returned.
+        Returns:
+            list: The users, in order.
 
-                If multiple filters are provided, ALL filters must be
-                valid for a user's information for it to be returned.
+        """
+        slots, self._offsets = self._codec.load_slots(
+            data_file,
+            object_hook=record.UserRecord.from_dict if self._compact else None,
+        )
+        if self._offsets is None:
+            # the file will be laid out in slots when it is next written
+            self._slots = None
+            return slots
+
+        self._slots = {}
+        self._dead_bytes = 0
+        users = []
+        for slot, user in enumerate(slots):
+            if user is None:
+                self._dead_bytes += self._offsets[slot + 1] - self._offsets[slot]
+            else:
+                self._slots[user["name"]] = slot
+                users.append(user)
+        return users
+
+    def _dump(self, data_file):
+        """Write the users to the data file with a slot each.
 
-                If None then no filters are applied and all user
-                information is returned.
+        Args:
+            data_file (io.BufferedIOBase): The data file to write.
+
+        """
+        self._offsets = self._codec.dump_slots(
+            self._users, data_file, default=record.UserRecord.to_dict
+        )
+        self._slots = {user["name"]: slot for slot, user in enumerate(self._users)}
+        self._dead_bytes = 0
+        self._dirty = {}
+        self._renamed = {}
+
+    def _write(self):
+        """Write the changed users to their slots in the data file.
+
+        The whole file is rewritten instead if it isn't laid out in slots
+        yet, if too much of it would be tombstones or changed, or if
+        another process changed it since it was last read or written
+        (e.g. while changes waited to be written in write-behind mode),
+        since the slots may have moved.
+
+        """
+        with self._file_lock.exclusive():
+            if not self._patchable():
+                super()._write()
+                return
+
+            patches = list(self._patches())
+            file_size = self._offsets[-1] + len(self._codec.END)
+            if self._dead_bytes > self._fragmentation_threshold * file_size:
+                super()._write()
+                return
+
+            _LOGGER.debug(f"Patching {len(patches)} slots of: {self._file_path}")
+            try:
+                with open(self._file_path, "r+b") as data_file:
+                    for offset, data in patches:
+                        data_file.seek(offset)
+                        data_file.write(data)
+                    data_file.flush()
+                    os.fsync(data_file.fileno())
+                    self._checked(file_._signature(os.fstat(data_file.fileno())))
+            except BaseException:
+                # the slots in the file are unknown, so rewrite it next
+                self._offsets = None
+                raise
+        self._dirty = {}
+        self._renamed = {}
+
+    def _patchable(self):
+        """Check whether the changed users can be written to their slots.
+
+        Must be called while the data file is exclusively locked.
 
         Returns:
-            list(dict): The list of information for each user that
-            matches the given `filters`.
+            bool: True if the file is laid out in the slots last read or
+            written, and few enough users changed.
+
+        """
+        if self._offsets is None or len(self._dirty) > (
+            self._fragmentation_threshold * len(self._positions)
+        ):
+            return False
+        try:
+            file_signature = file_._signature(os.stat(self._file_path))
+        except FileNotFoundError:
+            return False
+        return file_signature == self._file_signature
+
+    def _patches(self):
+        """Get the writes that change the slots of the changed users.
+
+        The slots of renamed, relocated, and appended users are updated
+        as they are planned.
+
+        Yields:
+            tuple(int, bytes): The offset in the file to write and the
+            data to write there.
 
         """
-        filters = filters or {}
-        result = []
-        for user in self._users:
-            user_matches = True
-            for field, pattern in filters.items():
-                if not fnmatch.fnmatch(user[field], pattern):
-                    user_matches = False
-                    break
-            if user_matches:
-                result.append(user)
-
-        return result
-
-    def create(self, user):
-        """Add the given `user` to the data store.
+        for new_name, old_name in self._renamed.items():
+            if new_name in self._slots:
+                # a deleted user's name was reused
+                yield self._tombstone(self._slots[new_name])
+            if old_name in self._slots:
+                self._slots[new_name] = self._slots.pop(old_name)
+
+        end = self._offsets[-1]
+        for name in self._dirty:
+            user = self._user(name)
+            slot = self._slots.pop(name, None)
+            if slot is not None:
+                if user is not None:
+                    capacity = self._offsets[slot + 1] - self._offsets[slot] - 2
+                    data = self._codec.encode(
+                        user, capacity=capacity, default=record.UserRecord.to_dict
+                    )
+                    if data is not None:
+                        self._slots[name] = slot
+                        yield self._offsets[slot], data
+                        continue
+                yield self._tombstone(slot)
+            if user is not None:
+                data = self._codec.encode(user, default=record.UserRecord.to_dict)
+                self._slots[name] = len(self._offsets) - 1
+                yield self._offsets[-1], data
+                self._offsets.append(self._offsets[-1] + len(data))
+
+        if self._offsets[-1] != end:
+            yield self._offsets[-1], self._codec.END
+
+    def _tombstone(self, slot):
+        """Get the write that overwrites the given `slot` with a tombstone.
 
         Args:
-            user (dict(str, str)): The user information to add to the
-                data store.
+            slot (int): The slot to overwrite.
 
-        Raises:
-            phonebook.InvalidUserError: Raised when the given user does
-                not provide needed information for a user.
-            phonebook.DuplicateUserError: Raised when a user with the
-                given `name` already exists in the data store.
+        Returns:
+            tuple(int, bytes): The offset in the file to write and the
+            data to write there.
 
         """
-        user = base.validate(user)
+        size = self._offsets[slot + 1] - self._offsets[slot]
+        self._dead_bytes += size
+        return self._offsets[slot], self._codec.encode(None, capacity=size - 2)
 
-        # ensure the given user doesn't already exist
-        for existing_user in self._users:
-            if user["name"] == existing_user["name"]:
-                raise _exceptions.DuplicateUserError(
-                    f"User '{user['name']}' already exists in the data store!"
-                )
+    @contextlib.contextmanager
+    def batch(self):
+        """Group the changes made inside the context into one batch.
 
-        self._users.append(user)
-        self._write()
+        The changes are applied in memory and the data file is only
+        written once when the context exits. If an exception is raised
+        inside the context then all of the changes are discarded.
 
-    def delete(self, name):
-        """Delete the user with given `name` from the data store.
+        Yields:
+            IncrementalJSONDataStore: This data store.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # nested batches are part of the outer batch
+                yield self
+                return
+
+            # changes still waiting to be written in write-behind mode
+            # must survive the batch being discarded
+            dirty = dict(self._dirty)
+            renamed = dict(self._renamed)
+            discarded = False
+            try:
+                with super().batch():
+                    try:
+                        yield self
+                    except BaseException:
+                        discarded = True
+                        raise
+            finally:
+                # discarding the batch reindexes the users, which forgets
+                # every change
+                if discarded:
+                    self._dirty = dirty
+                    self._renamed = renamed
+
+    def _index_users(self):
+        """Index the in-memory users by name and forget any changes."""
+        super()._index_users()
+        self._dirty = {}
+        self._renamed = {}
+
+    def _create(self, user):
+        """Add the given `user` to the in-memory users.
 
         Args:
-            name (str): The name of the user to delete from the data
-                store.
+            user (dict(str, str)): The user information to add.
 
-        Raises:
-            phonebook.MissingUserError: Raised when a user with the
-                given `name` does not exist in the data store.
+        Returns:
+            dict(str, str): The added user with unknown fields removed.
 
         """
-        user_index = None
-        # ensure the given user exists
-        for index, existing_user in enumerate(self._users):
-            if name == existing_user["name"]:
-                user_index = index
-                break
-        else:
-            raise _exceptions.MissingUserError(
-                f"User '{name}' does not exist in the data store!"
-            )
+        user = super()._create(user)
+        self._dirty[user["name"]] = None
+        return user
 
-        self._users.pop(user_index)
-        self._write()
+    def _delete(self, name):
+        """Delete the user with given `name` from the in-memory users.
 
-    def update(self, user_name, **user_fields):
-        """Update the user with the given `user_name` in the data store.
+        Args:
+            name (str): The name of the user to delete.
+
+        """
+        super()._delete(name)
+        self._dirty[name] = None
+
+    def _update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the in-memory users.
 
         Args:
-            user_name (str): The name of the user to update from the
-                data store.
+            user_name (str): The name of the user to update.
 
         Keyword Args:
             **user_fields (dict): The user information to replace the
-                requested user's information with. The valid options
-                are:
-
-                * **name**: The name to update the user to.
-                * **phone**: The phone number to update the user to.
-                * **address**: The address to update the user to.
+                requested user's information with.
 
-        Raises:
-            phonebook.MissingUserError: Raised when a user with the
-                given `name` does not exist in the data store.
-            phonebook.DuplicateUserError: Raised when a `name` field was
-                given that already exists in the Phonebook.
+        Returns:
+            dict(str, str): The updated user.
 
         """
-        user_fields = base.validate(user_fields, ignore_required_fields=True)
-        user_index = None
-        original_user = None
-        using_same_name = user_name == user_fields.get("name", user_name)
-
-        for index, existing_user in enumerate(self._users):
-            # ensure the given user exists
-            if user_name == existing_user["name"]:
-                user_index = index
-                original_user = existing_user
-                # only `break` if the user name hasn't changed,
-                # otherwise the rest of the users still need to be
-                # checked
-                if using_same_name:
-                    break
-            # ensure the given user doesn't already exist (if they
-            # changed the user name)
-            elif not using_same_name and user_fields["name"] == existing_user["name"]:
-                raise _exceptions.DuplicateUserError(
-                    f"User '{user_fields['name']}' already exists in the data store!"
-                )
-
-        if user_index is None or original_user is None:
-            raise _exceptions.MissingUserError(
-                f"User '{user_name}' does not exist in the data store!"
-            )
-
-        updated_user = copy.copy(original_user)
-        updated_user.update(user_fields)
-        self._users[user_index] = updated_user
-        self._write()
-
-    def reload(self):
-        """Reload the internal data store from the JSON file."""
-        _LOGGER.debug(f"Reloading data store: {self._file_path}")
-        with open(self._file_path) as data_file:
-            self._users = json.load(data_file)
-
-    def _write(self):
-        """Write the internal data store to the JSON file."""
-        _LOGGER.debug(f"Writing to data store: {self._file_path}")
-        with open(self._file_path, "w") as data_file:
-            json.dump(self._users, data_file, indent=2)
+        updated_user = super()._update(user_name, **user_fields)
+        new_name = updated_user["name"]
+        if new_name != user_name:
+            # the renamed user keeps the slot it was written to
+            written_name = self._renamed.pop(user_name, user_name)
+            if written_name != new_name:
+                self._renamed[new_name] = written_name
+            self._dirty[user_name] = None
+        self._dirty[new_name] = None
+        return updated_user
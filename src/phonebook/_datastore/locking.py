@@ -0,0 +1,199 @@
+"""Utilities to safely share data stores between threads and processes."""
+
+
+import contextlib
+import os
+import shutil
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # file locking is only supported on POSIX platforms
+    fcntl = None
+
+
+class FileLock(object):
+    """An inter-process readers-writer lock on a file.
+
+    Many processes (or threads) may hold the shared lock at once, but
+    the exclusive lock is only held by one at a time. The lock is held
+    on a separate ``.lock`` file next to the locked file, so the locked
+    file can be atomically replaced while the lock is held.
+
+    The lock is reentrant within a thread. On platforms without
+    :mod:`fcntl` (e.g. Windows) nothing is locked.
+
+    """
+
+    def __init__(self, file_path):
+        """Initialize the lock.
+
+        Args:
+            file_path (str): The path of the file to lock.
+
+        """
+        self._lock_path = f"{file_path}.lock"
+        self._state = threading.local()
+
+    @contextlib.contextmanager
+    def shared(self):
+        """Hold the shared lock for the duration of the context."""
+        with self._hold(exclusive=False):
+            yield
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        """Hold the exclusive lock for the duration of the context.
+
+        Raises:
+            RuntimeError: Raised when the thread already holds the shared
+                lock, since upgrading it could deadlock.
+
+        """
+        with self._hold(exclusive=True):
+            yield
+
+    @contextlib.contextmanager
+    def _hold(self, exclusive):
+        """Hold the lock for the duration of the context.
+
+        Args:
+            exclusive (bool): Whether to hold the exclusive lock rather
+                than the shared lock.
+
+        """
+        if fcntl is None:
+            yield
+            return
+
+        lock_file = getattr(self._state, "lock_file", None)
+        if lock_file is not None:
+            # already held by this thread
+            if exclusive and not self._state.exclusive:
+                raise RuntimeError(
+                    f"Unable to upgrade the shared lock on '{self._lock_path}'!"
+                )
+            yield
+            return
+
+        lock_file = open(self._lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._state.lock_file = lock_file
+            self._state.exclusive = exclusive
+            try:
+                yield
+            finally:
+                self._state.lock_file = None
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+
+@contextlib.contextmanager
+def atomic_write(file_path, mode="w"):
+    """Write a file so readers see either its old or new contents.
+
+    The contents are written to a temporary file next to the file, which
+    then replaces the file. If an exception is raised inside the context
+    the file is left unchanged.
+
+    Args:
+        file_path (str): The path of the file to write.
+
+    Keyword Args:
+        mode (str): The mode to open the temporary file with, e.g.
+            ``"wb"`` to write bytes.
+
+    Yields:
+        file: The temporary file to write the contents to.
+
+    """
+    temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, mode) as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+class ReadWriteLock(object):
+    """A lock that many readers or a single writer can hold at once.
+
+    Writers waiting for the lock are preferred over new readers, so a
+    steady stream of readers can't starve them. The lock is reentrant:
+    a thread holding the lock may acquire it again, and a thread holding
+    the write lock may also acquire the read lock.
+
+    """
+
+    def __init__(self):
+        """Initialize the lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = {}
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextlib.contextmanager
+    def read(self):
+        """Hold the read lock for the duration of the context."""
+        ident = threading.get_ident()
+        with self._condition:
+            if self._writer != ident and ident not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers[ident] = self._readers.get(ident, 0) + 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers[ident] -= 1
+                if not self._readers[ident]:
+                    del self._readers[ident]
+                    if not self._readers:
+                        self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def write(self):
+        """Hold the write lock for the duration of the context.
+
+        Raises:
+            RuntimeError: Raised when the thread only holds the read
+                lock, since upgrading it could deadlock.
+
+        """
+        ident = threading.get_ident()
+        with self._condition:
+            if self._writer != ident:
+                if ident in self._readers:
+                    raise RuntimeError("Unable to upgrade a read lock to a write lock!")
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                    if not self._waiting_writers:
+                        # let the readers waiting on the writers check again
+                        self._condition.notify_all()
+                self._writer = ident
+            self._writer_depth += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
@@ -0,0 +1,81 @@
+"""A compact in-memory representation of a user's information."""
+
+
+import sys
+
+
+class UserRecord(object):
+    """A compact record of a user's information.
+
+    A record keeps the fields of a user in slots rather than a
+    dictionary, which uses a third of the memory of a dictionary. The
+    addresses are interned so the users that share an address (e.g. a
+    household) share a single string.
+
+    Records support ``record[field]`` like a user dictionary, so they
+    can be matched by a :class:`~phonebook.Query` and indexed by a
+    :class:`~phonebook._datastore.index.TrigramIndex`. Records are only
+    equal to themselves, so they are found in a list by identity.
+
+    """
+
+    __slots__ = ("name", "phone", "address")
+
+    def __init__(self, name, phone, address):
+        """Initialize the record.
+
+        Args:
+            name (str): The name of the user.
+            phone (str): The phone number of the user.
+            address (str): The address of the user. Only a string
+                address is interned.
+
+        """
+        self.name = name
+        self.phone = phone
+        # only exact strings can be interned, and a hand-edited file may
+        # have any value
+        self.address = sys.intern(address) if type(address) is str else address
+
+    @classmethod
+    def from_dict(cls, user):
+        """Create a record of the given `user`.
+
+        Args:
+            user (dict(str, str)): The validated user information.
+
+        Returns:
+            UserRecord: The record of the user.
+
+        """
+        return cls(user["name"], user["phone"], user["address"])
+
+    def __getitem__(self, field):
+        """Get the value of the given `field`.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            str: The value of the field.
+
+        Raises:
+            KeyError: Raised when the record has no such field.
+
+        """
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __repr__(self):
+        """Get the representation of the record."""
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def to_dict(self):
+        """Get the user information as a new dictionary.
+
+        Returns:
+            dict(str, str): The user information.
+
+        """
+        return {"name": self.name, "phone": self.phone, "address": self.address}
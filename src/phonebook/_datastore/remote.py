@@ -0,0 +1,423 @@
+"""The data store used to access a Phonebook served by ``phonebook serve``."""
+
+
+import http.client
+import json
+import logging
+import socket
+import threading
+import urllib.parse
+
+from .. import _exceptions, _server
+from . import base
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """An HTTP connection over a Unix socket."""
+
+    def __init__(self, socket_path, timeout=None):
+        """Initialize the connection.
+
+        Args:
+            socket_path (str): The path of the Unix socket.
+
+        Keyword Args:
+            timeout (float or None): The number of seconds to wait for
+                the server before giving up. If None then the default
+                socket timeout is used.
+
+        """
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        """Connect to the Unix socket."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class RemoteDataStore(base.BaseDataStore):
+    """The data store used to access a Phonebook served by ``phonebook serve``.
+
+    Each request is a round-trip to the server, which keeps its own data
+    store loaded. The connection to the server is kept alive between
+    requests.
+
+    Each change is sent as it is made, so :meth:`batch` doesn't group
+    them: the changes made before a failure in a batch (or in
+    :meth:`create_many`, :meth:`delete_many`, or :meth:`update_many`)
+    are kept.
+
+    """
+
+    NAME = "remote"
+
+    def __init__(self, address, timeout=None):
+        """Initialize the data store.
+
+        Args:
+            address (str): The address of the server. Either
+                ``HOST:PORT`` or the path of a Unix socket.
+
+        Keyword Args:
+            timeout (float or None): The number of seconds to wait for
+                the server before giving up. If None then the default
+                socket timeout is used.
+
+        """
+        self._address = _server.parse_address(address)
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def get(self, name):
+        """Get a single user's information from the data store.
+
+        Args:
+            name (str): The name of the user to get from the data store.
+
+        Returns:
+            dict(str, str): The information for the requested user.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the requested user
+                does not exist in the data store.
+
+        """
+        return self._request("GET", _user_path(name))
+
+    def read(self, filters=None):
+        """Get user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. Each key of the dictionary is the name of the
+                field to filter by. Each value is a
+                :mod:`fnmatch`-compliant string that must be true for
+                the named field in order for the user to be returned.
+
+                If multiple filters are provided, ALL filters must be
+                valid for a user's information for it to be returned.
+
+                If None then no filters are applied and all user
+                information is returned.
+
+        Returns:
+            list(dict): The list of information for each user that
+            matches the given `filters`.
+
+        """
+        return list(self.iter_read(filters=filters))
+
+    def iter_read(self, filters=None, limit=None, offset=None, after=None):
+        """Iterate over user information from the data store.
+
+        The users are streamed from the server as they are iterated
+        over, over a separate connection.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. See :meth:`read` for details.
+            limit (int or None): The maximum number of users to return.
+                If None then all matching users are returned.
+            offset (int or None): The number of matching users to skip
+                before returning any.
+            after (str or None): The name of the last user returned by
+                the previous page. Only the users after it are returned.
+
+        Returns:
+            iterator(dict): The information for each user that matches
+            the given `filters`.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the `after` user
+                does not exist in the data store.
+
+        """
+        parameters = dict(filters or {})
+        pagination = {"limit": limit, "offset": offset, "after": after}
+        parameters.update(
+            (field, value) for field, value in pagination.items() if value is not None
+        )
+        path = "/users"
+        if parameters:
+            path += f"?{urllib.parse.urlencode(parameters)}"
+
+        connection = self._connect()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            if response.status != 200:
+                _raise_error(response)
+        except BaseException:
+            connection.close()
+            raise
+        return _stream_users(connection, response)
+
+    def complete(self, prefix, limit=None):
+        """Get the names of the users that start with the given `prefix`.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        parameters = {"prefix": prefix}
+        if limit is not None:
+            parameters["limit"] = limit
+        return self._request("GET", f"/names?{urllib.parse.urlencode(parameters)}")
+
+    def lookup_phone(self, number, digits=None):
+        """Get the users with the given phone `number`.
+
+        Args:
+            number (str): The phone number to look up.
+
+        Keyword Args:
+            digits (int or None): Only match the last this many digits
+                of the phone numbers. If None then every digit must
+                match.
+
+        Returns:
+            list(dict): The information for each user with the phone
+            number, sorted by name.
+
+        Raises:
+            ValueError: Raised when `digits` is less than one.
+
+        """
+        # only the digits are sent, which also checks `digits` is valid
+        key = base.normalize_phone(number, digits=digits)
+        if not key:
+            return []
+        path = f"/phones/{key}"
+        if digits is not None:
+            path += f"?{urllib.parse.urlencode({'digits': digits})}"
+        return self._request("GET", path)
+
+    def search(self, terms, limit=None):
+        """Get the users whose address has every one of the `terms`.
+
+        Args:
+            terms (str): The words and numbers to search for.
+
+        Keyword Args:
+            limit (int or None): The maximum number of users to get. If
+                None then every user found is returned.
+
+        Returns:
+            list(dict): The information for each user whose address has
+            every term, in the order they were added.
+
+        """
+        parameters = {"terms": terms}
+        if limit is not None:
+            parameters["limit"] = limit
+        return self._request("GET", f"/search?{urllib.parse.urlencode(parameters)}")
+
+    def create(self, user):
+        """Add the given `user` to the data store.
+
+        Args:
+            user (dict(str, str)): The user information to add to the
+                data store.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with the
+                given `name` already exists in the data store.
+
+        """
+        self._request("POST", "/users", user)
+
+    def delete(self, name):
+        """Delete the user with given `name` from the data store.
+
+        Args:
+            name (str): The name of the user to delete from the data
+                store.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+
+        """
+        self._request("DELETE", _user_path(name))
+
+    def update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the data store.
+
+        Args:
+            user_name (str): The name of the user to update from the
+                data store.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with. The valid options
+                are:
+
+                * **name**: The name to update the user to.
+                * **phone**: The phone number to update the user to.
+                * **address**: The address to update the user to.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        self._request("PATCH", _user_path(user_name), user_fields)
+
+    def close(self):
+        """Close the connection to the server."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        """Create a new connection to the server.
+
+        Returns:
+            http.client.HTTPConnection: The connection.
+
+        """
+        if isinstance(self._address, str):
+            return _UnixHTTPConnection(self._address, timeout=self._timeout)
+        host, port = self._address
+        return http.client.HTTPConnection(host, port, timeout=self._timeout)
+
+    def _request(self, method, path, body=None):
+        """Make a request to the server over the kept-alive connection.
+
+        Args:
+            method (str): The HTTP method of the request.
+            path (str): The path of the request.
+
+        Keyword Args:
+            body (dict or None): The object to send as JSON.
+
+        Returns:
+            object: The object the server responded with.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the server responded
+                with an invalid user error.
+            phonebook.MissingUserError: Raised when the server responded
+                with a missing user error.
+            phonebook.DuplicateUserError: Raised when the server
+                responded with a duplicate user error.
+
+        """
+        _LOGGER.debug(f"Requesting {method} {path}")
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+
+        with self._lock:
+            # reconnect once if the server closed the kept-alive
+            # connection since the last request, unless the server may
+            # already have applied a change it received
+            for attempt in range(2):
+                if self._connection is None:
+                    self._connection = self._connect()
+                sent = False
+                try:
+                    self._connection.request(method, path, body=data, headers=headers)
+                    sent = True
+                    response = self._connection.getresponse()
+                    response_data = response.read()
+                    break
+                except (http.client.HTTPException, ConnectionError):
+                    self._connection.close()
+                    self._connection = None
+                    if attempt or (sent and method != "GET"):
+                        raise
+
+        if response.status >= 400:
+            _raise_error(response, response_data)
+        return json.loads(response_data)
+
+
+def _user_path(name):
+    """Get the path of the user with the given `name`.
+
+    Args:
+        name (str): The name of the user.
+
+    Returns:
+        str: The path of the user.
+
+    """
+    return f"/users/{urllib.parse.quote(name, safe='')}"
+
+
+def _raise_error(response, data=None):
+    """Raise the error the server responded with.
+
+    Args:
+        response (http.client.HTTPResponse): The response of the server.
+
+    Keyword Args:
+        data (bytes or None): The body of the response, if already read.
+
+    Raises:
+        phonebook.InvalidUserError: Raised when the server responded
+            with an invalid user error.
+        phonebook.MissingUserError: Raised when the server responded
+            with a missing user error.
+        phonebook.DuplicateUserError: Raised when the server responded
+            with a duplicate user error.
+        RuntimeError: Raised for any other error.
+
+    """
+    if data is None:
+        data = response.read()
+    try:
+        error = json.loads(data)
+    except ValueError:
+        error = {"error": None, "message": data.decode(errors="replace")}
+
+    if error["error"] in _server.ERROR_STATUSES:
+        raise getattr(_exceptions, error["error"])(error["message"])
+    raise RuntimeError(
+        f"The server responded with {response.status} {response.reason}: "
+        f"{error['message']}"
+    )
+
+
+def _stream_users(connection, response):
+    """Iterate over the users streamed in the `response`.
+
+    Args:
+        connection (http.client.HTTPConnection): The connection of the
+            response, which is closed once the users are read.
+        response (http.client.HTTPResponse): The response streaming the
+            users as newline-delimited JSON.
+
+    Yields:
+        dict(str, str): The information for each user.
+
+    """
+    try:
+        for line in response:
+            yield json.loads(line)
+    finally:
+        connection.close()
@@ -0,0 +1,566 @@
+"""The read-only snapshot data store used to access the Phonebook.
+
+A snapshot is a binary file that is memory-mapped rather than parsed, so
+opening one is near-instant no matter how many users it has, and every
+process reading the same snapshot shares a single copy of it in the
+operating system's page cache. A snapshot is made up of:
+
+* A header of the :data:`_MAGIC` bytes and the number of users.
+* An offset table with the position of each user's record, in the order
+  the users were written.
+* A name index of the number of each user's record, sorted by the UTF-8
+  bytes of their name (the same order as sorting the names).
+* A string heap of the records. Each record is the lengths of the
+  user's UTF-8 encoded name, phone, and address followed by their bytes.
+
+Users are found by name, or by a prefix of their name, with a binary
+search of the name index. Other filters with literal text (e.g.
+``"*Main St*"``) search the string heap for it rather than checking
+every user, the candidates decode only the fields the filters check,
+and only the users that are returned are decoded into dictionaries. All
+integers are little-endian.
+"""
+
+
+import array
+import bisect
+import io
+import itertools
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from .. import _exceptions, _query
+from . import base, locking
+
+
+_LOGGER = logging.getLogger(__name__)
+_MAGIC = b"PBSNAP\x00\x01"
+_HEADER = struct.Struct("<8sQ")
+_OFFSET = struct.Struct("<Q")
+_RECORD_NUMBER = struct.Struct("<I")
+_LENGTHS = struct.Struct("<III")
+_NAME_LENGTH = struct.Struct("<I")
+_FIELDS = ("name", "phone", "address")
+_FIELD_INDEXES = {field: index for index, field in enumerate(_FIELDS)}
+
+
+class SnapshotDataStore(base.BaseDataStore):
+    """The read-only snapshot data store used to access the Phonebook.
+
+    Snapshots are written with :meth:`write`. Creating, updating, or
+    deleting users raises :exc:`io.UnsupportedOperation`.
+
+    """
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.snapshot")
+    NAME = "snapshot"
+    READ_ONLY = True
+
+    def __init__(self, file_path=None):
+        """Initialize the data store.
+
+        Keyword Args:
+            file_path (str): The path of the snapshot the data store
+                will read. If None, then the default path will be used.
+                An empty snapshot is written if the file doesn't exist.
+
+        """
+        self._file_path = file_path or self._DEFAULT_PATH
+        self._lock = locking.ReadWriteLock()
+        self._data = None
+        if not os.path.exists(self._file_path):
+            self.write([], self._file_path)
+        self.reload()
+
+    @classmethod
+    def write(cls, users, file_path=None):
+        """Write the given `users` to a snapshot.
+
+        The snapshot is written atomically, so the data stores reading
+        the previous snapshot are unaffected until they :meth:`reload`.
+
+        Args:
+            users (iterable(dict(str, str))): The information of each
+                user to write.
+
+        Keyword Args:
+            file_path (str): The path of the snapshot to write. If
+                None, then the default path will be used.
+
+        Returns:
+            int: The number of users written.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when a given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when more than one user
+                has the same name.
+
+        """
+        file_path = file_path or cls._DEFAULT_PATH
+        records = []
+        encoded_names = []
+        names = set()
+        for user in users:
+            user = base.validate(user)
+            if user["name"] in names:
+                raise _exceptions.DuplicateUserError(
+                    f"User '{user['name']}' already exists in the snapshot!"
+                )
+            names.add(user["name"])
+            fields = [user[field].encode() for field in _FIELDS]
+            records.append(_LENGTHS.pack(*map(len, fields)) + b"".join(fields))
+            encoded_names.append(fields[0])
+
+        count = len(records)
+        heap_start = _HEADER.size + count * (_OFFSET.size + _RECORD_NUMBER.size)
+        offsets = array.array("Q")
+        position = heap_start
+        for record in records:
+            offsets.append(position)
+            position += len(record)
+        # UTF-8 bytes sort in the same order as the names they encode
+        name_index = array.array(
+            "I", sorted(range(count), key=encoded_names.__getitem__)
+        )
+        if sys.byteorder != "little":  # pragma: no cover
+            offsets.byteswap()
+            name_index.byteswap()
+
+        _LOGGER.debug(f"Writing {count} users to snapshot: {file_path}")
+        with locking.atomic_write(file_path, mode="wb") as data_file:
+            data_file.write(_HEADER.pack(_MAGIC, count))
+            data_file.write(offsets.tobytes())
+            data_file.write(name_index.tobytes())
+            for record in records:
+                data_file.write(record)
+        return count
+
+    def get(self, name):
+        """Get a single user's information from the data store.
+
+        Args:
+            name (str): The name of the user to get from the data store.
+
+        Returns:
+            dict(str, str): The information for the requested user.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the requested user
+                does not exist in the data store.
+
+        """
+        with self._lock.read():
+            number = self._find(name)
+            if number is None:
+                raise _exceptions.MissingUserError(
+                    f"Unable to find a user with '{name}' name!"
+                )
+            return self._user(number)
+
+    def read(self, filters=None):
+        """Get user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. Each key of the dictionary is the name of the
+                field to filter by. Each value is a
+                :mod:`fnmatch`-compliant string that must be true for
+                the named field in order for the user to be returned.
+
+                If multiple filters are provided, ALL filters must be
+                valid for a user's information for it to be returned.
+
+                If None then no filters are applied and all user
+                information is returned.
+
+        Returns:
+            list(dict): The list of information for each user that
+            matches the given `filters`.
+
+        """
+        return list(self.iter_read(filters=filters))
+
+    def iter_read(self, filters=None, limit=None, offset=None, after=None):
+        """Iterate over user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. See :meth:`read` for details.
+            limit (int or None): The maximum number of users to return.
+                If None then all matching users are returned.
+            offset (int or None): The number of matching users to skip
+                before returning any.
+            after (str or None): The name of the last user returned by
+                the previous page. Only the users after it are returned.
+
+        Returns:
+            iterator(dict): The information for each user that matches
+            the given `filters`.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the `after` user
+                does not exist in the data store.
+
+        """
+        with self._lock.read():
+            query = _query.Query.compile(filters)
+            start = 0
+            if after is not None:
+                after_number = self._find(after)
+                if after_number is None:
+                    raise _exceptions.MissingUserError(
+                        f"User '{after}' does not exist in the data store!"
+                    )
+                start = after_number + 1
+
+            name = query.exact("name")
+            prefix = query.prefix("name")
+            if name is not None:
+                # an exact name can match at most one user, so use the index
+                # rather than scanning every user
+                number = self._find(name)
+                numbers = [] if number is None or number < start else [number]
+            elif prefix is not None:
+                # only the users in the prefix's range of the name index can
+                # match, and their record numbers are their order
+                numbers = sorted(
+                    number
+                    for number in self._prefixed(prefix.encode())
+                    if number >= start
+                )
+            else:
+                numbers = self._candidates(query, start)
+
+            # only the fields checked by the filters are decoded, and only
+            # the users in the page are decoded into dictionaries
+            matches = (
+                number
+                for number in numbers
+                if query.matches(_RecordView(self._data, self._offsets[number]))
+            )
+            return iter(
+                [
+                    self._user(number)
+                    for number in base.paginate(matches, limit=limit, offset=offset)
+                ]
+            )
+
+    def complete(self, prefix, limit=None):
+        """Get the names of the users that start with the given `prefix`.
+
+        The names are found with a binary search of the name index.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        with self._lock.read():
+            return [
+                self._name(number).decode()
+                for number in itertools.islice(self._prefixed(prefix.encode()), limit)
+            ]
+
+    def create(self, user):
+        """Add the given `user` to the data store.
+
+        Args:
+            user (dict(str, str)): The user information to add to the
+                data store.
+
+        Raises:
+            io.UnsupportedOperation: Always raised, as the data store is
+                read-only.
+
+        """
+        raise io.UnsupportedOperation(_read_only_message(self._file_path))
+
+    def delete(self, name):
+        """Delete the user with given `name` from the data store.
+
+        Args:
+            name (str): The name of the user to delete from the data
+                store.
+
+        Raises:
+            io.UnsupportedOperation: Always raised, as the data store is
+                read-only.
+
+        """
+        raise io.UnsupportedOperation(_read_only_message(self._file_path))
+
+    def update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the data store.
+
+        Args:
+            user_name (str): The name of the user to update from the
+                data store.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with.
+
+        Raises:
+            io.UnsupportedOperation: Always raised, as the data store is
+                read-only.
+
+        """
+        raise io.UnsupportedOperation(_read_only_message(self._file_path))
+
+    def reload(self):
+        """Map the latest snapshot written to the file.
+
+        Raises:
+            ValueError: Raised when the file isn't a snapshot.
+
+        """
+        _LOGGER.debug(f"Mapping snapshot: {self._file_path}")
+        with open(self._file_path, "rb") as data_file:
+            data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, count = _HEADER.unpack_from(data)
+        except struct.error:
+            magic = None
+        if magic != _MAGIC:
+            data.close()
+            raise ValueError(f"Not a Phonebook snapshot: {self._file_path}")
+
+        offsets_end = _HEADER.size + count * _OFFSET.size
+        offsets = _table(data, "Q", _HEADER.size, offsets_end)
+        name_index = _table(
+            data, "I", offsets_end, offsets_end + count * _RECORD_NUMBER.size
+        )
+        with self._lock.write():
+            self.close()
+            self._data = data
+            self._count = count
+            self._offsets = offsets
+            self._name_index = name_index
+
+    def close(self):
+        """Unmap the snapshot."""
+        with self._lock.write():
+            if self._data is None:
+                return
+            for table in (self._offsets, self._name_index):
+                if isinstance(table, memoryview):
+                    table.release()
+            self._data.close()
+            self._data = None
+
+    def _candidates(self, query, start):
+        """Iterate over the records that might match the `query`.
+
+        If the filters contain literal text, the string heap is searched
+        for the longest literal and only the records containing it are
+        candidates. Otherwise every record from `start` is a candidate.
+
+        Args:
+            query (phonebook.Query): The compiled filters.
+            start (int): The number of the first record to consider.
+
+        Yields:
+            int: The number of each candidate record, in order.
+
+        """
+        literals = [literal for field in query for literal in query.literals(field)]
+        if not literals:
+            yield from range(start, self._count)
+            return
+
+        literal = max(literals, key=len).encode()
+        end = len(self._data)
+        position = self._offsets[start] if start < self._count else end
+        while True:
+            position = self._data.find(literal, position)
+            if position == -1:
+                return
+            number = bisect.bisect_right(self._offsets, position) - 1
+            yield number
+            # continue from the next record
+            number += 1
+            position = self._offsets[number] if number < self._count else end
+
+    def _find(self, name):
+        """Find the number of the record of the user with the `name`.
+
+        Args:
+            name (str): The name of the user.
+
+        Returns:
+            int or None: The number of the user's record, or None if
+            there is no user with the `name`.
+
+        """
+        name = name.encode()
+        position = self._bisect(name)
+        if position < self._count:
+            number = self._name_index[position]
+            if self._name(number) == name:
+                return number
+        return None
+
+    def _prefixed(self, prefix):
+        """Iterate over the records of the names with the given `prefix`.
+
+        Args:
+            prefix (bytes): The UTF-8 encoded prefix of the names.
+
+        Yields:
+            int: The number of each record, in the order of the names.
+
+        """
+        for position in range(self._bisect(prefix), self._count):
+            number = self._name_index[position]
+            if not self._name(number).startswith(prefix):
+                return
+            yield number
+
+    def _bisect(self, name):
+        """Find where the given `name` is, or would be, in the name index.
+
+        Args:
+            name (bytes): The UTF-8 encoded name.
+
+        Returns:
+            int: The position of the first name in the name index that
+            isn't less than the `name`.
+
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(self._name_index[middle]) < name:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _name(self, number):
+        """Get the UTF-8 encoded name in the given record.
+
+        Args:
+            number (int): The number of the record.
+
+        Returns:
+            bytes: The encoded name.
+
+        """
+        offset = self._offsets[number]
+        name_length = _NAME_LENGTH.unpack_from(self._data, offset)[0]
+        start = offset + _LENGTHS.size
+        return self._data[start : start + name_length]
+
+    def _user(self, number):
+        """Decode the user in the given record.
+
+        Args:
+            number (int): The number of the record.
+
+        Returns:
+            dict(str, str): The user information.
+
+        """
+        return _RecordView(self._data, self._offsets[number]).to_dict()
+
+
+class _RecordView(object):
+    """A view of a user's record that decodes its fields when accessed."""
+
+    __slots__ = ("_data", "_bounds")
+
+    def __init__(self, data, offset):
+        """Initialize the view.
+
+        Args:
+            data (mmap.mmap): The mapped snapshot.
+            offset (int): The position of the record in the snapshot.
+
+        """
+        self._data = data
+        name_length, phone_length, address_length = _LENGTHS.unpack_from(data, offset)
+        name_start = offset + _LENGTHS.size
+        phone_start = name_start + name_length
+        address_start = phone_start + phone_length
+        # the start of each field, followed by the end of the record
+        self._bounds = (
+            name_start,
+            phone_start,
+            address_start,
+            address_start + address_length,
+        )
+
+    def __getitem__(self, field):
+        """Decode the given `field` of the record.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            str: The value of the field.
+
+        Raises:
+            KeyError: Raised when the record has no such field.
+
+        """
+        index = _FIELD_INDEXES[field]
+        return self._data[self._bounds[index] : self._bounds[index + 1]].decode()
+
+    def to_dict(self):
+        """Decode all of the fields of the record.
+
+        Returns:
+            dict(str, str): The user information.
+
+        """
+        return {field: self[field] for field in _FIELDS}
+
+
+def _table(data, typecode, start, end):
+    """Get a table of integers from the mapped snapshot.
+
+    Args:
+        data (mmap.mmap): The mapped snapshot.
+        typecode (str): The :mod:`array` type code of the integers.
+        start (int): The position of the table in the snapshot.
+        end (int): The position of the end of the table.
+
+    Returns:
+        memoryview or array.array: The integers. The table is read
+        directly from the mapped snapshot on little-endian machines,
+        and copied otherwise.
+
+    """
+    if sys.byteorder == "little":
+        return memoryview(data)[start:end].cast(typecode)
+    table = array.array(typecode, data[start:end])  # pragma: no cover
+    table.byteswap()  # pragma: no cover
+    return table  # pragma: no cover
+
+
+def _read_only_message(file_path):
+    """Get the message of the error raised when changing a snapshot.
+
+    Args:
+        file_path (str): The path of the snapshot.
+
+    Returns:
+        str: The error message.
+
+    """
+    return (
+        f"The snapshot '{file_path}' is read-only, write a new snapshot "
+        "with SnapshotDataStore.write instead"
+    )
@@ -0,0 +1,559 @@
+"""The SQLite data store used to access the information for Phonebook."""
+
+
+import contextlib
+import fnmatch
+import itertools
+import logging
+import os
+import sqlite3
+
+from .. import _exceptions
+from . import base, locking
+
+
+_LOGGER = logging.getLogger(__name__)
+_COLUMNS = ("name", "phone", "address")
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM users"
+_READ_CHUNK_SIZE = 1000
+
+
+def _filter_clause(field, pattern):
+    """Get the SQL expression that applies a single `read` filter.
+
+    Exact patterns are compared with ``=`` and simple wildcard patterns
+    with ``GLOB`` so SQLite can use the column's index. ``GLOB`` treats
+    character sets differently than :mod:`fnmatch` (e.g. ``[^...]``
+    versus ``[!...]``), so patterns containing them are matched by
+    :func:`fnmatch.fnmatch` instead.
+
+    Args:
+        field (str): The name of the column to filter by.
+        pattern (str): The :mod:`fnmatch`-compliant filter pattern.
+
+    Returns:
+        str: The SQL expression with a single ``?`` parameter for the
+        `pattern`.
+
+    """
+    if not base.has_wildcards(pattern):
+        return f"{field} = ?"
+    if "[" in pattern:
+        return f"fnmatch({field}, ?)"
+    return f"{field} GLOB ?"
+
+
+def _reversed_phone(phone):
+    """Get the digits of the given `phone` number in reverse order.
+
+    The phone numbers ending with the same digits start with the same
+    reversed digits, so the users are found by the last digits of their
+    phone number with a range of the column's index.
+
+    Args:
+        phone (str): The phone number.
+
+    Returns:
+        str: The reversed digits of the phone number.
+
+    """
+    return base.normalize_phone(phone)[::-1]
+
+
+class SQLiteDataStore(base.BaseDataStore):
+    """The SQLite data store used to access the information for Phonebook."""
+
+    _DEFAULT_PATH = os.path.expandvars("$HOME/phonebook.sqlite")
+    NAME = "sqlite"
+
+    def __init__(self, file_path=None):
+        """Initialize the data store.
+
+        Keyword Args:
+            file_path (str): The path of the SQLite database the data
+                store will use. If None, then the default path will be
+                used.
+
+        """
+        self._file_path = file_path or self._DEFAULT_PATH
+        self._in_batch = False
+        self._lock = locking.ReadWriteLock()
+        _LOGGER.debug(f"Connecting to data store: {self._file_path}")
+        # the connection is shared by every thread, with the lock
+        # ensuring changes are only made by one thread at a time
+        self._connection = sqlite3.connect(self._file_path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.create_function("fnmatch", 2, fnmatch.fnmatch)
+        self._connection.create_function("reversed_phone", 1, _reversed_phone)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS users "
+                "(name TEXT, phone TEXT, address TEXT, reversed_phone TEXT)"
+            )
+            table_info = self._connection.execute("PRAGMA table_info(users)")
+            if "reversed_phone" not in {row["name"] for row in table_info}:
+                # databases created before phone numbers were indexed
+                self._connection.execute(
+                    "ALTER TABLE users ADD COLUMN reversed_phone TEXT"
+                )
+            self._connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS users_name ON users (name)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS users_phone ON users (phone)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS users_address ON users (address)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS users_reversed_phone "
+                "ON users (reversed_phone)"
+            )
+            # index the users added without the store, e.g. by an earlier
+            # version
+            self._connection.execute(
+                "UPDATE users SET reversed_phone = reversed_phone(phone) "
+                "WHERE reversed_phone IS NULL"
+            )
+            has_address_tokens = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'address_tokens'"
+            ).fetchone()
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS address_tokens "
+                "(token TEXT, user_id INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS address_tokens_token "
+                "ON address_tokens (token, user_id)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS address_tokens_user_id "
+                "ON address_tokens (user_id)"
+            )
+            # a built-in trigger, so users deleted by other programs are
+            # removed from the index too
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS users_delete_address_tokens "
+                "AFTER DELETE ON users BEGIN "
+                "DELETE FROM address_tokens WHERE user_id = OLD.rowid; "
+                "END"
+            )
+            if not has_address_tokens:
+                # databases created before addresses were indexed
+                for row in self._connection.execute(
+                    "SELECT rowid, address FROM users"
+                ).fetchall():
+                    self._index_address(row[0], row[1])
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group the changes made inside the context into one transaction.
+
+        The changes are committed once when the context exits. If an
+        exception is raised inside the context then the transaction is
+        rolled back and all of the changes are discarded.
+
+        Yields:
+            SQLiteDataStore: This data store.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # nested batches are part of the outer batch
+                yield self
+                return
+
+            self._in_batch = True
+            try:
+                with self._connection:
+                    yield self
+            finally:
+                self._in_batch = False
+
+    def get(self, name):
+        """Get a single user's information from the data store.
+
+        Args:
+            name (str): The name of the user to get from the data store.
+
+        Returns:
+            dict(str, str): The information for the requested user.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the requested user
+                does not exist in the data store.
+
+        """
+        with self._lock.read():
+            row = self._connection.execute(
+                f"{_SELECT} WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            raise _exceptions.MissingUserError(
+                f"Unable to find a user with '{name}' name!"
+            )
+        return dict(row)
+
+    def read(self, filters=None):
+        """Get user information from the data store.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. Each key of the dictionary is the name of the
+                field to filter by. Each value is a
+                :mod:`fnmatch`-compliant string that must be true for the
+                named field in order for the user to be returned.
+
+                If multiple filters are provided, ALL filters must be
+                valid for a user's information for it to be returned.
+
+                If None then no filters are applied and all user
+                information is returned.
+
+        Returns:
+            list(dict): The list of information for each user that
+            matches the given `filters`.
+
+        """
+        return list(self.iter_read(filters=filters))
+
+    def iter_read(self, filters=None, limit=None, offset=None, after=None):
+        """Iterate over user information from the data store.
+
+        The users are read from the database in chunks as they are
+        iterated over rather than all being loaded at once.
+
+        Keyword Args:
+            filters (dict(str, str) or phonebook.Query or None): The
+                filters to use to restrict the user information
+                returned. See :meth:`read` for details.
+            limit (int or None): The maximum number of users to return.
+                If None then all matching users are returned.
+            offset (int or None): The number of matching users to skip
+                before returning any.
+            after (str or None): The name of the last user returned by
+                the previous page. Only the users after it are returned.
+
+        Returns:
+            iterator(dict): The information for each user that matches
+            the given `filters`.
+
+        Raises:
+            phonebook.MissingUserError: Raised when the `after` user
+                does not exist in the data store.
+
+        """
+        filters = filters or {}
+        clauses = []
+        parameters = []
+        for field, pattern in filters.items():
+            if field not in _COLUMNS:
+                # no user has an unknown field, so nothing can match
+                return iter([])
+            clauses.append(_filter_clause(field, pattern))
+            parameters.append(pattern)
+
+        with self._lock.read():
+            if after is not None:
+                row = self._connection.execute(
+                    "SELECT rowid FROM users WHERE name = ?", (after,)
+                ).fetchone()
+                if row is None:
+                    raise _exceptions.MissingUserError(
+                        f"User '{after}' does not exist in the data store!"
+                    )
+                clauses.append("rowid > ?")
+                parameters.append(row[0])
+
+        return self._iter_rows(clauses, parameters, limit, offset or 0)
+
+    def complete(self, prefix, limit=None):
+        """Get the names of the users that start with the given `prefix`.
+
+        The names are read in order from the unique index of the names,
+        starting at the `prefix`.
+
+        Args:
+            prefix (str): The text the names start with.
+
+        Keyword Args:
+            limit (int or None): The maximum number of names to get. If
+                None then every name with the prefix is returned.
+
+        Returns:
+            list(str): The names starting with the prefix, sorted.
+
+        """
+        with self._lock.read():
+            cursor = self._connection.execute(
+                "SELECT name FROM users WHERE name >= ? ORDER BY name", (prefix,)
+            )
+            names = itertools.takewhile(
+                lambda name: name.startswith(prefix), (row[0] for row in cursor)
+            )
+            return list(itertools.islice(names, limit))
+
+    def lookup_phone(self, number, digits=None):
+        """Get the users with the given phone `number`.
+
+        The reversed digits of each user's phone number are kept in an
+        indexed column, so the users are found with a single lookup (or
+        range, when matching the last `digits`) of the index. Users
+        added to the database by other programs are only indexed when
+        the data store is next opened.
+
+        Args:
+            number (str): The phone number to look up.
+
+        Keyword Args:
+            digits (int or None): Only match the last this many digits
+                of the phone numbers, e.g. to ignore a country or area
+                code. If None then every digit must match.
+
+        Returns:
+            list(dict): The information for each user with the phone
+            number, sorted by name.
+
+        Raises:
+            ValueError: Raised when `digits` is less than one.
+
+        """
+        key = base.normalize_phone(number, digits=digits)
+        if not key:
+            return []
+        if digits is None:
+            clause = "reversed_phone = ?"
+            parameters = [key[::-1]]
+        else:
+            # ":" sorts right after the digits, so the range covers every
+            # value starting with the reversed key
+            clause = "reversed_phone >= ? AND reversed_phone < ?"
+            parameters = [key[::-1], f"{key[::-1]}:"]
+        with self._lock.read():
+            rows = self._connection.execute(
+                f"{_SELECT} WHERE {clause} ORDER BY name", parameters
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, terms, limit=None):
+        """Get the users whose address has every one of the `terms`.
+
+        The words and numbers of each user's address are kept in an
+        indexed table, so the users with every term are found by
+        intersecting the users with each term rather than by checking
+        every address. Users added to (or changed in) the database by
+        other programs are not indexed.
+
+        Args:
+            terms (str): The words and numbers to search for, e.g.
+                ``"main 12"``. Case and punctuation are ignored.
+
+        Keyword Args:
+            limit (int or None): The maximum number of users to get. If
+                None then every user found is returned.
+
+        Returns:
+            list(dict): The information for each user whose address has
+            every term, in the order they were added.
+
+        """
+        tokens = sorted(base.tokenize(terms))
+        if not tokens:
+            return []
+        user_ids = " INTERSECT ".join(
+            ["SELECT user_id FROM address_tokens WHERE token = ?"] * len(tokens)
+        )
+        query = f"{_SELECT} WHERE rowid IN ({user_ids}) ORDER BY rowid"
+        parameters = list(tokens)
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock.read():
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [dict(row) for row in rows]
+
+    def create(self, user):
+        """Add the given `user` to the data store.
+
+        Args:
+            user (dict(str, str)): The user information to add to the
+                data store.
+
+        Raises:
+            phonebook.InvalidUserError: Raised when the given user does
+                not provide needed information for a user.
+            phonebook.DuplicateUserError: Raised when a user with the
+                given `name` already exists in the data store.
+
+        """
+        user = base.validate(user)
+
+        try:
+            with self._transaction():
+                cursor = self._connection.execute(
+                    f"INSERT INTO users ({', '.join(_COLUMNS)}, reversed_phone) "
+                    "VALUES (?, ?, ?, ?)",
+                    [user[column] for column in _COLUMNS]
+                    + [_reversed_phone(user["phone"])],
+                )
+                self._index_address(cursor.lastrowid, user["address"])
+        except sqlite3.IntegrityError:
+            # the unique index on the name is the only constraint
+            raise _exceptions.DuplicateUserError(
+                f"User '{user['name']}' already exists in the data store!"
+            )
+
+    def delete(self, name):
+        """Delete the user with given `name` from the data store.
+
+        Args:
+            name (str): The name of the user to delete from the data
+                store.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+
+        """
+        with self._transaction():
+            cursor = self._connection.execute(
+                "DELETE FROM users WHERE name = ?", (name,)
+            )
+
+        if not cursor.rowcount:
+            raise _exceptions.MissingUserError(
+                f"User '{name}' does not exist in the data store!"
+            )
+
+    def update(self, user_name, **user_fields):
+        """Update the user with the given `user_name` in the data store.
+
+        Args:
+            user_name (str): The name of the user to update from the
+                data store.
+
+        Keyword Args:
+            **user_fields (dict): The user information to replace the
+                requested user's information with. The valid options
+                are:
+
+                * **name**: The name to update the user to.
+                * **phone**: The phone number to update the user to.
+                * **address**: The address to update the user to.
+
+        Raises:
+            phonebook.MissingUserError: Raised when a user with the
+                given `name` does not exist in the data store.
+            phonebook.DuplicateUserError: Raised when a `name` field was
+                given that already exists in the Phonebook.
+
+        """
+        user_fields = base.validate(user_fields, ignore_required_fields=True)
+        if user_fields:
+            columns = [column for column in _COLUMNS if column in user_fields]
+            parameters = [user_fields[column] for column in columns]
+            if "phone" in user_fields:
+                columns.append("reversed_phone")
+                parameters.append(_reversed_phone(user_fields["phone"]))
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            query = f"UPDATE users SET {assignments} WHERE name = ?"
+            parameters.append(user_name)
+        else:
+            # nothing to change, but the user must still exist
+            query = "SELECT 1 FROM users WHERE name = ?"
+            parameters = [user_name]
+
+        try:
+            with self._transaction():
+                cursor = self._connection.execute(query, parameters)
+                found = cursor.rowcount if user_fields else cursor.fetchone()
+                if found and "address" in user_fields:
+                    row = self._connection.execute(
+                        "SELECT rowid FROM users WHERE name = ?",
+                        (user_fields.get("name", user_name),),
+                    ).fetchone()
+                    self._connection.execute(
+                        "DELETE FROM address_tokens WHERE user_id = ?", (row[0],)
+                    )
+                    self._index_address(row[0], user_fields["address"])
+        except sqlite3.IntegrityError:
+            raise _exceptions.DuplicateUserError(
+                f"User '{user_fields['name']}' already exists in the data store!"
+            )
+
+        if not found:
+            raise _exceptions.MissingUserError(
+                f"User '{user_name}' does not exist in the data store!"
+            )
+
+    def _iter_rows(self, clauses, parameters, limit, offset):
+        """Iterate over the users matching the `clauses` in chunks.
+
+        Each chunk is read while holding the lock, since the connection
+        is shared by every thread. The users changed between chunks may
+        or may not be included.
+
+        Args:
+            clauses (list(str)): The SQL conditions the users must match.
+            parameters (list): The parameters of the `clauses`.
+            limit (int or None): The maximum number of users to return.
+            offset (int): The number of matching users to skip.
+
+        Yields:
+            dict(str, str): The information for each user, in the order
+            the users were created in.
+
+        """
+        # keep the order the users were created in, like the file stores,
+        # and resume each chunk after the last user read
+        query = (
+            f"SELECT rowid, {', '.join(_COLUMNS)} FROM users"
+            f" WHERE {' AND '.join(clauses + ['rowid > ?'])}"
+            " ORDER BY rowid LIMIT ? OFFSET ?"
+        )
+        last_rowid = 0
+        while limit is None or limit > 0:
+            size = _READ_CHUNK_SIZE if limit is None else min(limit, _READ_CHUNK_SIZE)
+            with self._lock.read():
+                rows = self._connection.execute(
+                    query, parameters + [last_rowid, size, offset]
+                ).fetchall()
+            for row in rows:
+                yield dict(zip(_COLUMNS, row[1:]))
+            if len(rows) < size:
+                return
+            last_rowid = rows[-1][0]
+            offset = 0
+            if limit is not None:
+                limit -= len(rows)
+
+    def _index_address(self, user_id, address):
+        """Add the tokens of a user's `address` to the index of addresses.
+
+        Args:
+            user_id (int): The rowid of the user.
+            address (str): The address of the user.
+
+        """
+        self._connection.executemany(
+            "INSERT INTO address_tokens (token, user_id) VALUES (?, ?)",
+            [(token, user_id) for token in base.tokenize(address)],
+        )
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Commit the changes made inside the context.
+
+        The data store is exclusively locked for the duration of the
+        context. If a batch is in progress the changes are left for the
+        batch to commit instead.
+
+        """
+        with self._lock.write():
+            if self._in_batch:
+                # only the thread holding the lock can be in the batch
+                yield
+            else:
+                with self._connection:
+                    yield
@@ -1,16 +1,30 @@
 """Main functionality for the Phonebook library."""
 
 
+import itertools
 import logging
 
-from . import _datastore
+from . import _datastore, _exceptions, _transfer
 
 
 _DATA_STORE = None
-_DEFAULT_DATA_STORE = _datastore.DATA_STORES[0]
+_IMPORT_CHUNK_SIZE = 1000
 _LOGGER = logging.getLogger(__name__)
 
 
+def _default_data_store():
+    """Create the default data store, importing it only when it is used.
+
+    Returns:
+        BaseDataStore: The default data store.
+
+    """
+    return _datastore.load_data_store(_datastore.DATA_STORE_NAMES[0])()
+
+
+_DEFAULT_DATA_STORE = _default_data_store
+
+
 def set_data_store(data_store):
     """Set the data store to use.
 
@@ -58,12 +72,13 @@ def read(filters=None):
     """Get user information from the data store.
 
     Keyword Args:
-        filters (dict(str, str) or None): The filters to use to
-            restrict the user information returned. Each key of the
-            dictionary is the name of the field to filter by. Each
-            value is a :mod:`glob`-compliant string that must be
-            true for the named field in order for the user to be
-            returned.
+        filters (dict(str, str) or phonebook.Query or None): The
+            filters to use to restrict the user information returned.
+            Each key of the dictionary is the name of the field to
+            filter by. Each value is a :mod:`glob`-compliant string
+            that must be true for the named field in order for the user
+            to be returned. A :class:`phonebook.Query` compiles the
+            filters once so they can be used for many reads.
 
             If multiple filters are provided, ALL filters must be
             valid for a user's information for it to be returned.
@@ -82,6 +97,137 @@ def read(filters=None):
     return _DATA_STORE.read(filters=filters)
 
 
+def iter_read(filters=None, limit=None, offset=None, after=None):
+    """Iterate over user information from the data store.
+
+    Unlike :func:`read`, the users are not all gathered into a list
+    first, and the results can be split into pages::
+
+        page = list(phonebook.iter_read(limit=100))
+        next_page = list(phonebook.iter_read(limit=100, after=page[-1]["name"]))
+
+    Keyword Args:
+        filters (dict(str, str) or phonebook.Query or None): The
+            filters to use to restrict the user information returned.
+            See :func:`read` for details.
+        limit (int or None): The maximum number of users to return. If
+            None then all matching users are returned.
+        offset (int or None): The number of matching users to skip
+            before returning any.
+        after (str or None): The name of the last user returned by the
+            previous page. Only the users after it are returned, which
+            keeps pages stable when users are created in between pages.
+            The `after` user must still exist, so start again from the
+            first page if it was deleted.
+
+    Returns:
+        iterator(dict): The information for each user that matches the
+        given `filters`.
+
+    Raises:
+        phonebook.MissingUserError: Raised when the `after` user does
+            not exist in the data store.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(
+        f"Iterating over users with filters: {str(filters)} "
+        f"(limit={limit}, offset={offset}, after={after})"
+    )
+    return _DATA_STORE.iter_read(
+        filters=filters, limit=limit, offset=offset, after=after
+    )
+
+
+def complete(prefix, limit=None):
+    """Get the names of the users that start with the given `prefix`.
+
+    The built-in data stores find the names with a sorted index of the
+    names, so completing a name as it is typed doesn't check every
+    user::
+
+        phonebook.complete("Eric", limit=10)
+
+    Args:
+        prefix (str): The text the names start with.
+
+    Keyword Args:
+        limit (int or None): The maximum number of names to get. If None
+            then every name with the prefix is returned.
+
+    Returns:
+        list(str): The names starting with the prefix, sorted.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Completing names with prefix: {prefix} (limit={limit})")
+    return _DATA_STORE.complete(prefix, limit=limit)
+
+
+def lookup_phone(number, digits=None):
+    """Get the users with the given phone `number`.
+
+    Phone numbers are compared by their digits alone, so the number can
+    be formatted differently than the users' phone numbers. The
+    built-in data stores find the users with an index of the normalized
+    phone numbers rather than checking every user::
+
+        phonebook.lookup_phone("+1 (555) 123-4567", digits=10)
+
+    Args:
+        number (str): The phone number to look up.
+
+    Keyword Args:
+        digits (int or None): Only match the last this many digits of
+            the phone numbers, e.g. to ignore a country or area code. If
+            None then every digit must match.
+
+    Returns:
+        list(dict): The information for each user with the phone number,
+        sorted by name.
+
+    Raises:
+        ValueError: Raised when `digits` is less than one.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Looking up phone number: {number} (digits={digits})")
+    return _DATA_STORE.lookup_phone(number, digits=digits)
+
+
+def search(terms, limit=None):
+    """Get the users whose address has every one of the `terms`.
+
+    The terms and the addresses are split into words and numbers,
+    ignoring case and punctuation, so ``"main 12"`` finds
+    ``"12 Main St."`` but not ``"120 Main St."``. The built-in data
+    stores find the users with an index of the words of the addresses
+    rather than checking every user::
+
+        phonebook.search("main 12", limit=10)
+
+    Args:
+        terms (str): The words and numbers to search for.
+
+    Keyword Args:
+        limit (int or None): The maximum number of users to get. If None
+            then every user found is returned.
+
+    Returns:
+        list(dict): The information for each user whose address has every
+        term, in the order they were added. Empty if the `terms` have no
+        words or numbers.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Searching addresses for: {terms} (limit={limit})")
+    return _DATA_STORE.search(terms, limit=limit)
+
+
 def create(user):
     """Add the given `user` to the data store.
 
@@ -147,3 +293,209 @@ def update(user_name, **user_fields):
         set_data_store(_DEFAULT_DATA_STORE())
     _LOGGER.debug(f"Updating '{user_name}' user to: {str(user_fields)}")
     _DATA_STORE.update(user_name, **user_fields)
+
+
+def batch():
+    """Group the changes made inside the returned context into one batch.
+
+    The built-in data stores, other than the remote data store, persist
+    the changes made inside the context once when it exits, and discard
+    all of them if an exception is raised inside the context::
+
+        with phonebook.batch():
+            phonebook.create(user)
+            phonebook.delete(other_user["name"])
+
+    The remote data store sends each change to the server as it is
+    made, so the changes made before an exception are kept.
+
+    Returns:
+        contextmanager: The context to make the batch of changes in.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug("Starting a batch of changes")
+    return _DATA_STORE.batch()
+
+
+def create_many(users):
+    """Add all of the given `users` to the data store in one batch.
+
+    If any of the users cannot be added then none of them are added,
+    unless the data store doesn't support batches (see :func:`batch`).
+
+    Args:
+        users (iterable(dict(str, str))): The information of each user
+            to add to the data store.
+
+    Raises:
+        phonebook.InvalidUserError: Raised when a given user does not
+            provide needed information for a user.
+        phonebook.DuplicateUserError: Raised when a user with a given
+            `name` already exists in the data store.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug("Creating many users")
+    _DATA_STORE.create_many(users)
+
+
+def delete_many(names):
+    """Delete the users with the given `names` in one batch.
+
+    If any of the users cannot be deleted then none of them are
+    deleted, unless the data store doesn't support batches (see
+    :func:`batch`).
+
+    Args:
+        names (iterable(str)): The names of the users to delete from the
+            data store.
+
+    Raises:
+        phonebook.MissingUserError: Raised when a user with a given name
+            does not exist in the data store.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug("Deleting many users")
+    _DATA_STORE.delete_many(names)
+
+
+def update_many(updates):
+    """Update many users in the data store in one batch.
+
+    If any of the users cannot be updated then none of them are
+    updated, unless the data store doesn't support batches (see
+    :func:`batch`).
+
+    Args:
+        updates (dict(str, dict(str, str))): The user information to
+            replace, keyed by the name of the user to update. See
+            :func:`update` for the valid fields.
+
+    Raises:
+        phonebook.MissingUserError: Raised when a user with a given name
+            does not exist in the data store.
+        phonebook.DuplicateUserError: Raised when a `name` field was
+             given that already exists in the Phonebook.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Updating many users: {list(updates)}")
+    _DATA_STORE.update_many(updates)
+
+
+def import_users(input_file, input_format, skip_duplicates=False):
+    """Add all of the users in the given file to the data store in one batch.
+
+    The file is read, validated, and added to the data store a chunk of
+    users at a time, so it doesn't need to fit in memory. The changes
+    are saved once all of the users are added::
+
+        with open("users.csv", newline="") as users_file:
+            phonebook.import_users(users_file, "csv")
+
+    If any user cannot be added then none of them are added, unless the
+    data store doesn't support batches (see :func:`batch`).
+
+    Args:
+        input_file (file): The file to read the users from. CSV files
+            should be opened with ``newline=""``.
+        input_format (str): The format of the file. One of ``"csv"``,
+            ``"ndjson"``, ``"json"``, or ``"yaml"``.
+
+    Keyword Args:
+        skip_duplicates (bool): Skip the users whose name is already in
+            the data store or earlier in the file, rather than failing.
+
+    Returns:
+        int: The number of users added.
+
+    Raises:
+        ValueError: Raised when the file isn't valid for the
+            `input_format`.
+        phonebook.InvalidUserError: Raised when a user in the file does
+            not provide needed information for a user.
+        phonebook.DuplicateUserError: Raised when a user's name is
+            already in the data store or earlier in the file, unless
+            `skip_duplicates` is True.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Importing {input_format} users")
+
+    users = _transfer.read_users(input_file, input_format)
+    names = set()
+    created = 0
+    with _DATA_STORE.batch():
+        for chunk_start in itertools.count(step=_IMPORT_CHUNK_SIZE):
+            chunk = list(itertools.islice(users, _IMPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+
+            new_users = []
+            for user_number, user in enumerate(chunk, start=chunk_start + 1):
+                try:
+                    user = _datastore.base.validate(user)
+                except (_exceptions.InvalidUserError, AttributeError) as error:
+                    raise _exceptions.InvalidUserError(
+                        f"Invalid user #{user_number}: {error}"
+                    )
+                if user["name"] in names:
+                    if skip_duplicates:
+                        continue
+                    raise _exceptions.DuplicateUserError(
+                        f"User '{user['name']}' is in the file more than once!"
+                    )
+                names.add(user["name"])
+                new_users.append(user)
+
+            if not skip_duplicates:
+                _DATA_STORE.create_many(new_users)
+                created += len(new_users)
+                continue
+            for user in new_users:
+                try:
+                    _DATA_STORE.create(user)
+                except _exceptions.DuplicateUserError:
+                    continue
+                created += 1
+
+    _LOGGER.debug(f"Imported {created} users")
+    return created
+
+
+def export_users(output_file, output_format, filters=None):
+    """Write the users in the data store to the given file.
+
+    The users are written as they are read from the data store, so they
+    don't need to fit in memory.
+
+    Args:
+        output_file (file): The file to write the users to. CSV files
+            should be opened with ``newline=""``.
+        output_format (str): The format to write the users in. One of
+            ``"csv"``, ``"ndjson"``, ``"json"``, or ``"yaml"``.
+
+    Keyword Args:
+        filters (dict(str, str) or phonebook.Query or None): The
+            filters to use to restrict the users written. See
+            :func:`read` for details.
+
+    Returns:
+        int: The number of users written.
+
+    Raises:
+        ValueError: Raised when the `output_format` isn't supported.
+
+    """
+    if not _DATA_STORE:
+        set_data_store(_DEFAULT_DATA_STORE())
+    _LOGGER.debug(f"Exporting {output_format} users with filters: {str(filters)}")
+    users = _DATA_STORE.iter_read(filters=filters)
+    return _transfer.write_users(users, output_file, output_format)
@@ -0,0 +1,308 @@
+"""Compiled filters used to find users in the Phonebook."""
+
+
+import collections
+import collections.abc
+import fnmatch
+import functools
+import operator
+import os
+import re
+
+from ._datastore import base
+
+
+_CACHE_SIZE = 256
+# `fnmatch.fnmatch` normalizes the case (and slashes) of both the value
+# and the pattern on platforms like Windows, which plain string
+# comparisons can't replicate, so they are only used when normalizing
+# does nothing
+_PLAIN_COMPARISONS = os.path.normcase("Aa/") == "Aa/"
+# the order predicates are checked in, from the most to least selective
+_KIND_RANKS = {
+    "exact": 0,
+    "prefix": 1,
+    "suffix": 1,
+    "contains": 2,
+    "pattern": 3,
+    "any": 4,
+}
+
+
+_Predicate = collections.namedtuple("_Predicate", "field kind literal match")
+"""namedtuple: A single compiled filter.
+
+Attributes:
+    field (str): The name of the field the filter applies to.
+    kind (str): The kind of pattern. One of "exact", "prefix", "suffix",
+        "contains", "pattern", or "any".
+    literal (str or None): The literal text of an "exact", "prefix",
+        "suffix", or "contains" pattern.
+    match (callable): Takes the value of the field and returns True if
+        it matches the pattern.
+"""
+
+
+def _compile_predicate(field, pattern):
+    """Compile the filter `pattern` for the given `field`.
+
+    Args:
+        field (str): The name of the field the filter applies to.
+        pattern (str): The :mod:`fnmatch`-compliant pattern to compile.
+
+    Returns:
+        _Predicate: The compiled filter.
+
+    """
+    if not _PLAIN_COMPARISONS:
+        return _Predicate(
+            field, "pattern", None, lambda value: fnmatch.fnmatch(value, pattern)
+        )
+
+    if pattern and not pattern.strip("*"):
+        return _Predicate(field, "any", None, lambda value: True)
+
+    if not base.has_wildcards(pattern):
+        # unlike pattern.__eq__, never truthy for a value that isn't a
+        # string
+        return _Predicate(
+            field, "exact", pattern, functools.partial(operator.eq, pattern)
+        )
+
+    literal = pattern.strip("*")
+    if not base.has_wildcards(literal):
+        if pattern == f"{literal}*":
+            return _Predicate(
+                field, "prefix", literal, lambda value: value.startswith(literal)
+            )
+        if pattern == f"*{literal}":
+            return _Predicate(
+                field, "suffix", literal, lambda value: value.endswith(literal)
+            )
+        if pattern == f"*{literal}*":
+            return _Predicate(
+                field, "contains", literal, lambda value: literal in value
+            )
+
+    return _Predicate(
+        field, "pattern", None, re.compile(fnmatch.translate(pattern)).match
+    )
+
+
+def _literal_runs(pattern):
+    """Get the runs of literal text in the given `pattern`.
+
+    The runs are split by the wildcards and character sets of the
+    pattern the same way :func:`fnmatch.translate` parses them.
+
+    Args:
+        pattern (str): The :mod:`fnmatch`-compliant pattern.
+
+    Returns:
+        list(str): The runs of literal text, in order.
+
+    """
+    runs = []
+    run = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char in "*?":
+            runs.append(run)
+            run = ""
+        elif char == "[":
+            end = index
+            if end < len(pattern) and pattern[end] == "!":
+                end += 1
+            if end < len(pattern) and pattern[end] == "]":
+                end += 1
+            end = pattern.find("]", end)
+            if end == -1:
+                # an unterminated character set is a literal "["
+                run += char
+            else:
+                runs.append(run)
+                run = ""
+                index = end + 1
+        else:
+            run += char
+    runs.append(run)
+    return [run for run in runs if run]
+
+
+def _selectivity(predicate):
+    """Estimate how few users the given `predicate` matches.
+
+    Args:
+        predicate (_Predicate): The compiled filter to estimate.
+
+    Returns:
+        tuple: A sort key where the most selective predicates are the
+        smallest.
+
+    """
+    return (_KIND_RANKS[predicate.kind], -len(predicate.literal or ""))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _compile_query(filter_items):
+    """Compile (or get the already compiled) query for the given filters.
+
+    Args:
+        filter_items (tuple(tuple(str, str))): The sorted field and
+            pattern of each filter.
+
+    Returns:
+        Query: The compiled query.
+
+    """
+    return Query(dict(filter_items))
+
+
+class Query(collections.abc.Mapping):
+    """Filters compiled to efficiently find the users that match them.
+
+    A query is a read-only mapping of each field to filter by to the
+    :mod:`fnmatch`-compliant pattern it must match, so it can be used
+    anywhere the filters dictionary is accepted, e.g.::
+
+        query = phonebook.Query({"name": "Eric *", "phone": "555-*"})
+        phonebook.read(filters=query)
+
+    Each pattern is compiled once. Simple patterns (e.g. ``"abc"``,
+    ``"abc*"``, ``"*abc"``, and ``"*"``) are checked with plain string
+    comparisons rather than regular expressions, and the filters most
+    likely to reject a user are checked first.
+
+    """
+
+    def __init__(self, filters=None):
+        """Initialize the query.
+
+        Keyword Args:
+            filters (dict(str, str) or None): The filters to compile.
+                Each key of the dictionary is the name of the field to
+                filter by. Each value is a :mod:`fnmatch`-compliant
+                string that must be true for the named field in order
+                for the user to match. If None then every user matches.
+
+        """
+        self._filters = dict(filters or {})
+        predicates = [
+            _compile_predicate(field, pattern)
+            for field, pattern in self._filters.items()
+        ]
+        self._predicates = tuple(
+            (predicate.field, predicate.match)
+            for predicate in sorted(predicates, key=_selectivity)
+            # matching anything is only meaningful when the field might
+            # be missing
+            if predicate.kind != "any" or predicate.field not in base.REQUIRED_FIELDS
+        )
+        self._predicates_by_field = {
+            predicate.field: predicate for predicate in predicates
+        }
+        self._literals_by_field = {
+            field: _literal_runs(pattern) if _PLAIN_COMPARISONS else []
+            for field, pattern in self._filters.items()
+        }
+
+    @classmethod
+    def compile(cls, filters=None):
+        """Get the compiled query for the given `filters`.
+
+        Recently compiled queries are cached, so repeatedly reading
+        with the same filters only compiles them once.
+
+        Args:
+            filters (dict(str, str) or Query or None): The filters to
+                compile. If already a :class:`Query` it is returned
+                as-is.
+
+        Returns:
+            Query: The compiled query.
+
+        """
+        if isinstance(filters, cls):
+            return filters
+        return _compile_query(tuple(sorted((filters or {}).items())))
+
+    def __getitem__(self, field):
+        """Get the pattern for the given `field`."""
+        return self._filters[field]
+
+    def __iter__(self):
+        """Iterate over the fields that are filtered by."""
+        return iter(self._filters)
+
+    def __len__(self):
+        """Get the number of filters."""
+        return len(self._filters)
+
+    def __repr__(self):
+        """Get the representation of the query."""
+        return f"{self.__class__.__name__}({self._filters!r})"
+
+    def exact(self, field):
+        """Get the only value the given `field` can have to match.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            str or None: The value the `field` must equal, or None if
+            the field's filter is not an exact match (or there is no
+            filter for the field).
+
+        """
+        predicate = self._predicates_by_field.get(field)
+        if predicate is None or predicate.kind != "exact":
+            return None
+        return predicate.literal
+
+    def prefix(self, field):
+        """Get the prefix the given `field` must start with to match.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            str or None: The text the `field` must start with, or None
+            if the field's filter is not a pure prefix pattern like
+            ``"abc*"`` (or there is no filter for the field).
+
+        """
+        predicate = self._predicates_by_field.get(field)
+        if predicate is None or predicate.kind != "prefix":
+            return None
+        return predicate.literal
+
+    def literals(self, field):
+        """Get the literal text any value matching the `field` contains.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            list(str): The runs of literal text, in order, that every
+            value matching the field's filter must contain. Empty if
+            there is no filter for the field.
+
+        """
+        return self._literals_by_field.get(field, [])
+
+    def matches(self, user):
+        """Check if the given `user` matches all of the filters.
+
+        Args:
+            user (dict(str, str)): The user information to check.
+
+        Returns:
+            bool: True if the `user` matches every filter.
+
+        """
+        for field, match in self._predicates:
+            if not match(user[field]):
+                return False
+        return True
@@ -0,0 +1,404 @@
+"""An HTTP server that keeps a data store loaded to serve the Phonebook.
+
+The server exposes the public interface of :mod:`phonebook` as JSON over
+HTTP/1.1 (with keep-alive), on either a TCP port or a Unix socket:
+
+* ``GET /users/<name>``: Get a user.
+* ``GET /users?name=...&phone=...&address=...``: Read the users matching
+  the filters, with the optional ``limit``, ``offset``, and ``after``
+  parameters. The users are streamed as newline-delimited JSON.
+* ``POST /users``: Create the user in the JSON body.
+* ``PATCH /users/<name>``: Update a user with the fields in the JSON
+  body.
+* ``DELETE /users/<name>``: Delete a user.
+* ``GET /names?prefix=...``: Get the names starting with the prefix as a
+  JSON list, with the optional ``limit`` parameter.
+* ``GET /phones/<number>``: Get the users with the phone number as a
+  JSON list, with the optional ``digits`` parameter to only match the
+  last digits.
+* ``GET /search?terms=...``: Get the users whose address has every
+  term as a JSON list, with the optional ``limit`` parameter.
+
+Errors are returned as a JSON object with the name of the ``error`` and
+its ``message``.
+"""
+
+
+import http.server
+import itertools
+import json
+import logging
+import os
+import socketserver
+import stat
+import urllib.parse
+
+import phonebook
+
+from . import _exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+_READ_CHUNK_SIZE = 100
+_USER_ERRORS = (
+    _exceptions.InvalidUserError,
+    _exceptions.MissingUserError,
+    _exceptions.DuplicateUserError,
+)
+
+ERROR_STATUSES = {
+    _exceptions.InvalidUserError.__name__: 400,
+    _exceptions.MissingUserError.__name__: 404,
+    _exceptions.DuplicateUserError.__name__: 409,
+}
+"""dict(str, int): The HTTP status of each error raised by the Phonebook."""
+
+
+def parse_address(address):
+    """Parse the address of a server.
+
+    Args:
+        address (str): Either ``HOST:PORT`` or the path of a Unix
+            socket.
+
+    Returns:
+        tuple(str, int) or str: The host and port, or the path of the
+        Unix socket.
+
+    """
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def make_server(address):
+    """Create a server for the Phonebook.
+
+    The server uses the data store set with
+    :func:`phonebook.set_data_store` and handles each connection in its
+    own thread.
+
+    Args:
+        address (str): The address to serve on. Either ``HOST:PORT`` or
+            the path of a Unix socket.
+
+    Returns:
+        socketserver.BaseServer: The server, which is started with
+        :meth:`~socketserver.BaseServer.serve_forever`.
+
+    Raises:
+        FileExistsError: Raised when the address is the path of a file
+            that isn't a Unix socket.
+
+    """
+    server_address = parse_address(address)
+    if isinstance(server_address, str):
+        return _UnixHTTPServer(server_address, _RequestHandler)
+    return _TCPHTTPServer(server_address, _RequestHandler)
+
+
+class _TCPHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """An HTTP server on a TCP port that handles requests in threads."""
+
+    daemon_threads = True
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """An HTTP server on a Unix socket that handles requests in threads."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        """Bind to the Unix socket, replacing a stale socket file.
+
+        Raises:
+            FileExistsError: Raised when something other than a socket
+                already exists at the address, so it isn't removed.
+
+        """
+        if _is_socket(self.server_address):
+            os.remove(self.server_address)
+        elif os.path.lexists(self.server_address):
+            raise FileExistsError(
+                f"Unable to serve on '{self.server_address}', which already "
+                "exists and isn't a Unix socket!"
+            )
+        super().server_bind()
+
+    def server_close(self):
+        """Close the server and remove its socket file."""
+        super().server_close()
+        if _is_socket(self.server_address):
+            os.remove(self.server_address)
+
+
+class _HTTPError(Exception):
+    """An error with the request made to the server."""
+
+    def __init__(self, status, message):
+        """Initialize the error.
+
+        Args:
+            status (int): The HTTP status of the error.
+            message (str): The description of the error.
+
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """Handles the HTTP requests made to the server."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"phonebook/{phonebook.__version__}"
+
+    def do_GET(self):
+        """Get, read, complete, look up, or search for users."""
+        resource = urllib.parse.urlsplit(self.path).path.strip("/").split("/", 1)[0]
+        if resource == "names":
+            self._dispatch(self._complete, resource="names")
+        elif resource == "phones":
+            self._dispatch(self._lookup_phone, resource="phones")
+        elif resource == "search":
+            self._dispatch(self._search, resource="search")
+        else:
+            self._dispatch(self._get)
+
+    def do_POST(self):
+        """Create a user."""
+        self._dispatch(self._create)
+
+    def do_PATCH(self):
+        """Update a user."""
+        self._dispatch(self._update)
+
+    def do_DELETE(self):
+        """Delete a user."""
+        self._dispatch(self._delete)
+
+    def address_string(self):
+        """Get the address of the client, which is empty for Unix sockets."""
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Log the requests to the module's logger rather than stderr."""
+        _LOGGER.debug(f"{self.address_string()} - {format % args}")
+
+    def _dispatch(self, handler, resource="users"):
+        """Handle the request, sending any errors to the client.
+
+        Args:
+            handler (callable): Takes the name of the user in the path
+                (or None) and the query parameters, and handles the
+                request.
+
+        Keyword Args:
+            resource (str): The first part of the path the request must
+                be for.
+
+        """
+        self._streaming = False
+        self._body_read = False
+        try:
+            path = urllib.parse.urlsplit(self.path)
+            parts = path.path.strip("/").split("/", 1)
+            if parts[0] != resource:
+                raise _HTTPError(404, f"Unknown path: {path.path}")
+            name = urllib.parse.unquote(parts[1]) if len(parts) > 1 else None
+            handler(name, urllib.parse.parse_qs(path.query))
+        except _HTTPError as error:
+            self._discard_body()
+            self._send_json(error.status, {"error": "HTTPError", "message": str(error)})
+        except _USER_ERRORS as error:
+            self._discard_body()
+            error_name = error.__class__.__name__
+            self._send_json(
+                ERROR_STATUSES[error_name], {"error": error_name, "message": str(error)}
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception(f"Failed to handle {self.command} {self.path}")
+            if self._streaming:
+                # the users were partly sent, so the response can't be
+                # finished and the client sees the connection close
+                self.close_connection = True
+            else:
+                self._discard_body()
+                self._send_json(
+                    500, {"error": "InternalServerError", "message": str(error)}
+                )
+
+    def _get(self, name, query):
+        """Get the named user, or read the users matching the query."""
+        if name is not None:
+            self._send_json(200, phonebook.get(name))
+            return
+
+        filters = {
+            field: query[field][-1]
+            for field in ("name", "phone", "address")
+            if field in query
+        }
+        pagination = {field: _count(query, field) for field in ("limit", "offset")}
+        pagination["after"] = query["after"][-1] if "after" in query else None
+        self._send_users(phonebook.iter_read(filters=filters, **pagination))
+
+    def _complete(self, name, query):
+        """Get the names of the users starting with the prefix."""
+        limit = _count(query, "limit")
+        prefix = query["prefix"][-1] if "prefix" in query else ""
+        self._send_json(200, phonebook.complete(prefix, limit=limit))
+
+    def _lookup_phone(self, number, query):
+        """Get the users with the phone number in the path."""
+        if number is None:
+            raise _HTTPError(404, "Phone numbers are looked up at /phones/<number>")
+        try:
+            digits = int(query["digits"][-1]) if "digits" in query else None
+            users = phonebook.lookup_phone(number, digits=digits)
+        except ValueError:
+            raise _HTTPError(400, "The digits must be a positive integer")
+        self._send_json(200, users)
+
+    def _search(self, name, query):
+        """Get the users whose address has every term."""
+        limit = _count(query, "limit")
+        terms = query["terms"][-1] if "terms" in query else ""
+        self._send_json(200, phonebook.search(terms, limit=limit))
+
+    def _create(self, name, query):
+        """Create the user in the body of the request."""
+        if name is not None:
+            raise _HTTPError(405, "Users are created at /users")
+        phonebook.create(self._read_json())
+        self._send_json(201, {})
+
+    def _update(self, name, query):
+        """Update the named user with the fields in the body."""
+        if name is None:
+            raise _HTTPError(405, "Users are updated at /users/<name>")
+        phonebook.update(name, **self._read_json())
+        self._send_json(200, {})
+
+    def _delete(self, name, query):
+        """Delete the named user."""
+        if name is None:
+            raise _HTTPError(405, "Users are deleted at /users/<name>")
+        phonebook.delete(name)
+        self._send_json(200, {})
+
+    def _read_json(self):
+        """Read the JSON object in the body of the request.
+
+        Returns:
+            dict: The object in the body.
+
+        Raises:
+            _HTTPError: Raised when the body isn't a JSON object.
+
+        """
+        self._body_read = True
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"null")
+        except ValueError:
+            raise _HTTPError(400, "The body must be a JSON object")
+        if not isinstance(body, dict):
+            raise _HTTPError(400, "The body must be a JSON object")
+        return body
+
+    def _discard_body(self):
+        """Read the body of the request if it wasn't read yet.
+
+        Otherwise the body would be parsed as the next request on the
+        kept-alive connection.
+
+        """
+        if self._body_read:
+            return
+        self._body_read = True
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self.close_connection = True
+            return
+        if length > 0:
+            self.rfile.read(length)
+
+    def _send_json(self, status, body):
+        """Send the given `body` to the client as JSON.
+
+        Args:
+            status (int): The HTTP status of the response.
+            body (object): The object to send.
+
+        """
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_users(self, users):
+        """Stream the given `users` to the client as newline-delimited JSON.
+
+        Args:
+            users (iterator(dict)): The users to send.
+
+        """
+        self._streaming = True
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        while True:
+            chunk = list(itertools.islice(users, _READ_CHUNK_SIZE))
+            if not chunk:
+                break
+            data = "".join(f"{json.dumps(user)}\n" for user in chunk).encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def _count(query, field):
+    """Get the count in the given `field` of the query parameters.
+
+    Args:
+        query (dict(str, list(str))): The query parameters.
+        field (str): The name of the parameter.
+
+    Returns:
+        int or None: The count, or None if the parameter isn't given.
+
+    Raises:
+        _HTTPError: Raised when the parameter isn't a non-negative
+            integer.
+
+    """
+    if field not in query:
+        return None
+    try:
+        count = int(query[field][-1])
+    except ValueError:
+        count = -1
+    if count < 0:
+        raise _HTTPError(400, f"The {field} must be a non-negative integer")
+    return count
+
+
+def _is_socket(path):
+    """Check if the given `path` is a Unix socket.
+
+    Args:
+        path (str): The path to check.
+
+    Returns:
+        bool: True if the `path` exists and is a Unix socket.
+
+    """
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,216 @@
+"""Streaming readers and writers of users in the import and export formats.
+
+Every format is read and written one user at a time, so files much
+larger than memory can be imported and exported. :mod:`yaml` is only
+imported when YAML is read or written.
+"""
+
+
+import csv
+import json
+import os
+
+
+FORMATS = ("csv", "ndjson", "json", "yaml")
+"""tuple(str): The formats users can be imported from and exported to."""
+
+_EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+_FIELDS = ("name", "phone", "address")
+_JSON_CHUNK_SIZE = 64 * 1024
+
+
+def guess_format(file_path):
+    """Guess the format of a file from its extension.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str or None: The format of the file, or None if the extension
+        isn't known.
+
+    """
+    return _EXTENSION_FORMATS.get(os.path.splitext(file_path)[1].lower())
+
+
+def read_users(input_file, input_format):
+    """Iterate over the users in the given file.
+
+    Args:
+        input_file (file): The file to read the users from. CSV files
+            should be opened with ``newline=""``.
+        input_format (str): The format of the file. One of
+            :data:`FORMATS`.
+
+    Returns:
+        iterator(dict): The information for each user in the file.
+
+    Raises:
+        ValueError: Raised when the `input_format` isn't supported, or
+            the file isn't valid for the format.
+
+    """
+    if input_format not in FORMATS:
+        raise ValueError(f"Unsupported format: {input_format}")
+    return _READERS[input_format](input_file)
+
+
+def write_users(users, output_file, output_format):
+    """Write the given `users` to the file.
+
+    Args:
+        users (iterable(dict)): The information of each user to write.
+        output_file (file): The file to write the users to. CSV files
+            should be opened with ``newline=""``.
+        output_format (str): The format to write the users in. One of
+            :data:`FORMATS`.
+
+    Returns:
+        int: The number of users written.
+
+    Raises:
+        ValueError: Raised when the `output_format` isn't supported.
+
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"Unsupported format: {output_format}")
+    return _WRITERS[output_format](users, output_file)
+
+
+def _read_csv(input_file):
+    """Iterate over the users in a CSV file with a header row."""
+    for user in csv.DictReader(input_file):
+        # the fields missing from the end of a row are None
+        yield {field: value for field, value in user.items() if value is not None}
+
+
+def _read_ndjson(input_file):
+    """Iterate over the users in a newline-delimited JSON file."""
+    for line_number, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"Invalid JSON on line {line_number}: {error}")
+
+
+def _read_json(input_file):
+    """Iterate over the users in a JSON file containing a list of users.
+
+    The list is decoded one user at a time rather than all at once.
+
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def next_token(token_chars):
+        # skip the whitespace before the next token, reading more of the
+        # file as needed, and return it if it is one of `token_chars`
+        nonlocal buffer, position, eof
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            buffer, position = input_file.read(_JSON_CHUNK_SIZE), 0
+            eof = not buffer
+        if position < len(buffer) and buffer[position] in token_chars:
+            position += 1
+            return buffer[position - 1]
+        return None
+
+    if next_token("[") is None:
+        raise ValueError("The JSON file must contain a list of users")
+    if next_token("]") is not None:
+        return
+
+    while True:
+        next_token("")
+        while True:
+            try:
+                user, end = decoder.raw_decode(buffer, position)
+                break
+            except ValueError:
+                # the user may be split across chunks of the file
+                chunk = "" if eof else input_file.read(_JSON_CHUNK_SIZE)
+                if not chunk:
+                    raise
+                buffer, position = buffer[position:] + chunk, 0
+        position = end
+        yield user
+
+        separator = next_token(",]")
+        if separator == "]":
+            return
+        if separator is None:
+            raise ValueError("Expected ',' or ']' between the users")
+
+
+def _read_yaml(input_file):
+    """Iterate over the users in a YAML file containing a list of users.
+
+    The file is parsed into events so only one user is held at a time.
+
+    """
+    from ._datastore import codec
+
+    return codec.YAMLCodec().iter_load(input_file)
+
+
+def _write_csv(users, output_file):
+    """Write the users to a CSV file with a header row."""
+    writer = csv.DictWriter(output_file, fieldnames=_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for count, user in enumerate(users, start=1):
+        writer.writerow(user)
+    return count
+
+
+def _write_ndjson(users, output_file):
+    """Write the users to a newline-delimited JSON file."""
+    count = 0
+    for count, user in enumerate(users, start=1):
+        output_file.write(f"{json.dumps(user)}\n")
+    return count
+
+
+def _write_json(users, output_file):
+    """Write the users to a JSON file as a list, one user per line."""
+    output_file.write("[")
+    count = 0
+    for count, user in enumerate(users, start=1):
+        output_file.write(f"{',' if count > 1 else ''}\n  {json.dumps(user)}")
+    output_file.write("\n]\n" if count else "]\n")
+    return count
+
+
+def _write_yaml(users, output_file):
+    """Write the users to a YAML file as a list, one user at a time."""
+    from ._datastore import codec
+
+    return codec.YAMLCodec().dump(users, output_file)
+
+
+_READERS = {
+    "csv": _read_csv,
+    "ndjson": _read_ndjson,
+    "json": _read_json,
+    "yaml": _read_yaml,
+}
+_WRITERS = {
+    "csv": _write_csv,
+    "ndjson": _write_ndjson,
+    "json": _write_json,
+    "yaml": _write_yaml,
+}
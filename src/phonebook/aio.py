@@ -0,0 +1,340 @@
+"""Asynchronous functionality for the Phonebook library.
+
+The functions mirror those of :mod:`phonebook` and share its data store,
+but can be awaited from an :mod:`asyncio` event loop. Reading and
+writing the data store (including parsing and serializing its file) is
+run in the event loop's default executor so the loop is never blocked.
+
+Changes made at the same time are grouped into a single
+:func:`phonebook.batch`, so many concurrent changes only write the data
+store once, e.g.::
+
+    await asyncio.gather(
+        phonebook.aio.create({"name": "Eric Idle", ...}),
+        phonebook.aio.create({"name": "John Cleese", ...}),
+    )
+
+"""
+
+
+import asyncio
+import functools
+import itertools
+import logging
+
+from . import _main
+
+
+_LOGGER = logging.getLogger(__name__)
+_READ_CHUNK_SIZE = 100
+
+
+class _WriteCoalescer(object):
+    """Groups the changes made at the same time into a single batch."""
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self._pending = []
+        self._flush_task = None
+
+    async def submit(self, method_name, *args, **kwargs):
+        """Make a change to the data store.
+
+        The change is made along with every other change submitted
+        before the changes are next written.
+
+        Args:
+            method_name (str): The name of the data store's method that
+                makes the change.
+            *args (list): The positional arguments of the method.
+
+        Keyword Args:
+            **kwargs (dict): The keyword arguments of the method.
+
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending.append((method_name, args, kwargs, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush())
+        await future
+
+    async def wait(self):
+        """Wait for the submitted changes to be written."""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def _flush(self):
+        """Write the submitted changes until there are none left."""
+        try:
+            while self._pending:
+                changes, self._pending = self._pending, []
+                errors = await _run(_apply_changes, [change[:3] for change in changes])
+                for (_, _, _, future), error in zip(changes, errors):
+                    if future.done():
+                        # the caller was cancelled
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+        finally:
+            self._flush_task = None
+
+
+_WRITES = _WriteCoalescer()
+
+
+def _data_store():
+    """Get the data store, creating the default data store if needed.
+
+    Returns:
+        BaseDataStore: The data store used by the public interface.
+
+    """
+    if not _main._DATA_STORE:
+        _main.set_data_store(_main._DEFAULT_DATA_STORE())
+    return _main._DATA_STORE
+
+
+def _apply_changes(changes):
+    """Make the given changes to the data store in a single batch.
+
+    A change that fails (e.g. because of an invalid, missing, or
+    duplicate user) doesn't affect the other changes.
+
+    Args:
+        changes (list(tuple(str, tuple, dict))): The name of the data
+            store's method, and its positional and keyword arguments, of
+            each change.
+
+    Returns:
+        list(Exception or None): The error raised by each change, or
+        None if it succeeded.
+
+    """
+    data_store = _data_store()
+    errors = []
+    try:
+        with data_store.batch():
+            for method_name, args, kwargs in changes:
+                try:
+                    getattr(data_store, method_name)(*args, **kwargs)
+                except Exception as error:  # pylint: disable=broad-except
+                    errors.append(error)
+                else:
+                    errors.append(None)
+    except Exception as error:  # pylint: disable=broad-except
+        # nothing was written, so every change failed
+        return [error] * len(changes)
+    return errors
+
+
+async def _run(function, *args):
+    """Run the `function` in the event loop's default executor.
+
+    Args:
+        function (callable): The function to run.
+        *args (list): The arguments of the function.
+
+    Returns:
+        object: The result of the function.
+
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(function, *args))
+
+
+async def set_data_store(data_store):
+    """Set the data store to use.
+
+    Any changes being made to the previous data store are written first.
+
+    Args:
+        data_store (BaseDataStore): A
+            :class:`~._datastore.base.BaseDataStore` subclass to use for
+            the public interface.
+
+    Raises:
+        TypeError: Raised when the given `data_store` is not a subclass
+            of :class:`~._datastore.base.BaseDataStore`.
+
+    """
+    await _WRITES.wait()
+    _main.set_data_store(data_store)
+
+
+async def get(name):
+    """Get a single user's information from the data store.
+
+    Args:
+        name (str): The name of the user to get from the data store.
+
+    Returns:
+        dict(str, str): The information for the requested user.
+
+    Raises:
+        phonebook.MissingUserError: Raised when the requested user does
+            not exist in the data store.
+
+    """
+    _LOGGER.debug(f"Getting user: {name}")
+    return await _run(lambda: _data_store().get(name))
+
+
+async def read(filters=None, limit=None, offset=None, after=None):
+    """Iterate over user information from the data store.
+
+    The users are read from the data store in chunks as they are
+    iterated over, e.g.::
+
+        async for user in phonebook.aio.read(filters={"name": "Eric*"}):
+            print(user)
+
+    Keyword Args:
+        filters (dict(str, str) or phonebook.Query or None): The
+            filters to use to restrict the user information returned.
+            See :func:`phonebook.read` for details.
+        limit (int or None): The maximum number of users to return. If
+            None then all matching users are returned.
+        offset (int or None): The number of matching users to skip
+            before returning any.
+        after (str or None): The name of the last user returned by the
+            previous page. Only the users after it are returned.
+
+    Yields:
+        dict(str, str): The information for each user that matches the
+        given `filters`.
+
+    Raises:
+        phonebook.MissingUserError: Raised when the `after` user does
+            not exist in the data store.
+
+    """
+    _LOGGER.debug(f"Reading users with filters: {str(filters)}")
+    users = await _run(
+        lambda: _data_store().iter_read(
+            filters=filters, limit=limit, offset=offset, after=after
+        )
+    )
+    while True:
+        chunk = await _run(lambda: list(itertools.islice(users, _READ_CHUNK_SIZE)))
+        for user in chunk:
+            yield user
+        if len(chunk) < _READ_CHUNK_SIZE:
+            return
+
+
+async def complete(prefix, limit=None):
+    """Get the names of the users that start with the given `prefix`.
+
+    Args:
+        prefix (str): The text the names start with.
+
+    Keyword Args:
+        limit (int or None): The maximum number of names to get. If None
+            then every name with the prefix is returned.
+
+    Returns:
+        list(str): The names starting with the prefix, sorted.
+
+    """
+    _LOGGER.debug(f"Completing names with prefix: {prefix} (limit={limit})")
+    return await _run(lambda: _data_store().complete(prefix, limit=limit))
+
+
+async def lookup_phone(number, digits=None):
+    """Get the users with the given phone `number`.
+
+    Args:
+        number (str): The phone number to look up.
+
+    Keyword Args:
+        digits (int or None): Only match the last this many digits of
+            the phone numbers. If None then every digit must match.
+
+    Returns:
+        list(dict): The information for each user with the phone number,
+        sorted by name.
+
+    Raises:
+        ValueError: Raised when `digits` is less than one.
+
+    """
+    _LOGGER.debug(f"Looking up phone number: {number} (digits={digits})")
+    return await _run(lambda: _data_store().lookup_phone(number, digits=digits))
+
+
+async def search(terms, limit=None):
+    """Get the users whose address has every one of the `terms`.
+
+    Args:
+        terms (str): The words and numbers to search for.
+
+    Keyword Args:
+        limit (int or None): The maximum number of users to get. If None
+            then every user found is returned.
+
+    Returns:
+        list(dict): The information for each user whose address has every
+        term, in the order they were added.
+
+    """
+    _LOGGER.debug(f"Searching addresses for: {terms} (limit={limit})")
+    return await _run(lambda: _data_store().search(terms, limit=limit))
+
+
+async def create(user):
+    """Add the given `user` to the data store.
+
+    Args:
+        user (dict(str, str)): The user information to add to the data
+            store.
+
+    Raises:
+        phonebook.InvalidUserError: Raised when the given user does not
+            provide needed information for a user.
+        phonebook.DuplicateUserError: Raised when a user with the given
+            `name` already exists in the data store.
+
+    """
+    _LOGGER.debug(f"Creating user: {user}")
+    await _WRITES.submit("create", user)
+
+
+async def delete(name):
+    """Delete the user with given `name` from the data store.
+
+    Args:
+        name (str): The name of the user to delete from the data store.
+
+    Raises:
+        phonebook.MissingUserError: Raised when a user with the given
+            `name` does not exist in the data store.
+
+    """
+    _LOGGER.debug(f"Deleting user: {name}")
+    await _WRITES.submit("delete", name)
+
+
+async def update(user_name, **user_fields):
+    """Update the user with the given `user_name` in the data store.
+
+    Args:
+        user_name (str): The name of the user to update from the data
+            store.
+
+    Keyword Args:
+        **user_fields (dict): The user information to replace the
+            requested user's information with. See
+            :func:`phonebook.update` for the valid options.
+
+    Raises:
+        phonebook.MissingUserError: Raised when a user with the given
+            `name` does not exist in the data store.
+        phonebook.DuplicateUserError: Raised when a `name` field was
+            given that already exists in the Phonebook.
+
+    """
+    _LOGGER.debug(f"Updating '{user_name}' user to: {str(user_fields)}")
+    await _WRITES.submit("update", user_name, **user_fields)
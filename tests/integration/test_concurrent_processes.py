@@ -0,0 +1,57 @@
+"""Integration tests for sharing a data store file between processes."""
+
+
+import concurrent.futures
+
+import pytest
+
+from phonebook._datastore.json_ import JSONDataStore
+from phonebook._datastore.yaml_ import YAMLDataStore
+
+
+_PROCESSES = 4
+_USERS_PER_PROCESS = 25
+
+
+def _create_users(data_store_class, file_path, process_number):
+    """Create users in the data store at the given path.
+
+    Args:
+        data_store_class (type): The class of the data store.
+        file_path (str): The path of the data store's file.
+        process_number (int): The number of the process creating the
+            users, used to give each user a unique name.
+
+    """
+    data_store = data_store_class(file_path=file_path)
+    for user_number in range(_USERS_PER_PROCESS):
+        data_store.create(
+            {
+                "name": f"User {process_number}-{user_number}",
+                "phone": f"555-{user_number:04}",
+                "address": "here",
+            }
+        )
+        # reading between changes must never see a partially written file
+        data_store.reload()
+
+
+@pytest.mark.parametrize(
+    "data_store_class, file_name",
+    ((JSONDataStore, "phonebook.json"), (YAMLDataStore, "phonebook.yaml")),
+)
+def test_concurrent_creates(tmp_path, data_store_class, file_name):
+    """Test no changes are lost when many processes create users at once."""
+    file_path = str(tmp_path / file_name)
+    data_store_class(file_path=file_path)
+
+    with concurrent.futures.ProcessPoolExecutor(_PROCESSES) as executor:
+        futures = [
+            executor.submit(_create_users, data_store_class, file_path, number)
+            for number in range(_PROCESSES)
+        ]
+        for future in futures:
+            future.result()
+
+    users = data_store_class(file_path=file_path).read()
+    assert len(users) == _PROCESSES * _USERS_PER_PROCESS
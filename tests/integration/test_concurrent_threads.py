@@ -0,0 +1,113 @@
+"""Stress tests for sharing a data store between threads."""
+
+
+import random
+import sys
+import threading
+
+import pytest
+
+from phonebook._datastore import DATA_STORES
+from phonebook._exceptions import MissingUserError
+
+
+_THREADS = 8
+_OPERATIONS = 100
+
+
+def _stress(data_store, thread_number, expected_users, errors):
+    """Randomly change and read the users of the data store.
+
+    Each thread only changes the users it created, so the users expected
+    in the data store afterwards are known, while reading every user.
+
+    Args:
+        data_store (phonebook._datastore.base.BaseDataStore): The data
+            store to stress.
+        thread_number (int): The number of the thread, used to give its
+            users unique names.
+        expected_users (dict(str, dict)): Filled with the users the
+            thread expects to exist afterwards, by name.
+        errors (list(Exception)): Filled with any unexpected errors.
+
+    """
+    generator = random.Random(thread_number)
+    try:
+        for operation_number in range(_OPERATIONS):
+            operation = generator.choice(
+                ("create", "create", "update", "delete", "batch", "read", "get")
+            )
+            name = f"User {thread_number}-{operation_number}"
+            own_names = sorted(expected_users)
+            if operation == "create" or not own_names:
+                user = {"name": name, "phone": "555", "address": "here"}
+                data_store.create(user)
+                expected_users[name] = user
+            elif operation == "update":
+                old_name = generator.choice(own_names)
+                user = dict(expected_users.pop(old_name), name=name, phone="999")
+                data_store.update(old_name, name=name, phone="999")
+                expected_users[name] = user
+            elif operation == "delete":
+                old_name = generator.choice(own_names)
+                data_store.delete(old_name)
+                del expected_users[old_name]
+            elif operation == "batch":
+                old_name = generator.choice(own_names)
+                user = {"name": name, "phone": "123", "address": "there"}
+                with data_store.batch():
+                    data_store.delete(old_name)
+                    data_store.create(user)
+                del expected_users[old_name]
+                expected_users[name] = user
+            elif operation == "read":
+                users = data_store.read(filters={"name": f"User {thread_number}-*"})
+                assert {user["name"]: user for user in users} == expected_users
+            else:
+                old_name = generator.choice(own_names)
+                assert data_store.get(old_name) == expected_users[old_name]
+                with pytest.raises(MissingUserError):
+                    data_store.get(name)
+    except Exception as error:  # pylint: disable=broad-except
+        errors.append(error)
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Switch between threads as often as possible to expose races."""
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+_WRITABLE_DATA_STORES = [store for store in DATA_STORES if not store.READ_ONLY]
+
+
+@pytest.mark.parametrize(
+    "data_store_class",
+    _WRITABLE_DATA_STORES,
+    ids=[store.NAME for store in _WRITABLE_DATA_STORES],
+)
+def test_concurrent_changes(tmp_path, data_store_class):
+    """Test changing and reading the users from many threads at once."""
+    data_store = data_store_class(file_path=str(tmp_path / "phonebook"))
+    expected_users = [{} for _ in range(_THREADS)]
+    errors = []
+
+    threads = [
+        threading.Thread(
+            target=_stress, args=(data_store, number, expected_users[number], errors)
+        )
+        for number in range(_THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    expected = {name: user for users in expected_users for name, user in users.items()}
+    assert {user["name"]: user for user in data_store.read()} == expected
+    reloaded_data_store = data_store_class(file_path=str(tmp_path / "phonebook"))
+    assert {user["name"]: user for user in reloaded_data_store.read()} == expected
@@ -0,0 +1,14 @@
+"""Unit tests for the :func:`phonebook._bench.codec.codecs` function."""
+
+
+from phonebook._bench.codec import codecs
+
+
+def test_main_case():
+    """Test the codec of every file data store is benchmarked."""
+    result = codecs()
+
+    assert {"json", "json-compact", "yaml", "binary"}.issubset(result)
+    assert result["json-compact-gzip"].compression == "gzip"
+    assert "yaml (python)" in result or not result["yaml"].fast
+    assert "binary (python)" in result or not result["binary"].fast
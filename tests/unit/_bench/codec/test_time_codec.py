@@ -0,0 +1,19 @@
+"""Unit tests for the :func:`phonebook._bench.codec.time_codec` function."""
+
+
+import pytest
+
+from phonebook._bench.codec import codecs, time_codec
+from phonebook._bench.users import generate_users
+
+
+@pytest.mark.parametrize("name", sorted(codecs()))
+def test_main_case(name):
+    """Test the times and size of the file are measured."""
+    dump_seconds, load_seconds, size = time_codec(
+        codecs()[name], list(generate_users(100))
+    )
+
+    assert dump_seconds > 0
+    assert load_seconds > 0
+    assert size > 0
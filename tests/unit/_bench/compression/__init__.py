@@ -0,0 +1 @@
+"""Unit tests for the :mod:`phonebook._bench.compression` module."""
@@ -0,0 +1,34 @@
+"""Unit tests for the :func:`phonebook._bench.compression.run` function."""
+
+
+from phonebook._bench.compression import run
+from phonebook._bench.users import generate_users
+
+
+def test_main_case():
+    """Test each compression and level of each codec is timed."""
+    result = run(
+        list(generate_users(100)),
+        ["json", "binary"],
+        [None, "gzip", "bz2"],
+        [1, 9],
+        bandwidth=1.0,
+    )
+
+    assert [(item["codec"], item["compression"], item["level"]) for item in result] == [
+        ("json", None, None),
+        ("json", "gzip", 1),
+        ("json", "gzip", 9),
+        ("json", "bz2", 1),
+        ("json", "bz2", 9),
+        ("binary", None, None),
+        ("binary", "gzip", 1),
+        ("binary", "gzip", 9),
+        ("binary", "bz2", 1),
+        ("binary", "bz2", 9),
+    ]
+    uncompressed = result[0]
+    assert uncompressed["size"] > result[1]["size"]
+    assert uncompressed["read_seconds"] == (
+        uncompressed["load_seconds"] + uncompressed["size"] / 1e6
+    )
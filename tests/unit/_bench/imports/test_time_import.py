@@ -0,0 +1,14 @@
+"""Unit tests for the :func:`phonebook._bench.imports.time_import` function."""
+
+
+from phonebook._bench.imports import time_import
+
+
+def test_main_case():
+    """Test timing an import in new processes."""
+    result = time_import("import phonebook", runs=2)
+
+    assert result["statement"] == "import phonebook"
+    assert result["runs"] == 2
+    assert 0 < result["min_ms"] <= result["p50_ms"]
+    assert result["modules"] > 0
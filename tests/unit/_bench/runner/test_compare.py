@@ -0,0 +1,40 @@
+"""Unit tests for the :func:`phonebook._bench.runner.compare` function."""
+
+
+from phonebook._bench.runner import compare
+
+
+def _result(scenario, ops_per_second, p99_ms):
+    """Get a result of the given `scenario`."""
+    return {
+        "data_store": "json",
+        "users": 1000,
+        "scenario": scenario,
+        "ops_per_second": ops_per_second,
+        "p99_ms": p99_ms,
+    }
+
+
+def test_main_case():
+    """Test the ratios to the matching baseline results."""
+    baseline = [_result("get", 100.0, 2.0), _result("read", 10.0, 20.0)]
+    results = [_result("get", 200.0, 1.0), _result("create", 5.0, 1.0)]
+
+    result = compare(baseline, results)
+
+    assert result == [
+        {
+            "data_store": "json",
+            "users": 1000,
+            "scenario": "get",
+            "ops_per_second": 2.0,
+            "p99_ms": 0.5,
+        }
+    ]
+
+
+def test_with_zero_baseline():
+    """Test comparing to a baseline of zero."""
+    result = compare([_result("get", 0.0, 0.0)], [_result("get", 1.0, 1.0)])
+
+    assert result[0]["ops_per_second"] == float("inf")
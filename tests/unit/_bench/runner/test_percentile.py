@@ -0,0 +1,16 @@
+"""Unit tests for the :func:`phonebook._bench.runner.percentile` function."""
+
+
+import pytest
+
+from phonebook._bench.runner import percentile
+
+
+@pytest.mark.parametrize(
+    "percent, expected_result", [(0, 1), (50, 51), (90, 91), (99, 100), (100, 100)]
+)
+def test_main_case(percent, expected_result):
+    """Test getting percentiles of unsorted values."""
+    values = list(range(100, 0, -1))
+
+    assert percentile(values, percent) == expected_result
@@ -0,0 +1,71 @@
+"""Unit tests for the :func:`phonebook._bench.runner.run` function."""
+
+
+import pytest
+
+from phonebook._bench.runner import SCENARIOS, run
+from phonebook._datastore import JSONDataStore, SnapshotDataStore, SQLiteDataStore
+
+
+def test_main_case():
+    """Test every scenario is run against every data store and size."""
+    result = run([JSONDataStore, SQLiteDataStore], [20, 40], operations=5)
+
+    assert [
+        (
+            scenario_result["data_store"],
+            scenario_result["users"],
+            scenario_result["scenario"],
+        )
+        for scenario_result in result
+    ] == [
+        (data_store, users, scenario)
+        for data_store in ("json", "sqlite")
+        for users in (20, 40)
+        for scenario in SCENARIOS
+    ]
+    for scenario_result in result:
+        assert scenario_result["operations"] == 5
+        assert scenario_result["ops_per_second"] > 0
+        assert (
+            scenario_result["p50_ms"]
+            <= scenario_result["p90_ms"]
+            <= scenario_result["p99_ms"]
+        )
+        assert scenario_result["peak_memory_mb"] > 0
+
+
+def test_with_scenarios():
+    """Test only the given scenarios are run, in the usual order."""
+    result = run([JSONDataStore], [10], scenarios=["delete", "get"], operations=5)
+
+    assert [scenario_result["scenario"] for scenario_result in result] == [
+        "get",
+        "delete",
+    ]
+
+
+def test_read_only_data_store():
+    """Test a read-only data store skips the scenarios that change users."""
+    result = run([SnapshotDataStore], [10], operations=5)
+
+    assert [scenario_result["scenario"] for scenario_result in result] == [
+        "reload",
+        "get",
+        "read",
+    ]
+
+
+def test_with_duration():
+    """Test a scenario stops early once the duration has passed."""
+    result = run([JSONDataStore], [10], scenarios=["get"], duration=0)
+
+    assert result[0]["operations"] == 1
+
+
+def test_with_unknown_scenario():
+    """Test running a scenario that doesn't exist."""
+    with pytest.raises(ValueError) as error:
+        run([JSONDataStore], [10], scenarios=["get", "explode"])
+
+    assert "explode" in str(error.value)
@@ -0,0 +1,27 @@
+"""Unit tests for the :func:`phonebook._bench.users.generate_users` function."""
+
+
+from phonebook._bench.users import generate_users
+from phonebook._datastore.base import validate
+
+
+def test_main_case():
+    """Test the users are valid and have unique names."""
+    result = list(generate_users(1000))
+
+    assert len(result) == 1000
+    assert len({user["name"] for user in result}) == 1000
+    assert all(validate(user) == user for user in result)
+
+
+def test_is_repeatable():
+    """Test the same seed generates the same users."""
+    assert list(generate_users(10, seed=3)) == list(generate_users(10, seed=3))
+    assert list(generate_users(10, seed=3)) != list(generate_users(10, seed=4))
+
+
+def test_with_prefix():
+    """Test the prefix is added to each name."""
+    result = generate_users(10, prefix="New ")
+
+    assert all(user["name"].startswith("New ") for user in result)
@@ -0,0 +1,33 @@
+"""Unit tests for the :meth:`BaseDataStore.complete` method."""
+
+
+import pytest
+
+from phonebook._datastore.base import BaseDataStore
+
+
+_USERS = [
+    {"name": "Terry Jones", "phone": "123-456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "111-222-3333", "address": "there"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "far"},
+]
+
+
+@pytest.mark.parametrize(
+    "prefix, limit, expected_result",
+    (
+        ("Terry", None, ["Terry Gilliam", "Terry Jones"]),
+        ("Terry", 1, ["Terry Gilliam"]),
+        ("", 2, ["Eric Idle", "Terry Gilliam"]),
+        ("John", None, []),
+    ),
+)
+def test_main_case(mocker, prefix, limit, expected_result):
+    """Test getting the names that start with a prefix from `iter_read`."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.iter_read.return_value = iter(_USERS)
+
+    result = BaseDataStore.complete(mock_data_store, prefix, limit=limit)
+
+    mock_data_store.iter_read.assert_called_once_with()
+    assert result == expected_result
@@ -0,0 +1,38 @@
+"""Unit tests for the :meth:`BaseDataStore.create_many` method."""
+
+
+import pytest
+
+from phonebook._datastore.base import BaseDataStore
+from phonebook._exceptions import DuplicateUserError
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_main_case(mocker):
+    """Test each user is created inside a batch."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+
+    BaseDataStore.create_many(mock_data_store, _USERS)
+
+    mock_data_store.batch.assert_called_once_with()
+    assert mock_data_store.create.call_args_list == [
+        mocker.call(_USERS[0]),
+        mocker.call(_USERS[1]),
+    ]
+
+
+def test_with_error(mocker):
+    """Test the batch is given the error when a user cannot be created."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.create.side_effect = [None, DuplicateUserError("John Cleese")]
+
+    with pytest.raises(DuplicateUserError):
+        BaseDataStore.create_many(mock_data_store, _USERS)
+
+    exit_args = mock_data_store.batch.return_value.__exit__.call_args[0]
+    assert exit_args[0] is DuplicateUserError
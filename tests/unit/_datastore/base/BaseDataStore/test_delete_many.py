@@ -0,0 +1,17 @@
+"""Unit tests for the :meth:`BaseDataStore.delete_many` method."""
+
+
+from phonebook._datastore.base import BaseDataStore
+
+
+def test_main_case(mocker):
+    """Test each user is deleted inside a batch."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+
+    BaseDataStore.delete_many(mock_data_store, ["Eric Idle", "John Cleese"])
+
+    mock_data_store.batch.assert_called_once_with()
+    assert mock_data_store.delete.call_args_list == [
+        mocker.call("Eric Idle"),
+        mocker.call("John Cleese"),
+    ]
@@ -0,0 +1,77 @@
+"""Unit tests for the :meth:`BaseDataStore.iter_read` method."""
+
+
+import pytest
+
+from phonebook._datastore.base import BaseDataStore
+from phonebook._exceptions import MissingUserError
+
+
+_USERS = [
+    {"name": f"User {index}", "phone": str(index), "address": "here"}
+    for index in range(5)
+]
+
+
+@pytest.mark.parametrize(
+    "pagination, expected_indices",
+    (
+        ({}, [0, 1, 2, 3, 4]),
+        ({"limit": 2}, [0, 1]),
+        ({"offset": 3}, [3, 4]),
+        ({"limit": 2, "offset": 2}, [2, 3]),
+    ),
+)
+def test_pages_read(mocker, pagination, expected_indices):
+    """Test the result of `read` is paginated."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.read.return_value = _USERS
+
+    result = BaseDataStore.iter_read(
+        mock_data_store, filters={"name": "*"}, **pagination
+    )
+
+    mock_data_store.read.assert_called_once_with(filters={"name": "*"})
+    assert list(result) == [_USERS[index] for index in expected_indices]
+
+
+@pytest.mark.parametrize(
+    "pagination, expected_indices",
+    (
+        ({"after": "User 1"}, [2, 3, 4]),
+        ({"after": "User 1", "limit": 1, "offset": 1}, [3]),
+        ({"after": "User 4"}, []),
+    ),
+)
+def test_pages_after(mocker, pagination, expected_indices):
+    """Test the users after the `after` user are paginated."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.read.return_value = _USERS
+
+    result = BaseDataStore.iter_read(mock_data_store, **pagination)
+
+    mock_data_store.read.assert_called_once_with()
+    assert list(result) == [_USERS[index] for index in expected_indices]
+
+
+def test_after_user_not_matching(mocker):
+    """Test the `after` user only needs to exist, not match the filters."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.read.return_value = _USERS
+
+    result = BaseDataStore.iter_read(
+        mock_data_store, filters={"phone": "[02-4]"}, after="User 1"
+    )
+
+    assert list(result) == [_USERS[2], _USERS[3], _USERS[4]]
+
+
+def test_with_missing_after_user(mocker):
+    """Test `iter_read` when the `after` user doesn't exist."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.read.return_value = _USERS
+
+    with pytest.raises(MissingUserError) as error:
+        BaseDataStore.iter_read(mock_data_store, after="Eric Idle")
+
+    assert "Eric Idle" in str(error.value)
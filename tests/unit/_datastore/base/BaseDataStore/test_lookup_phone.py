@@ -0,0 +1,33 @@
+"""Unit tests for the :meth:`BaseDataStore.lookup_phone` method."""
+
+
+import pytest
+
+from phonebook._datastore.base import BaseDataStore
+
+
+_USERS = [
+    {"name": "Terry Jones", "phone": "(123) 456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "+1 123.456.7890", "address": "there"},
+    {"name": "John Cleese", "phone": "555-7890", "address": "far"},
+]
+
+
+@pytest.mark.parametrize(
+    "number, digits, expected_indices",
+    (
+        ("123-456-7890", None, [0]),
+        ("123-456-7890", 10, [1, 0]),
+        ("7890", 4, [1, 2, 0]),
+        ("999-9999", None, []),
+        ("", None, []),
+    ),
+)
+def test_main_case(mocker, number, digits, expected_indices):
+    """Test getting the users with a phone number from `iter_read`."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.iter_read.return_value = iter(_USERS)
+
+    result = BaseDataStore.lookup_phone(mock_data_store, number, digits=digits)
+
+    assert result == [_USERS[index] for index in expected_indices]
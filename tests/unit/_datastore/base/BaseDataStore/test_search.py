@@ -0,0 +1,33 @@
+"""Unit tests for the :meth:`BaseDataStore.search` method."""
+
+
+import pytest
+
+from phonebook._datastore.base import BaseDataStore
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "12 Main St."},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "120 Main St"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "Main 12"},
+]
+
+
+@pytest.mark.parametrize(
+    "terms, limit, expected_indices",
+    (
+        ("main 12", None, [0, 2]),
+        ("main 12", 1, [0]),
+        ("Main", None, [0, 1, 2]),
+        ("elm", None, []),
+        ("--", None, []),
+    ),
+)
+def test_main_case(mocker, terms, limit, expected_indices):
+    """Test getting the users whose address has every term from `iter_read`."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+    mock_data_store.iter_read.return_value = iter(_USERS)
+
+    result = BaseDataStore.search(mock_data_store, terms, limit=limit)
+
+    assert result == [_USERS[index] for index in expected_indices]
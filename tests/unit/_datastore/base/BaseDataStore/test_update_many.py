@@ -0,0 +1,20 @@
+"""Unit tests for the :meth:`BaseDataStore.update_many` method."""
+
+
+from phonebook._datastore.base import BaseDataStore
+
+
+def test_main_case(mocker):
+    """Test each user is updated inside a batch."""
+    mock_data_store = mocker.MagicMock(spec=BaseDataStore)
+
+    BaseDataStore.update_many(
+        mock_data_store,
+        {"Eric Idle": {"phone": "999"}, "John Cleese": {"name": "Terry Gilliam"}},
+    )
+
+    mock_data_store.batch.assert_called_once_with()
+    assert mock_data_store.update.call_args_list == [
+        mocker.call("Eric Idle", phone="999"),
+        mocker.call("John Cleese", name="Terry Gilliam"),
+    ]
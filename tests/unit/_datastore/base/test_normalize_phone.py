@@ -0,0 +1,29 @@
+"""Unit tests for the :func:`phonebook._datastore.base.normalize_phone` function."""
+
+
+import pytest
+
+from phonebook._datastore.base import normalize_phone
+
+
+@pytest.mark.parametrize(
+    "phone, digits, expected_result",
+    (
+        ("123-456-7890", None, "1234567890"),
+        ("+1 (123) 456.7890", None, "11234567890"),
+        ("+1 (123) 456.7890", 10, "1234567890"),
+        ("456-7890", 10, "4567890"),
+        ("here", None, ""),
+        (1234567, 4, "4567"),
+    ),
+)
+def test_main_case(phone, digits, expected_result):
+    """Test getting the digits of a phone number."""
+    assert normalize_phone(phone, digits=digits) == expected_result
+
+
+@pytest.mark.parametrize("digits", (0, -1))
+def test_with_invalid_digits(digits):
+    """Test keeping fewer than one digit."""
+    with pytest.raises(ValueError):
+        normalize_phone("123-456-7890", digits=digits)
@@ -0,0 +1,22 @@
+"""Unit tests for the :func:`phonebook._datastore.base.tokenize` function."""
+
+
+import pytest
+
+from phonebook._datastore.base import tokenize
+
+
+@pytest.mark.parametrize(
+    "text, expected_result",
+    (
+        ("12 Main St.", {"12", "main", "st"}),
+        ("Apt. 4B, 12 MAIN st", {"apt", "4b", "12", "main", "st"}),
+        ("main_street", {"main", "street"}),
+        ("Straße 5", {"strasse", "5"}),
+        ("  ", set()),
+        (None, set()),
+    ),
+)
+def test_main_case(text, expected_result):
+    """Test splitting text into casefolded words and numbers."""
+    assert tokenize(text) == expected_result
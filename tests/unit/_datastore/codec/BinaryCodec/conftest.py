@@ -0,0 +1,12 @@
+"""Fixtures for the :class:`BinaryCodec` tests."""
+
+
+import pytest
+
+from phonebook._datastore.codec import BinaryCodec
+
+
+@pytest.fixture(params=(True, False), ids=("fast", "python"))
+def binary_codec(request):
+    """Get a codec with and without the msgpack package."""
+    return BinaryCodec(fast=request.param)
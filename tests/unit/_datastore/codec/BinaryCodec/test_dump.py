@@ -0,0 +1,64 @@
+"""Unit tests for the :meth:`BinaryCodec.dump` method."""
+
+
+import io
+
+import pytest
+
+from phonebook._datastore.codec import BinaryCodec
+from phonebook._datastore.record import UserRecord
+
+
+def test_main_case(binary_codec):
+    """Test the users are written as a MessagePack array of maps."""
+    data_file = io.BytesIO()
+
+    result = binary_codec.dump([{"name": "Eric", "phone": "123"}], data_file)
+
+    assert result == 1
+    assert data_file.getvalue() == b"\x91\x82\xa4name\xa4Eric\xa5phone\xa3123"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        ("a" * 31, b"\xbf" + b"a" * 31),
+        ("a" * 32, b"\xd9\x20" + b"a" * 32),
+        ("a" * 256, b"\xda\x01\x00" + b"a" * 256),
+        ("a" * 65536, b"\xdb\x00\x01\x00\x00" + b"a" * 65536),
+        ("é", b"\xa2\xc3\xa9"),
+        (None, b"\xc0"),
+        (True, b"\xc3"),
+        (5, b"\x05"),
+        (-5, b"\xfb"),
+        (300, b"\xcd\x01\x2c"),
+        (-300, b"\xd1\xfe\xd4"),
+        (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+    ),
+)
+def test_values(binary_codec, value, expected):
+    """Test each type of value is written in its smallest form."""
+    data_file = io.BytesIO()
+
+    binary_codec.dump([{"a": value}], data_file)
+
+    assert data_file.getvalue() == b"\x91\x81\xa1a" + expected
+
+
+def test_default(binary_codec):
+    """Test users that aren't dictionaries are converted by the default."""
+    data_file = io.BytesIO()
+    user = {"name": "Eric Idle", "phone": "123", "address": "here"}
+
+    binary_codec.dump(
+        [UserRecord.from_dict(user)], data_file, default=UserRecord.to_dict
+    )
+
+    data_file.seek(0)
+    assert binary_codec.load(data_file) == [user]
+
+
+def test_not_a_scalar():
+    """Test a value that isn't a scalar raises a ValueError."""
+    with pytest.raises(ValueError, match="must be strings"):
+        BinaryCodec(fast=False).dump([{"name": b"Eric"}], io.BytesIO())
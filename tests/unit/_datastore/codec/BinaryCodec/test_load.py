@@ -0,0 +1,61 @@
+"""Unit tests for the :meth:`BinaryCodec.load` method."""
+
+
+import io
+
+import pytest
+
+from phonebook._datastore.codec import BinaryCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "Jöhn Cleese", "phone": "1" * 40, "address": "a" * 300},
+    {"name": "12", "phone": 5551234, "address": None, "age": -1.5, "ok": True},
+]
+
+
+def test_round_trip(binary_codec):
+    """Test the users written are read back the same."""
+    data_file = io.BytesIO()
+    binary_codec.dump(_DATA_SET, data_file)
+    data_file.seek(0)
+
+    result = binary_codec.load(data_file)
+
+    assert result == _DATA_SET
+
+
+def test_object_hook(binary_codec):
+    """Test each user is converted by the object hook as it is read."""
+    data_file = io.BytesIO()
+    binary_codec.dump(_DATA_SET[:1], data_file)
+    data_file.seek(0)
+
+    result = binary_codec.load(data_file, object_hook=UserRecord.from_dict)
+
+    assert isinstance(result[0], UserRecord)
+    assert result[0].to_dict() == _DATA_SET[0]
+
+
+def test_empty(binary_codec):
+    """Test an empty array has no users."""
+    assert binary_codec.load(io.BytesIO(b"\x90")) == []
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    (
+        (b"\x81\xa1a\xa1b", "must contain a list of users"),
+        (b"\x91\x81\xa1a\xa5b", "unexpected length"),
+        (b"\x91\x81\xa1a", "ended unexpectedly"),
+        (b"\x91\x81\xa1a\xcd\x01", "ended unexpectedly"),
+        (b"\x91\x81\xa1a\xc4\x01a", "Unsupported MessagePack type"),
+        (b"\x90\x90", "unexpected length"),
+    ),
+)
+def test_invalid(data, message):
+    """Test data that isn't a list of users raises a ValueError."""
+    with pytest.raises(ValueError, match=message):
+        BinaryCodec(fast=False).load(io.BytesIO(data))
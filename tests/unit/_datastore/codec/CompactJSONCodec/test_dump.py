@@ -0,0 +1,42 @@
+"""Unit tests for the :meth:`CompactJSONCodec.dump` method."""
+
+
+import io
+
+from phonebook._datastore.codec import CompactJSONCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_main_case():
+    """Test the users are written without any whitespace and read back."""
+    data_file = io.StringIO()
+
+    result = CompactJSONCodec().dump(_DATA_SET, data_file)
+
+    assert result == 2
+    assert data_file.getvalue() == (
+        '[{"name":"Eric Idle","phone":"123-456-7890","address":"here"},'
+        '{"name":"John Cleese","phone":"111-222-3333","address":"there"}]'
+    )
+    data_file.seek(0)
+    assert CompactJSONCodec().load(data_file) == _DATA_SET
+
+
+def test_default():
+    """Test users that aren't dictionaries are converted by the default."""
+    data_file = io.StringIO()
+
+    CompactJSONCodec().dump(
+        [UserRecord.from_dict(user) for user in _DATA_SET],
+        data_file,
+        default=UserRecord.to_dict,
+    )
+
+    data_file.seek(0)
+    assert CompactJSONCodec().load(data_file) == _DATA_SET
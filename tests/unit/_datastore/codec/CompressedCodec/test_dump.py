@@ -0,0 +1,49 @@
+"""Unit tests for the :meth:`CompressedCodec.dump` method."""
+
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+
+import pytest
+
+from phonebook._bench.users import generate_users
+from phonebook._datastore.codec import CompactJSONCodec, CompressedCodec
+
+
+_DATA_SET = [
+    {"name": f"Eric Idle {number}", "phone": "123-456-7890", "address": "here"}
+    for number in range(100)
+]
+
+
+@pytest.mark.parametrize(
+    "compression, decompress",
+    (("gzip", gzip.decompress), ("lzma", lzma.decompress), ("bz2", bz2.decompress)),
+)
+def test_main_case(compression, decompress):
+    """Test the wrapped codec's file is compressed."""
+    data_file = io.BytesIO()
+
+    result = CompressedCodec(CompactJSONCodec(), compression).dump(_DATA_SET, data_file)
+
+    assert result == len(_DATA_SET)
+    assert not data_file.closed
+    assert json.loads(decompress(data_file.getvalue())) == _DATA_SET
+
+
+@pytest.mark.parametrize("compression", ("gzip", "lzma"))
+def test_level(compression):
+    """Test a lower compression level makes a larger file."""
+    users = list(generate_users(1000))
+    sizes = []
+    for level in (0, 9):
+        data_file = io.BytesIO()
+        CompressedCodec(CompactJSONCodec(), compression, level=level).dump(
+            users, data_file
+        )
+        sizes.append(len(data_file.getvalue()))
+
+    assert sizes[0] > sizes[1]
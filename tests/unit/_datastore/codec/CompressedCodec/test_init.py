@@ -0,0 +1,21 @@
+"""Unit tests for the :meth:`CompressedCodec.__init__` method."""
+
+
+import pytest
+
+from phonebook._datastore.codec import CompressedCodec, JSONCodec
+
+
+def test_main_case():
+    """Test the name and extension combine the codec's and compression's."""
+    result = CompressedCodec(JSONCodec(), "lzma")
+
+    assert result.NAME == "json-lzma"
+    assert result.EXTENSION == ".json.xz"
+    assert result.BINARY
+
+
+def test_unknown_compression():
+    """Test an unknown compression raises a ValueError."""
+    with pytest.raises(ValueError, match="Unknown compression: zip"):
+        CompressedCodec(JSONCodec(), "zip")
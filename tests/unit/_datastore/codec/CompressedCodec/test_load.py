@@ -0,0 +1,54 @@
+"""Unit tests for the :meth:`CompressedCodec.load` method."""
+
+
+import gzip
+import io
+import json
+
+import pytest
+
+from phonebook._datastore.codec import (
+    BinaryCodec,
+    CompactJSONCodec,
+    CompressedCodec,
+    YAMLCodec,
+)
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "Jöhn Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+@pytest.mark.parametrize("level", (None, 1))
+@pytest.mark.parametrize("compression", ("gzip", "lzma", "bz2"))
+@pytest.mark.parametrize("codec", (CompactJSONCodec(), YAMLCodec(), BinaryCodec()))
+def test_round_trip(codec, compression, level):
+    """Test the users written are read back the same."""
+    compressed_codec = CompressedCodec(codec, compression, level=level)
+    data_file = io.BytesIO()
+    compressed_codec.dump(_DATA_SET, data_file)
+    data_file.seek(0)
+
+    result = compressed_codec.load(data_file)
+
+    assert result == _DATA_SET
+
+
+def test_object_hook():
+    """Test the object hook is passed to the wrapped codec."""
+    data_file = io.BytesIO(gzip.compress(json.dumps(_DATA_SET).encode("utf-8")))
+
+    result = CompressedCodec(CompactJSONCodec()).load(
+        data_file, object_hook=UserRecord.from_dict
+    )
+
+    assert [user.to_dict() for user in result] == _DATA_SET
+
+
+def test_not_compressed():
+    """Test a file that isn't compressed raises an OSError."""
+    with pytest.raises(OSError):
+        CompressedCodec(CompactJSONCodec()).load(io.BytesIO(b"[]"))
@@ -0,0 +1,37 @@
+"""Unit tests for the :meth:`JSONCodec.dump` method."""
+
+
+import io
+import json
+
+from phonebook._datastore.codec import JSONCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_main_case():
+    """Test the users are written as an indented list."""
+    data_file = io.StringIO()
+
+    result = JSONCodec().dump(_DATA_SET, data_file)
+
+    assert result == 2
+    assert data_file.getvalue() == json.dumps(_DATA_SET, indent=2)
+
+
+def test_default():
+    """Test users that aren't dictionaries are converted by the default."""
+    data_file = io.StringIO()
+
+    JSONCodec().dump(
+        [UserRecord.from_dict(user) for user in _DATA_SET],
+        data_file,
+        default=UserRecord.to_dict,
+    )
+
+    assert json.loads(data_file.getvalue()) == _DATA_SET
@@ -0,0 +1,38 @@
+"""Unit tests for the :meth:`JSONCodec.load` method."""
+
+
+import io
+import json
+
+import pytest
+
+from phonebook._datastore.codec import JSONCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [{"name": "Eric Idle", "phone": "123", "address": "here"}]
+
+
+def test_main_case():
+    """Test every user is read into a list."""
+    data_file = io.StringIO(json.dumps(_DATA_SET))
+
+    result = JSONCodec().load(data_file)
+
+    assert result == _DATA_SET
+
+
+def test_object_hook():
+    """Test each user is converted by the object hook as it is read."""
+    data_file = io.StringIO(json.dumps(_DATA_SET))
+
+    result = JSONCodec().load(data_file, object_hook=UserRecord.from_dict)
+
+    assert isinstance(result[0], UserRecord)
+    assert result[0].name == "Eric Idle"
+
+
+def test_invalid_json():
+    """Test a file that isn't valid JSON raises a ValueError."""
+    with pytest.raises(ValueError):
+        JSONCodec().load(io.StringIO("[{"))
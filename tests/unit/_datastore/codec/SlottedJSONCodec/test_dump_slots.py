@@ -0,0 +1,59 @@
+"""Unit tests for the :meth:`SlottedJSONCodec.dump_slots` method."""
+
+
+import io
+import json
+
+from phonebook._datastore.codec import SlottedJSONCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_main_case():
+    """Test each user is written in a padded slot on its own line."""
+    data_file = io.BytesIO()
+
+    result = SlottedJSONCodec().dump_slots(_DATA_SET, data_file)
+
+    data = data_file.getvalue()
+    lines = data.split(b"\n")
+    assert lines[0] == b"["
+    assert lines[1].startswith(json.dumps(_DATA_SET[0], separators=(",", ":")).encode())
+    assert lines[1].endswith(b" ,")
+    assert lines[-2:] == [b"null]", b""]
+    assert json.loads(data) == _DATA_SET + [None]
+    assert list(result) == [
+        2,
+        2 + len(lines[1]) + 1,
+        2 + len(lines[1]) + len(lines[2]) + 2,
+    ]
+    assert data[result[-1] :] == SlottedJSONCodec.END
+
+
+def test_no_users():
+    """Test an empty list of users is written as just the end."""
+    data_file = io.BytesIO()
+
+    result = SlottedJSONCodec().dump_slots([], data_file)
+
+    assert data_file.getvalue() == b"[\nnull]\n"
+    assert list(result) == [2]
+
+
+def test_default():
+    """Test users that aren't dictionaries are converted by the default."""
+    data_file = io.BytesIO()
+
+    SlottedJSONCodec().dump_slots(
+        [UserRecord.from_dict(user) for user in _DATA_SET],
+        data_file,
+        default=UserRecord.to_dict,
+    )
+
+    data_file.seek(0)
+    assert SlottedJSONCodec().load(data_file) == _DATA_SET
@@ -0,0 +1,48 @@
+"""Unit tests for the :meth:`SlottedJSONCodec.encode` method."""
+
+
+import json
+
+from phonebook._datastore.codec import SlottedJSONCodec
+
+
+_USER = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+_ENCODED = json.dumps(_USER, separators=(",", ":")).encode()
+
+
+def test_main_case():
+    """Test a user is padded with room to grow."""
+    result = SlottedJSONCodec().encode(_USER)
+
+    assert result.startswith(_ENCODED + b" " * SlottedJSONCodec.MIN_PADDING)
+    assert result.rstrip(b" ,\n") == _ENCODED
+    assert result.endswith(b",\n")
+
+
+def test_capacity():
+    """Test a user is padded to the given capacity."""
+    result = SlottedJSONCodec().encode(_USER, capacity=len(_ENCODED) + 3)
+
+    assert result == _ENCODED + b"   ,\n"
+
+
+def test_too_long():
+    """Test a user longer than the capacity doesn't fit."""
+    result = SlottedJSONCodec().encode(_USER, capacity=len(_ENCODED) - 1)
+
+    assert result is None
+
+
+def test_tombstone():
+    """Test None is encoded as a tombstone."""
+    result = SlottedJSONCodec().encode(None, capacity=6)
+
+    assert result == b"null  ,\n"
+
+
+def test_non_ascii():
+    """Test non-ASCII characters are escaped so each is a byte."""
+    result = SlottedJSONCodec().encode({"name": "Éric"}, capacity=20)
+
+    assert len(result) == 22
+    assert json.loads(result.rstrip(b" ,\n")) == {"name": "Éric"}
@@ -0,0 +1,79 @@
+"""Unit tests for the :meth:`SlottedJSONCodec.load_slots` method."""
+
+
+import io
+import json
+
+import pytest
+
+from phonebook._datastore.codec import SlottedJSONCodec
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_main_case():
+    """Test the user in each slot and the offsets of the slots are read."""
+    data_file = io.BytesIO()
+    offsets = SlottedJSONCodec().dump_slots(_DATA_SET, data_file)
+    data_file.seek(0)
+
+    result = SlottedJSONCodec().load_slots(data_file)
+
+    assert result == (_DATA_SET, offsets)
+
+
+def test_tombstone():
+    """Test a slot overwritten with a tombstone is read as None."""
+    codec = SlottedJSONCodec()
+    data_file = io.BytesIO()
+    offsets = codec.dump_slots(_DATA_SET, data_file)
+    data_file.seek(offsets[0])
+    data_file.write(codec.encode(None, capacity=offsets[1] - offsets[0] - 2))
+    data_file.seek(0)
+
+    result = codec.load_slots(data_file)
+
+    assert result == ([None, _DATA_SET[1]], offsets)
+    data_file.seek(0)
+    assert codec.load(data_file) == [_DATA_SET[1]]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        json.dumps(_DATA_SET).encode(),
+        json.dumps(_DATA_SET, indent=2).encode(),
+        b"[\n" + json.dumps(_DATA_SET[0]).encode() + b"\n]\n",
+    ],
+)
+def test_not_slotted(data):
+    """Test JSON that isn't laid out in slots is read without offsets."""
+    result = SlottedJSONCodec().load_slots(io.BytesIO(data))
+
+    assert result == (json.loads(data), None)
+
+
+def test_object_hook():
+    """Test each user is converted by the object hook as it is read."""
+    data_file = io.BytesIO()
+    SlottedJSONCodec().dump_slots(_DATA_SET, data_file)
+    data_file.seek(0)
+
+    slots, _ = SlottedJSONCodec().load_slots(
+        data_file, object_hook=UserRecord.from_dict
+    )
+
+    assert all(isinstance(user, UserRecord) for user in slots)
+    assert [user.to_dict() for user in slots] == _DATA_SET
+
+
+@pytest.mark.parametrize("data", [b'{"name": "Eric Idle"}', b"[\n{"])
+def test_invalid(data):
+    """Test a file that isn't a list of users is an error."""
+    with pytest.raises(ValueError):
+        SlottedJSONCodec().load_slots(io.BytesIO(data))
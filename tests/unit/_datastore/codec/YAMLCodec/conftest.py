@@ -0,0 +1,12 @@
+"""Fixtures for the :class:`YAMLCodec` tests."""
+
+
+import pytest
+
+from phonebook._datastore.codec import YAMLCodec
+
+
+@pytest.fixture(params=(True, False), ids=("fast", "python"))
+def yaml_codec(request):
+    """Get a codec with and without libyaml."""
+    return YAMLCodec(fast=request.param)
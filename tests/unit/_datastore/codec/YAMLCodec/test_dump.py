@@ -0,0 +1,91 @@
+"""Unit tests for the :meth:`YAMLCodec.dump` method."""
+
+
+import io
+
+import pytest
+import yaml
+
+from phonebook._datastore.record import UserRecord
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "5551234", "address": "yes"},
+    {"name": "12", "phone": "1e3", "address": "null"},
+    {"name": "Terry: Jones", "phone": "- 1", "address": "multi\nline"},
+]
+
+
+def test_main_case(yaml_codec):
+    """Test the users are written as a block list, in field order."""
+    data_file = io.StringIO()
+
+    result = yaml_codec.dump(_DATA_SET[:1], data_file)
+
+    assert result == 1
+    assert data_file.getvalue() == (
+        "- name: Eric Idle\n  phone: 123-456-7890\n  address: here\n"
+    )
+
+
+def test_round_trip(yaml_codec):
+    """Test strings that look like other types are read back as strings."""
+    data_file = io.StringIO()
+
+    result = yaml_codec.dump(iter(_DATA_SET), data_file)
+
+    assert result == len(_DATA_SET)
+    assert yaml.safe_load(data_file.getvalue()) == _DATA_SET
+    assert yaml_codec.load(io.StringIO(data_file.getvalue())) == _DATA_SET
+
+
+def test_matches_yaml_dump(yaml_codec):
+    """Test the file is the same as PyYAML writes it."""
+    data_file = io.StringIO()
+
+    yaml_codec.dump(_DATA_SET, data_file)
+
+    assert data_file.getvalue() == yaml.safe_dump(
+        _DATA_SET, default_flow_style=False, sort_keys=False
+    )
+
+
+def test_no_users(yaml_codec):
+    """Test an empty list is written when there are no users."""
+    data_file = io.StringIO()
+
+    result = yaml_codec.dump([], data_file)
+
+    assert result == 0
+    assert yaml.safe_load(data_file.getvalue()) == []
+
+
+def test_other_types(yaml_codec):
+    """Test values of other scalar types are written as those types."""
+    data_file = io.StringIO()
+
+    yaml_codec.dump([{"name": "Eric Idle", "phone": 123, "age": None}], data_file)
+
+    assert yaml.safe_load(data_file.getvalue()) == [
+        {"name": "Eric Idle", "phone": 123, "age": None}
+    ]
+
+
+def test_not_a_scalar(yaml_codec):
+    """Test a value that isn't a scalar raises a ValueError."""
+    with pytest.raises(ValueError, match="must be strings"):
+        yaml_codec.dump([{"name": ["Eric", "Idle"]}], io.StringIO())
+
+
+def test_default(yaml_codec):
+    """Test users that aren't dictionaries are converted by the default."""
+    data_file = io.StringIO()
+
+    yaml_codec.dump(
+        [UserRecord.from_dict(user) for user in _DATA_SET],
+        data_file,
+        default=UserRecord.to_dict,
+    )
+
+    assert yaml.safe_load(data_file.getvalue()) == _DATA_SET
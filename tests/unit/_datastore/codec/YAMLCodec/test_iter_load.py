@@ -0,0 +1,65 @@
+"""Unit tests for the :meth:`YAMLCodec.iter_load` method."""
+
+
+import io
+
+import pytest
+import yaml
+
+
+def test_main_case(yaml_codec):
+    """Test the users are read one at a time, in order."""
+    data_file = io.StringIO(
+        "- name: Eric Idle\n"
+        "  phone: 123-456-7890\n"
+        "  address: here\n"
+        "- name: John Cleese\n"
+        "  phone: 111-222-3333\n"
+        "  address: there\n"
+    )
+
+    result = yaml_codec.iter_load(data_file)
+
+    assert next(result) == {
+        "name": "Eric Idle",
+        "phone": "123-456-7890",
+        "address": "here",
+    }
+    assert list(result) == [
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"}
+    ]
+
+
+def test_values_are_strings(yaml_codec):
+    """Test values YAML would read as other types are read as strings."""
+    data_file = io.StringIO("- {name: 12, phone: 5551234, address: yes}\n")
+
+    result = list(yaml_codec.iter_load(data_file))
+
+    assert result == [{"name": "12", "phone": "5551234", "address": "yes"}]
+
+
+@pytest.mark.parametrize("text", ("", "[]\n"))
+def test_no_users(yaml_codec, text):
+    """Test an empty file or list has no users."""
+    assert list(yaml_codec.iter_load(io.StringIO(text))) == []
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    (
+        ("name: Eric Idle\n", "must contain a list of users"),
+        ("- Eric Idle\n", "must be a mapping"),
+        ("- name: [Eric, Idle]\n", "must be strings"),
+    ),
+)
+def test_not_a_list_of_users(yaml_codec, text, message):
+    """Test a file that isn't a list of users raises a ValueError."""
+    with pytest.raises(ValueError, match=message):
+        list(yaml_codec.iter_load(io.StringIO(text)))
+
+
+def test_invalid_yaml(yaml_codec):
+    """Test a file that isn't valid YAML raises a YAMLError."""
+    with pytest.raises(yaml.YAMLError):
+        list(yaml_codec.iter_load(io.StringIO("- name: 'Eric Idle\n")))
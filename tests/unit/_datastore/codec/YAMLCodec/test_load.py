@@ -0,0 +1,31 @@
+"""Unit tests for the :meth:`YAMLCodec.load` method."""
+
+
+import io
+
+from phonebook._datastore.record import UserRecord
+
+
+def test_main_case(yaml_codec):
+    """Test every user is read into a list."""
+    data_file = io.StringIO(
+        "- {name: Eric Idle, phone: '123', address: here}\n"
+        "- {name: John Cleese, phone: '456', address: there}\n"
+    )
+
+    result = yaml_codec.load(data_file)
+
+    assert result == [
+        {"name": "Eric Idle", "phone": "123", "address": "here"},
+        {"name": "John Cleese", "phone": "456", "address": "there"},
+    ]
+
+
+def test_object_hook(yaml_codec):
+    """Test each user is converted by the object hook as it is parsed."""
+    data_file = io.StringIO("- {name: Eric Idle, phone: '123', address: here}\n")
+
+    result = yaml_codec.load(data_file, object_hook=UserRecord.from_dict)
+
+    assert isinstance(result[0], UserRecord)
+    assert result[0].name == "Eric Idle"
@@ -0,0 +1,49 @@
+"""Unit tests for the :func:`phonebook._datastore.codec.detect_compression` function."""
+
+
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from phonebook._datastore.codec import detect_compression
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    (
+        ("phonebook.json", None),
+        ("phonebook.json.gz", "gzip"),
+        ("phonebook.yaml.xz", "lzma"),
+        ("phonebook.msgpack.bz2", "bz2"),
+    ),
+)
+def test_extension(tmp_path, file_name, expected):
+    """Test the compression of a new file is guessed from its extension."""
+    assert detect_compression(str(tmp_path / file_name)) == expected
+
+
+@pytest.mark.parametrize(
+    "compress, expected",
+    (
+        (gzip.compress, "gzip"),
+        (lzma.compress, "lzma"),
+        (bz2.compress, "bz2"),
+        (bytes, None),
+    ),
+)
+def test_magic_number(tmp_path, compress, expected):
+    """Test the compression of an existing file is detected from its bytes."""
+    file_path = tmp_path / "phonebook.json.gz"
+    file_path.write_bytes(compress(b"[]"))
+
+    assert detect_compression(str(file_path)) == expected
+
+
+def test_empty_file(tmp_path):
+    """Test the compression of an empty file is guessed from its extension."""
+    file_path = tmp_path / "phonebook.json.xz"
+    file_path.write_bytes(b"")
+
+    assert detect_compression(str(file_path)) == "lzma"
@@ -0,0 +1,37 @@
+"""Fixtures for the `phonebook._datastore.file_` unit tests."""
+
+
+import pytest
+
+from phonebook._datastore import DATA_STORES
+from phonebook._datastore.codec import COMPRESSIONS
+from phonebook._datastore.file_ import FileDataStore
+from phonebook._datastore.journal_ import JournalDataStore
+
+
+@pytest.fixture(
+    params=[
+        data_store
+        for data_store in DATA_STORES
+        if issubclass(data_store, FileDataStore)
+        and not issubclass(data_store, JournalDataStore)
+    ],
+    ids=lambda data_store: data_store.NAME,
+)
+def data_store_class(request):
+    """Get each data store built on the file data store engine."""
+    return request.param
+
+
+@pytest.fixture()
+def data_store_path(tmp_path, data_store_class):
+    """Get the path to use as the source of the data store.
+
+    Returns:
+        pathlib.Path: The path to use as the data store.
+
+    """
+    extension = data_store_class.CODEC.EXTENSION
+    if data_store_class.COMPRESSION is not None:
+        extension += COMPRESSIONS[data_store_class.COMPRESSION]
+    return tmp_path / f"test_data_source{extension}"
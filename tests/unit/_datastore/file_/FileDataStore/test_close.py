@@ -0,0 +1,49 @@
+"""Unit tests for the :meth:`FileDataStore.close` method."""
+
+
+from phonebook._datastore import file_
+
+
+_USER = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+
+
+def test_main_case(data_store_class, data_store_path, monkeypatch):
+    """Test the changes are written and no longer written at exit."""
+    registered = []
+    monkeypatch.setattr(file_.atexit, "register", registered.append)
+    monkeypatch.setattr(file_.atexit, "unregister", registered.remove)
+    data_store = data_store_class(
+        file_path=str(data_store_path), write_behind=True, flush_interval=60
+    )
+    data_store.create(_USER)
+    assert len(registered) == 1
+
+    data_store.close()
+
+    assert registered == []
+    assert data_store_class(file_path=str(data_store_path)).read() == [_USER]
+
+
+def test_at_exit(data_store_class, data_store_path, monkeypatch):
+    """Test the function registered with atexit writes the changes."""
+    registered = []
+    monkeypatch.setattr(file_.atexit, "register", registered.append)
+    data_store = data_store_class(
+        file_path=str(data_store_path), write_behind=True, flush_interval=60
+    )
+    data_store.create(_USER)
+
+    registered[0]()
+
+    assert data_store_class(file_path=str(data_store_path)).read() == [_USER]
+    data_store.close()
+
+
+def test_without_write_behind(data_store_class, data_store_path):
+    """Test closing a data store that writes each change does nothing."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    data_store.create(_USER)
+
+    data_store.close()
+
+    assert data_store_class(file_path=str(data_store_path)).read() == [_USER]
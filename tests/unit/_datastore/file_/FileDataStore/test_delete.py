@@ -0,0 +1,45 @@
+"""Unit tests for the :meth:`FileDataStore.delete` method."""
+
+
+_DATA_SET = [
+    {"name": f"User {number}", "phone": str(number), "address": "here"}
+    for number in range(6)
+]
+
+
+def test_leaves_holes(data_store_class, data_store_path):
+    """Test deleted users leave holes until they are half of the users."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    with data_store.batch():
+        data_store.create_many(_DATA_SET)
+        for name in ("User 1", "User 3", "User 4"):
+            data_store.delete(name)
+
+        assert data_store._users.count(None) == 3
+        assert data_store.read() == [_DATA_SET[0], _DATA_SET[2], _DATA_SET[5]]
+        assert data_store.get("User 5") == _DATA_SET[5]
+
+        data_store.delete("User 0")
+
+        assert data_store._users == [_DATA_SET[2], _DATA_SET[5]]
+        assert data_store.get("User 5") == _DATA_SET[5]
+
+    result = data_store_class(file_path=str(data_store_path))
+
+    assert result.read() == [_DATA_SET[2], _DATA_SET[5]]
+
+
+def test_update_after_delete(data_store_class, data_store_path):
+    """Test users after a hole are updated in place."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    data_store.create_many(_DATA_SET)
+
+    with data_store.batch():
+        data_store.delete("User 1")
+        data_store.update("User 4", name="Renamed", phone="999")
+
+    expected = [_DATA_SET[0]] + _DATA_SET[2:4]
+    expected += [{"name": "Renamed", "phone": "999", "address": "here"}, _DATA_SET[5]]
+    assert data_store.read() == expected
+    assert list(data_store.iter_read(after="Renamed")) == [_DATA_SET[5]]
+    assert data_store_class(file_path=str(data_store_path)).read() == expected
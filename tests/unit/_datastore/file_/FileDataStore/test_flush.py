@@ -0,0 +1,115 @@
+"""Unit tests for the :meth:`FileDataStore.flush` method."""
+
+
+import time
+
+import pytest
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+@pytest.fixture()
+def data_store(data_store_class, data_store_path):
+    """Get a write-behind data store that only writes when flushed.
+
+    Returns:
+        phonebook._datastore.file_.FileDataStore: The data store.
+
+    """
+    data_store = data_store_class(
+        file_path=str(data_store_path), write_behind=True, flush_interval=60
+    )
+    yield data_store
+    data_store.close()
+
+
+def test_main_case(data_store, data_store_class, data_store_path):
+    """Test the changes are only written when flushed."""
+    data_store.create(_DATA_SET[0])
+    data_store.create(_DATA_SET[1])
+    data_store.update("Eric Idle", phone="999")
+    assert data_store_class(file_path=str(data_store_path)).read() == []
+
+    data_store.flush()
+
+    assert data_store_class(file_path=str(data_store_path)).read() == [
+        dict(_DATA_SET[0], phone="999"),
+        _DATA_SET[1],
+    ]
+
+
+def test_without_changes(data_store, data_store_path):
+    """Test nothing is written when there are no changes."""
+    modified = data_store_path.stat().st_mtime_ns
+
+    data_store.flush()
+
+    assert data_store_path.stat().st_mtime_ns == modified
+
+
+def test_flush_interval(data_store_class, data_store_path):
+    """Test the changes are written once the flush interval has passed."""
+    data_store = data_store_class(
+        file_path=str(data_store_path), write_behind=True, flush_interval=0.05
+    )
+    data_store.create(_DATA_SET[0])
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if data_store_class(file_path=str(data_store_path)).read():
+            break
+        time.sleep(0.01)
+
+    assert data_store_class(file_path=str(data_store_path)).read() == _DATA_SET[:1]
+    data_store.close()
+
+
+def test_flush_changes(data_store_class, data_store_path):
+    """Test the changes are written once there are enough of them."""
+    data_store = data_store_class(
+        file_path=str(data_store_path),
+        write_behind=True,
+        flush_interval=60,
+        flush_changes=2,
+    )
+    data_store.create(_DATA_SET[0])
+    assert data_store_class(file_path=str(data_store_path)).read() == []
+
+    data_store.create(_DATA_SET[1])
+
+    assert data_store_class(file_path=str(data_store_path)).read() == _DATA_SET
+    data_store.close()
+
+
+def test_batch(data_store, data_store_class, data_store_path):
+    """Test the changes of a batch are also left to be flushed."""
+    with data_store.batch():
+        data_store.create(_DATA_SET[0])
+        data_store.flush()
+    assert data_store_class(file_path=str(data_store_path)).read() == []
+
+    data_store.flush()
+
+    assert data_store_class(file_path=str(data_store_path)).read() == _DATA_SET[:1]
+
+
+def test_not_reloaded(data_store_class, data_store_path):
+    """Test changes made by another process don't discard unwritten changes."""
+    data_store = data_store_class(
+        file_path=str(data_store_path),
+        write_behind=True,
+        flush_interval=60,
+        auto_reload=True,
+        reload_interval=0,
+    )
+    data_store.create(_DATA_SET[0])
+    data_store_class(file_path=str(data_store_path)).create(_DATA_SET[1])
+
+    assert data_store.read() == _DATA_SET[:1]
+    data_store.close()
+
+    assert data_store_class(file_path=str(data_store_path)).read() == _DATA_SET[:1]
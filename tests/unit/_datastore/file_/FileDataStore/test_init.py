@@ -0,0 +1,71 @@
+"""Unit tests for the :meth:`FileDataStore.__init__` method."""
+
+
+import gzip
+
+import pytest
+
+from phonebook._datastore import DATA_STORE_NAMES, load_data_store
+from phonebook._datastore.codec import COMPRESSIONS, detect_compression
+from phonebook._datastore.json_ import JSONDataStore
+from phonebook._datastore.yaml_ import YAMLDataStore
+
+
+_USER = {"name": "Eric Idle", "phone": "123", "address": "here"}
+
+
+def test_without_file(data_store_class, data_store_path):
+    """Test a new file is written in the data store's format."""
+    data_store = data_store_class(file_path=str(data_store_path))
+
+    assert data_store._users == []
+    mode = "rb" if data_store._codec.BINARY else "r"
+    with open(str(data_store_path), mode) as data_file:
+        assert data_store._codec.load(data_file) == []
+
+
+def test_registered(data_store_class):
+    """Test every file data store can be picked by its name."""
+    assert data_store_class.NAME in DATA_STORE_NAMES
+    assert load_data_store(data_store_class.NAME) is data_store_class
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSIONS))
+def test_compression_from_extension(tmp_path, compression):
+    """Test a new file is compressed as its extension says."""
+    file_path = tmp_path / f"phonebook.json{COMPRESSIONS[compression]}"
+
+    JSONDataStore(file_path=str(file_path)).create(_USER)
+
+    assert detect_compression(str(file_path)) == compression
+    assert JSONDataStore(file_path=str(file_path)).read() == [_USER]
+
+
+def test_compression_from_file(tmp_path):
+    """Test an existing compressed file is read whatever its name."""
+    file_path = tmp_path / "phonebook.yaml"
+    file_path.write_bytes(
+        gzip.compress(b"- {name: Eric Idle, phone: '123', address: here}\n")
+    )
+
+    data_store = YAMLDataStore(file_path=str(file_path))
+    data_store.update("Eric Idle", address="there")
+
+    assert detect_compression(str(file_path)) == "gzip"
+    assert YAMLDataStore(file_path=str(file_path)).read() == [
+        dict(_USER, address="there")
+    ]
+
+
+def test_compression(tmp_path):
+    """Test the given compression and level are used for a new file."""
+    file_path = tmp_path / "phonebook.json"
+
+    data_store = JSONDataStore(
+        file_path=str(file_path), compression="bz2", compression_level=1
+    )
+    data_store.create(_USER)
+
+    assert data_store._codec.level == 1
+    assert detect_compression(str(file_path)) == "bz2"
+    assert JSONDataStore(file_path=str(file_path)).read() == [_USER]
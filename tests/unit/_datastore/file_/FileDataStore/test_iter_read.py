@@ -0,0 +1,31 @@
+"""Unit tests for the :meth:`FileDataStore.iter_read` method."""
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "1", "address": "here"},
+    {"name": "Terry Jones", "phone": "2", "address": "here"},
+    {"name": "Eric Clapton", "phone": "3", "address": "here"},
+    {"name": "Terry Gilliam", "phone": "4", "address": "here"},
+    {"name": "Eric Bana", "phone": "5", "address": "here"},
+]
+
+
+def test_prefix_in_order(data_store_class, data_store_path):
+    """Test the users with a name prefix are read in the order they were added."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    data_store.create_many(_DATA_SET)
+
+    result = data_store.iter_read({"name": "Eric*"})
+
+    assert list(result) == [_DATA_SET[0], _DATA_SET[2], _DATA_SET[4]]
+
+
+def test_prefix_after(data_store_class, data_store_path):
+    """Test only the users with a name prefix after the `after` user are read."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    data_store.create_many(_DATA_SET)
+    data_store.delete("Eric Clapton")
+
+    result = data_store.iter_read({"name": "Eric*"}, after="Terry Jones")
+
+    assert list(result) == [_DATA_SET[4]]
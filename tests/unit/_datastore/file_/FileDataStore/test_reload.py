@@ -0,0 +1,34 @@
+"""Unit tests for the :meth:`FileDataStore.reload` method."""
+
+
+import pytest
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "Jöhn Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+@pytest.mark.parametrize("compact", (False, True))
+def test_changes_are_read_back(data_store_class, data_store_path, compact):
+    """Test the changes written by one data store are read by another."""
+    data_store = data_store_class(file_path=str(data_store_path), compact=compact)
+    with data_store.batch():
+        for user in _DATA_SET:
+            data_store.create(user)
+    data_store.update("Eric Idle", phone="999")
+
+    result = data_store_class(file_path=str(data_store_path), compact=compact)
+
+    assert result.read() == [dict(_DATA_SET[0], phone="999"), _DATA_SET[1]]
+
+
+def test_reload(data_store_class, data_store_path):
+    """Test reloading reads the changes made by another data store."""
+    data_store = data_store_class(file_path=str(data_store_path))
+    data_store_class(file_path=str(data_store_path)).create(_DATA_SET[0])
+
+    data_store.reload()
+
+    assert data_store.read() == _DATA_SET[:1]
@@ -0,0 +1,43 @@
+"""Unit tests for the :meth:`NameIndex.complete` method."""
+
+
+import pytest
+
+from phonebook._datastore.index import NameIndex
+
+
+_NAMES = ["John Cleese", "Eric Idle", "Terry Jones", "Terry Gilliam", "Eric"]
+
+
+@pytest.mark.parametrize(
+    "prefix, limit, expected_result",
+    (
+        ("Terry ", None, ["Terry Gilliam", "Terry Jones"]),
+        ("Eric", None, ["Eric", "Eric Idle"]),
+        ("Eric", 1, ["Eric"]),
+        ("", 2, ["Eric", "Eric Idle"]),
+        ("", None, sorted(_NAMES)),
+        ("Graham", None, []),
+        ("Zzz", None, []),
+        ("Terry", 0, []),
+    ),
+)
+def test_main_case(prefix, limit, expected_result):
+    """Test getting the names that start with a prefix."""
+    name_index = NameIndex(_NAMES)
+
+    assert name_index.complete(prefix, limit=limit) == expected_result
+
+
+def test_after_changes():
+    """Test the index is kept sorted as names are added and removed."""
+    name_index = NameIndex(_NAMES)
+
+    name_index.add("Terry Adams")
+    name_index.add("Aaron")
+    name_index.remove("Terry Jones")
+    name_index.add("Terry Zed")
+
+    expected_result = ["Terry Adams", "Terry Gilliam", "Terry Zed"]
+    assert name_index.complete("Terry") == expected_result
+    assert name_index.complete("A") == ["Aaron"]
@@ -0,0 +1,52 @@
+"""Unit tests for the :meth:`PhoneIndex.lookup` method."""
+
+
+import pytest
+
+from phonebook._datastore.index import PhoneIndex
+
+
+_DATA_SET = [
+    {"name": "Terry Jones", "phone": "(123) 456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "+1 123.456.7890", "address": "there"},
+    {"name": "John Cleese", "phone": "123-456-7890", "address": "far"},
+    {"name": "Michael Palin", "phone": "555-7890", "address": "near"},
+]
+
+
+@pytest.mark.parametrize(
+    "number, digits, expected_indices",
+    (
+        ("1234567890", None, [2, 0]),
+        ("+1 (123) 456-7890", None, [1]),
+        ("+1 (123) 456-7890", 10, [1, 2, 0]),
+        ("7890", 4, [1, 2, 3, 0]),
+        ("555-7890", None, [3]),
+        ("999-7890", 7, []),
+        ("no digits", None, []),
+    ),
+)
+def test_main_case(number, digits, expected_indices):
+    """Test getting the users with a phone number."""
+    phone_index = PhoneIndex(_DATA_SET)
+
+    result = phone_index.lookup(number, digits=digits)
+
+    assert result == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_after_changes():
+    """Test the index is kept up to date as users are changed."""
+    phone_index = PhoneIndex(_DATA_SET)
+    new_user = {"name": "Terry Jones", "phone": "555 7890", "address": "here"}
+
+    phone_index.remove(_DATA_SET[2])
+    phone_index.replace(_DATA_SET[0], new_user)
+    phone_index.add({"name": "Graham Chapman", "phone": "1-555-7890", "address": ""})
+
+    assert phone_index.lookup("123-456-7890") == []
+    assert [user["name"] for user in phone_index.lookup("5557890", digits=7)] == [
+        "Graham Chapman",
+        "Michael Palin",
+        "Terry Jones",
+    ]
@@ -0,0 +1,45 @@
+"""Unit tests for the :meth:`TokenIndex.search` method."""
+
+
+import pytest
+
+from phonebook._datastore.index import TokenIndex
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "12 Main St."},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "120 Main St"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "12 Side St"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "Main 12"},
+]
+
+
+@pytest.mark.parametrize(
+    "terms, expected_names",
+    (
+        ("main 12", ["Eric Idle", "Michael Palin"]),
+        ("MAIN", ["Eric Idle", "John Cleese", "Michael Palin"]),
+        ("st, 12", ["Eric Idle", "Terry Gilliam"]),
+        ("main 13", []),
+        ("ain", []),
+        ("", []),
+    ),
+)
+def test_main_case(terms, expected_names):
+    """Test getting the users whose address has every term."""
+    token_index = TokenIndex(_DATA_SET)
+
+    assert token_index.search(terms) == expected_names
+
+
+def test_after_changes():
+    """Test the index is kept up to date as users are changed."""
+    token_index = TokenIndex(_DATA_SET)
+    new_user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "9 Elm St"}
+
+    token_index.replace(_DATA_SET[0], new_user)
+    token_index.remove(_DATA_SET[3])
+    token_index.add({"name": "Graham Chapman", "phone": "555", "address": "12 Main"})
+
+    assert token_index.search("main 12") == ["Graham Chapman"]
+    assert token_index.search("st") == ["Eric Idle", "John Cleese", "Terry Gilliam"]
@@ -0,0 +1,66 @@
+"""Unit tests for the :meth:`TrigramIndex.candidates` method."""
+
+import pytest
+
+from phonebook._datastore.index import TrigramIndex
+from phonebook._query import Query
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "1 Main St"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "2 Side St"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "3 Main St"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "here"},
+]
+
+
+@pytest.mark.parametrize(
+    "filters, expected_names",
+    (
+        ({"address": "*Main St*"}, ["Eric Idle", "Terry Gilliam"]),
+        ({"address": "* St"}, ["Eric Idle", "John Cleese", "Terry Gilliam"]),
+        ({"name": "*ric*", "phone": "*555*"}, []),
+        ({"phone": "123-*", "address": "*Main*"}, ["Eric Idle"]),
+        ({"address": "*Elm St*"}, []),
+    ),
+)
+def test_main_case(filters, expected_names):
+    """Test getting the users that might match the filters."""
+    trigram_index = TrigramIndex(_DATA_SET)
+
+    assert trigram_index.candidates(Query(filters)) == expected_names
+
+
+@pytest.mark.parametrize(
+    "filters", ({}, {"address": "*St*"}, {"name": "E*"}, {"phone": "1?3*"})
+)
+def test_without_trigrams(filters):
+    """Test getting the users for filters without three literal characters."""
+    trigram_index = TrigramIndex(_DATA_SET)
+
+    assert trigram_index.candidates(Query(filters)) is None
+
+
+def test_after():
+    """Test only getting the users after a given user."""
+    trigram_index = TrigramIndex(_DATA_SET)
+
+    result = trigram_index.candidates(Query({"address": "*Main*"}), after="Eric Idle")
+
+    assert result == ["Terry Gilliam"]
+
+
+def test_after_changes():
+    """Test the users stay in order after adding, removing, and replacing."""
+    trigram_index = TrigramIndex(_DATA_SET)
+    new_user = {"name": "Graham Chapman", "phone": "000", "address": "4 Main St"}
+    updated_user = dict(_DATA_SET[0], name="Eric Idle II")
+
+    trigram_index.remove(_DATA_SET[2])
+    trigram_index.add(new_user)
+    trigram_index.replace(_DATA_SET[0], updated_user)
+
+    assert trigram_index.candidates(Query({"address": "*Main St"})) == [
+        "Eric Idle II",
+        "Graham Chapman",
+    ]
+    assert trigram_index._postings["address"].get("3 M") is None
@@ -0,0 +1,59 @@
+"""Fixtures for the `phonebook._datastore.journal_` unit tests."""
+
+
+import json
+
+import pytest
+
+from phonebook._datastore.journal_ import JournalDataStore
+
+
+@pytest.fixture()
+def data_store_path(tmp_path):
+    """Get the path to use as the snapshot of the data store.
+
+    Returns:
+        pathlib.Path: The path to use as the data store.
+
+    """
+    return tmp_path / "test_data_source.json"
+
+
+@pytest.fixture()
+def open_data_store(data_store_path):
+    """Get a function to open data stores that are closed after the test.
+
+    Returns:
+        callable: A function taking the keyword arguments of the data
+        store and returning the opened data store.
+
+    """
+    data_stores = []
+
+    def _open_data_store(**kwargs):
+        data_store = JournalDataStore(file_path=str(data_store_path), **kwargs)
+        data_stores.append(data_store)
+        return data_store
+
+    yield _open_data_store
+
+    for data_store in data_stores:
+        data_store.close()
+
+
+@pytest.fixture()
+def read_journal(data_store_path):
+    """Get a function to read the records of a journal.
+
+    Returns:
+        callable: A function taking the generation of the journal and
+        returning its records.
+
+    """
+
+    def _read_journal(generation=0):
+        journal_name = f"{data_store_path.name}.{generation}.journal"
+        journal_path = data_store_path.parent / journal_name
+        return [json.loads(line) for line in journal_path.read_text().splitlines()]
+
+    return _read_journal
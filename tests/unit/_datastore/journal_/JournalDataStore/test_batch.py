@@ -0,0 +1,44 @@
+"""Unit tests for the :meth:`JournalDataStore.batch` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_appends_once(open_data_store, read_journal):
+    """Test the records of a batch are appended when it exits."""
+    data_store = open_data_store()
+
+    with data_store.batch():
+        data_store.create_many(_DATA_SET)
+        data_store.delete("John Cleese")
+        assert read_journal() == []
+
+    assert read_journal() == [
+        {"op": "create", "user": _DATA_SET[0]},
+        {"op": "create", "user": _DATA_SET[1]},
+        {"op": "delete", "name": "John Cleese"},
+    ]
+    assert open_data_store()._users == [_DATA_SET[0]]
+
+
+def test_with_error(open_data_store, read_journal):
+    """Test none of the changes in a batch are kept when one fails."""
+    data_store = open_data_store()
+    data_store.create(_DATA_SET[0])
+
+    with pytest.raises(MissingUserError):
+        data_store.update_many(
+            {"Eric Idle": {"phone": "999"}, "John Cleese": {"phone": "999"}}
+        )
+
+    assert data_store._users == [_DATA_SET[0]]
+    assert data_store.get("Eric Idle") == _DATA_SET[0]
+    assert read_journal() == [{"op": "create", "user": _DATA_SET[0]}]
@@ -0,0 +1,112 @@
+"""Unit tests for the :meth:`JournalDataStore.compact` method."""
+
+
+import json
+import threading
+
+import pytest
+
+from phonebook._datastore import locking
+
+
+_USERS = [
+    {"name": f"User {index}", "phone": str(index), "address": "here"}
+    for index in range(5)
+]
+
+
+def test_writes_snapshot(data_store_path, open_data_store, read_journal):
+    """Test compacting writes a snapshot and starts a new journal."""
+    data_store = open_data_store()
+    for user in _USERS:
+        data_store.create(user)
+
+    data_store.compact()
+
+    assert json.loads(data_store_path.read_text()) == {
+        "generation": 1,
+        "users": _USERS,
+    }
+    assert not (data_store_path.parent / f"{data_store_path.name}.0.journal").exists()
+    assert read_journal(generation=1) == []
+    assert open_data_store()._users == _USERS
+
+
+@pytest.mark.parametrize("background_compaction", (False, True))
+def test_threshold(
+    data_store_path, open_data_store, read_journal, background_compaction
+):
+    """Test the journal is compacted once it passes the thresholds."""
+    data_store = open_data_store(
+        compact_min_records=3,
+        compact_ratio=1.0,
+        background_compaction=background_compaction,
+    )
+    for user in _USERS[:3]:
+        data_store.create(user)
+    data_store.update("User 0", phone="999")
+    data_store.close()
+
+    snapshot = json.loads(data_store_path.read_text())
+    assert snapshot == {"generation": 1, "users": _USERS[:3]}
+    assert read_journal(generation=1) == [
+        {
+            "op": "update",
+            "name": "User 0",
+            "user": {"name": "User 0", "phone": "999", "address": "here"},
+        }
+    ]
+
+
+def test_ratio(data_store_path, open_data_store):
+    """Test the journal is not compacted while it is small relative to the users."""
+    data_store = open_data_store(compact_min_records=1, compact_ratio=2.0)
+    data_store.create(_USERS[0])
+    assert data_store._generation == 0
+
+    data_store.update("User 0", phone="999")
+    assert data_store._generation == 1
+
+
+def test_waits_for_file_lock(data_store_path, open_data_store):
+    """Test the journal isn't compacted while another process locks the file."""
+    data_store = open_data_store()
+    data_store.create(_USERS[0])
+    thread = threading.Thread(target=data_store.compact)
+
+    with locking.FileLock(str(data_store_path)).exclusive():
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+        assert not data_store_path.exists()
+    thread.join()
+
+    assert json.loads(data_store_path.read_text())["users"] == _USERS[:1]
+
+
+def test_includes_other_process_changes(data_store_path, open_data_store):
+    """Test the changes another process appended are in the snapshot."""
+    data_store = open_data_store()
+    other_data_store = open_data_store()
+    other_data_store.create(_USERS[0])
+
+    data_store.compact()
+
+    assert json.loads(data_store_path.read_text())["users"] == _USERS[:1]
+    assert open_data_store().read() == _USERS[:1]
+
+
+def test_skips_older_snapshot(data_store_path, open_data_store):
+    """Test a snapshot older than another process's snapshot isn't written."""
+    data_store = open_data_store()
+    data_store.create(_USERS[0])
+    other_data_store = open_data_store()
+    other_data_store.compact()
+    other_data_store.compact()
+
+    data_store._write_snapshot([], generation=1)
+
+    assert json.loads(data_store_path.read_text()) == {
+        "generation": 2,
+        "users": _USERS[:1],
+    }
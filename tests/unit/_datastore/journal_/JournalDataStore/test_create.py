@@ -0,0 +1,88 @@
+"""Unit tests for the :meth:`JournalDataStore.create` method."""
+
+
+import threading
+
+import pytest
+
+from phonebook._datastore import locking
+from phonebook._exceptions import DuplicateUserError
+
+
+def test_appends_record(open_data_store, read_journal):
+    """Test creating a user appends a record to the journal."""
+    data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+
+    data_store.create(dict(user, foobar="baz"))
+
+    assert data_store._users == [user]
+    assert read_journal() == [{"op": "create", "user": user}]
+
+
+def test_survives_reopen(open_data_store):
+    """Test created users are loaded by a new data store."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    open_data_store().create(user)
+
+    assert open_data_store().get("Eric Idle") == user
+
+
+def test_with_duplicate_user(open_data_store, read_journal):
+    """Test `create` when the user already exists."""
+    data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    data_store.create(user)
+
+    with pytest.raises(DuplicateUserError):
+        data_store.create(user)
+
+    assert read_journal() == [{"op": "create", "user": user}]
+
+
+def test_waits_for_file_lock(data_store_path, open_data_store, read_journal):
+    """Test the record isn't appended while another process locks the file."""
+    data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    thread = threading.Thread(target=data_store.create, args=(user,))
+
+    with locking.FileLock(str(data_store_path)).exclusive():
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+        assert read_journal() == []
+    thread.join()
+
+    assert read_journal() == [{"op": "create", "user": user}]
+
+
+def test_with_user_created_by_other_process(open_data_store, read_journal):
+    """Test a user another process created since the journal was read."""
+    data_store = open_data_store()
+    other_data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    other_data_store.create(user)
+
+    with pytest.raises(DuplicateUserError):
+        data_store.create(user)
+
+    assert data_store.get("Eric Idle") == user
+    assert read_journal() == [{"op": "create", "user": user}]
+    assert open_data_store().read() == [user]
+
+
+def test_after_other_process_compacted(open_data_store, read_journal):
+    """Test creating a user after another process compacted the journal."""
+    users = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    data_store = open_data_store()
+    other_data_store = open_data_store()
+    other_data_store.create(users[0])
+    other_data_store.compact()
+
+    data_store.create(users[1])
+
+    assert read_journal(generation=1) == [{"op": "create", "user": users[1]}]
+    assert open_data_store().read() == users
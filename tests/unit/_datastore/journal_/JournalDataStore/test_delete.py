@@ -0,0 +1,47 @@
+"""Unit tests for the :meth:`JournalDataStore.delete` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_appends_record(open_data_store, read_journal):
+    """Test deleting a user appends a record to the journal."""
+    data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    data_store.create(user)
+
+    data_store.delete("Eric Idle")
+
+    assert data_store._users == []
+    assert read_journal() == [
+        {"op": "create", "user": user},
+        {"op": "delete", "name": "Eric Idle"},
+    ]
+    assert open_data_store()._users == []
+
+
+def test_with_missing_user(open_data_store, read_journal):
+    """Test `delete` when the user doesn't exists."""
+    data_store = open_data_store()
+
+    with pytest.raises(MissingUserError):
+        data_store.delete("Eric Idle")
+
+    assert read_journal() == []
+
+
+def test_with_user_deleted_by_other_process(open_data_store, read_journal):
+    """Test a user another process deleted since the journal was read."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    data_store = open_data_store()
+    data_store.create(user)
+    other_data_store = open_data_store()
+    other_data_store.delete("Eric Idle")
+
+    with pytest.raises(MissingUserError):
+        data_store.delete("Eric Idle")
+
+    assert len(read_journal()) == 2
+    assert open_data_store().read() == []
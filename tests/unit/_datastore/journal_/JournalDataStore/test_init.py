@@ -0,0 +1,121 @@
+"""Unit tests for the :meth:`JournalDataStore.__init__` method."""
+
+
+import json
+
+
+def test_without_files(data_store_path, open_data_store):
+    """Test creating a data store when no snapshot or journal exists."""
+    assert not data_store_path.exists()
+    data_store = open_data_store()
+    assert data_store._users == []
+    assert data_store._generation == 0
+
+
+def test_name(open_data_store):
+    """Test the data store has a name defined."""
+    data_store = open_data_store()
+    assert data_store.NAME == "journal"
+
+
+def test_with_snapshot(data_store_path, open_data_store):
+    """Test creating a data store from a snapshot."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps({"generation": 3, "users": data_set}))
+
+    data_store = open_data_store()
+    assert data_store._users == data_set
+    assert data_store._generation == 3
+
+
+def test_replays_journal(data_store_path, open_data_store):
+    """Test creating a data store replays the journal over the snapshot."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    data_store_path.write_text(json.dumps({"generation": 1, "users": data_set}))
+    records = [
+        {"op": "delete", "name": "Eric Idle"},
+        {
+            "op": "create",
+            "user": {"name": "Terry Gilliam", "phone": "555", "address": "not here"},
+        },
+        {
+            "op": "update",
+            "name": "John Cleese",
+            "user": {"name": "Michael Palin", "phone": "111", "address": "there"},
+        },
+    ]
+    journal_path = data_store_path.parent / f"{data_store_path.name}.1.journal"
+    journal_path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    data_store = open_data_store()
+    assert data_store._users == [
+        {"name": "Michael Palin", "phone": "111", "address": "there"},
+        {"name": "Terry Gilliam", "phone": "555", "address": "not here"},
+    ]
+    assert data_store.get("Michael Palin")
+
+
+def test_ignores_stale_journal(data_store_path, open_data_store):
+    """Test journals already included in the snapshot are not replayed."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps({"generation": 2, "users": data_set}))
+    stale_journal_path = data_store_path.parent / f"{data_store_path.name}.1.journal"
+    stale_journal_path.write_text(
+        json.dumps({"op": "create", "user": data_set[0]}) + "\n"
+    )
+
+    data_store = open_data_store()
+    assert data_store._users == data_set
+    assert not stale_journal_path.exists()
+
+
+def test_with_partial_record(data_store_path, open_data_store, caplog):
+    """Test a partially written record is ignored and terminated."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    journal_path = data_store_path.parent / f"{data_store_path.name}.0.journal"
+    journal_path.write_text(json.dumps({"op": "create", "user": user}) + '\n{"op": "cr')
+
+    data_store = open_data_store()
+    assert data_store._users == [user]
+    assert "corrupt" in caplog.text
+
+    data_store.delete("Eric Idle")
+    data_store.close()
+    journal_lines = journal_path.read_text().splitlines()
+    assert json.loads(journal_lines[-1]) == {"op": "delete", "name": "Eric Idle"}
+
+
+def test_trigram_index(open_data_store):
+    """Test the trigram index includes the users replayed from the journal."""
+    data_store = open_data_store()
+    data_store.create({"name": "Eric Idle", "phone": "123", "address": "1 Main St"})
+    data_store.create({"name": "John Cleese", "phone": "456", "address": "2 Elm St"})
+    data_store.update("John Cleese", address="3 Main St")
+    data_store.close()
+
+    data_store = open_data_store(trigram_index=True)
+
+    assert [user["name"] for user in data_store.read({"address": "*Main St*"})] == [
+        "Eric Idle",
+        "John Cleese",
+    ]
+
+
+def test_with_records_that_no_longer_apply(data_store_path, open_data_store, caplog):
+    """Test records conflicting with earlier records are skipped."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    journal_path = data_store_path.parent / f"{data_store_path.name}.0.journal"
+    records = [
+        {"op": "create", "user": user},
+        {"op": "create", "user": dict(user, phone="555")},
+        {"op": "delete", "name": "John Cleese"},
+    ]
+    journal_path.write_text("".join(f"{json.dumps(record)}\n" for record in records))
+
+    data_store = open_data_store()
+
+    assert data_store.read() == [user]
+    assert caplog.text.count("no longer applies") == 2
@@ -0,0 +1,34 @@
+"""Unit tests for the :meth:`JournalDataStore.update` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_appends_record(open_data_store, read_journal):
+    """Test updating a user appends the updated user to the journal."""
+    data_store = open_data_store()
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    data_store.create(user)
+
+    data_store.update("Eric Idle", name="John Cleese")
+
+    updated_user = {"name": "John Cleese", "phone": "123-456-7890", "address": "here"}
+    assert data_store._users == [updated_user]
+    assert read_journal()[-1] == {
+        "op": "update",
+        "name": "Eric Idle",
+        "user": updated_user,
+    }
+    assert open_data_store()._users == [updated_user]
+
+
+def test_with_missing_user(open_data_store, read_journal):
+    """Test `update` when the user doesn't exists."""
+    data_store = open_data_store()
+
+    with pytest.raises(MissingUserError):
+        data_store.update("Eric Idle", phone="999-999-9999")
+
+    assert read_journal() == []
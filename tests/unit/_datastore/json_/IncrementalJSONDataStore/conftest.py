@@ -0,0 +1,46 @@
+"""Fixtures for the `IncrementalJSONDataStore` unit tests."""
+
+
+import pytest
+
+from phonebook._datastore.json_ import IncrementalJSONDataStore
+
+
+@pytest.fixture()
+def data_store_path(tmp_path):
+    """Get the path to use as the source of the data store.
+
+    Returns:
+        pathlib.Path: The path to use as the data store.
+
+    """
+    return tmp_path / "test_data_source.json"
+
+
+@pytest.fixture()
+def data_set():
+    """Get the users the data store starts with.
+
+    Returns:
+        list(dict(str, str)): The users.
+
+    """
+    return [
+        {"name": f"User {number}", "phone": "123-456-7890", "address": "here"}
+        for number in range(10)
+    ]
+
+
+@pytest.fixture()
+def data_store(data_store_path, data_set):
+    """Get a data store of the `data_set` laid out in slots.
+
+    Returns:
+        IncrementalJSONDataStore: The data store.
+
+    """
+    data_store = IncrementalJSONDataStore(file_path=str(data_store_path))
+    with data_store.batch():
+        for user in data_set:
+            data_store.create(user)
+    return data_store
@@ -0,0 +1,26 @@
+"""Unit tests for the :meth:`IncrementalJSONDataStore.batch` method."""
+
+
+import pytest
+
+from phonebook._datastore.json_ import IncrementalJSONDataStore
+
+
+def test_discarded_keeps_unwritten_changes(data_store_path, data_set):
+    """Test discarding a batch keeps the changes waiting to be written."""
+    data_store = IncrementalJSONDataStore(
+        file_path=str(data_store_path), write_behind=True, flush_interval=60
+    )
+    data_store.create_many(data_set)
+    data_store.flush()
+    data_store.update("User 0", phone="999")
+
+    with pytest.raises(KeyError):
+        with data_store.batch():
+            data_store.update("User 1", phone="555")
+            raise KeyError("User 1")
+    data_store.close()
+
+    reloaded = IncrementalJSONDataStore(file_path=str(data_store_path))
+    assert reloaded.get("User 0")["phone"] == "999"
+    assert reloaded.get("User 1")["phone"] == "123-456-7890"
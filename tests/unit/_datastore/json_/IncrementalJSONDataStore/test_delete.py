@@ -0,0 +1,45 @@
+"""Unit tests for the :meth:`IncrementalJSONDataStore.delete` method."""
+
+
+import json
+
+from phonebook._datastore.json_ import IncrementalJSONDataStore
+
+
+def test_tombstone(data_store, data_store_path, data_set):
+    """Test a deleted user's slot is overwritten with a tombstone."""
+    size = data_store_path.stat().st_size
+
+    data_store.delete("User 3")
+
+    assert data_store_path.stat().st_size == size
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3] is None
+    assert IncrementalJSONDataStore(file_path=str(data_store_path)).read() == (
+        data_set[:3] + data_set[4:]
+    )
+
+
+def test_fragmented(data_store, data_store_path, data_set):
+    """Test the file is rewritten once it is mostly tombstones."""
+    for user in data_set[:5]:
+        data_store.delete(user["name"])
+    assert json.loads(data_store_path.read_bytes()).count(None) == 6
+
+    data_store.delete("User 5")
+
+    assert json.loads(data_store_path.read_bytes()) == data_set[6:] + [None]
+
+
+def test_create_after_delete(data_store, data_store_path, data_set):
+    """Test a user created after being deleted is appended to the file."""
+    data_store.delete("User 3")
+    data_store.create(data_set[3])
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3] is None
+    assert slots[-2] == data_set[3]
+    reloaded = IncrementalJSONDataStore(file_path=str(data_store_path))
+    assert reloaded.read() == data_store.read()
+    reloaded.update("User 4", phone="555")
+    assert json.loads(data_store_path.read_bytes())[4]["phone"] == "555"
@@ -0,0 +1,35 @@
+"""Unit tests for the :meth:`IncrementalJSONDataStore.__init__` method."""
+
+
+import json
+
+import pytest
+
+from phonebook._datastore.json_ import IncrementalJSONDataStore
+
+
+def test_new_file(data_store_path):
+    """Test a new data file is laid out in slots."""
+    IncrementalJSONDataStore(file_path=str(data_store_path))
+
+    assert data_store_path.read_bytes() == b"[\nnull]\n"
+
+
+def test_plain_json(data_store_path, data_set):
+    """Test a JSON file not laid out in slots is rewritten on the first change."""
+    data_store_path.write_text(json.dumps(data_set, indent=2))
+    data_store = IncrementalJSONDataStore(file_path=str(data_store_path))
+    assert data_store.read() == data_set
+
+    data_store.update("User 0", phone="555")
+
+    assert data_store_path.read_bytes().startswith(b'[\n{"name":"User 0","phone":"555"')
+    assert IncrementalJSONDataStore(file_path=str(data_store_path)).read() == (
+        data_store.read()
+    )
+
+
+def test_compressed(tmp_path):
+    """Test a compressed data file can't be used."""
+    with pytest.raises(ValueError):
+        IncrementalJSONDataStore(file_path=str(tmp_path / "phonebook.json.gz"))
@@ -0,0 +1,102 @@
+"""Unit tests for the :meth:`IncrementalJSONDataStore.update` method."""
+
+
+import json
+
+from phonebook._datastore.json_ import IncrementalJSONDataStore
+
+
+def test_in_place(data_store, data_store_path):
+    """Test a user that still fits in its slot is overwritten in place."""
+    data = data_store_path.read_bytes()
+
+    data_store.update("User 3", phone="555-0000", address="somewhere else")
+
+    new_data = data_store_path.read_bytes()
+    assert len(new_data) == len(data)
+    lines = zip(data.split(b"\n"), new_data.split(b"\n"))
+    changed = [index for index, (old, new) in enumerate(lines) if old != new]
+    assert changed == [4]
+    assert json.loads(new_data)[3] == {
+        "name": "User 3",
+        "phone": "555-0000",
+        "address": "somewhere else",
+    }
+
+
+def test_relocated(data_store, data_store_path, data_set):
+    """Test a user that no longer fits is moved to the end of the file."""
+    data_store.update("User 3", address="x" * 200)
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3] is None
+    assert slots[-2] == dict(data_set[3], address="x" * 200)
+    assert slots[-1] is None
+    reloaded = IncrementalJSONDataStore(file_path=str(data_store_path)).read()
+    assert reloaded == data_set[:3] + data_set[4:] + [slots[-2]]
+
+
+def test_renamed(data_store, data_store_path):
+    """Test a renamed user keeps its slot."""
+    data_store.update("User 3", name="Renamed")
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3]["name"] == "Renamed"
+    assert len(slots) == 11
+    assert IncrementalJSONDataStore(file_path=str(data_store_path)).read() == (
+        data_store.read()
+    )
+
+
+def test_renamed_back(data_store, data_store_path, data_set):
+    """Test a user renamed and renamed back in a batch keeps its slot."""
+    with data_store.batch():
+        data_store.update("User 3", name="Renamed")
+        data_store.update("Renamed", name="User 3", phone="555")
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3] == {"name": "User 3", "phone": "555", "address": "here"}
+    assert len(slots) == 11
+
+
+def test_reused_name(data_store, data_store_path):
+    """Test a user renamed to the name of a user deleted in a batch."""
+    with data_store.batch():
+        data_store.delete("User 5")
+        data_store.update("User 3", name="User 5")
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[3]["name"] == "User 5"
+    assert slots[5] is None
+    assert IncrementalJSONDataStore(file_path=str(data_store_path)).read() == (
+        data_store.read()
+    )
+
+
+def test_many_changes(data_store, data_store_path, data_set):
+    """Test the file is rewritten when most of the users change at once."""
+    with data_store.batch():
+        for user in data_set[:6]:
+            data_store.update(user["name"], address="x" * 200)
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert None not in slots[:-1]
+    assert slots[:-1] == data_store.read()
+
+
+def test_changed_by_another_process(data_store_path, data_set):
+    """Test the file is rewritten rather than patched if its slots moved."""
+    data_store = IncrementalJSONDataStore(
+        file_path=str(data_store_path), write_behind=True, flush_interval=60
+    )
+    data_store.create_many(data_set)
+    data_store.flush()
+    data_store.update("User 5", phone="999")
+    other_data_store = IncrementalJSONDataStore(file_path=str(data_store_path))
+    other_data_store.delete_many(["User 2", "User 3", "User 4"])
+
+    data_store.close()
+
+    slots = json.loads(data_store_path.read_bytes())
+    assert slots[:-1] == data_store.read()
+    assert slots[5]["phone"] == "999"
@@ -0,0 +1,45 @@
+"""Unit tests for the :meth:`JSONDataStore.complete` method."""
+
+
+import json
+
+import pytest
+
+from phonebook._datastore.json_ import JSONDataStore
+
+
+_DATA_SET = [
+    {"name": "Terry Jones", "phone": "123-456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "111-222-3333", "address": "there"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "far"},
+]
+
+
+@pytest.mark.parametrize(
+    "prefix, limit, expected_result",
+    (
+        ("Terry", None, ["Terry Gilliam", "Terry Jones"]),
+        ("Terry", 1, ["Terry Gilliam"]),
+        ("", None, ["Eric Idle", "Terry Gilliam", "Terry Jones"]),
+        ("John", None, []),
+    ),
+)
+def test_main_case(data_store_path, prefix, limit, expected_result):
+    """Test getting the names that start with a prefix."""
+    data_store_path.write_text(json.dumps(_DATA_SET))
+    data_store = JSONDataStore(file_path=str(data_store_path))
+
+    assert data_store.complete(prefix, limit=limit) == expected_result
+
+
+def test_after_changes(data_store_path):
+    """Test the names are completed after users are changed."""
+    data_store_path.write_text(json.dumps(_DATA_SET))
+    data_store = JSONDataStore(file_path=str(data_store_path))
+
+    data_store.create({"name": "Terry Adams", "phone": "555", "address": "near"})
+    data_store.update("Terry Jones", name="Graham Chapman")
+    data_store.delete("Terry Gilliam")
+
+    assert data_store.complete("Terry") == ["Terry Adams"]
+    assert data_store.complete("Graham") == ["Graham Chapman"]
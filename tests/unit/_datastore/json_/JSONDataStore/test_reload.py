@@ -31,3 +31,69 @@ def test_updates_to_data_store(data_store_path):
     data_store.reload()
 
     assert data_store._users == []
+
+
+def test_auto_reload(data_store_path):
+    """Test automatically reloading when the JSON file has changed."""
+    data_store_path.write_text(json.dumps([]))
+    data_store = JSONDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps(data_set))
+
+    assert data_store.read() == data_set
+    assert data_store.get("Eric Idle") == data_set[0]
+
+
+def test_auto_reload_disabled(data_store_path):
+    """Test the JSON file is not checked unless auto reloading is enabled."""
+    data_store_path.write_text(json.dumps([]))
+    data_store = JSONDataStore(file_path=str(data_store_path))
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps(data_set))
+
+    assert data_store.read() == []
+
+
+def test_auto_reload_interval(data_store_path, mocker):
+    """Test the JSON file is checked at most once per reload interval."""
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    data_store_path.write_text(json.dumps([]))
+    data_store = JSONDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=5
+    )
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps(data_set))
+
+    mock_monotonic.return_value = 104.0
+    assert data_store.read() == []
+    mock_monotonic.return_value = 105.0
+    assert data_store.read() == data_set
+
+
+def test_auto_reload_own_changes(data_store_path, mocker):
+    """Test changes made through the data store don't cause a reload."""
+    data_store_path.write_text(json.dumps([]))
+    data_store = JSONDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    mock_reload = mocker.spy(data_store, "reload")
+
+    data_store.create({"name": "Eric Idle", "phone": "123-456-7890", "address": "here"})
+    data_store.update("Eric Idle", phone="555-555-5555")
+    data_store.read()
+
+    mock_reload.assert_not_called()
+
+
+def test_auto_reload_missing_file(data_store_path):
+    """Test the users are kept while the JSON file is missing."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(json.dumps(data_set))
+    data_store = JSONDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    data_store_path.unlink()
+
+    assert data_store.read() == data_set
@@ -107,3 +107,23 @@ def test_with_missing_user(data_store_path):
         data_store.update("John Cleese", **user)
 
     assert "John Cleese" in str(error.value)
+
+
+def test_compact(data_store_path):
+    """Test updating a user in a compact data store."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    data_store_path.write_text(json.dumps(data_set))
+    data_store = JSONDataStore(file_path=str(data_store_path), compact=True)
+
+    data_store.update("Eric Idle", name="Terry Gilliam", address="not here")
+
+    updated_user = {
+        "name": "Terry Gilliam",
+        "phone": "123-456-7890",
+        "address": "not here",
+    }
+    assert data_store.read() == [updated_user, data_set[1]]
+    assert json.loads(data_store_path.read_text()) == [updated_user, data_set[1]]
@@ -0,0 +1,17 @@
+"""Fixtures for the `phonebook._datastore.locking.FileLock` unit tests."""
+
+
+import pytest
+
+from phonebook._datastore.locking import FileLock
+
+
+@pytest.fixture()
+def file_lock(tmp_path):
+    """Get a lock on a file in a temporary directory.
+
+    Returns:
+        FileLock: The lock.
+
+    """
+    return FileLock(str(tmp_path / "test_data_source.json"))
@@ -0,0 +1,34 @@
+"""Unit tests for the :meth:`FileLock.exclusive` method."""
+
+
+import pytest
+
+from phonebook._datastore import locking
+
+
+pytestmark = pytest.mark.skipif(
+    locking.fcntl is None, reason="File locking is not supported"
+)
+
+
+@pytest.mark.parametrize("method_name", ("shared", "exclusive"))
+def test_blocks_others(file_lock, acquired_in_thread, method_name):
+    """Test the exclusive lock is only held by one thread at a time."""
+    with file_lock.exclusive():
+        assert not acquired_in_thread(file_lock, method_name)
+
+
+def test_released(file_lock, acquired_in_thread):
+    """Test the exclusive lock is released when the context exits."""
+    with file_lock.exclusive():
+        pass
+
+    assert acquired_in_thread(file_lock, "exclusive")
+
+
+@pytest.mark.parametrize("method_name", ("shared", "exclusive"))
+def test_reentrant(file_lock, method_name):
+    """Test the exclusive lock can be acquired again by the same thread."""
+    with file_lock.exclusive():
+        with getattr(file_lock, method_name)():
+            pass
@@ -0,0 +1,46 @@
+"""Unit tests for the :meth:`FileLock.shared` method."""
+
+
+import pytest
+
+from phonebook._datastore import locking
+
+
+pytestmark = pytest.mark.skipif(
+    locking.fcntl is None, reason="File locking is not supported"
+)
+
+
+def test_creates_lock_file(file_lock, tmp_path):
+    """Test the lock is held on a separate lock file."""
+    with file_lock.shared():
+        assert (tmp_path / "test_data_source.json.lock").exists()
+
+    assert not (tmp_path / "test_data_source.json").exists()
+
+
+def test_allows_shared(file_lock, acquired_in_thread):
+    """Test the shared lock can be held by many threads at once."""
+    with file_lock.shared():
+        assert acquired_in_thread(file_lock, "shared")
+
+
+def test_blocks_exclusive(file_lock, acquired_in_thread):
+    """Test the exclusive lock waits for the shared lock."""
+    with file_lock.shared():
+        assert not acquired_in_thread(file_lock, "exclusive")
+
+
+def test_reentrant(file_lock):
+    """Test the shared lock can be acquired again by the same thread."""
+    with file_lock.shared():
+        with file_lock.shared():
+            pass
+
+
+def test_upgrade(file_lock):
+    """Test the shared lock can't be upgraded to the exclusive lock."""
+    with file_lock.shared():
+        with pytest.raises(RuntimeError):
+            with file_lock.exclusive():
+                pass
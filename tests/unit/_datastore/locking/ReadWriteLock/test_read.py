@@ -0,0 +1,44 @@
+"""Unit tests for the :meth:`ReadWriteLock.read` method."""
+
+
+import threading
+
+from phonebook._datastore.locking import ReadWriteLock
+
+
+def test_allows_readers(acquired_in_thread):
+    """Test the read lock can be held by many threads at once."""
+    lock = ReadWriteLock()
+
+    with lock.read():
+        assert acquired_in_thread(lock, "read")
+
+
+def test_blocks_writer(acquired_in_thread):
+    """Test the write lock waits for the readers."""
+    lock = ReadWriteLock()
+
+    with lock.read():
+        assert not acquired_in_thread(lock, "write")
+
+
+def test_prefers_waiting_writer(acquired_in_thread):
+    """Test new readers wait for a writer that is waiting for the lock."""
+    lock = ReadWriteLock()
+
+    with lock.read():
+        assert not acquired_in_thread(lock, "write")
+        assert not acquired_in_thread(lock, "read")
+
+
+def test_reentrant_with_waiting_writer(acquired_in_thread):
+    """Test a reader can acquire the lock again while a writer waits."""
+    lock = ReadWriteLock()
+    reacquired = threading.Event()
+
+    with lock.read():
+        assert not acquired_in_thread(lock, "write")
+        with lock.read():
+            reacquired.set()
+
+    assert reacquired.is_set()
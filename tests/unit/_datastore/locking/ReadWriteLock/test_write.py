@@ -0,0 +1,47 @@
+"""Unit tests for the :meth:`ReadWriteLock.write` method."""
+
+
+import pytest
+
+from phonebook._datastore.locking import ReadWriteLock
+
+
+@pytest.mark.parametrize("method_name", ("read", "write"))
+def test_blocks_others(acquired_in_thread, method_name):
+    """Test the write lock is only held by one thread at a time."""
+    lock = ReadWriteLock()
+
+    with lock.write():
+        assert not acquired_in_thread(lock, method_name)
+
+
+def test_released(acquired_in_thread):
+    """Test the write lock is released when the context exits."""
+    lock = ReadWriteLock()
+
+    with lock.write():
+        with lock.write():
+            pass
+        assert not acquired_in_thread(lock, "read")
+
+    assert acquired_in_thread(lock, "read")
+
+
+@pytest.mark.parametrize("method_name", ("read", "write"))
+def test_reentrant(method_name):
+    """Test the write lock can be acquired again by the same thread."""
+    lock = ReadWriteLock()
+
+    with lock.write():
+        with getattr(lock, method_name)():
+            pass
+
+
+def test_upgrade():
+    """Test the read lock can't be upgraded to the write lock."""
+    lock = ReadWriteLock()
+
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            with lock.write():
+                pass
@@ -0,0 +1,39 @@
+"""Fixtures for the `phonebook._datastore.locking` unit tests."""
+
+
+import threading
+
+import pytest
+
+
+@pytest.fixture()
+def acquired_in_thread():
+    """Get a function to check if a thread can acquire the lock.
+
+    Returns:
+        callable: A function taking the lock and the name of its method
+        to acquire it with (e.g. "shared" or "read"), and returning True
+        if another thread acquired the lock within a short time.
+
+    """
+    threads = []
+    released = threading.Event()
+
+    def _acquired_in_thread(lock, method_name):
+        acquired = threading.Event()
+
+        def _acquire():
+            with getattr(lock, method_name)():
+                acquired.set()
+                released.wait()
+
+        thread = threading.Thread(target=_acquire, daemon=True)
+        thread.start()
+        threads.append(thread)
+        return acquired.wait(timeout=0.2)
+
+    yield _acquired_in_thread
+
+    released.set()
+    for thread in threads:
+        thread.join()
@@ -0,0 +1,58 @@
+"""Unit tests for the :func:`phonebook._datastore.locking.atomic_write` function."""
+
+
+import os
+
+import pytest
+
+from phonebook._datastore.locking import atomic_write
+
+
+def test_new_file(tmp_path):
+    """Test atomically writing a file that doesn't exist."""
+    file_path = tmp_path / "test_data_source.json"
+
+    with atomic_write(str(file_path)) as data_file:
+        data_file.write("[]")
+
+    assert file_path.read_text() == "[]"
+    assert os.listdir(tmp_path) == ["test_data_source.json"]
+
+
+def test_binary_mode(tmp_path):
+    """Test atomically writing bytes to a file."""
+    file_path = tmp_path / "test_data_source.snapshot"
+
+    with atomic_write(str(file_path), mode="wb") as data_file:
+        data_file.write(b"\x00\x01")
+
+    assert file_path.read_bytes() == b"\x00\x01"
+
+
+def test_existing_file(tmp_path):
+    """Test atomically replacing a file keeps its permissions."""
+    file_path = tmp_path / "test_data_source.json"
+    file_path.write_text("old")
+    file_path.chmod(0o640)
+
+    with atomic_write(str(file_path)) as data_file:
+        # the file is unchanged until the context exits
+        data_file.write("new")
+        assert file_path.read_text() == "old"
+
+    assert file_path.read_text() == "new"
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_with_error(tmp_path):
+    """Test the file is unchanged when an error is raised."""
+    file_path = tmp_path / "test_data_source.json"
+    file_path.write_text("old")
+
+    with pytest.raises(ValueError):
+        with atomic_write(str(file_path)) as data_file:
+            data_file.write("new")
+            raise ValueError()
+
+    assert file_path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["test_data_source.json"]
@@ -0,0 +1,38 @@
+"""Unit tests for the :meth:`UserRecord.from_dict` method."""
+
+
+from phonebook._datastore.record import UserRecord
+
+
+def test_main_case():
+    """Test creating a record of a user."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+
+    result = UserRecord.from_dict(user)
+
+    assert (result.name, result.phone, result.address) == (
+        "Eric Idle",
+        "123-456-7890",
+        "here",
+    )
+
+
+def test_shared_strings():
+    """Test records of users with the same address share the string."""
+    first_user = UserRecord.from_dict(
+        {"name": "Eric Idle", "phone": "123", "address": "".join(["1 Main", " St"])}
+    )
+    second_user = UserRecord.from_dict(
+        {"name": "John Cleese", "phone": "456", "address": "".join(["1 Ma", "in St"])}
+    )
+
+    assert first_user.address is second_user.address
+
+
+def test_non_string_address():
+    """Test an address that isn't a string (e.g. hand-edited) is kept as is."""
+    user = {"name": "Eric Idle", "phone": "123", "address": 42}
+
+    result = UserRecord.from_dict(user)
+
+    assert result.address == 42
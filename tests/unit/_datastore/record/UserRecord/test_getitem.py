@@ -0,0 +1,26 @@
+"""Unit tests for the :meth:`UserRecord.__getitem__` method."""
+
+
+import pytest
+
+from phonebook._datastore.record import UserRecord
+
+
+@pytest.mark.parametrize(
+    "field, expected_result",
+    (("name", "Eric Idle"), ("phone", "123-456-7890"), ("address", "here")),
+)
+def test_main_case(field, expected_result):
+    """Test getting each field of the record."""
+    user = UserRecord("Eric Idle", "123-456-7890", "here")
+
+    assert user[field] == expected_result
+
+
+@pytest.mark.parametrize("field", ("email", "__class__", "to_dict"))
+def test_with_unknown_field(field):
+    """Test getting a field the record doesn't have."""
+    user = UserRecord("Eric Idle", "123-456-7890", "here")
+
+    with pytest.raises(KeyError):
+        user[field]
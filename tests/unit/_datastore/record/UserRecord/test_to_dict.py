@@ -0,0 +1,14 @@
+"""Unit tests for the :meth:`UserRecord.to_dict` method."""
+
+
+from phonebook._datastore.record import UserRecord
+
+
+def test_main_case():
+    """Test getting the user information as a new dictionary each time."""
+    user = UserRecord("Eric Idle", "123-456-7890", "here")
+
+    result = user.to_dict()
+
+    assert result == {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    assert user.to_dict() is not result
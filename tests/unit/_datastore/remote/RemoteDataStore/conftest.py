@@ -0,0 +1,71 @@
+"""Fixtures for the `phonebook._datastore.remote` unit tests."""
+
+
+import json
+import threading
+
+import pytest
+
+import phonebook
+from phonebook._datastore.json_ import JSONDataStore
+from phonebook._datastore.remote import RemoteDataStore
+
+
+@pytest.fixture()
+def served_data_store(mocker, tmp_path):
+    """Get the data store served by the server.
+
+    Returns:
+        JSONDataStore: The data store, with two users.
+
+    """
+    data_store_path = tmp_path / "test_data_source.json"
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    data_store_path.write_text(json.dumps(data_set))
+    data_store = JSONDataStore(file_path=str(data_store_path))
+    mocker.patch.object(phonebook._main, "_DATA_STORE", data_store)
+    return data_store
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server_address(request, served_data_store, tmp_path):
+    """Get the address of a running server.
+
+    The server is started on either a TCP port or a Unix socket.
+
+    Returns:
+        str: The address of the server.
+
+    """
+    if request.param == "tcp":
+        server = phonebook._server.make_server("127.0.0.1:0")
+        address = "{}:{}".format(*server.server_address)
+    else:
+        address = str(tmp_path / "phonebook.sock")
+        server = phonebook._server.make_server(address)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+
+    yield address
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture()
+def data_store(server_address):
+    """Get a remote data store connected to a running server.
+
+    Returns:
+        RemoteDataStore: The remote data store.
+
+    """
+    data_store = RemoteDataStore(server_address, timeout=10)
+    yield data_store
+    data_store.close()
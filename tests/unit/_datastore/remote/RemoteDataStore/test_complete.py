@@ -0,0 +1,24 @@
+"""Unit tests for the :meth:`RemoteDataStore.complete` method."""
+
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "prefix, limit, expected_result",
+    (
+        ("", None, ["Eric Idle", "John Cleese"]),
+        ("", 1, ["Eric Idle"]),
+        ("John", None, ["John Cleese"]),
+        ("Eric & John", None, []),
+    ),
+)
+def test_main_case(data_store, prefix, limit, expected_result):
+    """Test getting the names that start with a prefix."""
+    assert data_store.complete(prefix, limit=limit) == expected_result
+
+
+def test_with_negative_limit(data_store):
+    """Test the server rejects a negative `limit`."""
+    with pytest.raises(RuntimeError, match="400"):
+        data_store.complete("", limit=-1)
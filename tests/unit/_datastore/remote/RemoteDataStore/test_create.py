@@ -0,0 +1,91 @@
+"""Unit tests for the :meth:`RemoteDataStore.create` method."""
+
+
+import concurrent.futures
+import http.client
+
+import pytest
+
+from phonebook._datastore.remote import RemoteDataStore
+from phonebook._exceptions import DuplicateUserError, InvalidUserError
+
+
+def test_main_case(data_store, served_data_store):
+    """Test creating a user on the server."""
+    user = {"name": "Graham Chapman", "phone": "444-555-6666", "address": "where"}
+
+    data_store.create(user)
+
+    assert served_data_store.get("Graham Chapman") == user
+
+
+def test_with_duplicate_user(data_store):
+    """Test `create` when the user already exists."""
+    user = {"name": "Eric Idle", "phone": "444-555-6666", "address": "where"}
+
+    with pytest.raises(DuplicateUserError):
+        data_store.create(user)
+
+
+def test_with_invalid_user(data_store):
+    """Test `create` when the user is missing a required field."""
+    with pytest.raises(InvalidUserError):
+        data_store.create({"name": "Graham Chapman"})
+
+
+def test_with_concurrent_clients(server_address, served_data_store):
+    """Test creating users from many clients at once."""
+    clients = [RemoteDataStore(server_address, timeout=10) for _ in range(4)]
+
+    def create_users(client_number):
+        for i in range(10):
+            clients[client_number].create(
+                {"name": f"User {client_number}.{i}", "phone": "", "address": ""}
+            )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(create_users, range(4)))
+    for client in clients:
+        client.close()
+
+    assert len(served_data_store.read(filters={"name": "User *"})) == 40
+
+
+def test_not_resent_after_lost_response(data_store, served_data_store, mocker):
+    """Test a create isn't resent once the server may have applied it."""
+    data_store.get("Eric Idle")
+    connection = data_store._connection
+    getresponse = connection.getresponse
+
+    def lose_response():
+        getresponse().read()
+        raise http.client.RemoteDisconnected
+
+    mocker.patch.object(connection, "getresponse", side_effect=lose_response)
+    user = {"name": "Graham Chapman", "phone": "444-555-6666", "address": "here"}
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        data_store.create(user)
+
+    assert served_data_store.get("Graham Chapman") == user
+
+
+@pytest.mark.parametrize(
+    "method, path, status",
+    (
+        ("POST", "/users/Graham%20Chapman", "405"),
+        ("PATCH", "/users", "405"),
+        ("POST", "/foobar", "404"),
+    ),
+)
+def test_with_rejected_body(data_store, method, path, status):
+    """Test the connection is still usable after a body is rejected."""
+    user = {"name": "Graham Chapman", "phone": "444-555-6666", "address": "here"}
+    data_store.get("Eric Idle")
+    connection = data_store._connection
+
+    with pytest.raises(RuntimeError, match=status):
+        data_store._request(method, path, user)
+
+    assert data_store.get("Eric Idle")["name"] == "Eric Idle"
+    assert data_store._connection is connection
@@ -0,0 +1,19 @@
+"""Unit tests for the :meth:`RemoteDataStore.create_many` method."""
+
+
+import pytest
+
+from phonebook._exceptions import DuplicateUserError
+
+
+def test_keeps_changes_before_failure(data_store, served_data_store):
+    """Test the users created before a failure aren't discarded."""
+    users = [
+        {"name": "Graham Chapman", "phone": "444-555-6666", "address": "here"},
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    ]
+
+    with pytest.raises(DuplicateUserError):
+        data_store.create_many(users)
+
+    assert served_data_store.get("Graham Chapman") == users[0]
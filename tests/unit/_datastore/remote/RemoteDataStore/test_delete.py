@@ -0,0 +1,19 @@
+"""Unit tests for the :meth:`RemoteDataStore.delete` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store, served_data_store):
+    """Test deleting a user on the server."""
+    data_store.delete("Eric Idle")
+
+    assert [user["name"] for user in served_data_store.read()] == ["John Cleese"]
+
+
+def test_with_missing_user(data_store):
+    """Test `delete` when the user doesn't exist."""
+    with pytest.raises(MissingUserError):
+        data_store.delete("Graham Chapman")
@@ -0,0 +1,62 @@
+"""Unit tests for the :meth:`RemoteDataStore.get` method."""
+
+
+import http.client
+import socket
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store):
+    """Test getting a user by name."""
+    result = data_store.get("Eric Idle")
+
+    expected_result = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    assert result == expected_result
+
+
+def test_with_missing_user(data_store):
+    """Test `get` when the user doesn't exists."""
+    with pytest.raises(MissingUserError) as error:
+        data_store.get("Graham Chapman")
+
+    assert "Graham Chapman" in str(error.value)
+
+
+def test_keeps_connection_alive(data_store):
+    """Test many requests are made over the same connection."""
+    data_store.get("Eric Idle")
+    connection = data_store._connection
+
+    data_store.get("John Cleese")
+
+    assert data_store._connection is connection
+
+
+def test_reconnects(data_store):
+    """Test a new connection is made when the old one was closed."""
+    data_store.get("Eric Idle")
+    data_store._connection.sock.shutdown(socket.SHUT_RDWR)
+
+    result = data_store.get("John Cleese")
+
+    assert result["name"] == "John Cleese"
+
+
+def test_resent_after_lost_response(data_store, mocker):
+    """Test a get is resent on a new connection when the response is lost."""
+    data_store.get("Eric Idle")
+    connection = data_store._connection
+    getresponse = connection.getresponse
+
+    def lose_response():
+        getresponse().read()
+        raise http.client.RemoteDisconnected
+
+    mocker.patch.object(connection, "getresponse", side_effect=lose_response)
+
+    result = data_store.get("John Cleese")
+
+    assert result["name"] == "John Cleese"
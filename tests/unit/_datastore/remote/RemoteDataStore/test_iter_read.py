@@ -0,0 +1,51 @@
+"""Unit tests for the :meth:`RemoteDataStore.iter_read` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store):
+    """Test streaming every user."""
+    result = data_store.iter_read()
+
+    assert [user["name"] for user in result] == ["Eric Idle", "John Cleese"]
+
+
+def test_with_filters(data_store):
+    """Test streaming the users matching the filters."""
+    result = data_store.iter_read(filters={"address": "th*"})
+
+    assert [user["name"] for user in result] == ["John Cleese"]
+
+
+def test_with_pagination(data_store):
+    """Test streaming a page of users."""
+    result = data_store.iter_read(limit=1, after="Eric Idle")
+
+    assert [user["name"] for user in result] == ["John Cleese"]
+
+
+def test_with_missing_after_user(data_store):
+    """Test `iter_read` when the `after` user doesn't exist."""
+    with pytest.raises(MissingUserError):
+        data_store.iter_read(after="Graham Chapman")
+
+
+def test_with_many_users(data_store, served_data_store):
+    """Test streaming more users than fit in a single chunk."""
+    served_data_store.create_many(
+        {"name": f"User {i:03}", "phone": str(i), "address": "here"} for i in range(250)
+    )
+
+    result = list(data_store.iter_read(filters={"name": "User *"}))
+
+    assert [user["name"] for user in result] == [f"User {i:03}" for i in range(250)]
+
+
+@pytest.mark.parametrize("field", ("limit", "offset"))
+def test_with_negative_pagination(data_store, field):
+    """Test the server rejects a negative `limit` or `offset`."""
+    with pytest.raises(RuntimeError, match="400"):
+        data_store.iter_read(**{field: -1})
@@ -0,0 +1,27 @@
+"""Unit tests for the :meth:`RemoteDataStore.lookup_phone` method."""
+
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "number, digits, expected_names",
+    (
+        ("(123) 456-7890", None, ["Eric Idle"]),
+        ("+1 222-3333", 7, ["John Cleese"]),
+        ("3333", 1, ["John Cleese"]),
+        ("999-9999", None, []),
+        ("no digits", None, []),
+    ),
+)
+def test_main_case(data_store, number, digits, expected_names):
+    """Test getting the users with a phone number."""
+    result = data_store.lookup_phone(number, digits=digits)
+
+    assert [user["name"] for user in result] == expected_names
+
+
+def test_with_invalid_digits(data_store):
+    """Test matching fewer than one digit."""
+    with pytest.raises(ValueError):
+        data_store.lookup_phone("123", digits=0)
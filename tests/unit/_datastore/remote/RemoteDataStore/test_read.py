@@ -0,0 +1,8 @@
+"""Unit tests for the :meth:`RemoteDataStore.read` method."""
+
+
+def test_main_case(data_store):
+    """Test reading the users matching the filters."""
+    result = data_store.read(filters={"name": "Eric*"})
+
+    assert result == [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
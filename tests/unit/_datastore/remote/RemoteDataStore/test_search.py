@@ -0,0 +1,26 @@
+"""Unit tests for the :meth:`RemoteDataStore.search` method."""
+
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "terms, limit, expected_names",
+    (
+        ("HERE", None, ["Eric Idle"]),
+        ("there", 1, ["John Cleese"]),
+        ("here & there", None, []),
+        ("", None, []),
+    ),
+)
+def test_main_case(data_store, terms, limit, expected_names):
+    """Test getting the users whose address has every term."""
+    result = data_store.search(terms, limit=limit)
+
+    assert [user["name"] for user in result] == expected_names
+
+
+def test_with_negative_limit(data_store):
+    """Test the server rejects a negative `limit`."""
+    with pytest.raises(RuntimeError, match="400"):
+        data_store.search("here", limit=-1)
@@ -0,0 +1,38 @@
+"""Unit tests for the :meth:`RemoteDataStore.update` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store, served_data_store):
+    """Test updating a user on the server."""
+    data_store.update("Eric Idle", phone="444-555-6666")
+
+    assert served_data_store.get("Eric Idle")["phone"] == "444-555-6666"
+
+
+def test_with_name_needing_quoting(data_store, served_data_store):
+    """Test updating a user whose name isn't a valid path."""
+    data_store.update("Eric Idle", name="Eric/Idle?")
+
+    data_store.update("Eric/Idle?", phone="444-555-6666")
+
+    assert served_data_store.get("Eric/Idle?")["phone"] == "444-555-6666"
+
+
+def test_with_missing_user(data_store):
+    """Test `update` when the user doesn't exist."""
+    with pytest.raises(MissingUserError):
+        data_store.update("Graham Chapman", phone="444-555-6666")
+
+
+def test_with_server_error(data_store, served_data_store):
+    """Test an unexpected error on the server is sent as a response."""
+    with pytest.raises(RuntimeError, match="500"):
+        data_store._request(
+            "PATCH", "/users/Eric%20Idle", {"user_name": "Graham Chapman"}
+        )
+
+    assert data_store.get("Eric Idle") == served_data_store.get("Eric Idle")
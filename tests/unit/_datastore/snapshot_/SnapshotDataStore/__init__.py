@@ -0,0 +1 @@
+"""Unit tests for the :class:`SnapshotDataStore` class."""
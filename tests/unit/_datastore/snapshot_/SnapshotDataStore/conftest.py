@@ -0,0 +1,52 @@
+"""Fixtures for the `phonebook._datastore.snapshot_` unit tests."""
+
+
+import pytest
+
+from phonebook._datastore.snapshot_ import SnapshotDataStore
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "there"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "here"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "not found"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "here"},
+    {"name": "Émile Zola", "phone": "999", "address": "Paris"},
+    {"name": "Adam Ant", "phone": "000", "address": "Londres"},
+]
+
+
+@pytest.fixture()
+def data_store_path(tmp_path):
+    """Get the path to use as the source of the data store.
+
+    Returns:
+        pathlib.Path: The path to use as the data store.
+
+    """
+    return tmp_path / "test_data_source.snapshot"
+
+
+@pytest.fixture()
+def data_set():
+    """Get the users written to the snapshot of the data store.
+
+    Returns:
+        list(dict(str, str)): The users, in the order they are written.
+
+    """
+    return [dict(user) for user in _DATA_SET]
+
+
+@pytest.fixture()
+def data_store(data_store_path, data_set):
+    """Get a data store of a snapshot of the `data_set` users.
+
+    Yields:
+        SnapshotDataStore: The data store.
+
+    """
+    SnapshotDataStore.write(data_set, str(data_store_path))
+    data_store = SnapshotDataStore(file_path=str(data_store_path))
+    yield data_store
+    data_store.close()
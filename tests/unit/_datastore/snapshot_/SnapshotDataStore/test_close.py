@@ -0,0 +1,22 @@
+"""Unit tests for the :meth:`SnapshotDataStore.close` method."""
+
+
+import pytest
+
+
+def test_main_case(data_store):
+    """Test closing the data store unmaps the snapshot."""
+    data_store.close()
+    data_store.close()
+
+    with pytest.raises((ValueError, TypeError)):
+        data_store.get("Eric Idle")
+
+
+def test_after_reload(data_store):
+    """Test closing after reloading, which unmaps the previous snapshot."""
+    data_store.reload()
+
+    data_store.close()
+
+    assert data_store._data is None
@@ -0,0 +1,20 @@
+"""Unit tests for the :meth:`SnapshotDataStore.complete` method."""
+
+
+import pytest
+
+
+def test_main_case(data_store, data_set):
+    """Test getting every name that starts with a prefix."""
+    names = sorted(user["name"] for user in data_set)
+    for prefix in ("", "E", "Eric", "Terry ", "É", "Zzz"):
+        expected_result = [name for name in names if name.startswith(prefix)]
+        assert data_store.complete(prefix) == expected_result
+
+
+@pytest.mark.parametrize("limit", (0, 1, 2))
+def test_with_limit(data_store, data_set, limit):
+    """Test getting at most `limit` names."""
+    names = sorted(user["name"] for user in data_set)
+
+    assert data_store.complete("", limit=limit) == names[:limit]
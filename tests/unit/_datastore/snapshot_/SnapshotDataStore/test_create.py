@@ -0,0 +1,17 @@
+"""Unit tests for the :meth:`SnapshotDataStore.create` method."""
+
+
+import io
+
+import pytest
+
+
+def test_read_only(data_store, data_set):
+    """Test users can't be created in a snapshot."""
+    with pytest.raises(io.UnsupportedOperation):
+        data_store.create({"name": "Graham Chapman", "phone": "1", "address": "2"})
+
+    with pytest.raises(io.UnsupportedOperation):
+        data_store.create_many([{"name": "Graham Chapman"}])
+
+    assert data_store.read() == data_set
@@ -0,0 +1,14 @@
+"""Unit tests for the :meth:`SnapshotDataStore.delete` method."""
+
+
+import io
+
+import pytest
+
+
+def test_read_only(data_store, data_set):
+    """Test users can't be deleted from a snapshot."""
+    with pytest.raises(io.UnsupportedOperation):
+        data_store.delete("Eric Idle")
+
+    assert data_store.read() == data_set
@@ -0,0 +1,21 @@
+"""Unit tests for the :meth:`SnapshotDataStore.get` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store, data_set):
+    """Test getting each user by name."""
+    for user in data_set:
+        assert data_store.get(user["name"]) == user
+
+
+@pytest.mark.parametrize("name", ("Graham Chapman", "", "Eric", "Zzz", "Émile"))
+def test_with_missing_user(data_store, name):
+    """Test `get` when the user doesn't exists."""
+    with pytest.raises(MissingUserError) as error:
+        data_store.get(name)
+
+    assert repr(name) in str(error.value)
@@ -0,0 +1,33 @@
+"""Unit tests for the :meth:`SnapshotDataStore.__init__` method."""
+
+
+import pytest
+
+from phonebook._datastore.snapshot_ import SnapshotDataStore
+
+
+def test_without_file(data_store_path):
+    """Test creating a data store when the snapshot doesn't exist."""
+    assert not data_store_path.exists()
+
+    data_store = SnapshotDataStore(file_path=str(data_store_path))
+
+    assert data_store_path.exists()
+    assert data_store.read() == []
+
+
+def test_name(data_store_path):
+    """Test the data store has a name defined and is read-only."""
+    data_store = SnapshotDataStore(file_path=str(data_store_path))
+
+    assert data_store.NAME == "snapshot"
+    assert data_store.READ_ONLY
+
+
+@pytest.mark.parametrize("contents", (b"", b"[]", b"PBSNAP\x00\x02" + bytes(8)))
+def test_with_invalid_file(data_store_path, contents):
+    """Test creating a data store from a file that isn't a snapshot."""
+    data_store_path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        SnapshotDataStore(file_path=str(data_store_path))
@@ -0,0 +1,44 @@
+"""Unit tests for the :meth:`SnapshotDataStore.iter_read` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_indices",
+    (
+        ({}, [0, 1, 2, 3, 4, 5]),
+        ({"limit": 2}, [0, 1]),
+        ({"offset": 3}, [3, 4, 5]),
+        ({"limit": 1, "offset": 1}, [1]),
+        ({"after": "John Cleese"}, [2, 3, 4, 5]),
+        ({"after": "Adam Ant"}, []),
+        ({"filters": {"address": "here"}, "limit": 1}, [1]),
+        ({"filters": {"address": "here"}, "offset": 1}, [3]),
+        ({"filters": {"phone": "123-*"}, "after": "Eric Idle"}, [3]),
+        ({"filters": {"name": "Eric Idle"}, "after": "Eric Idle"}, []),
+        ({"filters": {"name": "Michael Palin"}, "after": "Eric Idle"}, [3]),
+        ({"filters": {"name": "*"}}, [0, 1, 2, 3, 4, 5]),
+        ({"filters": {"name": "É*"}}, [4]),
+        ({"filters": {"name": "[EM]*"}}, [0, 3]),
+        ({"filters": {"name": "*a*"}, "after": "Terry Gilliam"}, [3, 4, 5]),
+        ({"filters": {"name": "Eric *", "phone": "555*"}}, []),
+        ({"filters": {"name": "Zzz*"}}, []),
+    ),
+)
+def test_pagination(data_store, kwargs, expected_indices, data_set):
+    """Test iterating over a page of the users."""
+    result = data_store.iter_read(**kwargs)
+
+    assert not isinstance(result, list)
+    assert list(result) == [data_set[index] for index in expected_indices]
+
+
+def test_with_missing_after_user(data_store):
+    """Test `iter_read` when the `after` user doesn't exist."""
+    with pytest.raises(MissingUserError) as error:
+        data_store.iter_read(after="Graham Chapman")
+
+    assert "Graham Chapman" in str(error.value)
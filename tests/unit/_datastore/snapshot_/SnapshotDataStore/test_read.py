@@ -0,0 +1,28 @@
+"""Unit tests for the :meth:`SnapshotDataStore.read` method."""
+
+
+import pytest
+
+from phonebook import Query
+
+
+@pytest.mark.parametrize(
+    "filters, expected_indices",
+    (
+        (None, [0, 1, 2, 3, 4, 5]),
+        ({"name": "Eric Idle"}, [0]),
+        ({"name": "Graham Chapman"}, []),
+        ({"address": "here"}, [1, 3]),
+        ({"phone": "123-*"}, [0, 3]),
+        ({"address": "*ere*", "name": "*l*"}, [0, 1, 3]),
+        ({"name": "[ÉA]*"}, [4, 5]),
+        (Query({"address": "*o*"}), [2, 5]),
+        # the literal text spans the phone and address of the first user
+        ({"address": "*0the*"}, []),
+    ),
+)
+def test_main_case(data_store, filters, expected_indices, data_set):
+    """Test reading the users matching the filters, in their order."""
+    result = data_store.read(filters=filters)
+
+    assert result == [data_set[index] for index in expected_indices]
@@ -0,0 +1,14 @@
+"""Unit tests for the :meth:`SnapshotDataStore.update` method."""
+
+
+import io
+
+import pytest
+
+
+def test_read_only(data_store, data_set):
+    """Test users can't be updated in a snapshot."""
+    with pytest.raises(io.UnsupportedOperation):
+        data_store.update("Eric Idle", phone="999")
+
+    assert data_store.read() == data_set
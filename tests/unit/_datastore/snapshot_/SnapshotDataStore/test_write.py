@@ -0,0 +1,56 @@
+"""Unit tests for the :meth:`SnapshotDataStore.write` method."""
+
+
+import logging
+
+import pytest
+
+from phonebook._datastore.snapshot_ import SnapshotDataStore
+from phonebook._exceptions import DuplicateUserError, InvalidUserError
+
+
+def test_main_case(data_store_path, data_set):
+    """Test writing the users to a snapshot keeps their order."""
+    result = SnapshotDataStore.write(iter(data_set), str(data_store_path))
+
+    assert result == len(data_set)
+    assert SnapshotDataStore(file_path=str(data_store_path)).read() == data_set
+
+
+def test_with_unknown_field(data_store_path, caplog):
+    """Test the unknown fields of the users are discarded."""
+    user = {"name": "Eric Idle", "phone": "123", "address": "here", "age": "80"}
+
+    with caplog.at_level(logging.WARNING):
+        SnapshotDataStore.write([user], str(data_store_path))
+
+    assert "age" in caplog.text
+    assert SnapshotDataStore(file_path=str(data_store_path)).read() == [
+        {"name": "Eric Idle", "phone": "123", "address": "here"}
+    ]
+
+
+def test_with_invalid_user(data_store_path):
+    """Test writing a user that is missing required fields."""
+    with pytest.raises(InvalidUserError):
+        SnapshotDataStore.write([{"name": "Eric Idle"}], str(data_store_path))
+
+    assert not data_store_path.exists()
+
+
+def test_with_duplicate_user(data_store_path, data_set):
+    """Test writing two users with the same name."""
+    with pytest.raises(DuplicateUserError) as error:
+        SnapshotDataStore.write(data_set + data_set[:1], str(data_store_path))
+
+    assert "Eric Idle" in str(error.value)
+    assert not data_store_path.exists()
+
+
+def test_replaces_snapshot(data_store, data_store_path, data_set):
+    """Test a data store reads the replaced snapshot until it reloads."""
+    SnapshotDataStore.write(data_set[:1], str(data_store_path))
+
+    assert data_store.read() == data_set
+    data_store.reload()
+    assert data_store.read() == data_set[:1]
@@ -0,0 +1,77 @@
+"""Fixtures for the `phonebook._datastore.sqlite_` unit tests."""
+
+
+import sqlite3
+
+import pytest
+
+from phonebook._datastore.sqlite_ import SQLiteDataStore
+
+
+@pytest.fixture()
+def data_store_path(tmp_path):
+    """Get the path to use as the source of the data store.
+
+    Returns:
+        pathlib.Path: The path to use as the data store.
+
+    """
+    return tmp_path / "test_data_source.sqlite"
+
+
+@pytest.fixture()
+def data_store(data_store_path):
+    """Get a data store using the test database.
+
+    Returns:
+        SQLiteDataStore: The data store using the test database.
+
+    """
+    return SQLiteDataStore(file_path=str(data_store_path))
+
+
+@pytest.fixture()
+def insert_users(data_store):
+    """Get a function to add users directly to the test database.
+
+    Returns:
+        callable: A function taking a list of users to insert.
+
+    """
+
+    def _insert_users(users):
+        connection = sqlite3.connect(data_store._file_path)
+        with connection:
+            connection.executemany(
+                "INSERT INTO users (name, phone, address) "
+                "VALUES (:name, :phone, :address)",
+                users,
+            )
+        connection.close()
+
+    return _insert_users
+
+
+@pytest.fixture()
+def select_users(data_store):
+    """Get a function to read all users directly from the test database.
+
+    Returns:
+        callable: A function returning the list of users in the
+        database.
+
+    """
+
+    def _select_users():
+        connection = sqlite3.connect(data_store._file_path)
+        connection.row_factory = sqlite3.Row
+        users = [
+            dict(row)
+            for row in connection.execute(
+                "SELECT name, phone, address FROM users ORDER BY rowid"
+            )
+        ]
+        connection.close()
+        return users
+
+    return _select_users
@@ -0,0 +1,63 @@
+"""Unit tests for the :meth:`SQLiteDataStore.batch` method."""
+
+
+import pytest
+
+from phonebook._exceptions import DuplicateUserError, MissingUserError
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_commits_once(data_store, insert_users, select_users):
+    """Test the changes in a batch are committed when it exits."""
+    insert_users(_DATA_SET)
+
+    with data_store.batch():
+        data_store.create({"name": "Terry Gilliam", "phone": "555", "address": "far"})
+        data_store.update("Eric Idle", phone="999")
+        data_store.delete("John Cleese")
+        # other connections can't see the changes until they're committed
+        assert select_users() == _DATA_SET
+
+    assert select_users() == [
+        {"name": "Eric Idle", "phone": "999", "address": "here"},
+        {"name": "Terry Gilliam", "phone": "555", "address": "far"},
+    ]
+
+
+def test_with_error(data_store, insert_users, select_users):
+    """Test none of the changes in a batch are kept when one fails."""
+    insert_users(_DATA_SET)
+
+    with pytest.raises(DuplicateUserError):
+        with data_store.batch():
+            data_store.delete("Eric Idle")
+            data_store.create({"name": "John Cleese", "phone": "5", "address": "far"})
+
+    assert data_store.read() == _DATA_SET
+    assert select_users() == _DATA_SET
+
+
+def test_nested(data_store, select_users):
+    """Test a nested batch is committed with the outer batch."""
+    with data_store.batch():
+        with data_store.batch():
+            data_store.create(_DATA_SET[0])
+        assert select_users() == []
+        data_store.create(_DATA_SET[1])
+
+    assert select_users() == _DATA_SET
+
+
+def test_delete_many_with_missing_user(data_store, insert_users, select_users):
+    """Test `delete_many` deletes no users when one of them is missing."""
+    insert_users(_DATA_SET)
+
+    with pytest.raises(MissingUserError):
+        data_store.delete_many(["Eric Idle", "Terry Gilliam"])
+
+    assert select_users() == _DATA_SET
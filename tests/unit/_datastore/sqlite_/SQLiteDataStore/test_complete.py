@@ -0,0 +1,29 @@
+"""Unit tests for the :meth:`SQLiteDataStore.complete` method."""
+
+
+import pytest
+
+
+_DATA_SET = [
+    {"name": "Terry Jones", "phone": "123-456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "111-222-3333", "address": "there"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "far"},
+    {"name": "Terry%", "phone": "555", "address": "near"},
+]
+
+
+@pytest.mark.parametrize(
+    "prefix, limit, expected_result",
+    (
+        ("Terry ", None, ["Terry Gilliam", "Terry Jones"]),
+        ("Terry", 2, ["Terry Gilliam", "Terry Jones"]),
+        ("Terry%", None, ["Terry%"]),
+        ("", 1, ["Eric Idle"]),
+        ("John", None, []),
+    ),
+)
+def test_main_case(data_store, insert_users, prefix, limit, expected_result):
+    """Test getting the names that start with a prefix."""
+    insert_users(_DATA_SET)
+
+    assert data_store.complete(prefix, limit=limit) == expected_result
@@ -0,0 +1,89 @@
+"""Unit tests for the :meth:`SQLiteDataStore.create` method."""
+
+
+import itertools
+import logging
+
+import pytest
+
+from phonebook._datastore.base import REQUIRED_FIELDS
+from phonebook._exceptions import DuplicateUserError, InvalidUserError
+
+
+def test_with_empty_data_store(data_store, select_users):
+    """Test creating a user when the data store is empty."""
+    data_store.create({"name": "Eric Idle", "phone": "123-456-7890", "address": "here"})
+
+    expected_data = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    assert select_users() == expected_data
+
+
+def test_with_populated_database(data_store, insert_users, select_users):
+    """Test creating a user when the data store is not empty."""
+    insert_users([{"name": "John Cleese", "phone": "111-222-3333", "address": "there"}])
+
+    data_store.create({"name": "Eric Idle", "phone": "123-456-7890", "address": "here"})
+
+    expected_data = [
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    ]
+    assert select_users() == expected_data
+
+
+@pytest.mark.parametrize(
+    "missing_fields",
+    # get all combinations of any length (other than 0)
+    itertools.chain.from_iterable(
+        itertools.combinations(REQUIRED_FIELDS, length)
+        for length in range(1, len(REQUIRED_FIELDS))
+    ),
+)
+def test_with_missing_required_fields(data_store, select_users, missing_fields):
+    """Test `create` when the user is missing a required field."""
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    for missing_field in missing_fields:
+        del user[missing_field]
+
+    with pytest.raises(InvalidUserError) as error:
+        data_store.create(user)
+
+    error_msg = str(error.value)
+    for missing_field in missing_fields:
+        assert missing_field in error_msg
+    assert select_users() == []
+
+
+def test_with_unknown_field(data_store, select_users, caplog):
+    """Test `create` when the user has an unknown field."""
+    caplog.set_level(logging.WARNING)
+
+    user = {
+        "name": "Eric Idle",
+        "phone": "123-456-7890",
+        "address": "here",
+        "foobar": "baz",
+    }
+    data_store.create(user)
+
+    expected_data = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    assert select_users() == expected_data
+
+    for record in caplog.records:
+        if "foobar" in record.getMessage():
+            break
+    else:
+        pytest.fail("Unable to find warning message with unknown field 'foobar'")
+
+
+def test_with_duplicate_user(data_store, insert_users, select_users):
+    """Test `create` when the user already exists."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    insert_users(data_set)
+
+    user = {"name": "Eric Idle", "phone": "999-999-9999", "address": "not here"}
+    with pytest.raises(DuplicateUserError) as error:
+        data_store.create(user)
+
+    assert "Eric Idle" in str(error.value)
+    assert select_users() == data_set
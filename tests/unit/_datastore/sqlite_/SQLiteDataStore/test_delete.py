@@ -0,0 +1,31 @@
+"""Unit tests for the :meth:`SQLiteDataStore.delete` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store, insert_users, select_users):
+    """Test deleting a user."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    insert_users(data_set)
+
+    data_store.delete("Eric Idle")
+
+    assert select_users() == [data_set[1]]
+
+
+def test_with_missing_user(data_store, insert_users, select_users):
+    """Test `delete` when the user doesn't exists."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    insert_users(data_set)
+
+    with pytest.raises(MissingUserError) as error:
+        data_store.delete("John Cleese")
+
+    assert "John Cleese" in str(error.value)
+    assert select_users() == data_set
@@ -0,0 +1,30 @@
+"""Unit tests for the :meth:`SQLiteDataStore.get` method."""
+
+
+import pytest
+
+from phonebook._exceptions import MissingUserError
+
+
+def test_main_case(data_store, insert_users):
+    """Test getting a user by name."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    insert_users(data_set)
+
+    result = data_store.get("Eric Idle")
+
+    expected_result = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    assert result == expected_result
+
+
+def test_with_missing_user(data_store, insert_users):
+    """Test `get` when the user doesn't exists."""
+    insert_users([{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}])
+
+    with pytest.raises(MissingUserError) as error:
+        data_store.get("John Cleese")
+
+    assert "John Cleese" in str(error.value)
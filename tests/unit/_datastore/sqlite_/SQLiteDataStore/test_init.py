@@ -0,0 +1,48 @@
+"""Unit tests for the :meth:`SQLiteDataStore.__init__` method."""
+
+
+import sqlite3
+
+from phonebook._datastore.sqlite_ import SQLiteDataStore
+
+
+def test_without_file(data_store_path):
+    """Test creating a data store when the database doesn't exist."""
+    assert not data_store_path.exists()
+    data_store = SQLiteDataStore(file_path=str(data_store_path))
+    assert data_store
+    assert data_store_path.exists()
+    assert data_store.read() == []
+
+
+def test_name(data_store):
+    """Test the data store has a name defined."""
+    assert data_store.NAME == "sqlite"
+
+
+def test_with_existing_users(data_store_path, insert_users):
+    """Test creating a data store when the database has users."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    insert_users(data_set)
+
+    data_store = SQLiteDataStore(file_path=str(data_store_path))
+    assert data_store.read() == data_set
+
+
+def test_creates_indices(data_store_path, data_store):
+    """Test the database has an index for each field."""
+    connection = sqlite3.connect(str(data_store_path))
+    indices = {
+        row[0]
+        for row in connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users'"
+        )
+    }
+    connection.close()
+
+    assert "CREATE UNIQUE INDEX users_name ON users (name)" in indices
+    assert "CREATE INDEX users_phone ON users (phone)" in indices
+    assert "CREATE INDEX users_address ON users (address)" in indices
@@ -0,0 +1,86 @@
+"""Unit tests for the :meth:`SQLiteDataStore.iter_read` method."""
+
+
+import threading
+
+import pytest
+
+from phonebook._datastore import sqlite_
+from phonebook._exceptions import MissingUserError
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "there"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "here"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "not found"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "here"},
+]
+_PAGES = (
+    ({}, [0, 1, 2, 3]),
+    ({"limit": 2}, [0, 1]),
+    ({"offset": 3}, [3]),
+    ({"limit": 1, "offset": 1}, [1]),
+    ({"after": "John Cleese"}, [2, 3]),
+    ({"after": "Michael Palin"}, []),
+    ({"filters": {"address": "here"}, "limit": 1}, [1]),
+    ({"filters": {"address": "here"}, "offset": 1}, [3]),
+    ({"filters": {"phone": "123-*"}, "after": "Eric Idle"}, [3]),
+    ({"filters": {"foobar": "*"}, "limit": 1}, []),
+)
+
+
+@pytest.mark.parametrize("kwargs, expected_indices", _PAGES)
+def test_pagination(data_store, insert_users, kwargs, expected_indices):
+    """Test iterating over a page of the users."""
+    insert_users(_DATA_SET)
+
+    result = data_store.iter_read(**kwargs)
+
+    assert not isinstance(result, list)
+    assert list(result) == [_DATA_SET[index] for index in expected_indices]
+
+
+@pytest.mark.parametrize("kwargs, expected_indices", _PAGES)
+def test_pagination_in_chunks(
+    data_store, insert_users, mocker, kwargs, expected_indices
+):
+    """Test iterating over a page of the users read in many chunks."""
+    mocker.patch.object(sqlite_, "_READ_CHUNK_SIZE", 1)
+    insert_users(_DATA_SET)
+
+    result = data_store.iter_read(**kwargs)
+
+    assert list(result) == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_changed_while_iterating(data_store, insert_users, mocker):
+    """Test changing the users from another thread while iterating."""
+    mocker.patch.object(sqlite_, "_READ_CHUNK_SIZE", 1)
+    insert_users(_DATA_SET)
+    result = data_store.iter_read()
+    first_user = next(result)
+
+    thread = threading.Thread(target=data_store.delete, args=("John Cleese",))
+    thread.start()
+    thread.join()
+
+    assert [first_user, *result] == [_DATA_SET[0], *_DATA_SET[2:]]
+
+
+def test_after_deleted_users(data_store, insert_users):
+    """Test the next page is stable when earlier users are deleted."""
+    insert_users(_DATA_SET)
+    page = list(data_store.iter_read(limit=2))
+
+    data_store.delete("Eric Idle")
+
+    result = data_store.iter_read(limit=2, after=page[-1]["name"])
+    assert list(result) == _DATA_SET[2:]
+
+
+def test_with_missing_after_user(data_store):
+    """Test `iter_read` when the `after` user doesn't exist."""
+    with pytest.raises(MissingUserError) as error:
+        data_store.iter_read(after="Graham Chapman")
+
+    assert "Graham Chapman" in str(error.value)
@@ -0,0 +1,73 @@
+"""Unit tests for the :meth:`SQLiteDataStore.lookup_phone` method."""
+
+
+import sqlite3
+
+import pytest
+
+from phonebook._datastore.sqlite_ import SQLiteDataStore
+
+
+_DATA_SET = [
+    {"name": "Terry Jones", "phone": "(123) 456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "+1 123.456.7890", "address": "there"},
+    {"name": "John Cleese", "phone": "555-7890", "address": "far"},
+]
+
+
+@pytest.mark.parametrize(
+    "number, digits, expected_indices",
+    (
+        ("123-456-7890", None, [0]),
+        ("123-456-7890", 10, [1, 0]),
+        ("7890", 4, [1, 2, 0]),
+        ("999-9999", None, []),
+    ),
+)
+def test_main_case(data_store, number, digits, expected_indices):
+    """Test getting the users with a phone number."""
+    data_store.create_many(_DATA_SET)
+
+    result = data_store.lookup_phone(number, digits=digits)
+
+    assert result == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_after_update(data_store):
+    """Test the users are looked up by their new phone number."""
+    data_store.create_many(_DATA_SET)
+
+    data_store.update("Terry Jones", phone="555.7890")
+
+    result = data_store.lookup_phone("555-7890")
+
+    assert [user["name"] for user in result] == ["John Cleese", "Terry Jones"]
+
+
+def test_with_existing_users(data_store_path, insert_users):
+    """Test the users added without the data store are indexed when opened."""
+    insert_users(_DATA_SET)
+
+    data_store = SQLiteDataStore(file_path=str(data_store_path))
+
+    assert data_store.lookup_phone("555 7890") == [_DATA_SET[2]]
+
+
+def test_with_old_database(data_store_path):
+    """Test a database created without the phone number column is upgraded."""
+    connection = sqlite3.connect(str(data_store_path))
+    with connection:
+        connection.execute("CREATE TABLE users (name TEXT, phone TEXT, address TEXT)")
+        connection.executemany(
+            "INSERT INTO users VALUES (:name, :phone, :address)", _DATA_SET
+        )
+    connection.close()
+
+    data_store = SQLiteDataStore(file_path=str(data_store_path))
+
+    assert data_store.lookup_phone("7890", digits=4) == [
+        _DATA_SET[1],
+        _DATA_SET[2],
+        _DATA_SET[0],
+    ]
+    assert data_store.read() == _DATA_SET
@@ -0,0 +1,129 @@
+"""Unit tests for the :meth:`SQLiteDataStore.read` method."""
+
+
+import itertools
+
+import pytest
+
+from phonebook._datastore.base import REQUIRED_FIELDS
+from phonebook._query import Query
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "there"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "here"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "not found"},
+]
+
+
+def test_with_empty_database_no_filters(data_store):
+    """Test reading an empty data store with no filters."""
+    assert data_store.read() == []
+
+
+def test_with_multiple_users_no_filters(data_store, insert_users):
+    """Test reading a multiple-user data store with no filters."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read()
+    assert result == _DATA_SET
+
+
+@pytest.mark.parametrize(
+    "filters",
+    (
+        {"name": "Michael Palin"},
+        {"phone": "999-999-9999"},
+        {"address": "Camelot"},
+        {"name": "Michael *", "phone": "*9*"},
+        {"name": "[!EJT]*"},
+        {"foobar": "*"},
+    ),
+)
+def test_without_match(data_store, insert_users, filters):
+    """Test reading when no filters match."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=filters)
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    "exact_filters",
+    # all combinations of any length (other than 0)
+    itertools.chain.from_iterable(
+        itertools.combinations(
+            [("name", "Eric Idle"), ("phone", "123-456-7890"), ("address", "there")],
+            length,
+        )
+        for length in range(1, len(REQUIRED_FIELDS))
+    ),
+)
+def test_matching_exact_filter(data_store, insert_users, exact_filters):
+    """Test reading with an exact filter."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=dict(exact_filters))
+    assert result == [_DATA_SET[0]]
+
+
+@pytest.mark.parametrize(
+    "fuzzy_filters",
+    # all combinations of any length (other than 0)
+    itertools.chain.from_iterable(
+        itertools.combinations(
+            [("name", "Eric *"), ("phone", "123-*-7890"), ("address", "?here")], length
+        )
+        for length in range(1, len(REQUIRED_FIELDS))
+    ),
+)
+def test_fuzzy_filter_single_result(data_store, insert_users, fuzzy_filters):
+    """Test reading with a fuzzy filter with one result."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=dict(fuzzy_filters))
+    assert result == [_DATA_SET[0]]
+
+
+@pytest.mark.parametrize(
+    "fuzzy_filters",
+    # all combinations of any length (other than 0)
+    itertools.chain.from_iterable(
+        itertools.combinations(
+            [("name", "* *e"), ("phone", "1*"), ("address", "*here")], length
+        )
+        for length in range(1, len(REQUIRED_FIELDS))
+    ),
+)
+def test_fuzzy_filter_multiple_result(data_store, insert_users, fuzzy_filters):
+    """Test reading with a fuzzy filter with multiple results."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=dict(fuzzy_filters))
+    assert result == [_DATA_SET[0], _DATA_SET[1]]
+
+
+@pytest.mark.parametrize(
+    "filters, expected_indices",
+    (
+        ({"name": "[EJ]*"}, [0, 1]),
+        ({"name": "[!EJ]*"}, [2]),
+        ({"name": "[^EJ]*"}, [0, 1]),
+        ({"phone": "1[12]*"}, [0, 1]),
+        ({"name": "Eric*", "phone": "[0-9]*"}, [0]),
+    ),
+)
+def test_character_set_filter(data_store, insert_users, filters, expected_indices):
+    """Test reading with fnmatch character sets that GLOB handles differently."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=filters)
+    assert result == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_with_query(data_store, insert_users):
+    """Test reading with a compiled query."""
+    insert_users(_DATA_SET)
+
+    result = data_store.read(filters=Query({"name": "*e*", "address": "*here"}))
+    assert result == _DATA_SET[:2]
@@ -0,0 +1,64 @@
+"""Unit tests for the :meth:`SQLiteDataStore.search` method."""
+
+
+import sqlite3
+
+import pytest
+
+from phonebook._datastore.sqlite_ import SQLiteDataStore
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "12 Main St."},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "120 Main St"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "Main 12"},
+]
+
+
+@pytest.mark.parametrize(
+    "terms, limit, expected_indices",
+    (
+        ("main 12", None, [0, 2]),
+        ("main 12", 1, [0]),
+        ("Main", None, [0, 1, 2]),
+        ("elm", None, []),
+        ("--", None, []),
+    ),
+)
+def test_main_case(data_store, terms, limit, expected_indices):
+    """Test getting the users whose address has every term."""
+    data_store.create_many(_DATA_SET)
+
+    result = data_store.search(terms, limit=limit)
+
+    assert result == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_after_changes(data_store, insert_users):
+    """Test the users are found after they are changed."""
+    data_store.create_many(_DATA_SET)
+
+    data_store.update("Eric Idle", address="9 Elm St")
+    data_store.update("John Cleese", name="John Cleese Jr", address="12 main")
+    data_store.delete("Michael Palin")
+    insert_users([{"name": "Graham Chapman", "phone": "555", "address": "12 Main"}])
+
+    result = data_store.search("main 12")
+
+    assert [user["name"] for user in result] == ["John Cleese Jr"]
+    assert [user["name"] for user in data_store.search("elm")] == ["Eric Idle"]
+
+
+def test_with_old_database(data_store_path):
+    """Test the addresses of a database created before they were indexed."""
+    connection = sqlite3.connect(str(data_store_path))
+    with connection:
+        connection.execute("CREATE TABLE users (name TEXT, phone TEXT, address TEXT)")
+        connection.executemany(
+            "INSERT INTO users VALUES (:name, :phone, :address)", _DATA_SET
+        )
+    connection.close()
+
+    data_store = SQLiteDataStore(file_path=str(data_store_path))
+
+    assert data_store.search("12 MAIN") == [_DATA_SET[0], _DATA_SET[2]]
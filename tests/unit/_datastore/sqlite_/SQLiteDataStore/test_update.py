@@ -0,0 +1,90 @@
+"""Unit tests for the :meth:`SQLiteDataStore.update` method."""
+
+
+import logging
+
+import pytest
+
+from phonebook._exceptions import DuplicateUserError, MissingUserError
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_with_same_name(data_store, insert_users, select_users):
+    """Test when updating a user with the same name."""
+    insert_users(_DATA_SET)
+
+    updated_user = {"name": "Eric Idle", "phone": "999-999-9999", "address": "not here"}
+    data_store.update("Eric Idle", **updated_user)
+
+    assert select_users() == [updated_user, _DATA_SET[1]]
+
+
+def test_with_different_name(data_store, insert_users, select_users):
+    """Test when updating a user with a different name."""
+    insert_users(_DATA_SET)
+
+    updated_user = {
+        "name": "Terry Gilliam",
+        "phone": "999-999-9999",
+        "address": "not here",
+    }
+    data_store.update("Eric Idle", **updated_user)
+
+    assert select_users() == [updated_user, _DATA_SET[1]]
+
+
+def test_with_partial_fields(data_store, insert_users, select_users):
+    """Test when updating only some of the user's fields."""
+    insert_users(_DATA_SET)
+
+    data_store.update("Eric Idle", phone="999-999-9999")
+
+    expected_user = {"name": "Eric Idle", "phone": "999-999-9999", "address": "here"}
+    assert select_users() == [expected_user, _DATA_SET[1]]
+
+
+def test_with_unknown_field(data_store, insert_users, select_users, caplog):
+    """Test `update` when the user has an unknown field."""
+    caplog.set_level(logging.WARNING)
+    insert_users(_DATA_SET)
+
+    data_store.update("Eric Idle", foobar="baz")
+
+    assert select_users() == _DATA_SET
+    for record in caplog.records:
+        if "foobar" in record.getMessage():
+            break
+    else:
+        pytest.fail("Unable to find warning message with unknown field 'foobar'")
+
+
+def test_with_duplicate_user(data_store, insert_users, select_users):
+    """Test `update` when changing the name and the user already exists."""
+    insert_users(_DATA_SET)
+
+    updated_user = {
+        "name": "John Cleese",
+        "phone": "999-999-9999",
+        "address": "not here",
+    }
+    with pytest.raises(DuplicateUserError) as error:
+        data_store.update("Eric Idle", **updated_user)
+
+    assert "John Cleese" in str(error.value)
+    assert select_users() == _DATA_SET
+
+
+@pytest.mark.parametrize("user_fields", ({"phone": "999-999-9999"}, {}))
+def test_with_missing_user(data_store, insert_users, user_fields):
+    """Test `update` when the user doesn't exists."""
+    insert_users(_DATA_SET)
+
+    with pytest.raises(MissingUserError) as error:
+        data_store.update("Terry Gilliam", **user_fields)
+
+    assert "Terry Gilliam" in str(error.value)
@@ -0,0 +1,34 @@
+"""Unit tests for the :func:`phonebook._datastore.load_data_store` function."""
+
+
+import pytest
+
+import phonebook._datastore
+from phonebook._datastore import DATA_STORE_NAMES, load_data_store
+
+
+@pytest.mark.parametrize("name", DATA_STORE_NAMES)
+def test_main_case(name):
+    """Test loading each data store by name."""
+    result = load_data_store(name)
+
+    assert result.NAME == name
+    assert issubclass(result, phonebook._datastore.base.BaseDataStore)
+
+
+def test_with_unknown_name():
+    """Test loading a data store that doesn't exist."""
+    with pytest.raises(ValueError) as error:
+        load_data_store("xml")
+
+    assert "xml" in str(error.value)
+
+
+def test_attributes():
+    """Test the data store classes are available as attributes."""
+    assert phonebook._datastore.JSONDataStore is load_data_store("json")
+    assert phonebook._datastore.DATA_STORES == tuple(
+        load_data_store(name) for name in DATA_STORE_NAMES
+    )
+    with pytest.raises(AttributeError):
+        phonebook._datastore.XMLDataStore
@@ -0,0 +1,97 @@
+"""Unit tests for the :meth:`YAMLDataStore.batch` method."""
+
+
+import yaml
+
+import pytest
+
+from phonebook._datastore.yaml_ import YAMLDataStore
+from phonebook._exceptions import DuplicateUserError, InvalidUserError
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_writes_once(data_store_path, mocker):
+    """Test the changes in a batch are written to the file once."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    mock_write = mocker.spy(data_store, "_write")
+
+    with data_store.batch():
+        data_store.create({"name": "Terry Gilliam", "phone": "555", "address": "far"})
+        data_store.update("Eric Idle", phone="999")
+        data_store.delete("John Cleese")
+        mock_write.assert_not_called()
+
+    mock_write.assert_called_once_with()
+    expected_data = [
+        {"name": "Eric Idle", "phone": "999", "address": "here"},
+        {"name": "Terry Gilliam", "phone": "555", "address": "far"},
+    ]
+    assert data_store._users == expected_data
+    assert yaml.safe_load(data_store_path.read_text()) == expected_data
+
+
+def test_with_error(data_store_path):
+    """Test none of the changes in a batch are kept when one fails."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    with pytest.raises(DuplicateUserError):
+        with data_store.batch():
+            data_store.delete("Eric Idle")
+            data_store.update("John Cleese", name="Eric Idle", phone="999")
+            data_store.create({"name": "Eric Idle", "phone": "5", "address": "far"})
+
+    assert data_store._users == _DATA_SET
+    assert data_store.get("Eric Idle") == _DATA_SET[0]
+    assert data_store.get("John Cleese") == _DATA_SET[1]
+    assert yaml.safe_load(data_store_path.read_text()) == _DATA_SET
+
+
+def test_nested(data_store_path, mocker):
+    """Test a nested batch is written with the outer batch."""
+    data_store_path.write_text(yaml.dump([]))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    mock_write = mocker.spy(data_store, "_write")
+
+    with data_store.batch():
+        with data_store.batch():
+            data_store.create(_DATA_SET[0])
+        mock_write.assert_not_called()
+        data_store.create(_DATA_SET[1])
+
+    mock_write.assert_called_once_with()
+    assert yaml.safe_load(data_store_path.read_text()) == _DATA_SET
+
+
+def test_create_many_with_invalid_user(data_store_path):
+    """Test `create_many` adds no users when one of them is invalid."""
+    data_store_path.write_text(yaml.dump([]))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    with pytest.raises(InvalidUserError):
+        data_store.create_many([_DATA_SET[0], {"name": "John Cleese"}])
+
+    assert data_store._users == []
+    assert yaml.safe_load(data_store_path.read_text()) == []
+
+
+def test_with_changes_from_other_data_store(data_store_path):
+    """Test a batch applies its changes on top of other processes' changes."""
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    other_data_store = YAMLDataStore(file_path=str(data_store_path))
+    other_data_store.create(_DATA_SET[0])
+
+    with data_store.batch():
+        data_store.update("Eric Idle", phone="555-555-5555")
+        data_store.create(_DATA_SET[1])
+
+    assert yaml.safe_load(data_store_path.read_text()) == [
+        dict(_DATA_SET[0], phone="555-555-5555"),
+        _DATA_SET[1],
+    ]
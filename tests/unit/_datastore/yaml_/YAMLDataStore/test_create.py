@@ -104,3 +104,18 @@ def test_with_duplicate_user(data_store_path):
         data_store.create(user)
 
     assert "Eric Idle" in str(error.value)
+
+
+def test_with_changes_from_other_data_store(data_store_path):
+    """Test creating a user keeps the changes made by other processes."""
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    other_data_store = YAMLDataStore(file_path=str(data_store_path))
+    user = {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}
+    other_user = {"name": "John Cleese", "phone": "111-222-3333", "address": "there"}
+
+    other_data_store.create(other_user)
+    data_store.create(user)
+
+    assert yaml.safe_load(data_store_path.read_text()) == [other_user, user]
+    with pytest.raises(DuplicateUserError):
+        data_store.create(other_user)
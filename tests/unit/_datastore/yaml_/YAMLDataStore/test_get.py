@@ -36,3 +36,57 @@ def test_with_missing_user(data_store_path):
         data_store.get("John Cleese")
 
     assert "John Cleese" in str(error.value)
+
+
+def test_after_rename(data_store_path):
+    """Test `get` finds a user by their new name after an update."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.dump(data_set))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    data_store.update("Eric Idle", name="John Cleese")
+
+    expected_result = {
+        "name": "John Cleese",
+        "phone": "123-456-7890",
+        "address": "here",
+    }
+    assert data_store.get("John Cleese") == expected_result
+    with pytest.raises(MissingUserError):
+        data_store.get("Eric Idle")
+
+
+def test_after_delete(data_store_path):
+    """Test `get` does not find a user after they are deleted."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.dump(data_set))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    data_store.delete("Eric Idle")
+
+    with pytest.raises(MissingUserError):
+        data_store.get("Eric Idle")
+
+
+def test_after_reload(data_store_path):
+    """Test `get` finds users that were added to the file externally."""
+    data_store_path.write_text(yaml.dump([]))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.dump(data_set))
+
+    data_store.reload()
+
+    assert data_store.get("Eric Idle") == data_set[0]
+
+
+def test_compact(data_store_path):
+    """Test a compact data store returns a new dictionary for the user."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.safe_dump(data_set))
+    data_store = YAMLDataStore(file_path=str(data_store_path), compact=True)
+
+    result = data_store.get("Eric Idle")
+    result["phone"] = "999-999-9999"
+
+    assert data_store.get("Eric Idle") == data_set[0]
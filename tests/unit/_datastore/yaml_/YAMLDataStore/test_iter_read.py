@@ -0,0 +1,129 @@
+"""Unit tests for the :meth:`YAMLDataStore.iter_read` method."""
+
+import yaml
+
+import pytest
+
+from phonebook._datastore.yaml_ import YAMLDataStore
+from phonebook._exceptions import MissingUserError
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "there"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "here"},
+    {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "not found"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "here"},
+]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_indices",
+    (
+        ({}, [0, 1, 2, 3]),
+        ({"limit": 2}, [0, 1]),
+        ({"offset": 3}, [3]),
+        ({"limit": 1, "offset": 1}, [1]),
+        ({"after": "John Cleese"}, [2, 3]),
+        ({"after": "Michael Palin"}, []),
+        ({"filters": {"address": "here"}, "limit": 1}, [1]),
+        ({"filters": {"address": "here"}, "offset": 1}, [3]),
+        ({"filters": {"phone": "123-*"}, "after": "Eric Idle"}, [3]),
+        ({"filters": {"name": "Eric Idle"}, "after": "Eric Idle"}, []),
+        ({"filters": {"name": "Michael Palin"}, "after": "Eric Idle"}, [3]),
+        ({"filters": {"name": "Terry *"}}, [2]),
+        ({"filters": {"name": "*"}, "limit": 1, "offset": 1}, [1]),
+        ({"filters": {"name": "M*", "address": "here"}, "after": "Eric Idle"}, [3]),
+    ),
+)
+def test_pagination(data_store_path, kwargs, expected_indices):
+    """Test iterating over a page of the users."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    result = data_store.iter_read(**kwargs)
+
+    assert not isinstance(result, list)
+    assert list(result) == [_DATA_SET[index] for index in expected_indices]
+
+
+def test_with_missing_after_user(data_store_path):
+    """Test `iter_read` when the `after` user doesn't exist."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    with pytest.raises(MissingUserError) as error:
+        data_store.iter_read(after="Graham Chapman")
+
+    assert "Graham Chapman" in str(error.value)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"filters": {"address": "*ere*"}},
+        {"filters": {"phone": "*555*", "name": "*ael*"}},
+        {"filters": {"phone": "*555-5555"}, "after": "Eric Idle"},
+        {"filters": {"address": "*found"}, "limit": 1},
+        {"filters": {"name": "*"}, "offset": 1},
+    ),
+)
+def test_trigram_index(data_store_path, kwargs):
+    """Test the trigram index doesn't change the users that are returned."""
+    data_store_path.write_text(yaml.safe_dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    indexed_data_store = YAMLDataStore(
+        file_path=str(data_store_path), trigram_index=True
+    )
+
+    for store in (data_store, indexed_data_store):
+        store.delete("John Cleese")
+        store.update("Eric Idle", address="nowhere", phone="555-555-5555")
+        store.create({"name": "John Cleese", "phone": "555", "address": "where"})
+
+    assert list(indexed_data_store.iter_read(**kwargs)) == list(
+        data_store.iter_read(**kwargs)
+    )
+
+
+
+def test_name_prefix(data_store_path):
+    """Test users matching a name prefix are read in the order they were added."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    data_store.create({"name": "Eric Adams", "phone": "555", "address": "where"})
+    data_store.update("John Cleese", name="Eric Cleese")
+
+    result = data_store.iter_read(filters={"name": "Eric *"})
+
+    expected_names = ["Eric Idle", "Eric Cleese", "Eric Adams"]
+    assert [user["name"] for user in result] == expected_names
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"filters": {"address": "*ere*"}},
+        {"filters": {"name": "John Cleese"}},
+        {"filters": {"phone": "*555-5555"}, "after": "Eric Idle"},
+        {"filters": {"address": "*found"}, "limit": 1},
+    ),
+)
+@pytest.mark.parametrize("trigram_index", (False, True))
+def test_compact(data_store_path, kwargs, trigram_index):
+    """Test a compact data store returns the same users as dictionaries."""
+    data_store_path.write_text(yaml.safe_dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    compact_data_store = YAMLDataStore(
+        file_path=str(data_store_path), trigram_index=trigram_index, compact=True
+    )
+
+    for store in (data_store, compact_data_store):
+        store.delete("John Cleese")
+        store.update("Eric Idle", address="nowhere", phone="555-555-5555")
+        store.create({"name": "John Cleese", "phone": "555", "address": "where"})
+
+    result = list(compact_data_store.iter_read(**kwargs))
+
+    assert result == list(data_store.iter_read(**kwargs))
+    assert all(type(user) is dict for user in result)
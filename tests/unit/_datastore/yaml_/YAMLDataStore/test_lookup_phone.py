@@ -0,0 +1,54 @@
+"""Unit tests for the :meth:`YAMLDataStore.lookup_phone` method."""
+
+
+import yaml
+
+import pytest
+
+from phonebook._datastore.yaml_ import YAMLDataStore
+
+
+_DATA_SET = [
+    {"name": "Terry Jones", "phone": "(123) 456-7890", "address": "here"},
+    {"name": "Eric Idle", "phone": "+1 123.456.7890", "address": "there"},
+    {"name": "John Cleese", "phone": "555-7890", "address": "far"},
+]
+
+
+@pytest.mark.parametrize(
+    "number, digits, expected_indices",
+    (
+        ("123-456-7890", None, [0]),
+        ("123-456-7890", 10, [1, 0]),
+        ("7890", 4, [1, 2, 0]),
+        ("999-9999", None, []),
+    ),
+)
+@pytest.mark.parametrize("compact", (False, True))
+def test_main_case(data_store_path, number, digits, expected_indices, compact):
+    """Test getting the users with a phone number."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path), compact=compact)
+
+    result = data_store.lookup_phone(number, digits=digits)
+
+    assert result == [_DATA_SET[index] for index in expected_indices]
+    assert all(type(user) is dict for user in result)
+
+
+def test_after_changes(data_store_path):
+    """Test the users are looked up after they are changed."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    data_store.lookup_phone("7890", digits=4)
+
+    data_store.create({"name": "Graham Chapman", "phone": "555 7890", "address": ""})
+    data_store.update("Terry Jones", phone="555.7890")
+    data_store.delete("John Cleese")
+    with data_store.batch():
+        data_store.update("Eric Idle", name="Eric Idle Jr")
+
+    result = data_store.lookup_phone("555-7890")
+
+    assert [user["name"] for user in result] == ["Graham Chapman", "Terry Jones"]
+    assert data_store.lookup_phone("1-123-456-7890")[0]["name"] == "Eric Idle Jr"
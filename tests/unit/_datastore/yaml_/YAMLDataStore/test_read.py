@@ -140,3 +140,26 @@ def test_fuzzy_filter_multiple_result(data_store_path, fuzzy_filters):
 
     result = data_store.read(filters=dict(fuzzy_filters))
     assert result == [data_set[0], data_set[1]]
+
+
+@pytest.mark.parametrize(
+    "filters, expected_indices",
+    (
+        ({"name": "John Cleese"}, [1]),
+        ({"name": "John Cleese", "phone": "111-*"}, [1]),
+        ({"name": "John Cleese", "phone": "123-*"}, []),
+        ({"name": "John"}, []),
+    ),
+)
+def test_exact_name_filter(data_store_path, filters, expected_indices):
+    """Test reading with an exact name filter and other filters."""
+    data_set = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "there"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "here"},
+        {"name": "Terry Gilliam", "phone": "555-555-5555", "address": "not found"},
+    ]
+    data_store_path.write_text(yaml.dump(data_set))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+
+    result = data_store.read(filters=filters)
+    assert result == [data_set[index] for index in expected_indices]
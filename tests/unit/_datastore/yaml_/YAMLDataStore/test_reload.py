@@ -1,4 +1,4 @@
-"""Unit tests for the :meth:`YAMLDataStore.__init__` method."""
+"""Unit tests for the :meth:`YAMLDataStore.reload` method."""
 
 
 import yaml
@@ -31,3 +31,69 @@ def test_updates_to_data_store(data_store_path):
     data_store.reload()
 
     assert data_store._users == []
+
+
+def test_auto_reload(data_store_path):
+    """Test automatically reloading when the YAML file has changed."""
+    data_store_path.write_text(yaml.safe_dump([]))
+    data_store = YAMLDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.safe_dump(data_set))
+
+    assert data_store.read() == data_set
+    assert data_store.get("Eric Idle") == data_set[0]
+
+
+def test_auto_reload_disabled(data_store_path):
+    """Test the YAML file is not checked unless auto reloading is enabled."""
+    data_store_path.write_text(yaml.safe_dump([]))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.safe_dump(data_set))
+
+    assert data_store.read() == []
+
+
+def test_auto_reload_interval(data_store_path, mocker):
+    """Test the YAML file is checked at most once per reload interval."""
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    data_store_path.write_text(yaml.safe_dump([]))
+    data_store = YAMLDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=5
+    )
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.safe_dump(data_set))
+
+    mock_monotonic.return_value = 104.0
+    assert data_store.read() == []
+    mock_monotonic.return_value = 105.0
+    assert data_store.read() == data_set
+
+
+def test_auto_reload_own_changes(data_store_path, mocker):
+    """Test changes made through the data store don't cause a reload."""
+    data_store_path.write_text(yaml.safe_dump([]))
+    data_store = YAMLDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    mock_reload = mocker.spy(data_store, "reload")
+
+    data_store.create({"name": "Eric Idle", "phone": "123-456-7890", "address": "here"})
+    data_store.update("Eric Idle", phone="555-555-5555")
+    data_store.read()
+
+    mock_reload.assert_not_called()
+
+
+def test_auto_reload_missing_file(data_store_path):
+    """Test the users are kept while the YAML file is missing."""
+    data_set = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    data_store_path.write_text(yaml.safe_dump(data_set))
+    data_store = YAMLDataStore(
+        file_path=str(data_store_path), auto_reload=True, reload_interval=0
+    )
+    data_store_path.unlink()
+
+    assert data_store.read() == data_set
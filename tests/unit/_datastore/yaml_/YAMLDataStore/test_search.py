@@ -0,0 +1,55 @@
+"""Unit tests for the :meth:`YAMLDataStore.search` method."""
+
+
+import yaml
+
+import pytest
+
+from phonebook._datastore.yaml_ import YAMLDataStore
+
+
+_DATA_SET = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "12 Main St."},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "120 Main St"},
+    {"name": "Michael Palin", "phone": "123-555-5555", "address": "Main 12"},
+]
+
+
+@pytest.mark.parametrize(
+    "terms, limit, expected_indices",
+    (
+        ("main 12", None, [0, 2]),
+        ("main 12", 1, [0]),
+        ("Main", None, [0, 1, 2]),
+        ("elm", None, []),
+        ("--", None, []),
+    ),
+)
+@pytest.mark.parametrize("compact", (False, True))
+def test_main_case(data_store_path, terms, limit, expected_indices, compact):
+    """Test getting the users whose address has every term."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path), compact=compact)
+
+    result = data_store.search(terms, limit=limit)
+
+    assert result == [_DATA_SET[index] for index in expected_indices]
+    assert all(type(user) is dict for user in result)
+
+
+def test_after_changes(data_store_path):
+    """Test the users are found after they are changed."""
+    data_store_path.write_text(yaml.dump(_DATA_SET))
+    data_store = YAMLDataStore(file_path=str(data_store_path))
+    data_store.search("main")
+
+    data_store.create({"name": "Graham Chapman", "phone": "555", "address": "12 Main"})
+    data_store.update("Eric Idle", address="9 Elm St")
+    data_store.delete("Michael Palin")
+    with data_store.batch():
+        data_store.update("John Cleese", name="John Cleese Jr", address="12 main")
+
+    result = data_store.search("main 12")
+
+    assert [user["name"] for user in result] == ["John Cleese Jr", "Graham Chapman"]
+    assert [user["name"] for user in data_store.search("elm")] == ["Eric Idle"]
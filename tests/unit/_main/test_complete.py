@@ -0,0 +1,26 @@
+"""Unit tests for the :meth:`phonebook.complete` method."""
+
+
+import phonebook
+
+
+def test_with_data_store(mocker):
+    """Test when the data store is already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", mock_data_store)
+
+    phonebook.complete("Eric", limit=10)
+
+    mock_data_store.complete.assert_called_once_with("Eric", limit=10)
+
+
+def test_without_data_store(mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    phonebook.complete("Eric", limit=10)
+
+    mock_data_store.complete.assert_called_once_with("Eric", limit=10)
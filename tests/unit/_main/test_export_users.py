@@ -0,0 +1,40 @@
+"""Unit tests for the :meth:`phonebook.export_users` method."""
+
+
+import io
+import json
+
+import phonebook
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_with_data_store(mocker):
+    """Test when the data store is already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_data_store.iter_read.return_value = iter(_USERS)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", mock_data_store)
+    output_file = io.StringIO()
+
+    result = phonebook.export_users(output_file, "ndjson", filters={"name": "*"})
+
+    assert result == 2
+    mock_data_store.iter_read.assert_called_once_with(filters={"name": "*"})
+    assert [json.loads(line) for line in output_file.getvalue().splitlines()] == _USERS
+
+
+def test_without_data_store(mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_data_store.iter_read.return_value = iter(_USERS)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    phonebook.export_users(io.StringIO(), "json")
+
+    mock_data_store.iter_read.assert_called_once_with(filters=None)
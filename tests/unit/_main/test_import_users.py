@@ -0,0 +1,119 @@
+"""Unit tests for the :meth:`phonebook.import_users` method."""
+
+
+import io
+import json
+
+import pytest
+
+import phonebook
+from phonebook._datastore.json_ import JSONDataStore
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+@pytest.fixture()
+def data_store(mocker, tmp_path):
+    """Get a JSON data store that is set as the data store to use.
+
+    Returns:
+        JSONDataStore: The data store, with a single user.
+
+    """
+    data_store_path = tmp_path / "test_data_source.json"
+    data_store_path.write_text(
+        json.dumps([{"name": "Graham Chapman", "phone": "444", "address": "where"}])
+    )
+    data_store = JSONDataStore(file_path=str(data_store_path))
+    mocker.patch.object(phonebook._main, "_DATA_STORE", data_store)
+    return data_store
+
+
+def _ndjson(users):
+    """Get a file of the given `users` as newline-delimited JSON."""
+    return io.StringIO("".join(f"{json.dumps(user)}\n" for user in users))
+
+
+def test_main_case(data_store, mocker):
+    """Test importing users saves them once."""
+    mock_write = mocker.spy(data_store, "_write")
+
+    result = phonebook.import_users(_ndjson(_USERS), "ndjson")
+
+    assert result == 2
+    assert data_store.read(filters={"phone": "1*"}) == _USERS
+    mock_write.assert_called_once_with()
+
+
+def test_with_many_chunks(data_store, mocker):
+    """Test importing more users than fit in a chunk."""
+    mocker.patch.object(phonebook._main, "_IMPORT_CHUNK_SIZE", 3)
+    users = [{"name": f"User {i}", "phone": str(i), "address": ""} for i in range(10)]
+
+    result = phonebook.import_users(_ndjson(users), "ndjson")
+
+    assert result == 10
+    assert data_store.read(filters={"name": "User *"}) == users
+
+
+def test_with_invalid_user(data_store):
+    """Test nothing is imported when a user is invalid."""
+    users = _USERS + [{"name": "Terry Jones"}]
+
+    with pytest.raises(phonebook.InvalidUserError) as error:
+        phonebook.import_users(_ndjson(users), "ndjson")
+
+    assert "#3" in str(error.value)
+    assert [user["name"] for user in data_store.read()] == ["Graham Chapman"]
+
+
+def test_with_duplicate_in_file(data_store):
+    """Test nothing is imported when a name is in the file twice."""
+    users = _USERS + [_USERS[0]]
+
+    with pytest.raises(phonebook.DuplicateUserError):
+        phonebook.import_users(_ndjson(users), "ndjson")
+
+    assert [user["name"] for user in data_store.read()] == ["Graham Chapman"]
+
+
+def test_with_existing_user(data_store):
+    """Test nothing is imported when a name is already in the data store."""
+    users = _USERS + [{"name": "Graham Chapman", "phone": "555", "address": "here"}]
+
+    with pytest.raises(phonebook.DuplicateUserError):
+        phonebook.import_users(_ndjson(users), "ndjson")
+
+    assert [user["name"] for user in data_store.read()] == ["Graham Chapman"]
+
+
+def test_skip_duplicates(data_store):
+    """Test skipping the names already in the data store or file."""
+    users = [
+        _USERS[0],
+        {"name": "Graham Chapman", "phone": "555", "address": "here"},
+        {"name": "Eric Idle", "phone": "555", "address": "here"},
+        _USERS[1],
+    ]
+
+    result = phonebook.import_users(_ndjson(users), "ndjson", skip_duplicates=True)
+
+    assert result == 2
+    assert data_store.get("Graham Chapman")["phone"] == "444"
+    assert data_store.read(filters={"phone": "1*"}) == _USERS
+
+
+def test_without_data_store(mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    phonebook.import_users(_ndjson(_USERS), "ndjson")
+
+    mock_data_store.create_many.assert_called_once_with(_USERS)
@@ -0,0 +1,34 @@
+"""Unit tests for the :meth:`phonebook.iter_read` method."""
+
+
+import phonebook
+
+
+_FILTERS = {"name": "Eric *"}
+
+
+def test_with_data_store(mocker):
+    """Test when the data store is already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", mock_data_store)
+
+    result = phonebook.iter_read(filters=_FILTERS, limit=10, after="Eric Idle")
+
+    mock_data_store.iter_read.assert_called_once_with(
+        filters=_FILTERS, limit=10, offset=None, after="Eric Idle"
+    )
+    assert result == mock_data_store.iter_read.return_value
+
+
+def test_without_data_store(mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    phonebook.iter_read(filters=_FILTERS, offset=5)
+
+    mock_data_store.iter_read.assert_called_once_with(
+        filters=_FILTERS, limit=None, offset=5, after=None
+    )
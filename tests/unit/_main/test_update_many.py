@@ -0,0 +1,36 @@
+"""Unit tests for the :meth:`phonebook.update_many` method."""
+
+
+import phonebook
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+def test_with_data_store(mocker):
+    """Test when the data store is already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", mock_data_store)
+
+    phonebook.update_many({user["name"]: {"phone": "999"} for user in _USERS})
+
+    mock_data_store.update_many.assert_called_once_with(
+        {"Eric Idle": {"phone": "999"}, "John Cleese": {"phone": "999"}}
+    )
+
+
+def test_without_data_store(mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    phonebook.update_many({user["name"]: {"phone": "999"} for user in _USERS})
+
+    mock_data_store.update_many.assert_called_once_with(
+        {"Eric Idle": {"phone": "999"}, "John Cleese": {"phone": "999"}}
+    )
@@ -0,0 +1,24 @@
+"""Unit tests for the :meth:`Query.compile` method."""
+
+
+from phonebook._query import Query
+
+
+def test_cached():
+    """Test the same filters are only compiled once."""
+    query = Query.compile({"name": "Eric *", "phone": "555-*"})
+
+    assert Query.compile({"phone": "555-*", "name": "Eric *"}) is query
+    assert Query.compile({"name": "Eric *"}) is not query
+
+
+def test_with_query():
+    """Test compiling an already compiled query."""
+    query = Query({"name": "Eric *"})
+
+    assert Query.compile(query) is query
+
+
+def test_without_filters():
+    """Test compiling no filters."""
+    assert Query.compile(None) == {}
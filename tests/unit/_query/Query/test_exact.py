@@ -0,0 +1,22 @@
+"""Unit tests for the :meth:`Query.exact` method."""
+
+
+import pytest
+
+from phonebook._query import Query
+
+
+@pytest.mark.parametrize(
+    "filters, expected_result",
+    (
+        ({"name": "Eric Idle"}, "Eric Idle"),
+        ({"name": "Eric Idle", "phone": "5*"}, "Eric Idle"),
+        ({"name": "Eric *"}, None),
+        ({"name": "[E]ric Idle"}, None),
+        ({"phone": "555"}, None),
+        ({}, None),
+    ),
+)
+def test_main_case(filters, expected_result):
+    """Test getting the exact name of a query."""
+    assert Query(filters).exact("name") == expected_result
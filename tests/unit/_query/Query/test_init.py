@@ -0,0 +1,39 @@
+"""Unit tests for the :meth:`Query.__init__` method."""
+
+
+from phonebook._query import Query
+
+
+def test_mapping():
+    """Test the query can be used as the filters dictionary."""
+    filters = {"name": "Eric *", "phone": "555-*"}
+
+    query = Query(filters)
+
+    assert query == filters
+    assert dict(query) == filters
+    assert query["name"] == "Eric *"
+    assert len(query) == 2
+    assert "address" not in query
+
+
+def test_without_filters():
+    """Test a query without filters matches every user."""
+    query = Query()
+
+    assert query == {}
+    assert query.matches({"name": "Eric Idle", "phone": "", "address": ""})
+
+
+def test_selectivity_order():
+    """Test the most selective filters are checked first."""
+    query = Query(
+        {
+            "address": "*",
+            "phone": "1*2?3",
+            "foobar": "*",
+            "name": "Eric Idle",
+        }
+    )
+
+    assert [field for field, _ in query._predicates] == ["name", "phone", "foobar"]
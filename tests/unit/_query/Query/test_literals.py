@@ -0,0 +1,30 @@
+"""Unit tests for the :meth:`Query.literals` method."""
+
+
+import pytest
+
+from phonebook._query import Query
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_result",
+    (
+        ("Eric Idle", ["Eric Idle"]),
+        ("*Main St*", ["Main St"]),
+        ("12?4*Main", ["12", "4", "Main"]),
+        ("[EJ]ric [!I]dle", ["ric ", "dle"]),
+        ("[]]ric", ["ric"]),
+        ("[!]]ric", ["ric"]),
+        ("Eric [Idle", ["Eric [Idle"]),
+        ("*", []),
+        ("", []),
+    ),
+)
+def test_main_case(pattern, expected_result):
+    """Test getting the literal text of a field's pattern."""
+    assert Query({"address": pattern}).literals("address") == expected_result
+
+
+def test_without_filter():
+    """Test getting the literal text of a field that isn't filtered by."""
+    assert Query({"name": "Eric*"}).literals("address") == []
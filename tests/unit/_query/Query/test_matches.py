@@ -0,0 +1,63 @@
+"""Unit tests for the :meth:`Query.matches` method."""
+
+
+import fnmatch
+
+import pytest
+
+from phonebook._query import Query
+
+
+_VALUES = ("Eric Idle", "Eric", "Idle", "eric idle", "", "E*c", "[E]ric", "E\nIdle")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    (
+        "Eric Idle",
+        "Eric*",
+        "*Idle",
+        "*ic Id*",
+        "*",
+        "**",
+        "E?ic*",
+        "[EJ]ric*",
+        "[!E]*",
+        "E*e",
+        "E*c",
+        "[E]ric",
+        "",
+    ),
+)
+def test_same_as_fnmatch(pattern):
+    """Test the query matches the same values as :func:`fnmatch.fnmatch`."""
+    query = Query({"name": pattern})
+
+    for value in _VALUES:
+        expected = fnmatch.fnmatch(value, pattern)
+        assert query.matches({"name": value}) == expected, value
+
+
+def test_all_filters():
+    """Test a user must match all of the filters."""
+    query = Query({"name": "Eric *", "phone": "555-*"})
+
+    assert query.matches({"name": "Eric Idle", "phone": "555-1234"})
+    assert not query.matches({"name": "Eric Idle", "phone": "123-1234"})
+    assert not query.matches({"name": "John Cleese", "phone": "555-1234"})
+
+
+def test_unknown_field():
+    """Test filtering by a field the user doesn't have."""
+    query = Query({"foobar": "*"})
+
+    with pytest.raises(KeyError):
+        query.matches({"name": "Eric Idle"})
+
+
+def test_non_string_value():
+    """Test an exact filter doesn't match a value that isn't a string."""
+    query = Query({"phone": "999"})
+
+    assert not query.matches({"phone": 5551234})
+    assert query.matches({"phone": "999"})
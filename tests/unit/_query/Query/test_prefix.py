@@ -0,0 +1,24 @@
+"""Unit tests for the :meth:`Query.prefix` method."""
+
+
+import pytest
+
+from phonebook._query import Query
+
+
+@pytest.mark.parametrize(
+    "filters, expected_result",
+    (
+        ({"name": "Eric *"}, "Eric "),
+        ({"name": "Eric *", "phone": "5*"}, "Eric "),
+        ({"name": "Eric Idle"}, None),
+        ({"name": "*Idle"}, None),
+        ({"name": "E?ic *"}, None),
+        ({"name": "*"}, None),
+        ({"phone": "5*"}, None),
+        ({}, None),
+    ),
+)
+def test_main_case(filters, expected_result):
+    """Test getting the name prefix of a query."""
+    assert Query(filters).prefix("name") == expected_result
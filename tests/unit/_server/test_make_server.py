@@ -0,0 +1,43 @@
+"""Unit tests for the :func:`phonebook._server.make_server` function."""
+
+
+import socket
+
+import pytest
+
+from phonebook._server import make_server
+
+
+def test_unix_socket(tmp_path):
+    """Test the socket file is removed when the server is closed."""
+    address = tmp_path / "phonebook.sock"
+
+    server = make_server(str(address))
+    assert address.is_socket()
+    server.server_close()
+
+    assert not address.exists()
+
+
+def test_with_stale_socket(tmp_path):
+    """Test a socket file left behind by another server is replaced."""
+    address = tmp_path / "phonebook.sock"
+    stale_socket = socket.socket(socket.AF_UNIX)
+    stale_socket.bind(str(address))
+    stale_socket.close()
+
+    server = make_server(str(address))
+    server.server_close()
+
+    assert not address.exists()
+
+
+def test_with_existing_file(tmp_path):
+    """Test a file that isn't a socket is never removed."""
+    address = tmp_path / "phonebook.json"
+    address.write_text("[]")
+
+    with pytest.raises(FileExistsError):
+        make_server(str(address))
+
+    assert address.read_text() == "[]"
@@ -0,0 +1,21 @@
+"""Unit tests for the :func:`phonebook._server.parse_address` function."""
+
+
+import pytest
+
+from phonebook._server import parse_address
+
+
+@pytest.mark.parametrize(
+    "address, expected_result",
+    [
+        ("127.0.0.1:8080", ("127.0.0.1", 8080)),
+        ("localhost:0", ("localhost", 0)),
+        ("/tmp/phonebook.sock", "/tmp/phonebook.sock"),
+        ("phonebook.sock", "phonebook.sock"),
+        ("/tmp/phone:book.sock", "/tmp/phone:book.sock"),
+    ],
+)
+def test_main_case(address, expected_result):
+    """Test parsing TCP and Unix socket addresses."""
+    assert parse_address(address) == expected_result
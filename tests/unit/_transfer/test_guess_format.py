@@ -0,0 +1,24 @@
+"""Unit tests for the :func:`phonebook._transfer.guess_format` function."""
+
+
+import pytest
+
+from phonebook._transfer import guess_format
+
+
+@pytest.mark.parametrize(
+    "file_path, expected_result",
+    [
+        ("users.csv", "csv"),
+        ("users.ndjson", "ndjson"),
+        ("users.jsonl", "ndjson"),
+        ("/tmp/users.JSON", "json"),
+        ("users.yaml", "yaml"),
+        ("users.yml", "yaml"),
+        ("users.txt", None),
+        ("users", None),
+    ],
+)
+def test_main_case(file_path, expected_result):
+    """Test guessing the format from the extension."""
+    assert guess_format(file_path) == expected_result
@@ -0,0 +1,129 @@
+"""Unit tests for the :func:`phonebook._transfer.read_users` function."""
+
+
+import io
+
+import pytest
+
+from phonebook import _transfer
+from phonebook._transfer import read_users
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "1 Main St, Apt 2"},
+]
+
+
+@pytest.mark.parametrize(
+    "input_format, data",
+    [
+        (
+            "csv",
+            "name,phone,address\r\n"
+            "Eric Idle,123-456-7890,here\r\n"
+            'John Cleese,111-222-3333,"1 Main St, Apt 2"\r\n',
+        ),
+        (
+            "ndjson",
+            '{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}\n'
+            "\n"
+            '{"name": "John Cleese", "phone": "111-222-3333", '
+            '"address": "1 Main St, Apt 2"}\n',
+        ),
+        (
+            "json",
+            '[{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},\n'
+            ' {"name": "John Cleese", "phone": "111-222-3333", '
+            '"address": "1 Main St, Apt 2"}]',
+        ),
+        (
+            "yaml",
+            "- name: Eric Idle\n"
+            "  phone: 123-456-7890\n"
+            "  address: here\n"
+            "- {name: John Cleese, phone: 111-222-3333, address: '1 Main St, Apt 2'}\n",
+        ),
+    ],
+)
+def test_main_case(input_format, data):
+    """Test reading the users in each format."""
+    result = read_users(io.StringIO(data), input_format)
+
+    assert list(result) == _USERS
+
+
+@pytest.mark.parametrize(
+    "input_format, data",
+    [
+        ("csv", ""),
+        ("csv", "name,phone,address\n"),
+        ("ndjson", ""),
+        ("json", "[]"),
+        ("json", " [ ] "),
+        ("yaml", "[]"),
+        ("yaml", ""),
+    ],
+)
+def test_with_no_users(input_format, data):
+    """Test reading a file without any users."""
+    result = read_users(io.StringIO(data), input_format)
+
+    assert list(result) == []
+
+
+def test_json_across_chunks(mocker):
+    """Test reading a JSON file whose users are split across chunks."""
+    mocker.patch.object(_transfer, "_JSON_CHUNK_SIZE", 7)
+    data = '  [ {"name": "Eric Idle", "phone": "1", "address": "here"} ,\n'
+    data += '{"name": "John Cleese", "phone": "2", "address": "there"}  ]  '
+
+    result = read_users(io.StringIO(data), "json")
+
+    assert [user["name"] for user in result] == ["Eric Idle", "John Cleese"]
+
+
+def test_yaml_values_are_strings():
+    """Test the YAML fields are read as strings rather than resolved."""
+    data = "- {name: Eric Idle, phone: 1234567890, address: 42}\n"
+
+    result = read_users(io.StringIO(data), "yaml")
+
+    assert list(result) == [
+        {"name": "Eric Idle", "phone": "1234567890", "address": "42"}
+    ]
+
+
+def test_csv_with_missing_fields():
+    """Test the fields missing from the end of a CSV row are left out."""
+    data = "name,phone,address\nEric Idle,123-456-7890\n"
+
+    result = read_users(io.StringIO(data), "csv")
+
+    assert list(result) == [{"name": "Eric Idle", "phone": "123-456-7890"}]
+
+
+@pytest.mark.parametrize(
+    "input_format, data",
+    [
+        ("ndjson", '{"name": "Eric Idle"}\n{"name": \n'),
+        ("json", '{"name": "Eric Idle"}'),
+        ("json", '[{"name": "Eric Idle"} {"name": "John Cleese"}]'),
+        ("json", '[{"name": "Eric Idle"},'),
+        ("yaml", "name: Eric Idle\n"),
+        ("yaml", "- Eric Idle\n"),
+        ("yaml", "- name: [Eric, Idle]\n"),
+    ],
+)
+def test_with_invalid_file(input_format, data):
+    """Test reading a file that isn't valid for its format."""
+    with pytest.raises(ValueError):
+        list(read_users(io.StringIO(data), input_format))
+
+
+def test_with_unsupported_format():
+    """Test reading a format that isn't supported."""
+    with pytest.raises(ValueError) as error:
+        read_users(io.StringIO(""), "xml")
+
+    assert "xml" in str(error.value)
@@ -0,0 +1,46 @@
+"""Unit tests for the :func:`phonebook._transfer.write_users` function."""
+
+
+import io
+
+import pytest
+
+from phonebook._transfer import FORMATS, read_users, write_users
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "1 Main St, Apt 2"},
+]
+
+
+@pytest.mark.parametrize("output_format", FORMATS)
+def test_main_case(output_format):
+    """Test the written users can be read back."""
+    output_file = io.StringIO()
+
+    result = write_users(iter(_USERS), output_file, output_format)
+
+    assert result == 2
+    output_file.seek(0)
+    assert list(read_users(output_file, output_format)) == _USERS
+
+
+@pytest.mark.parametrize("output_format", FORMATS)
+def test_with_no_users(output_format):
+    """Test writing no users can be read back."""
+    output_file = io.StringIO()
+
+    result = write_users(iter([]), output_file, output_format)
+
+    assert result == 0
+    output_file.seek(0)
+    assert list(read_users(output_file, output_format)) == []
+
+
+def test_with_unsupported_format():
+    """Test writing a format that isn't supported."""
+    with pytest.raises(ValueError) as error:
+        write_users([], io.StringIO(), "xml")
+
+    assert "xml" in str(error.value)
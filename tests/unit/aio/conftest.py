@@ -0,0 +1,34 @@
+"""Fixtures for the `phonebook.aio` unit tests."""
+
+
+import asyncio
+
+import pytest
+
+import phonebook
+
+
+@pytest.fixture()
+def event_loop():
+    """Get a new event loop that is closed after the test.
+
+    Returns:
+        asyncio.AbstractEventLoop: The event loop.
+
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def mock_data_store(mocker):
+    """Get a mock data store that is set as the data store to use.
+
+    Returns:
+        unittest.mock.MagicMock: The mock data store.
+
+    """
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", mock_data_store)
+    return mock_data_store
@@ -0,0 +1,81 @@
+"""Unit tests for the :meth:`phonebook.aio.create` method."""
+
+
+import asyncio
+
+import pytest
+
+import phonebook.aio
+from phonebook._datastore.json_ import JSONDataStore
+
+
+_USERS = [
+    {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+    {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+]
+
+
+async def _gather(*coroutines):
+    """Run the `coroutines` at the same time and get their results."""
+    return await asyncio.gather(*coroutines, return_exceptions=True)
+
+
+def test_with_data_store(event_loop, mock_data_store):
+    """Test when the data store is already set."""
+    event_loop.run_until_complete(phonebook.aio.create(_USERS[0]))
+
+    mock_data_store.batch.assert_called_once_with()
+    mock_data_store.create.assert_called_once_with(_USERS[0])
+
+
+def test_without_data_store(event_loop, mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    event_loop.run_until_complete(phonebook.aio.create(_USERS[0]))
+
+    mock_data_store.create.assert_called_once_with(_USERS[0])
+
+
+def test_coalesces_writes(event_loop, tmp_path, mocker):
+    """Test concurrent changes are written to the data store at once."""
+    data_store = JSONDataStore(file_path=str(tmp_path / "test_data_source.json"))
+    mocker.patch.object(phonebook._main, "_DATA_STORE", data_store)
+    mock_write = mocker.spy(data_store, "_write")
+
+    event_loop.run_until_complete(
+        _gather(*(phonebook.aio.create(user) for user in _USERS))
+    )
+
+    mock_write.assert_called_once_with()
+    assert data_store.read() == _USERS
+
+
+def test_with_duplicate_user(event_loop, tmp_path, mocker):
+    """Test a failed change doesn't affect the changes made with it."""
+    data_store = JSONDataStore(file_path=str(tmp_path / "test_data_source.json"))
+    mocker.patch.object(phonebook._main, "_DATA_STORE", data_store)
+
+    results = event_loop.run_until_complete(
+        _gather(
+            phonebook.aio.create(_USERS[0]),
+            phonebook.aio.create(_USERS[0]),
+            phonebook.aio.create(_USERS[1]),
+        )
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], phonebook.DuplicateUserError)
+    assert results[2] is None
+    assert JSONDataStore(file_path=data_store._file_path).read() == _USERS
+
+
+def test_with_write_error(event_loop, mock_data_store):
+    """Test every change fails when the changes can't be written."""
+    mock_data_store.batch.return_value.__exit__.side_effect = OSError("Disk full")
+
+    with pytest.raises(OSError):
+        event_loop.run_until_complete(phonebook.aio.create(_USERS[0]))
@@ -0,0 +1,21 @@
+"""Unit tests for the :meth:`phonebook.aio.delete` method."""
+
+
+import pytest
+
+import phonebook.aio
+
+
+def test_with_data_store(event_loop, mock_data_store):
+    """Test when the data store is already set."""
+    event_loop.run_until_complete(phonebook.aio.delete("Eric Idle"))
+
+    mock_data_store.delete.assert_called_once_with("Eric Idle")
+
+
+def test_with_missing_user(event_loop, mock_data_store):
+    """Test the error raised by the data store is raised."""
+    mock_data_store.delete.side_effect = phonebook.MissingUserError("Eric Idle")
+
+    with pytest.raises(phonebook.MissingUserError):
+        event_loop.run_until_complete(phonebook.aio.delete("Eric Idle"))
@@ -0,0 +1,42 @@
+"""Unit tests for the :meth:`phonebook.aio.read` method."""
+
+
+import phonebook.aio
+
+
+_FILTERS = {"name": "Eric *"}
+
+
+async def _collect(async_iterator):
+    """Collect the items of the given `async_iterator` into a list."""
+    return [item async for item in async_iterator]
+
+
+def test_with_data_store(event_loop, mock_data_store):
+    """Test iterating over the users in the data store."""
+    users = [{"name": f"Eric {number}"} for number in range(250)]
+    mock_data_store.iter_read.return_value = iter(users)
+
+    result = event_loop.run_until_complete(
+        _collect(phonebook.aio.read(filters=_FILTERS, limit=300, after="Eric Idle"))
+    )
+
+    mock_data_store.iter_read.assert_called_once_with(
+        filters=_FILTERS, limit=300, offset=None, after="Eric Idle"
+    )
+    assert result == users
+
+
+def test_streams_users(event_loop, mock_data_store):
+    """Test the users are read from the data store as they are needed."""
+    users = iter([{"name": f"Eric {number}"} for number in range(250)])
+    mock_data_store.iter_read.return_value = users
+
+    async def _first(async_iterator):
+        async for item in async_iterator:
+            return item
+
+    result = event_loop.run_until_complete(_first(phonebook.aio.read()))
+
+    assert result == {"name": "Eric 0"}
+    assert next(users) == {"name": "Eric 100"}
@@ -0,0 +1,24 @@
+"""Unit tests for the :meth:`phonebook.aio.search` method."""
+
+
+import phonebook.aio
+
+
+def test_with_data_store(event_loop, mock_data_store):
+    """Test when the data store is already set."""
+    result = event_loop.run_until_complete(phonebook.aio.search("main 12", limit=10))
+
+    mock_data_store.search.assert_called_once_with("main 12", limit=10)
+    assert result == mock_data_store.search.return_value
+
+
+def test_without_data_store(event_loop, mocker):
+    """Test when the data store is not already set."""
+    mock_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+    mock_default_data_store = mocker.MagicMock(return_value=mock_data_store)
+    mocker.patch.object(phonebook._main, "_DATA_STORE", None)
+    mocker.patch.object(phonebook._main, "_DEFAULT_DATA_STORE", mock_default_data_store)
+
+    event_loop.run_until_complete(phonebook.aio.search("main 12", limit=10))
+
+    mock_data_store.search.assert_called_once_with("main 12", limit=10)
@@ -0,0 +1,42 @@
+"""Unit tests for the :meth:`phonebook.aio.set_data_store` method."""
+
+
+import asyncio
+
+import pytest
+
+import phonebook.aio
+
+
+def test_main_case(event_loop, mock_data_store, mocker):
+    """Test the data store is shared with the synchronous functions."""
+    new_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+
+    event_loop.run_until_complete(phonebook.aio.set_data_store(new_data_store))
+
+    assert phonebook._main._DATA_STORE == new_data_store
+
+
+def test_waits_for_changes(event_loop, mock_data_store, mocker):
+    """Test the pending changes are made to the previous data store."""
+    new_data_store = mocker.MagicMock(spec=phonebook._datastore.base.BaseDataStore)
+
+    async def _change_and_set():
+        delete = event_loop.create_task(phonebook.aio.delete("Eric Idle"))
+        # let the change be submitted
+        await asyncio.sleep(0)
+        await phonebook.aio.set_data_store(new_data_store)
+        await delete
+
+    event_loop.run_until_complete(_change_and_set())
+
+    mock_data_store.delete.assert_called_once_with("Eric Idle")
+    new_data_store.delete.assert_not_called()
+
+
+def test_invalid_data_store(event_loop):
+    """Test when the data store is not a BaseDataStore subclass."""
+    with pytest.raises(TypeError):
+        event_loop.run_until_complete(
+            phonebook.aio.set_data_store("not a valid data store")
+        )
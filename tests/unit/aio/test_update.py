@@ -0,0 +1,43 @@
+"""Unit tests for the :meth:`phonebook.aio.update` method."""
+
+
+import asyncio
+
+import phonebook.aio
+from phonebook._datastore.json_ import JSONDataStore
+
+
+def test_with_data_store(event_loop, mock_data_store):
+    """Test when the data store is already set."""
+    event_loop.run_until_complete(
+        phonebook.aio.update("Eric Idle", name="John Cleese", phone="555")
+    )
+
+    mock_data_store.update.assert_called_once_with(
+        "Eric Idle", name="John Cleese", phone="555"
+    )
+
+
+def test_with_unexpected_error(event_loop, tmp_path, mocker):
+    """Test an unexpected error only fails the change that raised it."""
+    data_store = JSONDataStore(file_path=str(tmp_path / "test_data_source.json"))
+    data_store.create({"name": "Eric Idle", "phone": "123", "address": "here"})
+    mocker.patch.object(phonebook._main, "_DATA_STORE", data_store)
+    mocker.patch.object(data_store, "delete", side_effect=RuntimeError("Boom"))
+
+    async def delete_and_update():
+        return await asyncio.gather(
+            phonebook.aio.delete("Eric Idle"),
+            phonebook.aio.update("Eric Idle", phone="555"),
+            return_exceptions=True,
+        )
+
+    results = event_loop.run_until_complete(delete_and_update())
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is None
+    assert JSONDataStore(file_path=data_store._file_path).get("Eric Idle") == {
+        "name": "Eric Idle",
+        "phone": "555",
+        "address": "here",
+    }
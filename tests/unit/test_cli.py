@@ -40,6 +40,46 @@ def test_get(mocker, capsys):
     assert json.loads(out) == []
 
 
+def test_complete(mocker, capsys):
+    """Test ``phonebook complete``."""
+    sys.argv = ["phonebook", "complete", "Eric", "--limit", "2"]
+    mock_complete = mocker.patch(
+        "phonebook.complete", return_value=["Eric Cleese", "Eric Idle"]
+    )
+
+    phonebook._cli.main()
+
+    mock_complete.assert_called_once_with("Eric", limit=2)
+    out, err = capsys.readouterr()
+    assert json.loads(out) == ["Eric Cleese", "Eric Idle"]
+
+
+def test_lookup_phone(mocker, capsys):
+    """Test ``phonebook lookup-phone``."""
+    users = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "here"}]
+    sys.argv = ["phonebook", "lookup-phone", "+1 123 456 7890", "--digits", "10"]
+    mock_lookup_phone = mocker.patch("phonebook.lookup_phone", return_value=users)
+
+    phonebook._cli.main()
+
+    mock_lookup_phone.assert_called_once_with("+1 123 456 7890", digits=10)
+    out, err = capsys.readouterr()
+    assert json.loads(out) == users
+
+
+def test_search(mocker, capsys):
+    """Test ``phonebook search``."""
+    users = [{"name": "Eric Idle", "phone": "123-456-7890", "address": "12 Main St"}]
+    sys.argv = ["phonebook", "search", "main", "12", "--limit", "5"]
+    mock_search = mocker.patch("phonebook.search", return_value=users)
+
+    phonebook._cli.main()
+
+    mock_search.assert_called_once_with("main 12", limit=5)
+    out, err = capsys.readouterr()
+    assert json.loads(out) == users
+
+
 def test_read_no_filters(mocker, capsys):
     """Test ``phonebook read`` without filters."""
     sys.argv = ["phonebook", "read"]
@@ -121,3 +161,210 @@ def test_update(mocker):
     mock_update.assert_called_once_with(
         "Eric Idle", name="New Name", phone="New Phone", address="New Address",
     )
+
+
+def test_sqlite_data_store(mocker):
+    """Test ``phonebook --data-store sqlite``."""
+    sys.argv = ["phonebook", "--data-store", "sqlite", "delete", "Eric Idle"]
+    mock_load_data_store = mocker.patch("phonebook._datastore.load_data_store")
+    mock_set_data_store = mocker.patch("phonebook.set_data_store")
+    mocker.patch("phonebook.delete")
+
+    phonebook._cli.main()
+
+    mock_load_data_store.assert_called_once_with("sqlite")
+    mock_data_store = mock_load_data_store.return_value.return_value
+    mock_set_data_store.assert_called_once_with(mock_data_store)
+
+
+def test_read_ndjson(mocker, capsys):
+    """Test ``phonebook read --output-format ndjson`` streams the users."""
+    sys.argv = ["phonebook", "read", "--output-format", "ndjson", "--limit", "2"]
+    users = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    mock_iter_read = mocker.patch("phonebook.iter_read", return_value=iter(users))
+
+    phonebook._cli.main()
+
+    mock_iter_read.assert_called_once_with(filters={}, limit=2, offset=None, after=None)
+    out, err = capsys.readouterr()
+    assert [json.loads(line) for line in out.splitlines()] == users
+
+
+def test_read_with_pagination(mocker, capsys):
+    """Test ``phonebook read`` with pagination options."""
+    sys.argv = ["phonebook", "read", "--offset", "1", "--after", "Eric Idle"]
+    users = [{"name": "John Cleese", "phone": "111-222-3333", "address": "there"}]
+    mock_iter_read = mocker.patch("phonebook.iter_read", return_value=iter(users))
+
+    phonebook._cli.main()
+
+    mock_iter_read.assert_called_once_with(
+        filters={}, limit=None, offset=1, after="Eric Idle"
+    )
+    out, err = capsys.readouterr()
+    assert json.loads(out) == users
+
+
+def test_server(mocker):
+    """Test ``phonebook --server`` uses the remote data store."""
+    sys.argv = ["phonebook", "--server", "127.0.0.1:8080", "delete", "Eric Idle"]
+    mock_remote = mocker.patch("phonebook._datastore.remote.RemoteDataStore")
+    mock_set_data_store = mocker.patch("phonebook.set_data_store")
+    mocker.patch("phonebook.delete")
+
+    phonebook._cli.main()
+
+    mock_remote.assert_called_once_with("127.0.0.1:8080")
+    mock_set_data_store.assert_called_once_with(mock_remote.return_value)
+
+
+def test_serve(mocker):
+    """Test ``phonebook serve`` serves until interrupted."""
+    sys.argv = ["phonebook", "serve", "--address", "/tmp/phonebook.sock"]
+    mocker.patch("phonebook.set_data_store")
+    mock_make_server = mocker.patch("phonebook._server.make_server")
+    mock_server = mock_make_server.return_value
+    mock_server.serve_forever.side_effect = KeyboardInterrupt
+
+    phonebook._cli.main()
+
+    mock_make_server.assert_called_once_with("/tmp/phonebook.sock")
+    mock_server.server_close.assert_called_once_with()
+
+
+def test_import(mocker, tmp_path):
+    """Test ``phonebook import`` guesses the format of the file."""
+    users_path = tmp_path / "users.csv"
+    users_path.write_text("name,phone,address\n")
+    sys.argv = ["phonebook", "import", str(users_path), "--skip-duplicates"]
+    mock_import_users = mocker.patch("phonebook.import_users", return_value=0)
+
+    phonebook._cli.main()
+
+    mock_import_users.assert_called_once_with(mocker.ANY, "csv", True)
+    assert mock_import_users.call_args[0][0].name == str(users_path)
+
+
+def test_import_stdin(mocker):
+    """Test ``phonebook import -`` reads ndjson from stdin."""
+    sys.argv = ["phonebook", "import", "-"]
+    mock_import_users = mocker.patch("phonebook.import_users", return_value=0)
+
+    phonebook._cli.main()
+
+    mock_import_users.assert_called_once_with(sys.stdin, "ndjson", False)
+
+
+def test_import_unknown_format(mocker, tmp_path):
+    """Test ``phonebook import`` when the format can't be guessed."""
+    sys.argv = ["phonebook", "import", str(tmp_path / "users.txt")]
+    mocker.patch("phonebook.import_users")
+
+    with pytest.raises(ValueError) as error:
+        phonebook._cli.main()
+
+    assert "--format" in str(error.value)
+
+
+def test_export(mocker, tmp_path):
+    """Test ``phonebook export`` with filters."""
+    users_path = tmp_path / "users.txt"
+    sys.argv = [
+        "phonebook",
+        "export",
+        str(users_path),
+        "--format",
+        "yaml",
+        "--name",
+        "Eric*",
+    ]
+    mock_export_users = mocker.patch("phonebook.export_users", return_value=0)
+
+    phonebook._cli.main()
+
+    mock_export_users.assert_called_once_with(
+        mocker.ANY, "yaml", filters={"name": "Eric*"}
+    )
+    assert users_path.exists()
+
+
+def test_export_stdout(mocker):
+    """Test ``phonebook export`` writes ndjson to stdout by default."""
+    sys.argv = ["phonebook", "export"]
+    mock_export_users = mocker.patch("phonebook.export_users", return_value=0)
+
+    phonebook._cli.main()
+
+    mock_export_users.assert_called_once_with(sys.stdout, "ndjson", filters={})
+
+
+def test_snapshot(mocker, tmp_path):
+    """Test ``phonebook snapshot`` writes the users to a snapshot."""
+    users = [
+        {"name": "Eric Idle", "phone": "123-456-7890", "address": "here"},
+        {"name": "John Cleese", "phone": "111-222-3333", "address": "there"},
+    ]
+    snapshot_path = tmp_path / "phonebook.snapshot"
+    sys.argv = ["phonebook", "snapshot", str(snapshot_path)]
+    mock_iter_read = mocker.patch("phonebook.iter_read", return_value=iter(users))
+
+    phonebook._cli.main()
+
+    mock_iter_read.assert_called_once_with()
+    snapshot_data_store = phonebook._datastore.load_data_store("snapshot")
+    assert snapshot_data_store(file_path=str(snapshot_path)).read() == users
+
+
+def test_bench(mocker, capsys, tmp_path):
+    """Test ``phonebook bench`` saves and compares the results."""
+    results = [
+        {
+            "data_store": "json",
+            "users": 10,
+            "scenario": "get",
+            "operations": 1,
+            "seconds": 0.5,
+            "ops_per_second": 2.0,
+            "p50_ms": 500.0,
+            "p90_ms": 500.0,
+            "p99_ms": 500.0,
+            "peak_memory_mb": None,
+        }
+    ]
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(
+        json.dumps({"environment": {"phonebook": "0.1.0"}, "results": results})
+    )
+    output_path = tmp_path / "results.json"
+    sys.argv = [
+        "phonebook",
+        "bench",
+        "--data-stores",
+        "json",
+        "--users",
+        "10",
+        "--output",
+        str(output_path),
+        "--compare",
+        str(baseline_path),
+    ]
+    mock_run = mocker.patch("phonebook._bench.runner.run", return_value=results)
+    mock_set_data_store = mocker.patch("phonebook.set_data_store")
+
+    phonebook._cli.main()
+
+    mock_run.assert_called_once_with(
+        [phonebook._datastore.JSONDataStore],
+        [10],
+        scenarios=phonebook._bench.SCENARIOS,
+        operations=100,
+        duration=2.0,
+    )
+    mock_set_data_store.assert_not_called()
+    assert json.loads(output_path.read_text())["results"] == results
+    out, err = capsys.readouterr()
+    assert "Compared to 0.1.0" in out
+    assert "1.00x" in out
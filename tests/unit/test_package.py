@@ -3,6 +3,8 @@
 
 import importlib
 import pkgutil
+import subprocess
+import sys
 
 import phonebook
 
@@ -19,3 +21,33 @@ def test_imports():
     prefix = package.__name__ + "."
     for _, modname, _ in pkgutil.walk_packages(package.__path__, prefix):
         importlib.import_module(modname)
+
+
+def test_lazy_imports():
+    """Test the CLI doesn't import the modules only some commands need."""
+    code = "import sys, phonebook._cli; print(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+    modules = set(output.split())
+    assert "phonebook._cli" in modules
+    lazy_modules = {
+        "yaml",
+        "sqlite3",
+        "http.client",
+        "http.server",
+        "phonebook._bench.runner",
+        "phonebook._datastore.codec",
+        "phonebook._datastore.file_",
+        "phonebook._datastore.json_",
+        "phonebook._datastore.yaml_",
+        "phonebook._datastore.sqlite_",
+        "phonebook._datastore.journal_",
+        "phonebook._datastore.remote",
+        "phonebook._server",
+    }
+    assert not modules.intersection(lazy_modules)